@@ -0,0 +1,27 @@
+/// 프랜차이즈 목록 쿼리를 프랜차이즈마다 한 가지씩 UNION ALL 로 이은 SQL.
+///
+/// `franchise IN (...) ORDER BY price DESC` 는 프랜차이즈가 둘 이상이면
+/// 인덱스 순서로 읽을 수 없어 카탈로그가 커지면 임시 B-tree 로 정렬합니다.
+/// 가지마다 `franchise = ?` 로 (franchise, 가격) 인덱스를 순서대로 읽으면
+/// SQLite 가 정렬 없이 MERGE 로 합칩니다. 같은 가격은 프랜차이즈 순입니다.
+///
+/// [where] 는 `franchise = ?` 를 뺀 나머지 조건, [args] 는 그 인자입니다.
+/// scripts/seed_query_plans.py 의 `{each}` 형태와 같은 SQL 을 만듭니다.
+({String sql, List<Object?> args}) franchiseMergeQuery({
+  required List<String> franchises,
+  required String orderBy,
+  String? where,
+  List<Object?> args = const [],
+}) {
+  final branch = where == null
+      ? 'SELECT * FROM menus WHERE franchise = ?'
+      : 'SELECT * FROM menus WHERE franchise = ? AND $where';
+  final unique = franchises.toSet();
+  return (
+    sql: '${List.filled(unique.length, branch).join(' UNION ALL ')} '
+        'ORDER BY $orderBy, franchise',
+    args: [
+      for (final franchise in unique) ...[franchise, ...args],
+    ],
+  );
+}
@@ -1,4 +1,5 @@
 import '../../../../core/database/database_helper.dart';
+import '../../../../core/database/franchise_merge_query.dart';
 import '../models/menu_item_model.dart';
 
 class MenuLocalDatasource {
@@ -9,14 +10,13 @@ class MenuLocalDatasource {
   Future<List<MenuItemModel>> getMenusByFranchise(
     List<String> franchises,
   ) async {
+    if (franchises.isEmpty) return [];
     final db = await _dbHelper.database;
-    final placeholders = List.filled(franchises.length, '?').join(',');
-    final result = await db.query(
-      'menus',
-      where: 'franchise IN ($placeholders)',
-      whereArgs: franchises,
+    final query = franchiseMergeQuery(
+      franchises: franchises,
       orderBy: 'price DESC',
     );
+    final result = await db.rawQuery(query.sql, query.args);
     return result.map(MenuItemModel.fromMap).toList();
   }
 
@@ -24,14 +24,15 @@ class MenuLocalDatasource {
     int budget,
     List<String> franchises,
   ) async {
+    if (franchises.isEmpty) return [];
     final db = await _dbHelper.database;
-    final placeholders = List.filled(franchises.length, '?').join(',');
-    final result = await db.query(
-      'menus',
-      where: 'franchise IN ($placeholders) AND price <= ?',
-      whereArgs: [...franchises, budget],
+    final query = franchiseMergeQuery(
+      franchises: franchises,
+      where: 'price <= ?',
+      args: [budget],
       orderBy: 'price DESC',
     );
+    final result = await db.rawQuery(query.sql, query.args);
     return result.map(MenuItemModel.fromMap).toList();
   }
 
@@ -1,4 +1,5 @@
 import '../../../../core/database/database_helper.dart';
+import '../../../../core/database/franchise_merge_query.dart';
 import '../../../menu/data/models/menu_item_model.dart';
 
 class RecommendationDatasource {
@@ -11,28 +12,27 @@ class RecommendationDatasource {
     List<String> franchises, {
     bool deliveryMode = false,
   }) async {
+    if (franchises.isEmpty) return [];
     final db = await _dbHelper.database;
-    final placeholders =
-        List.filled(franchises.length, '?').join(',');
 
     final String where;
     final String orderBy;
     if (deliveryMode) {
-      where = 'franchise IN ($placeholders) '
-          'AND price_delivery IS NOT NULL '
+      where = 'price_delivery IS NOT NULL '
           'AND price_delivery <= ?';
       orderBy = 'price_delivery DESC';
     } else {
-      where = 'franchise IN ($placeholders) AND price <= ?';
+      where = 'price <= ?';
       orderBy = 'price DESC';
     }
 
-    final result = await db.query(
-      'menus',
+    final query = franchiseMergeQuery(
+      franchises: franchises,
       where: where,
-      whereArgs: [...franchises, budget],
+      args: [budget],
       orderBy: orderBy,
     );
+    final result = await db.rawQuery(query.sql, query.args);
     return result.map(MenuItemModel.fromMap).toList();
   }
 }
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 메뉴판 정렬 벤치마크 (menu_board)
+
+합성 카탈로그(synth_catalog.py, 기본 5만 행)로 메뉴판이 다시 그려질 때
+한 번에 드는 시간을 두 방식으로 비교합니다.
+
+  memory  지금 앱처럼: getMenusByFranchise 로 전부 읽고 타입·검색어로 거른 뒤
+          MenuBoardSortMode 대로 정렬 (seed_board.sort_items)
+  board   menu_board 순위 인덱스를 훑어 첫 페이지(--page 개)만 읽음
+
+화면은 둘입니다.
+
+  franchise  프랜차이즈 메뉴판 — 실제 프랜차이즈 하나의 타입 하나
+  category   카테고리 비교 — 모든 프랜차이즈의 타입 하나
+
+검색어는 없음 / 흔한 글자('치즈') / 드문 글자('빅맥') 세 가지로 재고, 깊은
+페이지(OFFSET)가 얼마나 느려지는지도 따로 봅니다. 합성 프랜차이즈에는
+시그니처 키워드가 없으므로 인기순은 이름순과 같은 비용입니다.
+
+Usage:
+    python3 scripts/bench_board.py
+    python3 scripts/bench_board.py --rows 50000 --page 50 --repeat 10 --json board.json
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from menu_source import MENU_COLUMNS
+from recommendation_engine import load_signature_menus
+from seed_board import (
+    BOARD_COLUMNS,
+    BOARD_SCHEMA,
+    board_page,
+    build_menu_board,
+    sort_items,
+)
+from seed_query_plans import QUERY_SHAPES, bind_franchises
+from synth_catalog import generate_catalog, write_catalog_db
+
+MODES = ('popular', 'priceAsc', 'priceDesc', 'nameAsc')
+QUERIES = ('', '치즈', '빅맥')
+FRANCHISE = 'mcd'
+MENU_TYPE = 'burger'
+ALL_FRANCHISE_SQL = 'SELECT * FROM menus ORDER BY price DESC'
+BY_FRANCHISE_SQL = next(
+    template for name, _, template, _, _ in QUERY_SHAPES
+    if name == 'MenuLocalDatasource.getMenusByFranchise'
+)
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def build_bench_db(path, rows, signature_menus):
+    """합성 카탈로그 DB + menu_board → (conn, 순위 계산 초, insert 초)"""
+    write_catalog_db(path, rows)
+    conn = sqlite3.connect(path)
+    started = time.perf_counter()
+    board = build_menu_board(
+        (dict(zip(MENU_COLUMNS, row)) for row in rows), signature_menus,
+    )
+    ranked = time.perf_counter() - started
+    started = time.perf_counter()
+    for stmt in BOARD_SCHEMA:
+        conn.execute(stmt)
+    conn.executemany(
+        f'INSERT INTO menu_board ({", ".join(BOARD_COLUMNS)}) '
+        f'VALUES ({", ".join("?" * len(BOARD_COLUMNS))})',
+        board,
+    )
+    conn.execute('ANALYZE')
+    conn.commit()
+    return conn, ranked, time.perf_counter() - started
+
+
+def memory_board(conn, franchises, mode, query, signature_menus):
+    """getMenusByFranchise → 타입 필터 → contains → 정렬 (다시 그릴 때마다)"""
+    if franchises is None:
+        rows = conn.execute(ALL_FRANCHISE_SQL).fetchall()
+    else:
+        rows = conn.execute(
+            *bind_franchises(BY_FRANCHISE_SQL, franchises, ()),
+        ).fetchall()
+    items = [dict(zip(MENU_COLUMNS, row)) for row in rows]
+    items = [
+        m for m in items
+        if m['type'] == MENU_TYPE and (not query or query in m['name'])
+    ]
+    return sort_items(items, mode, signature_menus)
+
+
+def run(rows, page, repeat, seed):
+    signature_menus = load_signature_menus()
+    catalog = generate_catalog(rows, seed=seed)
+    report = {'rows': len(catalog), 'page': page, 'repeat': repeat, 'results': []}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'board.db')
+        conn, ranked, inserted = build_bench_db(path, catalog, signature_menus)
+        report['rankSeconds'] = round(ranked, 3)
+        report['insertSeconds'] = round(inserted, 3)
+        report['dbBytes'] = os.path.getsize(path)
+        print(
+            f'{len(catalog):,} items: ranks {ranked * 1000:.0f} ms, '
+            f'menu_board insert + indexes {inserted * 1000:.0f} ms, '
+            f'file {report["dbBytes"]:,} bytes'
+        )
+        print(
+            f'  {"screen":<11}{"mode":<11}{"query":<7}{"memory ms":>11}'
+            f'{"rows":>7}{"board ms":>10}{"rows":>6}{"speedup":>9}'
+        )
+        try:
+            for screen, franchises in (('franchise', [FRANCHISE]), ('category', None)):
+                for mode in MODES:
+                    for query in QUERIES:
+                        memory_ms, expected = _median_ms(
+                            lambda: memory_board(
+                                conn, franchises, mode, query, signature_menus,
+                            ),
+                            repeat,
+                        )
+                        board_ms, got = _median_ms(
+                            lambda: board_page(
+                                conn, mode, MENU_TYPE, franchises, query, page,
+                            ),
+                            repeat,
+                        )
+                        if [row[0] for row in got] != \
+                                [m['id'] for m in expected[:page]]:
+                            raise RuntimeError(
+                                f'menu_board page differs: {screen} {mode} {query!r}'
+                            )
+                        speedup = memory_ms / board_ms if board_ms else float('inf')
+                        print(
+                            f'  {screen:<11}{mode:<11}{query or "-":<7}'
+                            f'{memory_ms:>11.3f}{len(expected):>7,}'
+                            f'{board_ms:>10.3f}{len(got):>6}{speedup:>8.1f}x'
+                        )
+                        report['results'].append({
+                            'screen': screen, 'mode': mode, 'query': query,
+                            'memoryMs': round(memory_ms, 3),
+                            'matched': len(expected),
+                            'boardMs': round(board_ms, 3),
+                        })
+
+            # OFFSET 은 건너뛴 행도 인덱스에서 읽으므로 깊어질수록 느려짐
+            print(f'\n  category priceAsc, page of {page} at offset:')
+            report['offsets'] = {}
+            count = conn.execute(
+                'SELECT COUNT(*) FROM menu_board WHERE type = ?', (MENU_TYPE,),
+            ).fetchone()[0]
+            for offset in (0, count // 10, count // 2, max(0, count - page)):
+                board_ms, _ = _median_ms(
+                    lambda: board_page(
+                        conn, 'priceAsc', MENU_TYPE, None, '', page, offset,
+                    ),
+                    repeat,
+                )
+                report['offsets'][offset] = round(board_ms, 3)
+                print(f'    {offset:>7,}: {board_ms:.3f} ms')
+        finally:
+            conn.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Menu board sort benchmark')
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--page', type=int, default=50, help='한 페이지 행 수')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 JSON으로 저장')
+    args = parser.parse_args()
+
+    report = run(args.rows, args.page, args.repeat, args.seed)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\nWrote: {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 업데이트 확인 부하 테스트 (serve_data.py)
+
+serve_data.py 를 별도 프로세스로 띄우고, 클라이언트 수천 개가 manifest.json 을
+폴링하는 상황을 asyncio 로 흉내 냅니다. 같은 시나리오(같은 seed)를 두 방식으로
+돌려 요청 수, 초당 요청, 지연, 실제로 오간 바이트(헤더 포함)를 비교합니다.
+
+  naive        지금 앱처럼: manifest 를 매번 무조건 GET, DB 는 압축 없이 받고
+               연결이 끊기면 처음부터 다시
+  conditional  If-None-Match 로 폴링(바뀌지 않았으면 304), Accept-Encoding: gzip,
+               끊긴 다운로드는 Range + If-Range 로 이어받기
+
+클라이언트는 각자 keep-alive 연결 하나로 --polls 번 확인합니다. --stale 비율의
+클라이언트는 이전 manifest 를 들고 있어 첫 확인에서 새 manifest 와 최신 DB 를
+받고, 그중 --drop 비율은 DB 를 받다가 중간에 연결이 끊깁니다. 나머지는 이미
+최신이라 폴링만 합니다.
+
+서빙하는 트리는 gh-pages/ 를 임시 폴더에 복사하고 최신 DB 의 gzip 압축본
+(compress_db.py 와 같은 설정)을 더한 것입니다.
+
+Usage:
+    python3 scripts/bench_data_server.py
+    python3 scripts/bench_data_server.py --clients 5000 --connections 512 --json load.json
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from bench_queries import git_revision
+from compress_db import compress_file
+from generate_delta import PAGES_DIR, published_versions
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MODES = ('naive', 'conditional')
+
+
+class Client:
+    """keep-alive 연결 하나로 요청을 보내는 최소 HTTP/1.1 클라이언트"""
+
+    def __init__(self, host, port, stats):
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self._reader = self._writer = None
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._reader = self._writer = None
+
+    async def get(self, path, kind, headers=(), drop_after=None):
+        """(status, {헤더}, body) — drop_after 바이트를 받으면 연결을 끊음"""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port,
+            )
+        lines = [f'GET {path} HTTP/1.1', f'Host: {self.host}']
+        lines.extend(f'{name}: {value}' for name, value in headers)
+        self._writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+        started = time.perf_counter()
+        head = await self._reader.readuntil(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        status = int(status_line.split(' ')[1])
+        response = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(':')
+                response[name.strip().lower()] = value.strip()
+        length = int(response.get('content-length', 0))
+        if drop_after is not None and drop_after < length:
+            body = await self._reader.readexactly(drop_after)
+            await self.close()
+            status = 'dropped'
+        else:
+            body = await self._reader.readexactly(length)
+        self.stats['latency'].append(time.perf_counter() - started)
+        self.stats['status'][status] += 1
+        self.stats['bytes'][kind] += len(head) + len(body)
+        if response.get('connection') == 'close':
+            await self.close()
+        return status, response, body
+
+
+def _manifest_version(response, body):
+    if response.get('content-encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return json.loads(body)['version']
+
+
+async def _run_client(host, port, stats, plan, mode):
+    """클라이언트 하나: plan = (stale, drop 위치 비율 또는 None, polls)
+
+    앱처럼 manifest 의 version 으로 업데이트 여부를 정하고, ETag 는
+    If-None-Match 에만 씁니다.
+    """
+    stale, drop_at, polls = plan
+    client = Client(host, port, stats)
+    conditional = mode == 'conditional'
+    current_version, current_etag = stats['manifest'][mode]
+    if stale:
+        version, etag = current_version - 1, '"previous"'
+    else:
+        version, etag = current_version, current_etag
+    encoding = [('Accept-Encoding', 'gzip')] if conditional else []
+    try:
+        for _ in range(polls):
+            headers = list(encoding)
+            if conditional:
+                headers.append(('If-None-Match', etag))
+            status, response, body = await client.get(
+                '/manifest.json', 'manifest', headers,
+            )
+            if status == 304:
+                continue
+            etag = response.get('etag')
+            latest = _manifest_version(response, body)
+            if latest != version:
+                await _download(client, stats['db_path'], drop_at, conditional)
+                version = latest
+    finally:
+        await client.close()
+
+
+async def _download(client, path, drop_at, conditional):
+    headers = [('Accept-Encoding', 'gzip')] if conditional else []
+    drop_after = None
+    if drop_at is not None:
+        size = client.stats['db_sizes']['gzip' if conditional else None]
+        drop_after = int(size * drop_at)
+    status, response, body = await client.get(path, 'db', headers, drop_after)
+    if status != 'dropped':
+        return
+    if conditional:
+        resume = headers + [
+            ('Range', f'bytes={len(body)}-'), ('If-Range', response['etag']),
+        ]
+        await client.get(path, 'db', resume)
+    else:
+        await client.get(path, 'db', headers)
+
+
+async def run_mode(host, port, mode, plans, connections, context):
+    stats = {
+        'latency': [], 'status': Counter(), 'bytes': Counter(), **context,
+    }
+    gate = asyncio.Semaphore(connections)
+
+    async def limited(plan):
+        async with gate:
+            await _run_client(host, port, stats, plan, mode)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(plan) for plan in plans))
+    elapsed = time.perf_counter() - started
+    latency = sorted(stats['latency'])
+    requests = len(latency)
+    return {
+        'mode': mode,
+        'requests': requests,
+        'seconds': round(elapsed, 3),
+        'requestsPerSecond': round(requests / elapsed, 1),
+        'p50Ms': round(statistics.median(latency) * 1000, 2),
+        'p99Ms': round(latency[min(requests - 1, int(requests * 0.99))] * 1000, 2),
+        'status': {str(k): v for k, v in sorted(stats['status'].items(), key=str)},
+        'manifestBytes': stats['bytes']['manifest'],
+        'dbBytes': stats['bytes']['db'],
+        'totalBytes': stats['bytes']['manifest'] + stats['bytes']['db'],
+    }
+
+
+def make_plans(clients, polls, stale, drop, seed):
+    rng = random.Random(seed)
+    plans = []
+    for _ in range(clients):
+        is_stale = rng.random() < stale
+        drop_at = rng.uniform(0.1, 0.9) if is_stale and rng.random() < drop else None
+        plans.append((is_stale, drop_at, polls))
+    return plans
+
+
+def prepare_tree(tmp):
+    """gh-pages 복사본 + 최신 DB gzip 압축본 → (root, DB URL 경로, {encoding: 크기})"""
+    root = os.path.join(tmp, 'pages')
+    shutil.copytree(PAGES_DIR, root)
+    data_dir = os.path.join(root, 'data')
+    version, db_path = published_versions(data_dir)[-1]
+    _, gz_size = compress_file(db_path, db_path + '.gz', 'gzip')
+    sizes = {None: os.path.getsize(db_path), 'gzip': gz_size}
+    return root, f'/data/menu_v{version}.db', sizes
+
+
+def start_server(root):
+    """serve_data.py 를 자식 프로세스로 띄움 → (process, port)"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(SCRIPT_DIR, 'serve_data.py'),
+         '--root', root, '--port', '0'],
+        stdout=subprocess.PIPE, text=True,
+    )
+    line = process.stdout.readline()
+    if not line.startswith('Serving'):
+        process.kill()
+        raise RuntimeError(f'serve_data.py did not start: {line!r}')
+    return process, int(line.rsplit(':', 1)[1])
+
+
+async def _current_manifest(host, port, mode):
+    """(version, ETag) — 최신 클라이언트가 이 방식으로 받아 둔 manifest"""
+    stats = {'latency': [], 'status': Counter(), 'bytes': Counter()}
+    client = Client(host, port, stats)
+    headers = [('Accept-Encoding', 'gzip')] if mode == 'conditional' else []
+    try:
+        _, response, body = await client.get('/manifest.json', 'manifest', headers)
+    finally:
+        await client.close()
+    return _manifest_version(response, body), response['etag']
+
+
+def run(clients, polls, stale, drop, connections, seed):
+    plans = make_plans(clients, polls, stale, drop, seed)
+    report = {
+        'revision': git_revision(),
+        'clients': clients,
+        'polls': polls,
+        'stale': stale,
+        'drop': drop,
+        'connections': connections,
+        'seed': seed,
+        'results': [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        root, db_path, sizes = prepare_tree(tmp)
+        report['manifestSize'] = os.path.getsize(os.path.join(root, 'manifest.json'))
+        report['dbSize'] = sizes[None]
+        report['dbGzipSize'] = sizes['gzip']
+        process, port = start_server(root)
+        try:
+            context = {
+                'db_path': db_path,
+                'db_sizes': sizes,
+                'manifest': {
+                    mode: asyncio.run(_current_manifest('127.0.0.1', port, mode))
+                    for mode in MODES
+                },
+            }
+            for mode in MODES:
+                report['results'].append(asyncio.run(
+                    run_mode('127.0.0.1', port, mode, plans, connections, context),
+                ))
+        finally:
+            process.terminate()
+            process.wait()
+    return report
+
+
+def _print_report(report):
+    print(
+        f'{report["clients"]:,} clients x {report["polls"]} polls, '
+        f'{report["stale"]:.0%} stale, {report["drop"]:.0%} of downloads dropped, '
+        f'{report["connections"]} concurrent'
+    )
+    print(
+        f'manifest {report["manifestSize"]:,} bytes, DB {report["dbSize"]:,} bytes '
+        f'(gzip {report["dbGzipSize"]:,})'
+    )
+    print(
+        f'  {"mode":<12}{"requests":>9}{"req/s":>9}{"p50 ms":>8}{"p99 ms":>8}'
+        f'{"manifest B":>13}{"DB B":>13}{"total B":>13}  status'
+    )
+    for r in report['results']:
+        status = ', '.join(f'{k}: {v}' for k, v in r['status'].items())
+        print(
+            f'  {r["mode"]:<12}{r["requests"]:>9,}{r["requestsPerSecond"]:>9,.0f}'
+            f'{r["p50Ms"]:>8.2f}{r["p99Ms"]:>8.2f}{r["manifestBytes"]:>13,}'
+            f'{r["dbBytes"]:>13,}{r["totalBytes"]:>13,}  {status}'
+        )
+    naive, conditional = report['results']
+    for key, label in (('manifestBytes', 'manifest'), ('dbBytes', 'DB'),
+                       ('totalBytes', 'total')):
+        saved = naive[key] - conditional[key]
+        share = saved / naive[key] if naive[key] else 0
+        print(f'  saved ({label}): {saved:,} bytes ({share:.1%})')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Update-check load test')
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--polls', type=int, default=5, help='클라이언트당 manifest 확인 횟수')
+    parser.add_argument(
+        '--stale', type=float, default=0.1,
+        help='이전 manifest 를 가진(업데이트가 필요한) 클라이언트 비율',
+    )
+    parser.add_argument(
+        '--drop', type=float, default=0.3,
+        help='DB 다운로드 중 연결이 끊기는 비율',
+    )
+    parser.add_argument('--connections', type=int, default=256, help='동시 연결 수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 JSON으로 저장')
+    args = parser.parse_args()
+
+    report = run(
+        args.clients, args.polls, args.stale, args.drop, args.connections, args.seed,
+    )
+    _print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\nWrote: {args.json}')
+
+
+if __name__ == '__main__':
+    main()
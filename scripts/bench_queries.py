@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 시드 DB 쿼리 벤치마크
+
+synth_catalog.py로 만든 1만~100만 행 카탈로그에서 다음을 잽니다.
+
+  - DB 생성 시간(insert + ANALYZE)과 파일 크기
+  - seed_query_plans.QUERY_SHAPES 의 menus 쿼리마다 (프랜차이즈 1/2/5개)
+      cold   매번 새 연결 — SQLite 페이지 캐시가 빈 상태
+      warm   같은 연결로 반복 — 필요한 페이지가 모두 캐시에 있는 상태
+      small  cache_size 를 아주 작게 잡은 연결 — 페이지를 계속 다시 읽는 상태
+  - 쿼리 계획 위반 여부 (실패로 처리하지 않고 기록만)
+
+결과는 JSON으로 저장하고, --compare 로 이전 결과와 비교해 tolerance 배 이상
+(그리고 --min-delta-ms 이상) 느려진 항목이 있으면 종료 코드 1을 돌려줍니다.
+
+Usage:
+    python3 scripts/bench_queries.py --rows 10000 100000 --json bench.json
+    python3 scripts/bench_queries.py --rows 10000 --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+
+from seed_query_plans import (
+    FRANCHISE_SAMPLES,
+    QUERY_SHAPES,
+    bind_franchises,
+    explain,
+    per_franchise,
+    plan_violations,
+)
+from synth_catalog import generate_catalog, write_catalog_db
+
+# 쿼리 형태별 IN 목록 외 인자 (synth 카탈로그에도 항상 있는 값)
+SHAPE_ARGS = {
+    'MenuLocalDatasource.getMenusByFranchise': (),
+    'MenuLocalDatasource.getMenusWithinBudget': (10000,),
+    'MenuLocalDatasource.getMenuById': ('mcd_burger_01',),
+    'MenuLocalDatasource.searchMenus': ('%버거%',),
+    'RecommendationDatasource.getCandidates': (10000,),
+    'RecommendationDatasource.getCandidates (delivery)': (10000,),
+}
+
+SMALL_CACHE_PAGES = 16
+
+
+def bench_queries():
+    """(이름, 프랜차이즈 수, sql, params, 인덱스 스캔 허용) — 벤치 대상 쿼리"""
+    for name, _, template, _, allow_index_scan in QUERY_SHAPES:
+        if name not in SHAPE_ARGS:
+            continue
+        if not per_franchise(template):
+            yield name, 0, template, SHAPE_ARGS[name], allow_index_scan
+            continue
+        for franchises in FRANCHISE_SAMPLES:
+            sql, params = bind_franchises(template, franchises, SHAPE_ARGS[name])
+            yield name, len(franchises), sql, params, allow_index_scan
+
+
+def _time_ms(conn, sql, params):
+    started = time.perf_counter()
+    rows = conn.execute(sql, params).fetchall()
+    return (time.perf_counter() - started) * 1000, len(rows)
+
+
+def _median_ms(connect, sql, params, repeat, fresh):
+    samples = []
+    conn = None if fresh else connect()
+    for _ in range(repeat):
+        if fresh:
+            conn = connect()
+        ms, count = _time_ms(conn, sql, params)
+        samples.append(ms)
+        if fresh:
+            conn.close()
+    if not fresh:
+        conn.close()
+    return statistics.median(samples), count
+
+
+def bench_db(path, repeat):
+    """DB 하나에 대해 모든 쿼리 형태의 cold/warm/small 시간"""
+    uri = f'file:{path}?mode=ro'
+
+    def connect():
+        return sqlite3.connect(uri, uri=True)
+
+    def connect_small():
+        conn = connect()
+        conn.execute(f'PRAGMA cache_size = {SMALL_CACHE_PAGES}')
+        return conn
+
+    results = []
+    plan_conn = connect()
+    for name, franchises, sql, params, allow_index_scan in bench_queries():
+        plan = explain(plan_conn, sql, params)
+        warm_conn = connect()
+        _time_ms(warm_conn, sql, params)  # 캐시 채우기
+        warm_conn.close()
+        cold_ms, rows = _median_ms(connect, sql, params, repeat, fresh=True)
+        warm_ms, _ = _median_ms(connect, sql, params, repeat, fresh=False)
+        small_ms, _ = _median_ms(connect_small, sql, params, repeat, fresh=False)
+        results.append({
+            'query': name,
+            'franchises': franchises,
+            'rows': rows,
+            'coldMs': round(cold_ms, 4),
+            'warmMs': round(warm_ms, 4),
+            'smallCacheMs': round(small_ms, 4),
+            'plan': plan,
+            'planViolations': plan_violations(plan, allow_index_scan),
+        })
+    plan_conn.close()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, repeat, seed):
+    report = {
+        'revision': git_revision(),
+        'sqliteVersion': sqlite3.sqlite_version,
+        'python': platform.python_version(),
+        'seed': seed,
+        'repeat': repeat,
+        'catalogs': [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f'menu_{size}.db')
+            catalog = generate_catalog(size, seed=seed)
+            build_s = write_catalog_db(path, catalog)
+            entry = {
+                'rows': size,
+                'buildSeconds': round(build_s, 3),
+                'fileBytes': os.path.getsize(path),
+                'queries': bench_db(path, repeat),
+            }
+            report['catalogs'].append(entry)
+            _print_catalog(entry)
+    return report
+
+
+def _print_catalog(entry):
+    print(
+        f'\n{entry["rows"]:,} rows — build {entry["buildSeconds"]:.2f}s, '
+        f'{entry["fileBytes"]:,} bytes'
+    )
+    print(
+        f'  {"query":<52}{"n":>3}{"rows":>9}'
+        f'{"cold ms":>10}{"warm ms":>10}{"small ms":>10}'
+    )
+    for q in entry['queries']:
+        flag = '  ! ' + ', '.join(q['planViolations']) if q['planViolations'] else ''
+        print(
+            f'  {q["query"]:<52}{q["franchises"]:>3}{q["rows"]:>9,}'
+            f'{q["coldMs"]:>10.3f}{q["warmMs"]:>10.3f}{q["smallCacheMs"]:>10.3f}{flag}'
+        )
+
+
+def compare(baseline, current, tolerance, min_delta_ms):
+    """baseline 대비 tolerance 배 이상, min_delta_ms 이상 느려진 항목 목록
+
+    1ms 미만 쿼리는 측정 잡음이 배율로는 크게 보이므로 절대 차이도 봅니다.
+    """
+    def keyed(report):
+        return {
+            (c['rows'], q['query'], q['franchises']): q
+            for c in report['catalogs'] for q in c['queries']
+        }
+
+    before = keyed(baseline)
+    regressions = []
+    for key, q in keyed(current).items():
+        if key not in before:
+            continue
+        for metric in ('coldMs', 'warmMs', 'smallCacheMs'):
+            old, new = before[key][metric], q[metric]
+            if old > 0 and new / old >= tolerance and new - old >= min_delta_ms:
+                regressions.append((*key, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed DB query benchmark')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 JSON으로 저장')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=1.5)
+    parser.add_argument('--min-delta-ms', type=float, default=1.0)
+    args = parser.parse_args()
+
+    report = run(args.rows, args.repeat, args.seed)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\nWrote: {args.json}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.tolerance, args.min_delta_ms)
+        print(f'\nCompared with {args.compare} (revision {baseline.get("revision")})')
+        for rows, query, franchises, metric, old, new in regressions:
+            print(
+                f'  REGRESSION {rows:,} rows {query} [{franchises}] '
+                f'{metric}: {old:.3f} → {new:.3f} ms'
+            )
+        if regressions:
+            raise SystemExit(1)
+        print(f'  no regressions (tolerance {args.tolerance}x)')
+
+
+if __name__ == '__main__':
+    main()
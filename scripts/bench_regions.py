@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 지역가(price_overrides) 벤치마크
+
+synth_catalog.py 카탈로그에 지역 수를 1 → 250 으로 늘려 가며
+price_overrides 를 붙이고 다음을 잽니다.
+
+  - DB 파일 크기와 price_overrides 가 차지하는 바이트
+    (비교: 지역마다 menus 를 통째로 복사했을 때의 크기)
+  - 지역 R의 실제 가격 조회 (메뉴 id 하나, 무작위 id·지역, warm 연결)
+  - 지역 R의 프랜차이즈 메뉴 목록 (LEFT JOIN, 프랜차이즈 1개, 실제 가격 순)
+    과 그중 정렬 비용 (같은 쿼리를 ORDER BY 없이 잰 시간과의 차이)
+  - 두 쿼리의 실행 계획 위반 여부 (목록은 seed_query_plans.PLAN_ALLOWANCES 적용)
+
+지역마다 메뉴의 --override-ratio 만큼만 기본가와 다르게 둡니다 (±10%,
+100원 단위). 같은 seed면 같은 데이터입니다.
+
+Usage:
+    python3 scripts/bench_regions.py
+    python3 scripts/bench_regions.py --rows 100000 --regions 1 50 250 --json regions.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from bench_queries import git_revision
+from menu_source import MENU_COLUMNS
+from seed_cache import table_size_bytes
+from seed_query_plans import PLAN_ALLOWANCES, explain, plan_violations
+from seed_regions import (
+    PRICE_OVERRIDE_COLUMNS,
+    PRICE_OVERRIDE_SCHEMA,
+    REGION_LIST_SQL,
+    REGION_LOOKUP_SQL,
+)
+from synth_catalog import generate_catalog, write_catalog_db
+
+LOOKUP_SQL = REGION_LOOKUP_SQL
+LIST_SQL = REGION_LIST_SQL.replace('{in}', '?')
+UNSORTED_LIST_SQL = LIST_SQL.split(' ORDER BY ')[0]
+LIST_ALLOWED = PLAN_ALLOWANCES['price_overrides (franchise list)'][0]
+
+_ID = MENU_COLUMNS.index('id')
+_PRICE = MENU_COLUMNS.index('price')
+_DELIVERY = MENU_COLUMNS.index('price_delivery')
+
+
+def region_name(number):
+    return f'region{number:03d}'
+
+
+def synth_overrides(catalog, regions, ratio, seed=0):
+    """지역마다 ratio 비율의 메뉴에 기본가와 다른 가격"""
+    rng = random.Random(seed)
+    per_region = max(1, int(len(catalog) * ratio))
+    for number in range(1, regions + 1):
+        for row in rng.sample(catalog, per_region):
+            price = max(100, int(round(row[_PRICE] * rng.uniform(0.9, 1.1), -2)))
+            if price == row[_PRICE]:
+                price += 100
+            delivery = row[_DELIVERY]
+            if delivery is not None:
+                delivery = max(price, int(round(delivery * price / row[_PRICE], -2)))
+            yield row[_ID], region_name(number), price, delivery
+
+
+def write_region_db(path, catalog, overrides):
+    """카탈로그 DB + price_overrides → (빌드 초, override 행 수)"""
+    elapsed = write_catalog_db(path, catalog)
+    started = time.perf_counter()
+    conn = sqlite3.connect(path)
+    try:
+        for stmt in PRICE_OVERRIDE_SCHEMA:
+            conn.execute(stmt)
+        placeholders = ', '.join('?' * len(PRICE_OVERRIDE_COLUMNS))
+        with conn:
+            conn.executemany(
+                f'INSERT INTO price_overrides VALUES ({placeholders})',
+                sorted(overrides),
+            )
+        count = conn.execute('SELECT COUNT(*) FROM price_overrides').fetchone()[0]
+        conn.execute('ANALYZE')
+        conn.commit()
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+    return elapsed + time.perf_counter() - started, count
+
+
+def _median_us(conn, sql, params_list):
+    samples = []
+    for params in params_list:
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def bench_db(path, catalog, regions, lookups, seed):
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        rng = random.Random(seed)
+        ids = [row[_ID] for row in catalog]
+        lookup_params = [
+            (region_name(rng.randint(1, regions)), rng.choice(ids))
+            for _ in range(lookups)
+        ]
+        list_params = [
+            (region_name(rng.randint(1, regions)), 'mcd')
+            for _ in range(max(1, lookups // 20))
+        ]
+        # 캐시 채우기
+        _median_us(conn, LOOKUP_SQL, lookup_params)
+        _median_us(conn, LIST_SQL, list_params)
+        _median_us(conn, UNSORTED_LIST_SQL, list_params)
+
+        plans = {
+            'lookup': explain(conn, LOOKUP_SQL, lookup_params[0]),
+            'list': explain(conn, LIST_SQL, list_params[0]),
+        }
+        cursor = conn.cursor()
+        list_us = _median_us(conn, LIST_SQL, list_params)
+        return {
+            'lookupUs': round(_median_us(conn, LOOKUP_SQL, lookup_params), 2),
+            'listUs': round(list_us, 2),
+            'sortUs': round(list_us - _median_us(conn, UNSORTED_LIST_SQL, list_params), 2),
+            'menusBytes': table_size_bytes(cursor, [
+                'menus', 'sqlite_autoindex_menus_1', 'idx_menus_franchise_price',
+                'idx_menus_franchise_price_delivery', 'idx_menus_franchise_name',
+            ]),
+            'overrideBytes': table_size_bytes(cursor, ['price_overrides']),
+            'planViolations': {
+                name: plan_violations(
+                    plan, allow_index_scan=name == 'list',
+                    allowed=LIST_ALLOWED if name == 'list' else (),
+                )
+                for name, plan in plans.items()
+            },
+        }
+    finally:
+        conn.close()
+
+
+def run(rows, region_counts, ratio, lookups, seed):
+    catalog = generate_catalog(rows, seed=seed)
+    report = {
+        'revision': git_revision(),
+        'sqliteVersion': sqlite3.sqlite_version,
+        'rows': rows,
+        'overrideRatio': ratio,
+        'seed': seed,
+        'results': [],
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for regions in region_counts:
+            path = os.path.join(tmp, f'regions_{regions}.db')
+            build_s, count = write_region_db(
+                path, catalog, synth_overrides(catalog, regions, ratio, seed),
+            )
+            entry = {
+                'regions': regions,
+                'overrides': count,
+                'buildSeconds': round(build_s, 3),
+                'fileBytes': os.path.getsize(path),
+                **bench_db(path, catalog, regions, lookups, seed),
+            }
+            report['results'].append(entry)
+    return report
+
+
+def _bytes(value):
+    return '-' if value is None else f'{value:,}'
+
+
+def _print_report(report):
+    print(
+        f'{report["rows"]:,} rows, {report["overrideRatio"]:.0%} of items '
+        f'overridden per region (sqlite {report["sqliteVersion"]})'
+    )
+    print(
+        f'  {"regions":>7}{"overrides":>11}{"file bytes":>13}{"override B":>12}'
+        f'{"dense copy B":>14}{"lookup µs":>11}{"list µs":>10}{"sort µs":>9}'
+    )
+    for r in report['results']:
+        dense = r['menusBytes'] * r['regions'] if r['menusBytes'] is not None else None
+        violations = [
+            f'{name}: {", ".join(problems)}'
+            for name, problems in r['planViolations'].items() if problems
+        ]
+        print(
+            f'  {r["regions"]:>7}{r["overrides"]:>11,}{r["fileBytes"]:>13,}'
+            f'{_bytes(r["overrideBytes"]):>12}{_bytes(dense):>14}'
+            f'{r["lookupUs"]:>11.1f}{r["listUs"]:>10.1f}{r["sortUs"]:>9.1f}'
+            f'{"  ! " + "; ".join(violations) if violations else ""}'
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Regional price override benchmark')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument(
+        '--regions', type=int, nargs='+', default=[1, 10, 50, 100, 250],
+    )
+    parser.add_argument(
+        '--override-ratio', type=float, default=0.02,
+        help='지역마다 기본가와 다른 메뉴 비율 (기본 0.02)',
+    )
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 JSON으로 저장')
+    args = parser.parse_args()
+
+    report = run(args.rows, args.regions, args.override_ratio, args.lookups, args.seed)
+    _print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\nWrote: {args.json}')
+    if any(
+        problems for r in report['results']
+        for problems in r['planViolations'].values()
+    ):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
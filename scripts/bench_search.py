@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 메뉴명 검색 벤치마크
+
+MenuLocalDatasource.searchMenus 의 `name LIKE '%q%'` 전체 스캔과
+seed_search.py 인덱스 질의를 메뉴 소스 1× / 10× / 100× 규모에서 비교합니다.
+LIKE는 초성("ㅂㄱ")이나 입력 중인 글자("빅ㅁ")를 찾지 못하므로
+두 방식의 결과 수가 다를 수 있습니다.
+
+Usage:
+    python3 scripts/bench_search.py
+    python3 scripts/bench_search.py --scales 1 10 100 --repeat 20 --json out.json
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from generate_seed_db import SCHEMA
+from menu_source import MENU_COLUMNS, load_menus
+from seed_search import (
+    FORM_COLUMNS,
+    GRAM_COLUMNS,
+    GRAM_SCHEMA,
+    SEARCH_SCHEMA,
+    build_search_forms,
+    build_search_grams,
+    search,
+)
+
+QUERIES = ['빅맥', '상하이', '불고기 버거', '치즈', 'BBQ', 'ㅂㄱ', 'ㅆㅂㄱ', '빅ㅁ', '와퍼', '1']
+
+
+def scaled_menus(scale):
+    """메뉴 소스를 scale배로 복제 (복제본은 id/이름에 번호를 붙여 구분)"""
+    menus = load_menus()
+    rows = list(menus)
+    for copy in range(1, scale):
+        rows.extend(
+            (f'{row[0]}_x{copy}', row[1], f'{row[2]} {copy}', *row[3:])
+            for row in menus
+        )
+    return rows
+
+
+def _insert(conn, table, columns, rows):
+    placeholders = ', '.join('?' * len(columns))
+    conn.executemany(
+        f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({placeholders})',
+        rows,
+    )
+
+
+def build_bench_db(path, rows):
+    conn = sqlite3.connect(path)
+    for stmt in SCHEMA + SEARCH_SCHEMA + GRAM_SCHEMA:
+        conn.execute(stmt)
+    _insert(conn, 'menus', MENU_COLUMNS, rows)
+    started = time.perf_counter()
+    forms = build_search_forms(dict(zip(MENU_COLUMNS, row)) for row in rows)
+    _insert(conn, 'menu_search_forms', FORM_COLUMNS, forms)
+    _insert(conn, 'menu_search_grams', GRAM_COLUMNS, build_search_grams(forms))
+    conn.commit()
+    return conn, time.perf_counter() - started
+
+
+def _median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def run(scales, repeat):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            rows = scaled_menus(scale)
+            path = os.path.join(tmp, f'bench_{scale}.db')
+            conn, index_build = build_bench_db(path, rows)
+            print(
+                f'\n{scale}x — {len(rows):,} items, '
+                f'index build {index_build * 1000:.0f} ms, '
+                f'file {os.path.getsize(path):,} bytes'
+            )
+            print(f'  {"query":<12}{"LIKE ms":>10}{"rows":>8}{"index ms":>10}{"rows":>8}{"speedup":>9}')
+            for query in QUERIES:
+                like_ms, like_rows = _median_ms(
+                    lambda: conn.execute(
+                        'SELECT * FROM menus WHERE name LIKE ? ORDER BY franchise, name',
+                        (f'%{query}%',),
+                    ).fetchall(),
+                    repeat,
+                )
+                index_ms, index_rows = _median_ms(lambda: search(conn, query), repeat)
+                speedup = like_ms / index_ms if index_ms else float('inf')
+                print(
+                    f'  {query:<12}{like_ms:>10.3f}{len(like_rows):>8}'
+                    f'{index_ms:>10.3f}{len(index_rows):>8}{speedup:>8.1f}x'
+                )
+                results.append({
+                    'scale': scale,
+                    'items': len(rows),
+                    'query': query,
+                    'likeMs': like_ms,
+                    'likeRows': len(like_rows),
+                    'indexMs': index_ms,
+                    'indexRows': len(index_rows),
+                })
+            conn.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Menu search benchmark')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--json', help='결과를 JSON으로 저장')
+    args = parser.parse_args()
+
+    results = run(args.scales, args.repeat)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f'\nWrote: {args.json}')
+
+
+if __name__ == '__main__':
+    main()
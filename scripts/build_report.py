@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 시드 DB 빌드 리포트
+
+generate_seed_db.py 가 빌드마다 build/seed_report.json 을 남깁니다.
+
+  phases    단계별 소요 시간 (check, stable_ids, derive, schema, insert,
+            analyze, vacuum, sync, query_plans ...) — 실행한 단계만
+  file      파일 크기, page size / page 수 / free page 수
+  objects   테이블·인덱스별 크기와 page 수 (dbstat, 없으면 null)
+  counts    테이블별 행 수, 프랜차이즈 × 타입별 메뉴 수
+  prices    프랜차이즈 × 타입별 매장가·배달가 분포 (min / p25 / median / p75 / max)
+
+리포트는 마지막 배포 DB(gh-pages/data/menu_v{N}.db)와 자동으로 비교합니다.
+배포 때 올린 menu_v{N}.report.json 이 있으면 그것과, 없으면 배포 DB 파일을
+직접 읽어 만든 리포트(단계 시간 없음)와 비교합니다. 크기가 SIZE_GROWTH 배
+넘게 커졌거나 단계가 SLOW_PHASE 배 넘게 느려진 항목은 `!` 로 표시합니다.
+
+인덱스는 스키마와 함께 만들고 insert 중에 채웁니다 (insert 뒤에 만들면
+파일 바이트가 달라져 generate_delta.py 의 정규 재구성과 어긋남). 그래서
+인덱스 빌드 시간은 insert 에 포함되고, 인덱스 비용은 objects 의 크기로 봅니다.
+
+Usage:
+    python3 scripts/build_report.py                   # 마지막 빌드 리포트와 배포본 비교
+    python3 scripts/build_report.py diff OLD.json NEW.json
+    python3 scripts/build_report.py attach            # 리포트를 최신 배포 DB 옆에 복사
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import sqlite3
+import statistics
+import time
+
+from generate_delta import DATA_DIR, PROJECT_DIR, published_versions
+
+REPORT_PATH = os.path.join(PROJECT_DIR, 'build', 'seed_report.json')
+REPORT_FORMAT = 1
+
+# 이만큼 넘게 커지거나 느려지면 표시
+SIZE_GROWTH = 1.10
+SIZE_MIN_BYTES = 4096
+SLOW_PHASE = 2.0
+SLOW_MIN_SECONDS = 0.05
+
+
+class PhaseTimer:
+    """단계별 시간 누적 (같은 이름을 여러 번 쓰면 더함)"""
+
+    def __init__(self):
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + \
+                time.perf_counter() - started
+
+    def rounded(self):
+        return {name: round(seconds, 4) for name, seconds in self.phases.items()}
+
+
+def _pragma(conn, name):
+    return conn.execute(f'PRAGMA {name}').fetchone()[0]
+
+
+def object_sizes(conn):
+    """{이름: {type, table, bytes, pages}} — dbstat 이 없으면 None"""
+    try:
+        stats = {
+            name: (size, pages) for name, size, pages in conn.execute(
+                'SELECT name, SUM(pgsize), COUNT(*) FROM dbstat GROUP BY name'
+            )
+        }
+    except sqlite3.OperationalError:
+        return None
+    objects = {}
+    for name, kind, table in conn.execute(
+        "SELECT name, type, tbl_name FROM sqlite_master "
+        "WHERE type IN ('table', 'index') ORDER BY name"
+    ):
+        size, pages = stats.get(name, (0, 0))
+        objects[name] = {'type': kind, 'table': table, 'bytes': size, 'pages': pages}
+    return objects
+
+
+def _distribution(values):
+    if not values:
+        return None
+    if len(values) == 1:
+        quartiles = [values[0]] * 3
+    else:
+        quartiles = statistics.quantiles(values, n=4, method='inclusive')
+    return {
+        'count': len(values),
+        'min': values[0],
+        'p25': quartiles[0],
+        'median': quartiles[1],
+        'p75': quartiles[2],
+        'max': values[-1],
+        'mean': round(statistics.fmean(values), 1),
+    }
+
+
+def menu_stats(conn):
+    """(프랜차이즈 × 타입별 메뉴 수, 가격 분포) — menus 를 한 번만 읽음"""
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(menus)')}
+    delivery = 'price_delivery' if 'price_delivery' in columns else 'NULL'
+    groups = {}
+    for franchise, menu_type, price, price_delivery in conn.execute(
+        f'SELECT franchise, type, price, {delivery} FROM menus '
+        'ORDER BY franchise, type, price'
+    ):
+        group = groups.setdefault(f'{franchise}/{menu_type}', ([], []))
+        group[0].append(price)
+        if price_delivery is not None:
+            group[1].append(price_delivery)
+
+    counts = {key: len(store) for key, (store, _) in groups.items()}
+    prices = {
+        key: {
+            'price': _distribution(store),
+            'price_delivery': _distribution(sorted(delivery_prices)),
+        }
+        for key, (store, delivery_prices) in groups.items()
+    }
+    return counts, prices
+
+
+def collect_report(path, phases=None, options=None):
+    """DB 파일 하나의 리포트"""
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        tables = [
+            row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            )
+        ]
+        rows = {
+            table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+            for table in tables
+        }
+        menus, prices = menu_stats(conn)
+        report = {
+            'format': REPORT_FORMAT,
+            'sqliteVersion': sqlite3.sqlite_version,
+            'options': options or {},
+            'phases': phases or {},
+            'file': {
+                'bytes': os.path.getsize(path),
+                'pageSize': _pragma(conn, 'page_size'),
+                'pages': _pragma(conn, 'page_count'),
+                'freePages': _pragma(conn, 'freelist_count'),
+            },
+            'objects': object_sizes(conn),
+            'counts': {'rows': rows, 'menus': menus},
+            'prices': prices,
+        }
+    finally:
+        conn.close()
+    return report
+
+
+def write_report(report, path=REPORT_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def published_baseline(data_dir=DATA_DIR):
+    """(version, 리포트) — 최신 배포 DB 기준 (배포본이 없으면 (None, None))"""
+    versions = published_versions(data_dir)
+    if not versions:
+        return None, None
+    version, path = versions[-1]
+    attached = f'{os.path.splitext(path)[0]}.report.json'
+    if os.path.exists(attached):
+        with open(attached, encoding='utf-8') as f:
+            return version, json.load(f)
+    return version, collect_report(path)
+
+
+def _grew(old, new, ratio=SIZE_GROWTH, minimum=SIZE_MIN_BYTES):
+    return new > old * ratio and new - old >= minimum
+
+
+def diff_reports(old, new):
+    """[(표시, 설명)] — 표시는 '!'(커짐/느려짐) 또는 ' '"""
+    lines = []
+
+    def add(flag, text):
+        lines.append(('!' if flag else ' ', text))
+
+    old_file, new_file = old['file'], new['file']
+    if old_file['bytes'] != new_file['bytes'] or \
+            old_file['pageSize'] != new_file['pageSize']:
+        add(
+            _grew(old_file['bytes'], new_file['bytes']),
+            f'file: {old_file["bytes"]:,} → {new_file["bytes"]:,} bytes '
+            f'(page {old_file["pageSize"]} → {new_file["pageSize"]}, '
+            f'free {old_file["freePages"]} → {new_file["freePages"]})',
+        )
+
+    old_objects, new_objects = old.get('objects') or {}, new.get('objects') or {}
+    for name in sorted(set(old_objects) | set(new_objects)):
+        before = old_objects.get(name, {}).get('bytes')
+        after = new_objects.get(name, {}).get('bytes')
+        if before == after:
+            continue
+        if before is None:
+            add(after >= SIZE_MIN_BYTES, f'+ {name}: {after:,} bytes')
+        elif after is None:
+            add(False, f'- {name}: {before:,} bytes')
+        else:
+            add(_grew(before, after), f'  {name}: {before:,} → {after:,} bytes')
+
+    old_rows, new_rows = old['counts']['rows'], new['counts']['rows']
+    for table in sorted(set(old_rows) | set(new_rows)):
+        before, after = old_rows.get(table), new_rows.get(table)
+        if before != after:
+            add(False, f'rows {table}: {before} → {after}')
+
+    old_prices, new_prices = old['prices'], new['prices']
+    for key in sorted(set(old_prices) | set(new_prices)):
+        for column in ('price', 'price_delivery'):
+            before = (old_prices.get(key) or {}).get(column)
+            after = (new_prices.get(key) or {}).get(column)
+            if before and after and before['median'] != after['median']:
+                add(False, (
+                    f'median {column} {key}: {before["median"]:,} → '
+                    f'{after["median"]:,}'
+                ))
+
+    old_phases, new_phases = old.get('phases') or {}, new.get('phases') or {}
+    for phase in new_phases:
+        before, after = old_phases.get(phase), new_phases[phase]
+        if before is None:
+            continue
+        if after > before * SLOW_PHASE and after - before >= SLOW_MIN_SECONDS:
+            add(True, f'phase {phase}: {before:.3f}s → {after:.3f}s')
+    return lines
+
+
+def format_diff(lines, label):
+    flagged = sum(1 for flag, _ in lines if flag == '!')
+    header = f'Report diff vs {label}: {len(lines)} changes'
+    if flagged:
+        header += f', {flagged} flagged'
+    return '\n'.join([header] + [f'  {flag} {text}' for flag, text in lines])
+
+
+def attach_report(path=REPORT_PATH, data_dir=DATA_DIR):
+    """빌드 리포트를 최신 배포 DB 옆(menu_v{N}.report.json)에 복사"""
+    versions = published_versions(data_dir)
+    if not versions:
+        raise SystemExit(f'No published DB in {data_dir}')
+    dest = f'{os.path.splitext(versions[-1][1])[0]}.report.json'
+    shutil.copyfile(path, dest)
+    return dest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed DB build report')
+    sub = parser.add_subparsers(dest='command')
+    diff = sub.add_parser('diff', help='리포트 두 개 비교')
+    diff.add_argument('old')
+    diff.add_argument('new')
+    sub.add_parser('attach', help='리포트를 최신 배포 DB 옆에 복사')
+    args = parser.parse_args()
+
+    if args.command == 'attach':
+        print(f'Attached: {attach_report()}')
+        return
+    if args.command == 'diff':
+        with open(args.old, encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.new, encoding='utf-8') as f:
+            new = json.load(f)
+        print(format_diff(diff_reports(old, new), args.old))
+        return
+
+    with open(REPORT_PATH, encoding='utf-8') as f:
+        report = json.load(f)
+    version, baseline = published_baseline()
+    if baseline is None:
+        print(f'No published DB in {DATA_DIR}')
+        return
+    print(format_diff(diff_reports(baseline, report), f'v{version}'))
+
+
+if __name__ == '__main__':
+    main()
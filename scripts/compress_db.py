@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 압축 DB 배포 + 스트리밍 다운로드 검증
+
+generate_manifest.dart가 올린 최신 menu_v{N}.db를 gzip(항상)과
+zstd(`zstandard` 모듈이 있을 때)로 압축해 gh-pages/data 에 두고,
+manifest.json 에 다음을 기록합니다.
+
+    "compressed": [{"codec", "url", "compressedSha256", "compressedSize"}, ...]
+    "codec" / "compressedUrl" / "compressedSha256" / "compressedSize"
+        — 가장 작은 압축본 (클라이언트가 풀 수 있는 codec이 아니면 목록에서 고름)
+
+기존 sha256 / sizeBytes 는 압축을 푼 DB 기준 그대로입니다.
+
+download_verified()는 참조 클라이언트입니다. 응답을 고정 크기 청크로 읽으면서
+압축본 해시, 압축 해제, 원본 해시, 파일 쓰기를 한 번에 처리하므로 메모리는
+DB 크기와 상관없이 청크 몇 개 분량만 씁니다. 두 해시가 모두 맞을 때만
+임시 파일을 최종 경로로 옮깁니다.
+
+Usage:
+    python3 scripts/compress_db.py                 # 압축본 생성 + manifest 갱신
+    python3 scripts/compress_db.py download URL SHA256 OUT [--codec gzip]
+                                   [--compressed-sha256 HASH]
+    python3 scripts/compress_db.py selftest        # 로컬 HTTP 서버로 검증
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import urllib.request
+
+from generate_delta import (
+    BASE_URL,
+    DATA_DIR,
+    MANIFEST_PATH,
+    PROJECT_DIR,
+    published_versions,
+    sha256_file,
+)
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 사항 — 없으면 gzip만 만듦
+    zstandard = None
+
+_STREAM_ERRORS = (OSError, EOFError) + (
+    (zstandard.ZstdError,) if zstandard is not None else ()
+)
+
+CHUNK_SIZE = 64 * 1024
+GZIP_LEVEL = 9
+ZSTD_LEVEL = 19
+
+# selftest: 내려받을 파일 크기(청크 수)와 허용하는 메모리 최고치(청크 수).
+# gzip 은 zlib 창(32 KiB)과 읽기 버퍼가 더해져 64 KiB 청크에서 5배 가까이 씁니다.
+SELFTEST_CHUNKS = 32
+PEAK_CHUNKS = 6
+
+CODEC_SUFFIX = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def available_codecs():
+    return ('gzip', 'zstd') if zstandard is not None else ('gzip',)
+
+
+class _HashingReader:
+    """read()로 지나가는 바이트의 SHA-256과 크기를 계산하는 래퍼"""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        self.sha256.update(data)
+        self.size += len(data)
+        return data
+
+    def readable(self):
+        return True
+
+
+def _decompressing_reader(codec, raw):
+    if codec == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ValueError('zstd codec requires the zstandard module')
+        return zstandard.ZstdDecompressor().stream_reader(raw, read_size=CHUNK_SIZE)
+    if codec is None:
+        return raw
+    raise ValueError(f'Unknown codec: {codec}')
+
+
+def compress_file(src, dest, codec):
+    """src → dest 스트리밍 압축 (같은 입력이면 같은 바이트)
+
+    Returns: (compressedSha256, compressedSize)
+    """
+    with open(src, 'rb') as fin, open(dest, 'wb') as fout:
+        if codec == 'gzip':
+            # mtime/filename 을 고정해야 결정적
+            with gzip.GzipFile(
+                filename='', mode='wb', fileobj=fout,
+                compresslevel=GZIP_LEVEL, mtime=0,
+            ) as writer:
+                shutil.copyfileobj(fin, writer, CHUNK_SIZE)
+        elif codec == 'zstd':
+            cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, write_checksum=True)
+            cctx.copy_stream(
+                fin, fout, size=os.path.getsize(src),
+                read_size=CHUNK_SIZE, write_size=CHUNK_SIZE,
+            )
+        else:
+            raise ValueError(f'Unknown codec: {codec}')
+    return sha256_file(dest), os.path.getsize(dest)
+
+
+def verify_stream(raw, expected_sha256, out, codec=None,
+                  compressed_sha256=None, chunk_size=CHUNK_SIZE):
+    """raw(파일 객체)를 한 번 읽으며 압축 해제·해시·쓰기
+
+    Returns: (압축 해제 크기, 전송된 바이트 수)
+    Raises: ValueError — 해시 불일치 또는 손상된 압축 스트림
+    """
+    source = _HashingReader(raw)
+    reader = _decompressing_reader(codec, source)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            out.write(chunk)
+            size += len(chunk)
+    except _STREAM_ERRORS as e:
+        raise ValueError(f'Corrupt {codec} stream: {e}') from e
+    if codec is not None:
+        # 압축 프레임 뒤에 남은 바이트도 해시에 포함해 검사
+        while source.read(chunk_size):
+            pass
+
+    if compressed_sha256 is not None and \
+            source.sha256.hexdigest() != compressed_sha256:
+        raise ValueError('Compressed SHA-256 mismatch')
+    if digest.hexdigest() != expected_sha256:
+        raise ValueError('SHA-256 mismatch')
+    return size, source.size
+
+
+def download_verified(url, expected_sha256, out_path, codec=None,
+                      compressed_sha256=None, chunk_size=CHUNK_SIZE):
+    """참조 다운로더: 스트리밍으로 받아 검증한 뒤에만 out_path 에 둠"""
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, suffix='.part')
+    try:
+        with urllib.request.urlopen(url) as response, \
+                os.fdopen(fd, 'wb') as out:
+            result = verify_stream(
+                response, expected_sha256, out, codec,
+                compressed_sha256, chunk_size,
+            )
+        os.replace(tmp_path, out_path)
+        return result
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def compress_published(data_dir=DATA_DIR, manifest_path=MANIFEST_PATH):
+    """최신 버전 DB를 압축하고 manifest.json 에 기록"""
+    versions = published_versions(data_dir)
+    if not versions:
+        print('Nothing to do: no published DB')
+        return []
+    version, db_path = versions[-1]
+    db_sha256 = sha256_file(db_path)
+    db_size = os.path.getsize(db_path)
+
+    entries = []
+    for codec in available_codecs():
+        name = f'menu_v{version}.db{CODEC_SUFFIX[codec]}'
+        dest = os.path.join(data_dir, name)
+        digest, size = compress_file(db_path, dest, codec)
+
+        # 검증: 압축본을 스트리밍으로 풀어 원본 해시와 비교
+        with open(dest, 'rb') as raw, open(os.devnull, 'wb') as sink:
+            verify_stream(raw, db_sha256, sink, codec, digest)
+
+        print(
+            f'  v{version} {codec}: {size:,} bytes '
+            f'({size / db_size:.1%} of {db_size:,})'
+        )
+        entries.append({
+            'codec': codec,
+            'url': f'{BASE_URL}/data/{name}',
+            'compressedSha256': digest,
+            'compressedSize': size,
+        })
+    if zstandard is None:
+        print('  (zstandard not installed: zstd skipped)')
+    entries.sort(key=lambda entry: entry['compressedSize'])
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != version:
+            raise RuntimeError(
+                f'manifest.json is at v{manifest.get("version")}, '
+                f'expected v{version}'
+            )
+        best = entries[0]
+        manifest.update({
+            'codec': best['codec'],
+            'compressedUrl': best['url'],
+            'compressedSha256': best['compressedSha256'],
+            'compressedSize': best['compressedSize'],
+            'compressed': entries,
+        })
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(manifest, indent=2, ensure_ascii=False) + '\n')
+        print(f'Updated: {manifest_path}')
+    return entries
+
+
+def _serve(directory):
+    """directory 를 서빙하는 http.server 하위 프로세스 → (process, base URL)
+
+    서버를 같은 프로세스에서 돌리면 tracemalloc 이 서버 스레드의 할당까지
+    세므로 다운로더의 메모리만 재려면 프로세스를 분리해야 합니다.
+    """
+    import subprocess
+
+    server = subprocess.Popen(
+        [sys.executable, '-u', '-m', 'http.server', '0',
+         '--bind', '127.0.0.1', '--directory', directory],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    # "Serving HTTP on 127.0.0.1 port 8000 (http://127.0.0.1:8000/) ..."
+    banner = server.stdout.readline()
+    if ' port ' not in banner:
+        server.kill()
+        raise RuntimeError(f'http.server did not start: {banner!r}')
+    port = int(banner.split(' port ')[1].split()[0])
+    return server, f'http://127.0.0.1:{port}'
+
+
+def selftest(db_path, chunk_size=CHUNK_SIZE):
+    """로컬 HTTP 서버로 압축본 다운로드 → 검증, 손상 감지, 메모리 상한 확인
+
+    DB를 청크 SELFTEST_CHUNKS 개 이상이 되도록 이어 붙인 파일을 내려받고,
+    tracemalloc 최고치가 chunk_size × PEAK_CHUNKS 를 넘으면 실패로 셉니다.
+    파일이 상한보다 크므로 응답 전체를 메모리에 올리는 회귀는 여기서 걸립니다.
+    """
+    import tracemalloc
+
+    with open(db_path, 'rb') as f:
+        db = f.read()
+    copies = -(-SELFTEST_CHUNKS * chunk_size // len(db))
+    limit = PEAK_CHUNKS * chunk_size
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        payload_path = os.path.join(tmp, 'menu.db')
+        with open(payload_path, 'wb') as f:
+            for _ in range(copies):
+                f.write(db)
+        payload_sha256 = sha256_file(payload_path)
+        payload_size = os.path.getsize(payload_path)
+        print(f'  payload: {copies} x {len(db):,} = {payload_size:,} bytes, '
+              f'peak limit {limit // 1024:,} KiB')
+
+        artifacts = {None: ('menu.db', payload_sha256)}
+        for codec in available_codecs():
+            name = f'menu.db{CODEC_SUFFIX[codec]}'
+            digest, _ = compress_file(payload_path, os.path.join(tmp, name), codec)
+            artifacts[codec] = (name, digest)
+
+            # 한 바이트를 뒤집은 손상본
+            with open(os.path.join(tmp, name), 'rb') as f:
+                data = bytearray(f.read())
+            data[len(data) // 2] ^= 0xFF
+            with open(os.path.join(tmp, f'corrupt{CODEC_SUFFIX[codec]}'), 'wb') as f:
+                f.write(data)
+
+        server, base = _serve(tmp)
+        try:
+            # 첫 요청에서 일어나는 모듈 import 가 측정에 섞이지 않도록 미리 한 번
+            with urllib.request.urlopen(f'{base}/') as response:
+                response.read()
+
+            out_path = os.path.join(tmp, 'out.db')
+            for codec, (name, digest) in artifacts.items():
+                tracemalloc.start()
+                size, sent = download_verified(
+                    f'{base}/{name}', payload_sha256, out_path, codec,
+                    digest if codec else None, chunk_size,
+                )
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                ok = size == payload_size and \
+                    sha256_file(out_path) == payload_sha256
+                bounded = peak <= limit
+                failures += (not ok) + (not bounded)
+                print(
+                    f'  [{"ok" if ok else "FAIL"}] {codec or "raw"}: '
+                    f'{sent:,} bytes sent, {size:,} bytes written'
+                )
+                print(
+                    f'  [{"ok" if bounded else "FAIL"}] {codec or "raw"}: '
+                    f'peak {peak / 1024:,.0f} KiB ({peak / chunk_size:.1f} chunks)'
+                )
+
+                if codec is None:
+                    continue
+                os.remove(out_path)
+                try:
+                    download_verified(
+                        f'{base}/corrupt{CODEC_SUFFIX[codec]}', payload_sha256,
+                        out_path, codec, digest, chunk_size,
+                    )
+                    detected = False
+                except ValueError:
+                    detected = True
+                detected = detected and not os.path.exists(out_path)
+                failures += not detected
+                print(f'  [{"ok" if detected else "FAIL"}] {codec}: corruption rejected')
+        finally:
+            server.terminate()
+            server.wait()
+            server.stdout.close()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compressed DB artifacts')
+    sub = parser.add_subparsers(dest='command')
+    download = sub.add_parser('download', help='스트리밍 다운로드 + 해시 검증')
+    download.add_argument('url')
+    download.add_argument('sha256')
+    download.add_argument('out')
+    download.add_argument('--codec', choices=sorted(CODEC_SUFFIX))
+    download.add_argument('--compressed-sha256')
+    test = sub.add_parser('selftest', help='로컬 HTTP 서버로 다운로더 검증')
+    test.add_argument(
+        'db',
+        nargs='?',
+        default=os.path.join(PROJECT_DIR, 'assets', 'menu_seed.db'),
+    )
+    args = parser.parse_args()
+
+    if args.command == 'download':
+        try:
+            size, sent = download_verified(
+                args.url, args.sha256, args.out, args.codec, args.compressed_sha256,
+            )
+        except ValueError as e:
+            print(f'Error: {e}')
+            sys.exit(1)
+        print(f'Downloaded: {args.out} ({sent:,} bytes -> {size:,} bytes)')
+        return
+
+    if args.command == 'selftest':
+        print(f'Self-test with {args.db}')
+        failures = selftest(args.db)
+        if failures:
+            raise SystemExit(f'{failures} check(s) failed')
+        print('All checks passed')
+        return
+
+    print(f'Compressing latest DB in {DATA_DIR}')
+    compress_published()
+
+
+if __name__ == '__main__':
+    main()
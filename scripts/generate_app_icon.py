@@ -1,33 +1,99 @@
 #!/usr/bin/env python3
-"""Generate app icon and splash images for Burger Budget."""
+"""Generate app icon and splash images for Burger Budget.
 
-from PIL import Image, ImageDraw, ImageFont
+The checked-in masters in assets/icons are the source of truth:
+
+    app_icon.png             launcher icon (mipmap-*/ic_launcher.png)
+    app_icon_foreground.png  adaptive icon foreground (drawable-*/ic_launcher_foreground.png)
+    splash_icon.png          pre-Android 12 splash (drawable-*/splash.png)
+    splash_icon_12.png       Android 12 splash icon (drawable-*/android12splash.png
+                             and the drawable-night-* copies)
+
+`python3 scripts/generate_app_icon.py` derives every Android density from those
+masters in a process pool. Each master is decoded once per worker and each
+output is resampled from it (bicubic). Outputs whose master, size and
+options are unchanged (see icon_assets.lock.json) are skipped. PNGs are written
+with the smallest lossless encoding: palette when the image has at most 256
+colours, RGB when alpha is fully opaque. The legacy splash is also cropped to
+the smallest centred box around its visible pixels; launch_background.xml
+centres the bitmap, so placement is unchanged but the bitmap decoded at cold
+start is smaller.
+
+`python3 scripts/generate_app_icon.py draw --out DIR` renders the simple
+placeholder burger (supersampled once, every size derived from it) for
+bootstrapping new masters.
+"""
+
+import argparse
+import hashlib
+import io
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from PIL import Image, ImageChops, ImageDraw
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 OUTPUT_DIR = os.path.join(PROJECT_DIR, 'assets', 'icons')
+RES_DIR = os.path.join(PROJECT_DIR, 'android', 'app', 'src', 'main', 'res')
+LOCK_PATH = os.path.join(SCRIPT_DIR, 'icon_assets.lock.json')
+
+# Bump when resampling or encoding changes, so cached outputs are redone
+PIPELINE_VERSION = 1
 
 # Brand color
 BG_COLOR = '#FF6B35'
 WHITE = '#FFFFFF'
 
+SUPERSAMPLE = 4
+RESAMPLE = Image.BICUBIC
+
+DENSITIES = (
+    ('mdpi', 1.0),
+    ('hdpi', 1.5),
+    ('xhdpi', 2.0),
+    ('xxhdpi', 3.0),
+    ('xxxhdpi', 4.0),
+)
+
+# (name, master, size in dp at mdpi — None means master width / 4 like
+#  flutter_native_splash, output paths, crop transparent margins)
+ASSETS = (
+    ('launcher', 'app_icon.png', 48,
+     ('mipmap-{density}/ic_launcher.png',), False),
+    ('foreground', 'app_icon_foreground.png', 108,
+     ('drawable-{density}/ic_launcher_foreground.png',), False),
+    ('splash', 'splash_icon.png', None,
+     ('drawable-{density}/splash.png',), True),
+    # Android 12 scales the icon into its own mask, so no cropping here
+    ('splash12', 'splash_icon_12.png', None,
+     ('drawable-{density}/android12splash.png',
+      'drawable-night-{density}/android12splash.png'), False),
+)
+
 
 def create_app_icon(size=1024):
-    """Create main app icon: orange circle with burger emoji."""
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    """Create main app icon: orange circle with burger emoji.
+
+    Drawn at SUPERSAMPLE x size and downsampled, so edges are anti-aliased.
+    """
+    canvas = size * SUPERSAMPLE
+    img = Image.new('RGBA', (canvas, canvas), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
     # Orange circular background
-    margin = int(size * 0.02)
+    margin = int(canvas * 0.02)
     draw.ellipse(
-        [margin, margin, size - margin, size - margin],
+        [margin, margin, canvas - margin, canvas - margin],
         fill=BG_COLOR,
     )
 
     # Draw burger symbol (stylized lines)
-    cx, cy = size // 2, size // 2
-    r = int(size * 0.28)
+    cx, cy = canvas // 2, canvas // 2
+    r = int(canvas * 0.28)
 
     # Top bun (arc)
     bun_top = int(cy - r * 1.1)
@@ -85,46 +151,284 @@ def create_app_icon(size=1024):
             fill=WHITE,
         )
 
-    return img
+    return img.resize((size, size), RESAMPLE)
 
 
-def create_foreground(size=1024):
+def create_foreground(icon, size=1024):
     """Create adaptive icon foreground (transparent bg + icon)."""
     # Adaptive icons need 108dp with 72dp safe zone (66.7%)
     # Add padding for the safe zone
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
 
-    icon = create_app_icon(int(size * 0.7))
-    offset = (size - icon.width) // 2
-    img.paste(icon, (offset, offset), icon)
+    inner = icon.resize((int(size * 0.7),) * 2, RESAMPLE)
+    offset = (size - inner.width) // 2
+    img.paste(inner, (offset, offset), inner)
     return img
 
 
-def create_splash_icon(size=512):
+def create_splash_icon(icon, size=512):
     """Create splash screen icon (smaller, centered)."""
-    return create_app_icon(size)
+    return icon.resize((size, size), RESAMPLE)
 
 
-def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+# ── Density pipeline ──
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _load_master(path):
+    """Decode a master once per process"""
+    img = Image.open(path)
+    img.load()
+    return img
+
+
+def centered_crop_box(img, multiple=8):
+    """Smallest box around the visible pixels that keeps the image centre
+
+    Width and height are rounded up to `multiple` so every density scale
+    (x0.25 … x1) lands on whole pixels.
+    """
+    if img.mode != 'RGBA':
+        return (0, 0, img.width, img.height)
+    bbox = img.getchannel('A').getbbox()
+    if bbox is None:
+        return (0, 0, img.width, img.height)
+    cx, cy = img.width / 2, img.height / 2
+    half = multiple / 2
+
+    def extent(low, high, centre, limit):
+        reach = max(centre - low, high - centre)
+        reach = min(limit / 2, -(-reach // half) * half)
+        return int(centre - reach), int(centre + reach)
+
+    left, right = extent(bbox[0], bbox[2], cx, img.width)
+    top, bottom = extent(bbox[1], bbox[3], cy, img.height)
+    return (left, top, right, bottom)
+
+
+def encode_png(img):
+    """Smallest lossless PNG encoding of img
+
+    Returns: (png bytes, mode)
+    """
+    if img.mode == 'RGBA':
+        alpha = img.getchannel('A')
+        if alpha.getextrema() == (255, 255):
+            img = img.convert('RGB')
+        else:
+            # Colour under alpha 0 is invisible; clear it so it packs better
+            visible = alpha.point(lambda a: 255 if a else 0)
+            img = Image.composite(img, Image.new('RGBA', img.size), visible)
+    candidates = [img]
+    if img.getcolors(256) is not None:
+        palette = img.quantize(
+            colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE,
+        )
+        if ImageChops.difference(palette.convert(img.mode), img).getbbox() is None:
+            candidates.append(palette)
+
+    best = None
+    for candidate in candidates:
+        for options in ({'optimize': True}, {'compress_level': 9}):
+            buffer = io.BytesIO()
+            candidate.save(buffer, 'PNG', **options)
+            data = buffer.getvalue()
+            if best is None or len(data) < len(best[0]):
+                best = (data, candidate.mode)
+    return best
+
+
+def _target_size(master, dp, scale):
+    base = master.width / 4 if dp is None else dp
+    return max(1, round(base * scale))
+
 
-    # Main app icon
+def render_job(job):
+    """Process pool worker: resample one output from its master
+
+    Returns: (job, png bytes, output mode, (width, height))
+    """
+    master = _load_master(job['master'])
+    if job['crop']:
+        box = centered_crop_box(master)
+        source = master.crop(box)
+        base = master.width / 4 if job['dp'] is None else job['dp']
+        factor = base * job['scale'] / master.width
+        size = (max(1, round(source.width * factor)),
+                max(1, round(source.height * factor)))
+    else:
+        source = master
+        side = _target_size(master, job['dp'], job['scale'])
+        size = (side, side)
+
+    img = source if source.size == size else source.resize(size, RESAMPLE)
+    data, mode = encode_png(img)
+    return job, data, mode, size
+
+
+def plan_jobs(masters_dir=OUTPUT_DIR, res_dir=RES_DIR):
+    """One job per (asset, density); same-image outputs share a job"""
+    jobs = []
+    master_hashes = {}
+    for name, master_file, dp, outputs, crop in ASSETS:
+        master = os.path.join(masters_dir, master_file)
+        if master not in master_hashes:
+            with open(master, 'rb') as f:
+                master_hashes[master] = sha256_bytes(f.read())
+        for density, scale in DENSITIES:
+            spec = {
+                'asset': name, 'density': density, 'dp': dp, 'scale': scale,
+                'crop': crop, 'pipeline': PIPELINE_VERSION,
+            }
+            key = sha256_bytes(
+                (master_hashes[master] + json.dumps(spec, sort_keys=True)).encode()
+            )
+            jobs.append({
+                **spec,
+                'master': master,
+                'key': key,
+                'outputs': [
+                    os.path.join(res_dir, pattern.format(density=density))
+                    for pattern in outputs
+                ],
+            })
+    return jobs
+
+
+def _file_sha256(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return sha256_bytes(f.read())
+
+
+def _decoded_bytes(path):
+    """Bytes of the ARGB_8888 bitmap Android decodes for this PNG"""
+    with Image.open(path) as img:
+        return img.width * img.height * 4
+
+
+def build_assets(force=False, workers=None, lock_path=LOCK_PATH,
+                 masters_dir=OUTPUT_DIR, res_dir=RES_DIR):
+    """Render every stale output
+
+    Returns: [{path, asset, density, status, before, after, decodedBefore, decodedAfter}]
+    """
+    lock = {}
+    if os.path.exists(lock_path) and not force:
+        with open(lock_path, encoding='utf-8') as f:
+            lock = json.load(f)
+
+    report, stale = [], []
+    for job in plan_jobs(masters_dir, res_dir):
+        fresh = all(
+            lock.get(os.path.relpath(path, PROJECT_DIR), {}).get('key') == job['key']
+            and lock[os.path.relpath(path, PROJECT_DIR)]['sha256'] == _file_sha256(path)
+            for path in job['outputs']
+        )
+        if fresh:
+            for path in job['outputs']:
+                size = os.path.getsize(path)
+                report.append({
+                    'path': os.path.relpath(path, PROJECT_DIR),
+                    'asset': job['asset'], 'density': job['density'],
+                    'status': 'cached', 'before': size, 'after': size,
+                })
+        else:
+            stale.append(job)
+
+    if stale:
+        workers = min(workers or os.cpu_count() or 1, len(stale))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(render_job, stale))
+        else:
+            results = [render_job(job) for job in stale]
+
+        for job, data, mode, (width, height) in results:
+            for path in job['outputs']:
+                rel = os.path.relpath(path, PROJECT_DIR)
+                before = os.path.getsize(path) if os.path.exists(path) else None
+                decoded_before = _decoded_bytes(path) if before is not None else None
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                lock[rel] = {'key': job['key'], 'sha256': sha256_bytes(data)}
+                report.append({
+                    'path': rel, 'asset': job['asset'], 'density': job['density'],
+                    'status': 'rendered', 'mode': mode, 'before': before,
+                    'after': len(data), 'decodedBefore': decoded_before,
+                    'decodedAfter': width * height * 4,
+                })
+
+        with open(lock_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(dict(sorted(lock.items())), indent=2) + '\n')
+
+    report.sort(key=lambda entry: entry['path'])
+    return report
+
+
+def print_report(report, elapsed):
+    print(f'  {"asset":<58}{"status":>9}{"before":>10}{"after":>10}{"saved":>9}')
+    for entry in report:
+        before = entry['before']
+        saved = '' if before is None else f'{before - entry["after"]:,}'
+        print(
+            f'  {entry["path"]:<58}{entry["status"]:>9}'
+            f'{"-" if before is None else f"{before:,}":>10}'
+            f'{entry["after"]:>10,}{saved:>9}'
+        )
+    rendered = [e for e in report if e['status'] == 'rendered']
+    before = sum(e['before'] or 0 for e in rendered)
+    after = sum(e['after'] for e in rendered)
+    print(
+        f'{len(rendered)} rendered, {len(report) - len(rendered)} cached '
+        f'in {elapsed:.2f}s'
+    )
+    if rendered:
+        print(f'PNG bytes: {before:,} -> {after:,} ({before - after:,} saved)')
+    decoded = [e for e in rendered if e.get('decodedBefore')]
+    if decoded:
+        old = sum(e['decodedBefore'] for e in decoded)
+        new = sum(e['decodedAfter'] for e in decoded)
+        print(f'Decoded bitmaps: {old:,} -> {new:,} bytes')
+
+
+def draw_masters(out_dir):
+    """Render the placeholder burger once and derive the three masters"""
+    os.makedirs(out_dir, exist_ok=True)
     icon = create_app_icon(1024)
-    icon_path = os.path.join(OUTPUT_DIR, 'app_icon.png')
-    icon.save(icon_path, 'PNG')
-    print(f'Generated: {icon_path}')
-
-    # Adaptive foreground
-    fg = create_foreground(1024)
-    fg_path = os.path.join(OUTPUT_DIR, 'app_icon_foreground.png')
-    fg.save(fg_path, 'PNG')
-    print(f'Generated: {fg_path}')
-
-    # Splash icon
-    splash = create_splash_icon(512)
-    splash_path = os.path.join(OUTPUT_DIR, 'splash_icon.png')
-    splash.save(splash_path, 'PNG')
-    print(f'Generated: {splash_path}')
+    outputs = (
+        ('app_icon.png', icon),
+        ('app_icon_foreground.png', create_foreground(icon, 1024)),
+        ('splash_icon.png', create_splash_icon(icon, 512)),
+    )
+    for name, img in outputs:
+        path = os.path.join(out_dir, name)
+        with open(path, 'wb') as f:
+            f.write(encode_png(img)[0])
+        print(f'Generated: {path}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='App icon and splash assets')
+    sub = parser.add_subparsers(dest='command')
+    draw = sub.add_parser('draw', help='render placeholder masters')
+    draw.add_argument('--out', required=True, help='output directory for masters')
+    parser.add_argument('--force', action='store_true', help='ignore the lock file')
+    parser.add_argument('--workers', type=int, help='process count (default: CPUs)')
+    args = parser.parse_args()
+
+    if args.command == 'draw':
+        draw_masters(args.out)
+        return
+
+    started = time.perf_counter()
+    report = build_assets(force=args.force, workers=args.workers)
+    print_report(report, time.perf_counter() - started)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - DB Delta Generator
+
+gh-pages/data/menu_v*.db 중 이전 버전 각각에서 최신 버전으로 가는
+행 단위 delta(menus.id 기준 upsert/delete)를 생성하고
+manifest.json의 `deltas` 항목에 등록합니다.
+
+delta 적용 결과는 스키마 + rowid 순서대로 DB를 다시 만드는 방식이라
+최신 menu_vN.db와 바이트 단위로 동일합니다. 생성 시 모든 delta를
+실제로 적용해 검증하고, 전체 DB보다 크면 manifest에 올리지 않습니다.
+
+Usage:
+    python3 scripts/generate_delta.py                      # delta 생성 + manifest 갱신
+    python3 scripts/generate_delta.py apply BASE DELTA OUT # 참조 구현으로 delta 적용
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import struct
+import sys
+import tempfile
+
+from menu_source import insert_menus
+from seed_publish import is_publish_schema, write_publish_db
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+PAGES_DIR = os.path.join(PROJECT_DIR, 'gh-pages')
+DATA_DIR = os.path.join(PAGES_DIR, 'data')
+MANIFEST_PATH = os.path.join(PAGES_DIR, 'manifest.json')
+BASE_URL = 'https://sirdeath.github.io/burger-budget'
+
+DELTA_FORMAT = 1
+
+# SQLite 헤더의 SQLITE_VERSION_NUMBER 필드 (마지막으로 쓴 라이브러리 버전)
+_HEADER_VERSION_OFFSET = 96
+
+_DB_NAME = re.compile(r'^menu_v(\d+)\.db$')
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path):
+    with open(path, 'rb') as f:
+        return sha256_bytes(f.read())
+
+
+def published_versions(data_dir=DATA_DIR):
+    """[(version, path)] — 버전 오름차순"""
+    versions = []
+    for name in os.listdir(data_dir):
+        match = _DB_NAME.match(name)
+        if match:
+            versions.append((int(match.group(1)), os.path.join(data_dir, name)))
+    return sorted(versions)
+
+
+def read_snapshot(path):
+    """DB를 재구성하는 데 필요한 정보를 읽어옴
+
+    배포용 DB(--publish)는 menus VIEW 의 행을 menu_items rowid 와 함께 읽습니다.
+    Returns: {schema, columns, rows: {id: (rowid, *values)}, sqliteVersion, pageSize}
+    """
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        schema = [
+            row[0] for row in conn.execute(
+                'SELECT sql FROM sqlite_master WHERE sql IS NOT NULL '
+                'ORDER BY rowid'
+            )
+        ]
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(menus)')]
+        if is_publish_schema(schema):
+            select = (
+                f'SELECT i.rowid, {", ".join(f"m.{c}" for c in columns)} '
+                'FROM menu_items i JOIN menus m ON m.id = i.id'
+            )
+        else:
+            select = f'SELECT rowid, {", ".join(columns)} FROM menus'
+        rows = {row[1]: row for row in conn.execute(select)}
+        (page_size,) = conn.execute('PRAGMA page_size').fetchone()
+    finally:
+        conn.close()
+
+    with open(path, 'rb') as f:
+        header = f.read(100)
+    (sqlite_version,) = struct.unpack_from('>I', header, _HEADER_VERSION_OFFSET)
+
+    return {
+        'schema': schema,
+        'columns': columns,
+        'rows': rows,
+        'sqliteVersion': sqlite_version,
+        'pageSize': page_size,
+    }
+
+
+def build_delta(base, target, base_version, target_version, base_sha256):
+    """base → target delta
+
+    컬럼 구성이 다르면 base 행을 재사용할 수 없으므로 전체 행이 upsert 됩니다.
+    rowid가 바뀐 행도 upsert 대상입니다 (재구성 시 순서가 같아야 바이트 동일).
+    배포 빌드는 rowid를 이전 버전에서 물려받으므로(seed_publish.assign_rowids)
+    메뉴를 더하거나 빼도 그 행만 delta에 들어갑니다.
+    """
+    same_columns = base['columns'] == target['columns']
+    upserts = []
+    for key, row in target['rows'].items():
+        if not same_columns or base['rows'].get(key) != row:
+            upserts.append(list(row))
+    upserts.sort(key=lambda row: row[0])
+    deletes = sorted(key for key in base['rows'] if key not in target['rows'])
+
+    return {
+        'format': DELTA_FORMAT,
+        'from': base_version,
+        'to': target_version,
+        'baseSha256': base_sha256,
+        'sqliteVersion': target['sqliteVersion'],
+        'pageSize': target['pageSize'],
+        'schema': target['schema'],
+        'columns': target['columns'],
+        'upserts': upserts,
+        'deletes': deletes,
+    }
+
+
+def encode_delta(delta):
+    """결정적(deterministic) gzip JSON — 같은 delta는 항상 같은 바이트"""
+    payload = json.dumps(
+        delta, ensure_ascii=False, separators=(',', ':'),
+    ).encode('utf-8')
+    return gzip.compress(payload, compresslevel=9, mtime=0)
+
+
+def decode_delta(data):
+    return json.loads(gzip.decompress(data).decode('utf-8'))
+
+
+def _is_stat_table(stmt):
+    return stmt.startswith('CREATE TABLE sqlite_stat')
+
+
+def write_canonical_db(path, schema, columns, rows, sqlite_version=None,
+                       page_size=None):
+    """스키마 생성 → rowid 순 insert 로 DB를 재구성
+
+    generate_seed_db.py의 전체 재생성과 같은 순서·같은 배치 크기라서, 같은 행이면
+    같은 바이트가 나옵니다. sqlite_version이 주어지면 헤더의
+    라이브러리 버전 필드도 맞춰 줍니다. 스키마에 sqlite_stat1 이 있으면
+    생성기와 마찬가지로 insert 후 ANALYZE 로 다시 만듭니다.
+    배포용 스키마면 seed_publish.write_publish_db 로 같은 page size에 다시 만듭니다.
+    """
+    if os.path.exists(path):
+        os.remove(path)
+
+    if is_publish_schema(schema):
+        ordered = sorted(rows, key=lambda row: row[0])
+        write_publish_db(
+            path,
+            [dict(zip(columns, row[1:])) for row in ordered],
+            page_size=page_size,
+            schema=[stmt for stmt in schema if not _is_stat_table(stmt)],
+            rowids=[row[0] for row in ordered],
+        )
+        _patch_sqlite_version(path, sqlite_version)
+        return
+
+    analyze = any(_is_stat_table(stmt) for stmt in schema)
+    conn = sqlite3.connect(path)
+    try:
+        for stmt in schema:
+            if not _is_stat_table(stmt):
+                conn.execute(stmt)
+        insert_menus(
+            conn,
+            sorted(rows, key=lambda row: row[0]),
+            columns=('rowid', *columns),
+        )
+        if analyze:
+            conn.execute('ANALYZE')
+            conn.commit()
+    finally:
+        conn.close()
+
+    _patch_sqlite_version(path, sqlite_version)
+
+
+def _patch_sqlite_version(path, sqlite_version):
+    if sqlite_version is not None:
+        with open(path, 'r+b') as f:
+            f.seek(_HEADER_VERSION_OFFSET)
+            f.write(struct.pack('>I', sqlite_version))
+
+
+def apply_delta(base_path, delta, out_path):
+    """참조 applier: base DB + delta → out_path (최신 버전과 바이트 동일)"""
+    base_sha256 = sha256_file(base_path)
+    if base_sha256 != delta['baseSha256']:
+        raise ValueError(
+            f'Base mismatch: expected {delta["baseSha256"]}, got {base_sha256}'
+        )
+
+    base = read_snapshot(base_path)
+    rows = {}
+    if base['columns'] == delta['columns']:
+        rows.update(base['rows'])
+    for key in delta['deletes']:
+        rows.pop(key, None)
+    for row in delta['upserts']:
+        rows[row[1]] = tuple(row)
+
+    # 같은 rowid를 두 id가 차지하면 delta가 base와 맞지 않는 것
+    rowids = [row[0] for row in rows.values()]
+    if len(rowids) != len(set(rowids)):
+        raise ValueError('Delta does not apply cleanly: duplicate rowids')
+
+    write_canonical_db(
+        out_path,
+        delta['schema'],
+        delta['columns'],
+        rows.values(),
+        delta['sqliteVersion'],
+        delta.get('pageSize'),
+    )
+
+
+def generate_deltas(data_dir=DATA_DIR, manifest_path=MANIFEST_PATH):
+    versions = published_versions(data_dir)
+    if len(versions) < 2:
+        print('Nothing to do: fewer than two published versions')
+        return []
+
+    target_version, target_path = versions[-1]
+    target = read_snapshot(target_path)
+    with open(target_path, 'rb') as f:
+        target_bytes = f.read()
+    target_sha256 = sha256_bytes(target_bytes)
+
+    entries = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for base_version, base_path in versions[:-1]:
+            base_sha256 = sha256_file(base_path)
+            delta = build_delta(
+                read_snapshot(base_path), target,
+                base_version, target_version, base_sha256,
+            )
+            data = encode_delta(delta)
+
+            # 검증: 실제로 적용한 결과가 최신 DB와 바이트 단위로 같아야 함
+            out_path = os.path.join(tmp, f'v{base_version}.db')
+            apply_delta(base_path, decode_delta(data), out_path)
+            if sha256_file(out_path) != target_sha256:
+                raise RuntimeError(
+                    f'v{base_version} + delta != v{target_version} '
+                    '(published DB is not a canonical build)'
+                )
+
+            label = (
+                f'v{base_version} -> v{target_version}: '
+                f'{len(delta["upserts"])} upserts, '
+                f'{len(delta["deletes"])} deletes, {len(data)} bytes'
+            )
+            if len(data) >= len(target_bytes):
+                print(f'  {label} (skipped: not smaller than full DB)')
+                continue
+
+            name = f'menu_v{base_version}_v{target_version}.delta.gz'
+            with open(os.path.join(data_dir, name), 'wb') as f:
+                f.write(data)
+            print(f'  {label}')
+
+            entries.append({
+                'from': base_version,
+                'url': f'{BASE_URL}/data/{name}',
+                'sha256': sha256_bytes(data),
+                'sizeBytes': len(data),
+                'baseSha256': base_sha256,
+            })
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != target_version:
+            raise RuntimeError(
+                f'manifest.json is at v{manifest.get("version")}, '
+                f'expected v{target_version}'
+            )
+        manifest['deltas'] = entries
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(manifest, indent=2, ensure_ascii=False) + '\n')
+        print(f'Updated: {manifest_path}')
+
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Burger Budget DB delta generator')
+    sub = parser.add_subparsers(dest='command')
+    apply_parser = sub.add_parser('apply', help='delta를 base DB에 적용')
+    apply_parser.add_argument('base')
+    apply_parser.add_argument('delta')
+    apply_parser.add_argument('out')
+    args = parser.parse_args()
+
+    if args.command == 'apply':
+        with open(args.delta, 'rb') as f:
+            delta = decode_delta(f.read())
+        try:
+            apply_delta(args.base, delta, args.out)
+        except ValueError as e:
+            print(f'Error: {e}')
+            sys.exit(1)
+        print(f'Applied: v{delta["from"]} -> v{delta["to"]} ({args.out})')
+        print(f'  sha256: {sha256_file(args.out)}')
+        return
+
+    print(f'Generating deltas in {DATA_DIR}')
+    generate_deltas()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,615 +3,106 @@
 Burger Budget - Seed DB Generator
 
 5개 프랜차이즈(맥도날드, 버거킹, KFC, 맘스터치, 롯데리아)의
-메뉴 데이터를 SQLite DB로 생성합니다.
+메뉴 데이터(scripts/menu_data/*.csv, menu_source.py)를 SQLite DB로 생성합니다.
 
 Usage:
-    python3 scripts/generate_seed_db.py
+    python3 scripts/generate_seed_db.py                # 전체 재생성
+    python3 scripts/generate_seed_db.py --incremental  # 변경분만 반영
+    python3 scripts/generate_seed_db.py --combos       # combos 테이블 포함
+    python3 scripts/generate_seed_db.py --cache-brackets 55  # 추천 캐시 포함
+    python3 scripts/generate_seed_db.py --search-index # 메뉴명 검색 인덱스 포함
+    python3 scripts/generate_seed_db.py --price-history  # 배포 버전별 가격 이력 포함
+    python3 scripts/generate_seed_db.py --regions      # 지역·매장별 가격 override 포함
+    python3 scripts/generate_seed_db.py --menu-board   # 메뉴판 정렬 순위 테이블 포함
+    python3 scripts/generate_seed_db.py --affordability  # 예산별 선택지 수 곡선 포함
+    python3 scripts/generate_seed_db.py --item-keys    # 정수 메뉴 키 매핑 포함
+    python3 scripts/generate_seed_db.py --publish      # 배포용 압축 DB (lookup 테이블 + VIEW)
 """
 
+import argparse
 import os
 import sqlite3
+from collections import Counter
+
+from build_report import (
+    REPORT_PATH,
+    PhaseTimer,
+    collect_report,
+    diff_reports,
+    format_diff,
+    published_baseline,
+    write_report,
+)
+from generate_delta import published_versions, read_snapshot
+from item_keys import (
+    ITEM_FRANCHISE_COLUMNS,
+    ITEM_FRANCHISE_SCHEMA,
+    ITEM_KEY_COLUMNS,
+    ITEM_KEY_SCHEMA,
+    build_item_keys,
+)
+from menu_columns import COLUMNS_PATH, read_db_rows, write_columns
+from menu_source import (
+    MENU_COLUMNS,
+    insert_menus,
+    iter_menu_rows,
+    iter_region_overrides,
+    load_menus,
+)
+from seed_affordability import (
+    AFFORDABILITY_COLUMNS,
+    AFFORDABILITY_SCHEMA,
+    build_affordability,
+)
+from seed_board import BOARD_COLUMNS, BOARD_SCHEMA, build_menu_board
+from seed_cache import (
+    CACHE_COLUMNS,
+    CACHE_SCHEMA,
+    DEFAULT_CACHE_TOP_K,
+    build_recommendation_cache,
+    cache_budgets,
+)
+from price_history import (
+    PRICE_HISTORY_COLUMNS,
+    PRICE_HISTORY_SCHEMA,
+    build_price_history_rows,
+    read_versions,
+)
+from seed_checks import check_catalog, format_violations
+from seed_combos import COMBO_COLUMNS, COMBO_SCHEMA, build_combos
+from seed_publish import assign_rowids, write_publish_db
+from seed_query_plans import (
+    check_query_plans,
+    check_synthetic_plans,
+    format_failures,
+)
+from seed_regions import (
+    PRICE_OVERRIDE_COLUMNS,
+    PRICE_OVERRIDE_SCHEMA,
+    build_price_overrides,
+    region_counts,
+)
+from seed_search import (
+    FORM_COLUMNS,
+    GRAM_COLUMNS,
+    GRAM_SCHEMA,
+    SEARCH_SCHEMA,
+    build_search_forms,
+    build_search_grams,
+)
+from stable_ids import StableIds, format_report as format_stable_report
 
 # Output path
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 DB_PATH = os.path.join(PROJECT_DIR, 'assets', 'menu_seed.db')
 
-# ── Menu Data ────────────────────────────────────────────────
-# (id, franchise, name, type, price, price_delivery, price_updated_at,
-#  calories, imageUrl, tags, includes_side, includes_drink)
-#
-# Data source: .claude/price-collection/price-summary.md
-# price = 매장가격 (공식앱 매장주문 기준)
-# price_delivery = 배달가격 (None이면 배달 정보 없음)
-#   맥도날드/버거킹/KFC/롯데리아 → 공식앱 배달주문
-#   맘스터치 → 배달의민족(배민) (공식앱은 매장=배달 동일가)
-
-MENUS = [
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # McDonald's (mcd) — 2026-02-28 수집
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-    # ── mcd 버거 ──
-    ('mcd_burger_01', 'mcd', '더블 쿼터파운더 치즈 BBQ 베이컨', 'burger', 10500, 11400, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('mcd_burger_02', 'mcd', '쿼터파운더 치즈 BBQ 베이컨', 'burger', 8100, 9000, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('mcd_burger_03', 'mcd', '더블 쿼터파운더 치즈', 'burger', 7700, 8600, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('mcd_burger_04', 'mcd', '맥크리스피 디럭스 버거', 'burger', 6800, 7700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_burger_05', 'mcd', '맥크리스피 클래식 버거', 'burger', 5900, 6800, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_burger_06', 'mcd', '빅맥', 'burger', 5700, 6600, '2026-02-28', None, None, '시그니처,인기', 0, 0),
-    ('mcd_burger_07', 'mcd', '더블 불고기 버거', 'burger', 4700, 5600, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_burger_08', 'mcd', '쿼터파운더 치즈', 'burger', 5900, 6800, '2026-02-28', None, None, '시그니처', 0, 0),
-    ('mcd_burger_09', 'mcd', '맥스파이시 상하이 버거', 'burger', 5900, 6800, '2026-02-28', None, None, '시그니처,매운,인기', 0, 0),
-    ('mcd_burger_10', 'mcd', '토마토 치즈 비프 버거', 'burger', 4000, 4900, '2026-02-28', None, None, '가성비', 0, 0),
-    ('mcd_burger_11', 'mcd', '1955 버거', 'burger', 6700, 7600, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('mcd_burger_12', 'mcd', '맥치킨 모짜렐라', 'burger', 5000, 5900, '2026-02-28', None, None, '인기', 0, 0),
-    ('mcd_burger_13', 'mcd', '트리플 치즈버거', 'burger', 6100, 7000, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('mcd_burger_14', 'mcd', '맥치킨', 'burger', 3500, 4400, '2026-02-28', None, None, '가성비', 0, 0),
-    ('mcd_burger_15', 'mcd', '불고기 버거', 'burger', 3800, 4700, '2026-02-28', None, None, '가성비', 0, 0),
-    ('mcd_burger_16', 'mcd', '슈슈 버거', 'burger', 4700, 5600, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_burger_17', 'mcd', '슈비 버거', 'burger', 6200, 7100, '2026-02-28', None, None, '인기', 0, 0),
-    ('mcd_burger_18', 'mcd', '베이컨 토마토 디럭스', 'burger', 5800, 6700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_burger_19', 'mcd', '치즈버거', 'burger', 3200, 4100, '2026-02-28', None, None, '가성비', 0, 0),
-    ('mcd_burger_20', 'mcd', '더블 치즈버거', 'burger', 5000, 5900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_burger_21', 'mcd', '햄버거', 'burger', 2800, 3700, '2026-02-28', None, None, '가성비', 0, 0),
-
-    # ── mcd 세트 (버거 세트가격이 있는 것만) ──
-    ('mcd_set_01', 'mcd', '더블 쿼터파운더 치즈 BBQ 베이컨 세트', 'set', 11900, 13300, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('mcd_set_02', 'mcd', '쿼터파운더 치즈 BBQ 베이컨 세트', 'set', 9500, 10900, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('mcd_set_03', 'mcd', '더블 쿼터파운더 치즈 세트', 'set', 9600, 11000, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('mcd_set_04', 'mcd', '맥크리스피 디럭스 버거 세트', 'set', 8400, 9800, '2026-02-28', None, None, '', 1, 1),
-    ('mcd_set_05', 'mcd', '맥크리스피 클래식 버거 세트', 'set', 7400, 8800, '2026-02-28', None, None, '', 1, 1),
-    ('mcd_set_06', 'mcd', '빅맥 세트', 'set', 7600, 9000, '2026-02-28', None, None, '시그니처,인기', 1, 1),
-    ('mcd_set_07', 'mcd', '더블 불고기 버거 세트', 'set', 6800, 8200, '2026-02-28', None, None, '', 1, 1),
-    ('mcd_set_08', 'mcd', '쿼터파운더 치즈 세트', 'set', 7900, 9300, '2026-02-28', None, None, '시그니처', 1, 1),
-    ('mcd_set_09', 'mcd', '맥스파이시 상하이 버거 세트', 'set', 7700, 9100, '2026-02-28', None, None, '시그니처,매운,인기', 1, 1),
-    ('mcd_set_10', 'mcd', '토마토 치즈 비프 버거 세트', 'set', 5600, 7000, '2026-02-28', None, None, '가성비', 1, 1),
-    ('mcd_set_11', 'mcd', '1955 버거 세트', 'set', 8400, 9800, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('mcd_set_12', 'mcd', '맥치킨 모짜렐라 세트', 'set', 7300, 8700, '2026-02-28', None, None, '인기', 1, 1),
-    ('mcd_set_13', 'mcd', '트리플 치즈버거 세트', 'set', 7500, 8900, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('mcd_set_14', 'mcd', '맥치킨 세트', 'set', 5600, 7000, '2026-02-28', None, None, '가성비', 1, 1),
-    ('mcd_set_15', 'mcd', '불고기 버거 세트', 'set', 5500, 6900, '2026-02-28', None, None, '가성비', 1, 1),
-    ('mcd_set_16', 'mcd', '슈슈 버거 세트', 'set', 6000, 7400, '2026-02-28', None, None, '', 1, 1),
-    ('mcd_set_17', 'mcd', '슈비 버거 세트', 'set', 8500, 9900, '2026-02-28', None, None, '인기', 1, 1),
-    ('mcd_set_18', 'mcd', '베이컨 토마토 디럭스 세트', 'set', 8000, 9400, '2026-02-28', None, None, '', 1, 1),
-    ('mcd_set_19', 'mcd', '치즈버거 세트', 'set', 5000, 6400, '2026-02-28', None, None, '가성비', 1, 1),
-    ('mcd_set_20', 'mcd', '더블 치즈버거 세트', 'set', 6300, 7700, '2026-02-28', None, None, '', 1, 1),
-    # 햄버거: 매장 세트 '-' → 세트 없음
-
-    # ── mcd 사이드 ──
-    ('mcd_side_01', 'mcd', '맥윙 2조각', 'side', 3700, 4600, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_02', 'mcd', '맥윙 4조각', 'side', 6900, 7800, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_03', 'mcd', '맥윙 8조각', 'side', 13000, 13900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_04', 'mcd', '맥너겟 6조각', 'side', 4100, 5000, '2026-02-28', None, None, '인기', 0, 0),
-    ('mcd_side_05', 'mcd', '맥너겟 4조각', 'side', 2000, 3700, '2026-02-28', None, None, '가성비', 0, 0),
-    ('mcd_side_06', 'mcd', '해피 스낵 고구마 후라이', 'side', 2700, 3600, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_07', 'mcd', '해피 스낵 창녕 갈릭 비프 스낵랩', 'side', 3000, 3900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_08', 'mcd', '상하이 치킨 스낵랩', 'side', 3500, 4400, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_09', 'mcd', '후렌치 후라이 - 미디엄', 'side', 2600, 3500, '2026-02-28', None, None, '인기', 0, 0),
-    ('mcd_side_10', 'mcd', '코울슬로', 'side', 2000, 2900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_11', 'mcd', '골든 모짜렐라 치즈스틱 4조각', 'side', 4500, 5400, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_12', 'mcd', '골든 모짜렐라 치즈스틱 2조각', 'side', 2800, 3700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_side_13', 'mcd', '맥스파이시 치킨텐더 2조각', 'side', 2700, 3600, '2026-02-28', None, None, '매운', 0, 0),
-    # 소스류 제외 (스위트 앤 사워 소스, 스위트 칠리 소스, 케이준 소스, 핫케익 시럽 추가)
-
-    # ── mcd 음료 ──
-    # 해피 스낵 아이스 드립 커피: 매장전용, 배달에 대응 없음 → 제외
-    ('mcd_drink_01', 'mcd', '아이스 드립 커피 - 미디엄', 'drink', 3200, 3200, '2026-02-28', None, None, '', 0, 0),  # 배달전용: price=배달가
-    ('mcd_drink_02', 'mcd', '아이스 드립 커피 - 라지', 'drink', 3600, 3600, '2026-02-28', None, None, '', 0, 0),  # 배달전용: price=배달가
-    ('mcd_drink_03', 'mcd', '코카 콜라 제로 - 미디엄', 'drink', 2000, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_04', 'mcd', '코카-콜라 - 미디엄', 'drink', 2000, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_05', 'mcd', '스프라이트 - 미디엄', 'drink', 2000, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_06', 'mcd', '환타 - 미디엄', 'drink', 2000, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_07', 'mcd', '망고 피치 아이스티 - 미디엄', 'drink', 3400, 4200, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_08', 'mcd', '피치 아이스티 - 미디엄', 'drink', 3100, 3900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_09', 'mcd', '바닐라 쉐이크 - 미디엄', 'drink', 2500, 3600, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_10', 'mcd', '딸기 쉐이크 - 미디엄', 'drink', 2800, 3600, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_11', 'mcd', '초코 쉐이크 - 미디엄', 'drink', 2800, 3600, '2026-02-28', None, None, '', 0, 0),
-    # 생수 제외
-    ('mcd_drink_12', 'mcd', '아이스 바닐라 라떼 - 미디엄', 'drink', 3900, 4700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_13', 'mcd', '아이스 아메리카노 - 미디엄', 'drink', 2700, 3500, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_14', 'mcd', '아이스 카페라떼 - 미디엄', 'drink', 3400, 4200, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_15', 'mcd', '드립 커피 - 미디엄', 'drink', 2400, 3200, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_16', 'mcd', '바닐라 라떼 - 미디엄', 'drink', 3900, 4700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_17', 'mcd', '아메리카노 - 미디엄', 'drink', 2700, 3500, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_18', 'mcd', '카페라떼 - 미디엄', 'drink', 3400, 4200, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_19', 'mcd', '카푸치노 - 미디엄', 'drink', 3400, 4200, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_20', 'mcd', '디카페인 아이스 바닐라 라떼 - 미디엄', 'drink', 4100, 4900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_21', 'mcd', '디카페인 아이스 아메리카노 - 미디엄', 'drink', 2900, 3700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_22', 'mcd', '디카페인 아이스 카페라떼 - 미디엄', 'drink', 3600, 4400, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_23', 'mcd', '디카페인 바닐라 라떼 - 미디엄', 'drink', 4100, 4900, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_24', 'mcd', '디카페인 아메리카노 - 미디엄', 'drink', 2900, 3700, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_25', 'mcd', '디카페인 카페라떼 - 미디엄', 'drink', 3600, 4400, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_drink_26', 'mcd', '디카페인 카푸치노 - 미디엄', 'drink', 3600, 4400, '2026-02-28', None, None, '', 0, 0),
-
-    # ── mcd 디저트 ──
-    ('mcd_dessert_01', 'mcd', '해피 스낵 한입 초코 츄러스 3조각', 'dessert', 2500, 3300, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_02', 'mcd', '베리 스트로베리 맥플러리', 'dessert', 3600, 4400, '2026-02-28', None, None, '인기', 0, 0),
-    ('mcd_dessert_03', 'mcd', '오레오 맥플러리', 'dessert', 3600, 4400, '2026-02-28', None, None, '인기', 0, 0),
-    ('mcd_dessert_04', 'mcd', '딸기 오레오 맥플러리', 'dessert', 3600, None, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_05', 'mcd', '초코 오레오 맥플러리', 'dessert', 3600, None, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_06', 'mcd', '바닐라 선데이 아이스크림', 'dessert', 2200, None, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_07', 'mcd', '초코 선데이 아이스크림', 'dessert', 2400, None, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_08', 'mcd', '딸기 선데이 아이스크림', 'dessert', 2400, None, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_09', 'mcd', '스트로베리콘', 'dessert', 1900, None, '2026-02-28', None, None, '', 0, 0),
-    ('mcd_dessert_10', 'mcd', '아이스크림콘', 'dessert', 1500, None, '2026-02-28', None, None, '가성비', 0, 0),
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # Burger King (bk) — 2026-03-01 수집
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-    # ── bk 버거 ──
-    ('bk_burger_01', 'bk', '더오치 맥시멈 원파운더', 'burger', 16900, 17900, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('bk_burger_02', 'bk', '더오치 맥시멈3', 'burger', 13900, 14900, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('bk_burger_03', 'bk', '베이비 버거', 'burger', 10900, 12000, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_04', 'bk', '더오치 맥시멈2', 'burger', 10500, 11500, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('bk_burger_05', 'bk', '콰트로X콰트로 큐브스테이크', 'burger', 10500, 11600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_06', 'bk', '터프페퍼 큐브스테이크', 'burger', 10500, 11600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_07', 'bk', '오리지널스 이탈리안 살사베르데', 'burger', 10500, 11400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_08', 'bk', '오리지널스 뉴욕 스테이크', 'burger', 10500, 11400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_09', 'bk', '몬스터와퍼', 'burger', 9600, 10600, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('bk_burger_10', 'bk', '콰트로페퍼 큐브스테이크 와퍼', 'burger', 9500, 10600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_11', 'bk', '베이컨치즈와퍼', 'burger', 9200, 10200, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('bk_burger_12', 'bk', '콰트로치즈와퍼', 'burger', 8200, 9200, '2026-03-01', None, None, '시그니처,프리미엄', 0, 0),
-    ('bk_burger_13', 'bk', '통새우와퍼', 'burger', 8200, 9200, '2026-03-01', None, None, '인기', 0, 0),
-    ('bk_burger_14', 'bk', '치즈와퍼', 'burger', 8000, 9000, '2026-03-01', None, None, '인기', 0, 0),
-    ('bk_burger_15', 'bk', '갈릭불고기와퍼', 'burger', 7700, 8700, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_16', 'bk', '치킨킹BLT', 'burger', 7700, 8800, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_17', 'bk', '와퍼', 'burger', 7400, 8400, '2026-03-01', None, None, '시그니처,인기', 0, 0),
-    ('bk_burger_18', 'bk', '불고기와퍼', 'burger', 7400, 8400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_19', 'bk', '더 크리스퍼 베이컨&치즈', 'burger', 6700, 7700, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_20', 'bk', '치킨킹', 'burger', 6700, 7800, '2026-03-01', None, None, '인기', 0, 0),
-    ('bk_burger_21', 'bk', '통새우슈림프버거', 'burger', 6300, 7300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_22', 'bk', '더 크리스퍼', 'burger', 5700, 6700, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_23', 'bk', '콰트로치즈 와퍼주니어', 'burger', 5600, 6600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_24', 'bk', '통새우와퍼주니어', 'burger', 5600, 6600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_25', 'bk', '더블비프불고기버거', 'burger', 5300, 6300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_26', 'bk', '치즈와퍼주니어', 'burger', 5300, 6300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_27', 'bk', '몬스터 주니어', 'burger', 5200, 6200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_burger_28', 'bk', '와퍼주니어', 'burger', 5000, 6000, '2026-03-01', None, None, '가성비', 0, 0),
-    ('bk_burger_29', 'bk', '불고기와퍼주니어', 'burger', 5000, 6000, '2026-03-01', None, None, '가성비', 0, 0),
-    ('bk_burger_30', 'bk', '비프불고기버거', 'burger', 4300, 5300, '2026-03-01', None, None, '가성비', 0, 0),
-    ('bk_burger_31', 'bk', '치킨 치즈 마요 버거', 'burger', 4200, 5200, '2026-03-01', None, None, '가성비', 0, 0),
-    ('bk_burger_32', 'bk', '치킨버거', 'burger', 4000, 5000, '2026-03-01', None, None, '가성비', 0, 0),
-    ('bk_burger_33', 'bk', '치즈버거', 'burger', 3800, 4800, '2026-03-01', None, None, '가성비', 0, 0),
-
-    # ── bk 세트 ──
-    ('bk_set_01', 'bk', '더오치 맥시멈 원파운더 세트', 'set', 18900, 20400, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('bk_set_02', 'bk', '더오치 맥시멈3 세트', 'set', 15900, 17400, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('bk_set_03', 'bk', '베이비 버거 세트', 'set', 13900, 15500, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_04', 'bk', '더오치 맥시멈2 세트', 'set', 12500, 14000, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('bk_set_05', 'bk', '콰트로X콰트로 큐브스테이크 세트', 'set', 12700, 14300, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_06', 'bk', '터프페퍼 큐브스테이크 세트', 'set', 12700, 14300, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_07', 'bk', '오리지널스 이탈리안 살사베르데 세트', 'set', 12500, 13900, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_08', 'bk', '오리지널스 뉴욕 스테이크 세트', 'set', 12500, 13900, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_09', 'bk', '몬스터와퍼 세트', 'set', 11300, 12800, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('bk_set_10', 'bk', '콰트로페퍼 큐브스테이크 와퍼 세트', 'set', 11700, 13300, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_11', 'bk', '베이컨치즈와퍼 세트', 'set', 11400, 12900, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('bk_set_12', 'bk', '콰트로치즈와퍼 세트', 'set', 10400, 11900, '2026-03-01', None, None, '시그니처,프리미엄', 1, 1),
-    ('bk_set_13', 'bk', '통새우와퍼 세트', 'set', 10400, 11900, '2026-03-01', None, None, '인기', 1, 1),
-    ('bk_set_14', 'bk', '치즈와퍼 세트', 'set', 10200, 11700, '2026-03-01', None, None, '인기', 1, 1),
-    ('bk_set_15', 'bk', '갈릭불고기와퍼 세트', 'set', 9900, 11400, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_16', 'bk', '치킨킹BLT 세트', 'set', 9900, 11500, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_17', 'bk', '와퍼 세트', 'set', 9600, 11100, '2026-03-01', None, None, '시그니처,인기', 1, 1),
-    ('bk_set_18', 'bk', '불고기와퍼 세트', 'set', 9600, 11100, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_19', 'bk', '더 크리스퍼 베이컨&치즈 세트', 'set', 8900, 10400, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_20', 'bk', '치킨킹 세트', 'set', 8900, 10500, '2026-03-01', None, None, '인기', 1, 1),
-    ('bk_set_21', 'bk', '통새우슈림프버거 세트', 'set', 8000, 9500, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_22', 'bk', '더 크리스퍼 세트', 'set', 7900, 9400, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_23', 'bk', '콰트로치즈 와퍼주니어 세트', 'set', 7800, 9300, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_24', 'bk', '통새우와퍼주니어 세트', 'set', 7800, 9300, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_25', 'bk', '더블비프불고기버거 세트', 'set', 7000, 8500, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_26', 'bk', '치즈와퍼주니어 세트', 'set', 7500, 9000, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_27', 'bk', '몬스터 주니어 세트', 'set', 6900, 8400, '2026-03-01', None, None, '', 1, 1),
-    ('bk_set_28', 'bk', '와퍼주니어 세트', 'set', 7200, 8700, '2026-03-01', None, None, '가성비', 1, 1),
-    ('bk_set_29', 'bk', '불고기와퍼주니어 세트', 'set', 7200, 8700, '2026-03-01', None, None, '가성비', 1, 1),
-    ('bk_set_30', 'bk', '비프불고기버거 세트', 'set', 6000, 7500, '2026-03-01', None, None, '가성비', 1, 1),
-    ('bk_set_31', 'bk', '치킨 치즈 마요 버거 세트', 'set', 5900, 7400, '2026-03-01', None, None, '가성비', 1, 1),
-    ('bk_set_32', 'bk', '치킨버거 세트', 'set', 5700, 7200, '2026-03-01', None, None, '가성비', 1, 1),
-    ('bk_set_33', 'bk', '치즈버거 세트', 'set', 6000, 7500, '2026-03-01', None, None, '가성비', 1, 1),
-
-    # ── bk 사이드 ──
-    ('bk_side_01', 'bk', '바삭킹 8조각+스위트칠리소스', 'side', 11600, 13900, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_02', 'bk', '바삭킹 8조각+디아블로소스', 'side', 11600, 13900, '2026-03-01', None, None, '매운', 0, 0),
-    ('bk_side_03', 'bk', '코코넛슈림프 9조각+스위트칠리소스', 'side', 10100, 11100, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_04', 'bk', '코코넛슈림프 6조각+스위트칠리소스', 'side', 7200, 8200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_05', 'bk', '바삭킹 4조각', 'side', 6000, 7500, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_06', 'bk', '너겟킹 10조각', 'side', 5600, 6600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_07', 'bk', '너겟킹 8조각', 'side', 4500, 5500, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_08', 'bk', '리얼 어니언링(L)', 'side', 4200, 5200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_09', 'bk', '코코넛슈림프 3조각+스위트칠리소스', 'side', 4100, 5100, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_10', 'bk', '크리스퍼 랩', 'side', 3600, 4600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_11', 'bk', '크리스퍼 텐더', 'side', 3300, 4300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_12', 'bk', '터프페퍼 치즈프라이', 'side', 3200, 4200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_13', 'bk', '바삭킹 2조각', 'side', 3200, 4400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_14', 'bk', '리얼 어니언링(R)', 'side', 2800, 3800, '2026-03-01', None, None, '인기', 0, 0),
-    ('bk_side_15', 'bk', '프렌치프라이(L)', 'side', 2800, 3800, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_16', 'bk', '21치즈스틱', 'side', 2600, 3600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_17', 'bk', '쉐이킹프라이 구운갈릭', 'side', 2600, 3600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_18', 'bk', '쉐이킹프라이 매콤치즈', 'side', 2600, 3600, '2026-03-01', None, None, '매운', 0, 0),
-    ('bk_side_19', 'bk', '쉐이킹프라이 스윗어니언', 'side', 2600, 3600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_20', 'bk', '너겟킹 4조각', 'side', 2300, 3300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_21', 'bk', '프렌치프라이(R)', 'side', 2300, 3300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_22', 'bk', '콘샐러드', 'side', 2300, 3300, '2026-03-01', None, None, '', 0, 0),
-    ('bk_side_23', 'bk', '코울슬로', 'side', 2300, 3300, '2026-03-01', None, None, '', 0, 0),
-
-    # ── bk 음료 ──
-    ('bk_drink_01', 'bk', '핫초코', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_02', 'bk', '아이스초코', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_03', 'bk', '코카콜라(L)', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_04', 'bk', '코카콜라 제로(L)', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_05', 'bk', '스프라이트(L)', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_06', 'bk', '스프라이트 제로(L)', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_07', 'bk', '닥터페퍼 제로(L)', 'drink', 2400, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_08', 'bk', '코카콜라(R)', 'drink', 2200, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_09', 'bk', '코카콜라 제로(R)', 'drink', 2200, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_10', 'bk', '스프라이트(R)', 'drink', 2200, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_11', 'bk', '스프라이트 제로(R)', 'drink', 2200, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_12', 'bk', '닥터페퍼 제로(R)', 'drink', 2200, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_13', 'bk', '아메리카노', 'drink', 1600, 2600, '2026-03-01', None, None, '', 0, 0),
-    ('bk_drink_14', 'bk', '아이스아메리카노', 'drink', 1600, 2600, '2026-03-01', None, None, '', 0, 0),
-    # 순수(미네랄워터) 제외
-    ('bk_drink_15', 'bk', '캔콜라(245ml)', 'drink', 2300, 2300, '2026-03-01', None, None, '', 0, 0),  # 배달전용: price=배달가
-    # 소스 & 시즈닝 전체 제외
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # KFC (kfc) — 2026-02-28 수집
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-    # ── kfc 버거 ──
-    ('kfc_burger_01', 'kfc', '칠리징거통다리', 'burger', 6700, 7000, '2026-02-28', None, None, '매운', 0, 0),
-    ('kfc_burger_02', 'kfc', '클래식징거통다리', 'burger', 6400, 6700, '2026-02-28', None, None, '인기', 0, 0),
-    ('kfc_burger_03', 'kfc', '징거', 'burger', 5900, 6200, '2026-02-28', None, None, '시그니처,인기', 0, 0),
-    ('kfc_burger_04', 'kfc', '징거더블다운통다리', 'burger', 9000, 9300, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('kfc_burger_05', 'kfc', '치즈징거통다리', 'burger', 7100, 7400, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_burger_06', 'kfc', '징거BLT', 'burger', 7100, 7400, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_burger_07', 'kfc', '징거타워', 'burger', 6900, 7200, '2026-02-28', None, None, '시그니처,인기', 0, 0),
-    ('kfc_burger_08', 'kfc', '더블커넬오리지널', 'burger', 6800, 7100, '2026-02-28', None, None, '', 0, 0),
-    # 켄치밥 단품 → type='burger'
-    ('kfc_burger_09', 'kfc', '투움바켄치밥', 'burger', 5900, 6200, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_burger_10', 'kfc', '갓양념켄치밥', 'burger', 4900, 5200, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_burger_11', 'kfc', '트위스터', 'burger', 4200, 4500, '2026-02-28', None, None, '가성비', 0, 0),
-
-    # ── kfc 세트 (버거 세트) ──
-    ('kfc_set_01', 'kfc', '칠리징거통다리 세트', 'set', 8700, 9200, '2026-02-28', None, None, '매운', 1, 1),
-    ('kfc_set_02', 'kfc', '클래식징거통다리 세트', 'set', 8400, 8900, '2026-02-28', None, None, '인기', 1, 1),
-    ('kfc_set_03', 'kfc', '징거 세트', 'set', 7900, 8400, '2026-02-28', None, None, '시그니처,인기', 1, 1),
-    ('kfc_set_04', 'kfc', '징거더블다운통다리 세트', 'set', 11000, 11500, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('kfc_set_05', 'kfc', '치즈징거통다리 세트', 'set', 9100, 9600, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_06', 'kfc', '징거BLT 세트', 'set', 9100, 9600, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_07', 'kfc', '징거타워 세트', 'set', 8900, 9400, '2026-02-28', None, None, '시그니처,인기', 1, 1),
-    ('kfc_set_08', 'kfc', '더블커넬오리지널 세트', 'set', 8800, 9300, '2026-02-28', None, None, '', 1, 1),
-
-    # ── kfc 박스 (type='set', includes_side=1, includes_drink=1) ──
-    ('kfc_set_09', 'kfc', '칠리징거통다리 박스', 'set', 10600, 11300, '2026-02-28', None, None, '매운', 1, 1),
-    ('kfc_set_10', 'kfc', '클래식징거통다리 박스', 'set', 10300, 11000, '2026-02-28', None, None, '인기', 1, 1),
-    ('kfc_set_11', 'kfc', '징거 박스', 'set', 9800, 10500, '2026-02-28', None, None, '시그니처,인기', 1, 1),
-    ('kfc_set_12', 'kfc', '징거더블다운통다리 박스', 'set', 12900, 13600, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('kfc_set_13', 'kfc', '치즈징거통다리 박스', 'set', 11000, 11700, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_14', 'kfc', '징거BLT 박스', 'set', 11000, 11700, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_15', 'kfc', '징거타워 박스', 'set', 10800, 11500, '2026-02-28', None, None, '시그니처,인기', 1, 1),
-    ('kfc_set_16', 'kfc', '더블커넬오리지널 박스', 'set', 10700, 11400, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_17', 'kfc', '최현석 CHEFS PACK', 'set', 13900, 14900, '2026-02-28', None, None, '프리미엄', 1, 1),
-    ('kfc_set_18', 'kfc', '최현석 CHEFS BOX', 'set', 10900, 11600, '2026-02-28', None, None, '프리미엄', 1, 1),
-
-    # ── kfc 켄치밥 세트/콤보 ──
-    ('kfc_set_19', 'kfc', '투움바켄치밥세트', 'set', 7900, 8400, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_20', 'kfc', '투움바켄치밥콤보', 'set', 6900, 7400, '2026-02-28', None, None, '', 0, 1),
-    ('kfc_set_21', 'kfc', '갓양념켄치밥세트', 'set', 6900, 7400, '2026-02-28', None, None, '', 1, 1),
-    ('kfc_set_22', 'kfc', '갓양념켄치밥콤보', 'set', 5900, 6400, '2026-02-28', None, None, '', 0, 1),
-    ('kfc_set_23', 'kfc', '트위스터세트', 'set', 6200, 6700, '2026-02-28', None, None, '가성비', 1, 1),
-    ('kfc_set_24', 'kfc', '해쉬통다리세트', 'set', 4500, 4800, '2026-02-28', None, None, '', 1, 1),
-
-    # ── kfc 치킨 (type='side') ──
-    # 갓양념치킨
-    ('kfc_side_01', 'kfc', '갓양념치킨 8조각', 'side', 25400, 26200, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_02', 'kfc', '갓양념치킨 5조각', 'side', 16700, 17200, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_03', 'kfc', '갓양념치킨 3조각', 'side', 10200, 10500, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_04', 'kfc', '갓양념치킨 1조각', 'side', 3500, 3600, '2026-02-28', None, None, '인기', 0, 0),
-    # 오리지널치킨
-    ('kfc_side_05', 'kfc', '오리지널치킨 8조각', 'side', 23800, 24600, '2026-02-28', None, None, '시그니처', 0, 0),
-    ('kfc_side_06', 'kfc', '오리지널치킨 5조각', 'side', 15700, 16200, '2026-02-28', None, None, '시그니처', 0, 0),
-    ('kfc_side_07', 'kfc', '오리지널치킨 3조각', 'side', 9600, 9900, '2026-02-28', None, None, '시그니처', 0, 0),
-    ('kfc_side_08', 'kfc', '오리지널치킨 1조각', 'side', 3300, 3400, '2026-02-28', None, None, '시그니처', 0, 0),
-    # 트러플치르르통다리
-    ('kfc_side_09', 'kfc', '트러플치르르통다리 8조각', 'side', 26200, 27000, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('kfc_side_10', 'kfc', '트러플치르르통다리 5조각', 'side', 17200, 17700, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('kfc_side_11', 'kfc', '트러플치르르통다리 3조각', 'side', 10500, 10800, '2026-02-28', None, None, '프리미엄', 0, 0),
-    ('kfc_side_12', 'kfc', '트러플치르르통다리 1조각', 'side', 3600, 3700, '2026-02-28', None, None, '프리미엄', 0, 0),
-    # 핫크리스피통다리
-    ('kfc_side_13', 'kfc', '핫크리스피통다리 8조각', 'side', 24600, 25400, '2026-02-28', None, None, '매운', 0, 0),
-    ('kfc_side_14', 'kfc', '핫크리스피통다리 5조각', 'side', 16200, 16700, '2026-02-28', None, None, '매운', 0, 0),
-    ('kfc_side_15', 'kfc', '핫크리스피통다리 3조각', 'side', 9900, 10200, '2026-02-28', None, None, '매운', 0, 0),
-    ('kfc_side_16', 'kfc', '핫크리스피통다리 1조각', 'side', 3400, 3500, '2026-02-28', None, None, '매운', 0, 0),
-    # 갓양념통다리
-    ('kfc_side_17', 'kfc', '갓양념통다리 8조각', 'side', 26200, 27000, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_18', 'kfc', '갓양념통다리 5조각', 'side', 17200, 17700, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_19', 'kfc', '갓양념통다리 3조각', 'side', 10500, 10800, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_20', 'kfc', '갓양념통다리 1조각', 'side', 3600, 3700, '2026-02-28', None, None, '', 0, 0),
-    # 복버켓
-    ('kfc_side_21', 'kfc', '복버켓', 'side', 15900, 16900, '2026-02-28', None, None, '', 0, 0),
-    # 핫크리스피치킨
-    ('kfc_side_22', 'kfc', '핫크리스피치킨 5조각', 'side', 15700, 16200, '2026-02-28', None, None, '매운,인기', 0, 0),
-    ('kfc_side_23', 'kfc', '핫크리스피치킨 3조각', 'side', 9600, 9900, '2026-02-28', None, None, '매운,인기', 0, 0),
-    ('kfc_side_24', 'kfc', '핫크리스피치킨 1조각', 'side', 3300, 3400, '2026-02-28', None, None, '매운,인기', 0, 0),
-
-    # ── kfc 사이드 ──
-    ('kfc_side_25', 'kfc', '텐더 4조각', 'side', 5900, 6000, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_26', 'kfc', '텐더 2조각', 'side', 3200, 3300, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_27', 'kfc', '매쉬포테이토 그레이비', 'side', 2900, 3000, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_28', 'kfc', '버터비스켓', 'side', 2600, 2700, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_29', 'kfc', '너겟 8조각', 'side', 4800, 5000, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_30', 'kfc', '너겟 4조각', 'side', 2600, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_31', 'kfc', '트러플치르르프라이', 'side', 2500, 2700, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_32', 'kfc', '프렌치프라이L', 'side', 2800, 3000, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_33', 'kfc', '프렌치프라이M', 'side', 2300, 2500, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_34', 'kfc', '에그타르트', 'side', 2300, 2400, '2026-02-28', None, None, '인기', 0, 0),
-    ('kfc_side_35', 'kfc', '코울슬로', 'side', 2100, 2300, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_36', 'kfc', '해쉬브라운', 'side', 1500, 1700, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_side_37', 'kfc', '버터갈릭라이스', 'side', 2500, 2800, '2026-02-28', None, None, '', 0, 0),
-    # 소스류 제외 (갓양념소스, 스모키머스타드소스, 그레이비소스, 스위트칠리소스, 파이어칠리소스, 스파이시마요소스, 살사소스, 딸기잼)
-
-    # ── kfc 음료 ──
-    ('kfc_drink_01', 'kfc', '탄산음료(L)', 'drink', 2400, 2700, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_02', 'kfc', '탄산음료(M)', 'drink', 2200, 2500, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_03', 'kfc', '페트콜라 500mL', 'drink', 2800, 3100, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_04', 'kfc', '캔콜라 245mL', 'drink', 2200, 2500, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_05', 'kfc', '아이스아메리카노(L)', 'drink', 2500, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_06', 'kfc', '아메리카노(M)', 'drink', 1900, 2200, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_07', 'kfc', '아이스아메리카노(M)', 'drink', 1900, 2200, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_08', 'kfc', '오렌지주스', 'drink', 2300, 2600, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_09', 'kfc', '아이스초코', 'drink', 2500, 2800, '2026-02-28', None, None, '', 0, 0),
-    ('kfc_drink_10', 'kfc', '핫초코', 'drink', 2500, 2800, '2026-02-28', None, None, '', 0, 0),
-    # 생수 제외
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # Mom's Touch (mom) — 2026-03-01 수집
-    # 배달가격 출처: 배달의민족 (공식앱은 매장=배달 동일가)
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-    # ── mom 버거 ──
-    ('mom_burger_01', 'mom', '슈퍼싸이더블Kick', 'burger', 9200, 10200, '2026-03-01', None, None, '프리미엄,매운', 0, 0),
-    ('mom_burger_02', 'mom', '싸이플렉스버거', 'burger', 8900, 9900, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_burger_03', 'mom', '쉬림프싸이플렉스버거', 'burger', 8200, 9200, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_04', 'mom', '에드워드 리 싸이버거', 'burger', 8100, 9100, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_burger_05', 'mom', '에드워드 리 K 싸이버거', 'burger', 7800, 8800, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_burger_06', 'mom', '아라비아따치즈버거', 'burger', 7700, 8700, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_burger_07', 'mom', '불불불불싸이버거', 'burger', 7100, 8100, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_burger_08', 'mom', '텍사스바베큐치킨버거', 'burger', 6900, 7900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_09', 'mom', '새우불고기버거', 'burger', 6600, 7600, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_10', 'mom', '언빌리버블버거', 'burger', 6500, 7500, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_11', 'mom', '인크레더블버거', 'burger', 6300, 7300, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_12', 'mom', '트리플딥치즈싸이버거', 'burger', 6000, 7000, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_13', 'mom', '불대박직화불고기버거', 'burger', 5800, None, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_14', 'mom', '디럭스불고기버거', 'burger', 5800, 6800, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_15', 'mom', '화이트갈릭싸이버거', 'burger', 5800, 6800, '2026-03-01', None, None, '인기', 0, 0),
-    ('mom_burger_16', 'mom', '딥치즈싸이버거', 'burger', 5700, 6700, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_17', 'mom', '대박직화불고기버거', 'burger', 5600, None, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_18', 'mom', '와우스모크디럭스버거', 'burger', 5600, None, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_19', 'mom', '화이트갈릭버거', 'burger', 5500, 6500, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_20', 'mom', '불싸이버거', 'burger', 5400, 6400, '2026-03-01', None, None, '시그니처,매운,인기', 0, 0),
-    ('mom_burger_21', 'mom', '딥치즈버거', 'burger', 5400, 6400, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_22', 'mom', '싸이버거', 'burger', 5200, 6200, '2026-03-01', None, None, '시그니처,인기,가성비', 0, 0),
-    ('mom_burger_23', 'mom', '할라피뇨통살버거', 'burger', 5100, None, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_burger_24', 'mom', '휠렛버거', 'burger', 5000, 6000, '2026-03-01', None, None, '', 0, 0),
-    ('mom_burger_25', 'mom', '불고기버거', 'burger', 4200, 5200, '2026-03-01', None, None, '가성비', 0, 0),
-    ('mom_burger_26', 'mom', '통새우버거', 'burger', 4100, 5100, '2026-03-01', None, None, '가성비', 0, 0),
-
-    # ── mom 세트 ──
-    ('mom_set_01', 'mom', '슈퍼싸이더블Kick 세트', 'set', 11700, 13200, '2026-03-01', None, None, '프리미엄,매운', 1, 1),
-    ('mom_set_02', 'mom', '싸이플렉스버거 세트', 'set', 11400, 12900, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('mom_set_03', 'mom', '쉬림프싸이플렉스버거 세트', 'set', 10700, 12200, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_04', 'mom', '에드워드 리 싸이버거 세트', 'set', 10600, 12100, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('mom_set_05', 'mom', '에드워드 리 K 싸이버거 세트', 'set', 10300, 11800, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('mom_set_06', 'mom', '아라비아따치즈버거 세트', 'set', 10200, 11700, '2026-03-01', None, None, '매운', 1, 1),
-    ('mom_set_07', 'mom', '불불불불싸이버거 세트', 'set', 9600, 11100, '2026-03-01', None, None, '매운', 1, 1),
-    ('mom_set_08', 'mom', '텍사스바베큐치킨버거 세트', 'set', 9400, 10900, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_09', 'mom', '새우불고기버거 세트', 'set', 9100, 10600, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_10', 'mom', '언빌리버블버거 세트', 'set', 9000, 10500, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_11', 'mom', '인크레더블버거 세트', 'set', 8800, 10300, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_12', 'mom', '트리플딥치즈싸이버거 세트', 'set', 8500, 10000, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_13', 'mom', '불대박직화불고기버거 세트', 'set', 8300, None, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_14', 'mom', '디럭스불고기버거 세트', 'set', 8300, 9800, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_15', 'mom', '화이트갈릭싸이버거 세트', 'set', 8300, 9800, '2026-03-01', None, None, '인기', 1, 1),
-    ('mom_set_16', 'mom', '딥치즈싸이버거 세트', 'set', 8200, 9700, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_17', 'mom', '대박직화불고기버거 세트', 'set', 8100, None, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_18', 'mom', '와우스모크디럭스버거 세트', 'set', 8100, None, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_19', 'mom', '화이트갈릭버거 세트', 'set', 8000, 9500, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_20', 'mom', '불싸이버거 세트', 'set', 7900, 9400, '2026-03-01', None, None, '시그니처,매운,인기', 1, 1),
-    ('mom_set_21', 'mom', '딥치즈버거 세트', 'set', 7900, 9400, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_22', 'mom', '싸이버거 세트', 'set', 7700, 9200, '2026-03-01', None, None, '시그니처,인기,가성비', 1, 1),
-    ('mom_set_23', 'mom', '할라피뇨통살버거 세트', 'set', 7500, None, '2026-03-01', None, None, '매운', 1, 1),
-    ('mom_set_24', 'mom', '휠렛버거 세트', 'set', 7500, 9000, '2026-03-01', None, None, '', 1, 1),
-    ('mom_set_25', 'mom', '불고기버거 세트', 'set', 6700, 8200, '2026-03-01', None, None, '가성비', 1, 1),
-    ('mom_set_26', 'mom', '통새우버거 세트', 'set', 6600, 8100, '2026-03-01', None, None, '가성비', 1, 1),
-
-    # ── mom 치킨 (type='side') ──
-    ('mom_side_01', 'mom', '에드워드 리 치킨 한마리', 'side', 21500, 24500, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_side_02', 'mom', '핫치즈치킨 한마리', 'side', 20500, 23500, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_03', 'mom', '맘스양념치킨 한마리', 'side', 19900, 22900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_04', 'mom', '간장마늘치킨 한마리', 'side', 19900, 22900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_05', 'mom', '반반치킨(후라이드+양념1종)', 'side', 18900, 21900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_06', 'mom', '후라이드치킨 한마리', 'side', 17900, 20900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_07', 'mom', '에드워드 리 치킨 반마리', 'side', 11900, 13900, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_side_08', 'mom', '핫치즈치킨 반마리', 'side', 11400, 13400, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_09', 'mom', '맘스양념치킨 반마리', 'side', 10900, 12900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_10', 'mom', '간장마늘치킨 반마리', 'side', 10900, 12900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_11', 'mom', '후라이드치킨 반마리', 'side', 9900, 11900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_12', 'mom', '후라이드통다리 1조각', 'side', 5000, 6000, '2026-03-01', None, None, '', 0, 0),
-
-    # ── mom 순살 (type='side', 레귤러 사이즈) ──
-    ('mom_side_13', 'mom', '에드워드 리 크림디종 와우순살', 'side', 14900, 17900, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_side_14', 'mom', '핫치즈와우순살', 'side', 14700, 16700, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_15', 'mom', '칠리콘와우순살', 'side', 14700, 16700, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_16', 'mom', '골든갈릭와우순살', 'side', 14700, 16700, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_17', 'mom', '특제간장와우순살', 'side', 14700, 16700, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_18', 'mom', '후라이드와우순살', 'side', 12100, 14100, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_19', 'mom', '에드워드 리 빅싸이순살', 'side', 14900, 17900, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('mom_side_20', 'mom', '핫치즈빅싸이순살', 'side', 14500, 17500, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_21', 'mom', '맘스양념빅싸이순살', 'side', 13900, 16900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_22', 'mom', '간장마늘빅싸이순살', 'side', 13900, 16900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_23', 'mom', '후라이드빅싸이순살', 'side', 11900, 14900, '2026-03-01', None, None, '', 0, 0),
-
-    # ── mom 떡강정 (type='side', S 사이즈) ──
-    ('mom_side_24', 'mom', '간장마늘떡강정', 'side', 4500, 5600, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_25', 'mom', '치파오떡강정', 'side', 4500, 5600, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_26', 'mom', '케이준떡강정', 'side', 4300, 5400, '2026-03-01', None, None, '', 0, 0),
-
-    # ── mom 사이드 ──
-    ('mom_side_27', 'mom', '치킨치즈스틱 2조각', 'side', 4300, 5500, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_28', 'mom', '바삭크림치즈볼 4조각', 'side', 3800, 4800, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_29', 'mom', '케이준양념감자(대)', 'side', 3600, 4600, '2026-03-01', None, None, '인기', 0, 0),
-    ('mom_side_30', 'mom', '매콤김떡만', 'side', 3600, 4400, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_31', 'mom', '갈릭김떡만', 'side', 3600, 4400, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_32', 'mom', '미트칠리감자', 'side', 3300, 4500, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_33', 'mom', '치즈감자', 'side', 2900, 3700, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_34', 'mom', '팝콘볼(오리지널)', 'side', 2700, 3800, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_35', 'mom', '팝콘볼(고구마치즈)', 'side', 2700, 3800, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_36', 'mom', '할라피뇨너겟 10조각', 'side', 4600, 5600, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_37', 'mom', '할라피뇨너겟 4조각', 'side', 2100, 2900, '2026-03-01', None, None, '매운', 0, 0),
-    ('mom_side_38', 'mom', '바삭크림치즈볼 2조각', 'side', 2100, 2900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_39', 'mom', '케이준양념감자(중)', 'side', 2100, 2900, '2026-03-01', None, None, '인기', 0, 0),
-    ('mom_side_40', 'mom', '치즈스틱 2조각', 'side', 2100, 2900, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_41', 'mom', '코올슬로', 'side', 1900, 2700, '2026-03-01', None, None, '', 0, 0),
-    ('mom_side_42', 'mom', '콘샐러드', 'side', 1900, 2700, '2026-03-01', None, None, '', 0, 0),
-    # 소스류 제외 (버번소스 2000원은 소스, 맘스양념소스, 랜치소스, 매콤치즈마요소스, 치킨무, 딥스모크소스, 고메버터시즈닝)
-
-    # ── mom 음료 ──
-    ('mom_drink_01', 'mom', '펩시콜라(1.25L)', 'drink', 2500, 3000, '2026-03-01', None, None, '', 0, 0),
-    ('mom_drink_02', 'mom', '아메리카노(ICE)', 'drink', 2000, None, '2026-03-01', None, None, '', 0, 0),
-    ('mom_drink_03', 'mom', '아메리카노(HOT)', 'drink', 1500, None, '2026-03-01', None, None, '', 0, 0),
-    ('mom_drink_04', 'mom', '펩시콜라', 'drink', 2400, 2400, '2026-03-01', None, None, '', 0, 0),  # 배달전용: price=배달가
-    ('mom_drink_05', 'mom', '펩시콜라제로', 'drink', 2400, 2400, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    ('mom_drink_06', 'mom', '사이다', 'drink', 2400, 2400, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    ('mom_drink_07', 'mom', '청포도에이드', 'drink', 3000, 3000, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    ('mom_drink_08', 'mom', '레몬에이드', 'drink', 3000, 3000, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    ('mom_drink_09', 'mom', '오렌지주스', 'drink', 2800, 2800, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    # 배민 전용 세트 제외 (싱글세트, 커플세트, 패밀리세트 등 다인분 번들)
-
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    # Lotteria (lot) — 2026-03-01 수집
-    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-    # ── lot 버거 ──
-    ('lot_burger_01', 'lot', '더블 한우불고기버거', 'burger', 13000, 13800, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('lot_burger_02', 'lot', '모짜렐라버거 토마토바질', 'burger', 9100, 9900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_03', 'lot', '모짜렐라버거 발사믹바질', 'burger', 9100, 9900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_04', 'lot', '한우불고기버거', 'burger', 9000, 9800, '2026-03-01', None, None, '프리미엄', 0, 0),
-    ('lot_burger_05', 'lot', '모짜렐라 인 더 버거 베이컨', 'burger', 8000, 8800, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_06', 'lot', '리아 불고기 더블(빅불)', 'burger', 7600, 8400, '2026-03-01', None, None, '인기', 0, 0),
-    ('lot_burger_07', 'lot', '전주 비빔라이스 버거', 'burger', 7300, 8100, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_08', 'lot', 'NEW 더블 미라클버거', 'burger', 7200, 8000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_09', 'lot', '더블엑스투버거', 'burger', 7200, 8000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_10', 'lot', '더블 클래식치즈버거', 'burger', 7200, 8000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_11', 'lot', '통다리 크리스피치킨버거(그릭랜치)', 'burger', 6900, 7700, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_12', 'lot', '통다리 크리스피치킨버거(파이어핫)', 'burger', 6900, 7700, '2026-03-01', None, None, '매운', 0, 0),
-    ('lot_burger_13', 'lot', '핫크리스피치킨버거', 'burger', 6200, 7000, '2026-03-01', None, None, '매운', 0, 0),
-    ('lot_burger_14', 'lot', '리아 새우 베이컨', 'burger', 6100, 6900, '2026-03-01', None, None, '인기', 0, 0),
-    ('lot_burger_15', 'lot', '리아 불고기 베이컨', 'burger', 6100, 6900, '2026-03-01', None, None, '인기', 0, 0),
-    ('lot_burger_16', 'lot', '리아 사각새우 더블', 'burger', 6100, 6900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_17', 'lot', '더블 치킨버거', 'burger', 5800, 6600, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_18', 'lot', 'NEW 미라클버거', 'burger', 5700, 6500, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_19', 'lot', '클래식치즈버거', 'burger', 5500, 6300, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_20', 'lot', '리아 불고기', 'burger', 5000, 5800, '2026-03-01', None, None, '시그니처,인기', 0, 0),
-    ('lot_burger_21', 'lot', '리아 새우', 'burger', 5000, 5800, '2026-03-01', None, None, '시그니처,인기', 0, 0),
-    ('lot_burger_22', 'lot', '더블 데리버거', 'burger', 5000, 5800, '2026-03-01', None, None, '', 0, 0),
-    ('lot_burger_23', 'lot', '치킨버거', 'burger', 4300, 5100, '2026-03-01', None, None, '가성비', 0, 0),
-    ('lot_burger_24', 'lot', '데리버거', 'burger', 3700, 4500, '2026-03-01', None, None, '가성비', 0, 0),
-    ('lot_burger_25', 'lot', '베이컨에그번', 'burger', 4400, 4400, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    ('lot_burger_26', 'lot', '에그샐러드번', 'burger', 4300, 4300, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-
-    # ── lot 세트 ──
-    ('lot_set_01', 'lot', '더블 한우불고기버거 세트', 'set', 14900, 16200, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('lot_set_02', 'lot', '모짜렐라버거 토마토바질 세트', 'set', 11200, 12500, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_03', 'lot', '모짜렐라버거 발사믹바질 세트', 'set', 11200, 12500, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_04', 'lot', '한우불고기버거 세트', 'set', 10900, 12200, '2026-03-01', None, None, '프리미엄', 1, 1),
-    ('lot_set_05', 'lot', '모짜렐라 인 더 버거 베이컨 세트', 'set', 10000, 11300, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_06', 'lot', '리아 불고기 더블(빅불) 세트', 'set', 9600, 10900, '2026-03-01', None, None, '인기', 1, 1),
-    ('lot_set_07', 'lot', '전주 비빔라이스 버거 세트', 'set', 9200, 10500, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_08', 'lot', 'NEW 더블 미라클버거 세트', 'set', 9200, 10500, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_09', 'lot', '더블엑스투버거 세트', 'set', 9200, 10500, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_10', 'lot', '더블 클래식치즈버거 세트', 'set', 9200, 10500, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_11', 'lot', '통다리 크리스피치킨버거(그릭랜치) 세트', 'set', 8900, 10200, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_12', 'lot', '통다리 크리스피치킨버거(파이어핫) 세트', 'set', 8900, 10200, '2026-03-01', None, None, '매운', 1, 1),
-    ('lot_set_13', 'lot', '핫크리스피치킨버거 세트', 'set', 8300, 9600, '2026-03-01', None, None, '매운', 1, 1),
-    ('lot_set_14', 'lot', '리아 새우 베이컨 세트', 'set', 8300, 9600, '2026-03-01', None, None, '인기', 1, 1),
-    ('lot_set_15', 'lot', '리아 불고기 베이컨 세트', 'set', 8300, 9600, '2026-03-01', None, None, '인기', 1, 1),
-    ('lot_set_16', 'lot', '리아 사각새우 더블 세트', 'set', 8300, 9600, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_17', 'lot', '더블 치킨버거 세트', 'set', 8000, 9300, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_18', 'lot', 'NEW 미라클버거 세트', 'set', 7900, 9200, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_19', 'lot', '클래식치즈버거 세트', 'set', 7700, 9000, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_20', 'lot', '리아 불고기 세트', 'set', 7300, 8600, '2026-03-01', None, None, '시그니처,인기', 1, 1),
-    ('lot_set_21', 'lot', '리아 새우 세트', 'set', 7300, 8600, '2026-03-01', None, None, '시그니처,인기', 1, 1),
-    ('lot_set_22', 'lot', '더블 데리버거 세트', 'set', 7300, 8600, '2026-03-01', None, None, '', 1, 1),
-    ('lot_set_23', 'lot', '치킨버거 세트', 'set', 6700, 8000, '2026-03-01', None, None, '가성비', 1, 1),
-    ('lot_set_24', 'lot', '데리버거 세트', 'set', 6100, 7400, '2026-03-01', None, None, '가성비', 1, 1),
-    ('lot_set_25', 'lot', '베이컨에그번 콤보', 'set', 5500, 5500, '2026-03-01', None, None, '', 1, 1),  # 배달전용
-    ('lot_set_26', 'lot', '에그샐러드번 콤보', 'set', 5400, 5400, '2026-03-01', None, None, '', 1, 1),  # 배달전용
-
-    # ── lot 치킨 (type='side') ──
-    ('lot_side_01', 'lot', '화이어윙 4조각', 'side', 5500, 6300, '2026-03-01', None, None, '매운', 0, 0),
-    ('lot_side_02', 'lot', '치킨휠레 4조각', 'side', 5300, 6100, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_03', 'lot', '화이어윙 2조각', 'side', 3200, 4000, '2026-03-01', None, None, '매운', 0, 0),
-    ('lot_side_04', 'lot', '치킨휠레 2조각', 'side', 3100, 3900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_05', 'lot', '치킨다리 1조각', 'side', 2900, 3700, '2026-03-01', None, None, '', 0, 0),
-
-    # ── lot 사이드 ──
-    ('lot_side_06', 'lot', '지파이 NEW 하바네로 (L)', 'side', 5500, 6300, '2026-03-01', None, None, '매운', 0, 0),
-    ('lot_side_07', 'lot', '지파이 고소한맛 (S)', 'side', 4500, 5300, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_08', 'lot', '양념너겟', 'side', 3300, 4100, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_09', 'lot', 'NEW 치킨너겟', 'side', 3100, 3900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_10', 'lot', '통오징어링', 'side', 2800, 3600, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_11', 'lot', '치즈스틱', 'side', 2800, 3600, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_12', 'lot', '양념감자', 'side', 2600, 3400, '2026-03-01', None, None, '인기', 0, 0),
-    ('lot_side_13', 'lot', '포테이토 (L)', 'side', 2500, 3300, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_14', 'lot', '롱치즈스틱', 'side', 2400, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_15', 'lot', '포테이토 (R)', 'side', 2000, 2800, '2026-03-01', None, None, '', 0, 0),
-    ('lot_side_16', 'lot', '코올슬로', 'side', 1900, 2700, '2026-03-01', None, None, '', 0, 0),
-
-    # ── lot 음료 ──
-    ('lot_drink_01', 'lot', '아이스카페라떼 (살균우유)', 'drink', 3300, 4000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_02', 'lot', '카페라떼 (살균우유)', 'drink', 3300, 4000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_03', 'lot', '레몬에이드 (L)', 'drink', 3000, 3700, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_04', 'lot', '아이스아메리카노 (L)', 'drink', 3000, 3700, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_05', 'lot', '레몬에이드 (R)', 'drink', 2700, 3400, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_06', 'lot', '아이스티 (L)', 'drink', 2600, 3300, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_07', 'lot', '아메리카노', 'drink', 2500, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_08', 'lot', '아이스아메리카노 (R)', 'drink', 2500, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_09', 'lot', '오렌지주스 (PET)', 'drink', 2500, 3200, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_10', 'lot', '아이스티 (R)', 'drink', 2300, 3000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_11', 'lot', '캐모마일 티', 'drink', 2200, 2900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_12', 'lot', '펩시콜라 (L)', 'drink', 2200, 2900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_13', 'lot', '사이다 (L)', 'drink', 2200, 2900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_14', 'lot', '제로슈거콜라 (L)', 'drink', 2200, 2900, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_15', 'lot', '펩시콜라 (R)', 'drink', 2000, 2700, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_16', 'lot', '사이다 (R)', 'drink', 2000, 2700, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_17', 'lot', '제로슈거콜라 (R)', 'drink', 2000, 2700, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_18', 'lot', '허쉬 핫초코', 'drink', 2500, None, '2026-03-01', None, None, '', 0, 0),
-    ('lot_drink_19', 'lot', 'PET 콜라', 'drink', 3500, 3500, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-    ('lot_drink_20', 'lot', 'PET 사이다', 'drink', 3500, 3500, '2026-03-01', None, None, '', 0, 0),  # 배달전용
-
-    # ── lot 디저트 ──
-    ('lot_dessert_01', 'lot', '토네이도 망고젤리', 'dessert', 3200, 4000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_02', 'lot', '토네이도 더블초코', 'dessert', 3200, 4000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_03', 'lot', '토네이도 초코쿠키', 'dessert', 3200, 4000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_04', 'lot', '토네이도 스트로베리', 'dessert', 3200, 4000, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_05', 'lot', '선데 허쉬초코', 'dessert', 2300, None, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_06', 'lot', '선데아이스크림 스트로베리', 'dessert', 2300, None, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_07', 'lot', '선데아이스크림 플레인', 'dessert', 2100, None, '2026-03-01', None, None, '', 0, 0),
-    ('lot_dessert_08', 'lot', '소프트콘', 'dessert', 1300, None, '2026-03-01', None, None, '가성비', 0, 0),
-]
-
-
-def generate_db():
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
-
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+# ── Schema ───────────────────────────────────────────────────
+# 문자열은 sqlite_master에 그대로 저장되므로 공백까지 유지합니다.
+# (증분 모드가 기존 DB 스키마와 비교할 때 사용)
 
-    cursor.execute('''
+SCHEMA = [
+    '''
         CREATE TABLE menus (
             id            TEXT PRIMARY KEY,
             franchise     TEXT NOT NULL,
@@ -626,62 +117,547 @@ def generate_db():
             includes_side INTEGER NOT NULL DEFAULT 0,
             includes_drink INTEGER NOT NULL DEFAULT 0
         )
-    ''')
-
-    cursor.execute('''
-        CREATE INDEX idx_menus_franchise ON menus(franchise)
-    ''')
-
-    cursor.execute('''
-        CREATE INDEX idx_menus_price ON menus(price)
-    ''')
+    ''',
+    # 인덱스는 seed_query_plans.QUERY_SHAPES 의 쿼리에 맞춰 둡니다.
+    # 프랜차이즈 목록 쿼리는 프랜차이즈마다 UNION ALL 가지로 나뉘므로 franchise 가
+    # 앞에 와야 가지별로 가격 순서대로 읽고 정렬 없이 합칠 수 있습니다.
+    '''
+        CREATE INDEX idx_menus_franchise_price ON menus(franchise, price DESC)
+    ''',
+    '''
+        CREATE INDEX idx_menus_franchise_price_delivery ON menus(franchise, price_delivery DESC)
+        WHERE price_delivery IS NOT NULL
+    ''',
+    '''
+        CREATE INDEX idx_menus_franchise_name ON menus(franchise, name)
+    ''',
+]
 
-    cursor.execute('''
-        CREATE INDEX idx_menus_name ON menus(name)
-    ''')
 
+def _derived_tables(menu_rows, combos=False, cache_brackets=0,
+                    cache_top_k=DEFAULT_CACHE_TOP_K, search_index=False,
+                    price_history=False, regions=False, menu_board=False,
+                    affordability=False, item_keys=False, id_mapping=None):
+    """옵션으로 켠 파생 테이블 목록: [(schema, table, columns, rows)]"""
+    menus = [dict(zip(MENU_COLUMNS, row)) for row in menu_rows]
+    tables = []
+    if combos:
+        tables.append((COMBO_SCHEMA, 'combos', COMBO_COLUMNS, build_combos(menus)))
+    if cache_brackets:
+        tables.append((
+            CACHE_SCHEMA,
+            'recommendation_cache',
+            CACHE_COLUMNS,
+            build_recommendation_cache(menus, cache_brackets, cache_top_k),
+        ))
+    if search_index:
+        forms = build_search_forms(menus)
+        tables.append((SEARCH_SCHEMA, 'menu_search_forms', FORM_COLUMNS, forms))
+        tables.append((
+            GRAM_SCHEMA, 'menu_search_grams', GRAM_COLUMNS, build_search_grams(forms),
+        ))
+    if price_history:
+        tables.append((
+            PRICE_HISTORY_SCHEMA,
+            'price_history',
+            PRICE_HISTORY_COLUMNS,
+            build_price_history_rows(read_versions(), menus),
+        ))
+    if regions:
+        tables.append((
+            PRICE_OVERRIDE_SCHEMA,
+            'price_overrides',
+            PRICE_OVERRIDE_COLUMNS,
+            build_price_overrides(menus, iter_region_overrides(), id_mapping),
+        ))
+    if menu_board:
+        tables.append((
+            BOARD_SCHEMA, 'menu_board', BOARD_COLUMNS, build_menu_board(menus),
+        ))
+    if affordability:
+        tables.append((
+            AFFORDABILITY_SCHEMA,
+            'affordability',
+            AFFORDABILITY_COLUMNS,
+            build_affordability(menus),
+        ))
+    if item_keys:
+        franchise_rows, key_rows = build_item_keys(menus)
+        tables.append((
+            ITEM_FRANCHISE_SCHEMA, 'item_franchises', ITEM_FRANCHISE_COLUMNS,
+            franchise_rows,
+        ))
+        tables.append((ITEM_KEY_SCHEMA, 'item_keys', ITEM_KEY_COLUMNS, key_rows))
+    return tables
+
+
+def _schema_matches(cursor, schema):
+    """기존 DB의 스키마가 schema와 동일한지 확인"""
+    cursor.execute(
+        'SELECT name, sql FROM sqlite_master WHERE sql IS NOT NULL ORDER BY rowid'
+    )
+    entries = cursor.fetchall()
+    # FTS5 등 가상 테이블이 자동으로 만드는 shadow 테이블은 비교에서 제외
+    virtual = [
+        name for name, sql in entries
+        if sql.upper().startswith('CREATE VIRTUAL TABLE')
+    ]
+    # ANALYZE 가 만드는 sqlite_stat* 도 스키마 정의가 아니므로 제외
+    existing = [
+        sql.strip() for name, sql in entries
+        if not any(name.startswith(f'{v}_') for v in virtual)
+        and not name.startswith('sqlite_stat')
+    ]
+    return existing == [stmt.strip() for stmt in schema]
+
+
+def _insert_rows(cursor, table, columns, rows):
+    placeholders = ', '.join('?' * len(columns))
     cursor.executemany(
-        'INSERT INTO menus (id, franchise, name, type, price, price_delivery, price_updated_at, '
-        'calories, imageUrl, tags, includes_side, includes_drink) '
-        'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
-        MENUS,
+        f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({placeholders})',
+        rows,
     )
 
-    conn.commit()
 
-    # ── Summary ──
-    cursor.execute('SELECT COUNT(*) FROM menus')
-    total = cursor.fetchone()[0]
+def _create_db(derived, menu_rows, timer):
+    """DB를 삭제 후 처음부터 생성
 
-    cursor.execute(
-        'SELECT franchise, COUNT(*) FROM menus GROUP BY franchise ORDER BY franchise'
-    )
-    by_franchise = cursor.fetchall()
+    menu_rows 는 리스트여도, 소스 파일 스트림이어도 됩니다 (배치 단위 insert).
+    인덱스는 스키마와 함께 만들어 insert 중에 채웁니다 (정규 재구성과 같은 순서).
+    """
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
 
-    cursor.execute(
-        'SELECT type, COUNT(*) FROM menus GROUP BY type ORDER BY type'
-    )
-    by_type = cursor.fetchall()
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
 
-    cursor.execute(
-        'SELECT COUNT(*) FROM menus WHERE price_delivery IS NOT NULL'
+    with timer.phase('schema'):
+        for stmt in SCHEMA:
+            cursor.execute(stmt)
+        for schema, _, _, _ in derived:
+            for stmt in schema:
+                cursor.execute(stmt)
+
+    with timer.phase('insert'):
+        insert_menus(conn, menu_rows)
+        for _, table, columns, rows in derived:
+            _insert_rows(cursor, table, columns, rows)
+        conn.commit()
+
+    with timer.phase('analyze'):
+        conn.execute('ANALYZE')
+        conn.commit()
+    return conn
+
+
+def _sync_db(conn, derived, menu_rows, timer):
+    """메뉴 소스와 기존 DB를 비교해 변경분만 단일 트랜잭션으로 반영
+
+    menus는 행 단위로 insert/update/delete 하고, 파생 테이블은 내용이
+    달라졌을 때만 통째로 교체합니다. 변경이 없으면 쓰기를 전혀 하지
+    않으므로 파일(SHA-256)이 그대로 유지됩니다. 반영한 뒤에는 ANALYZE 로
+    sqlite_stat1 을 다시 만듭니다.
+    Returns: (inserted, updated, deleted, 교체된 파생 테이블 이름 목록)
+    """
+    cursor = conn.cursor()
+    cursor.execute(f'SELECT {", ".join(MENU_COLUMNS)} FROM menus')
+    existing = {row[0]: row for row in cursor.fetchall()}
+    desired = {row[0]: row for row in menu_rows}
+
+    inserts = [row for key, row in desired.items() if key not in existing]
+    updates = [
+        row for key, row in desired.items()
+        if key in existing and existing[key] != row
+    ]
+    deletes = [(key,) for key in existing if key not in desired]
+
+    replaced = []
+    for _, table, columns, rows in derived:
+        cursor.execute(f'SELECT {", ".join(columns)} FROM {table}')
+        if Counter(cursor.fetchall()) != Counter(tuple(row) for row in rows):
+            replaced.append((table, columns, rows))
+
+    if not (inserts or updates or deletes or replaced):
+        return 0, 0, 0, []
+
+    assignments = ', '.join(f'{col} = ?' for col in MENU_COLUMNS[1:])
+    with timer.phase('sync'), conn:
+        conn.executemany('DELETE FROM menus WHERE id = ?', deletes)
+        conn.executemany(
+            f'UPDATE menus SET {assignments} WHERE id = ?',
+            [row[1:] + row[:1] for row in updates],
+        )
+        _insert_rows(conn, 'menus', MENU_COLUMNS, inserts)
+        for table, columns, rows in replaced:
+            conn.execute(f'DELETE FROM {table}')
+            _insert_rows(conn, table, columns, rows)
+    with timer.phase('analyze'):
+        conn.execute('ANALYZE')
+        conn.commit()
+    return (
+        len(inserts), len(updates), len(deletes),
+        [table for table, _, _ in replaced],
     )
-    with_delivery = cursor.fetchone()[0]
+
+
+def _previous_rowids():
+    """마지막 배포 DB의 {id: rowid} — 배포본이 없으면 빈 dict"""
+    versions = published_versions()
+    if not versions:
+        return {}
+    rows = read_snapshot(versions[-1][1])['rows']
+    return {key: row[0] for key, row in rows.items()}
+
+
+def _publish_db(menu_rows, timer):
+    """배포용 DB 생성 (seed_publish.py) 후 menus VIEW 가 소스와 같은지 확인
+
+    menu_items rowid 는 마지막 배포 DB에서 물려받아 delta가 바뀐 행만 담게 합니다.
+    Returns: (선택한 page size, {page size: 파일 크기})
+    """
+    menus = [dict(zip(MENU_COLUMNS, row)) for row in menu_rows]
+    rowids = assign_rowids([m['id'] for m in menus], _previous_rowids())
+    page_size, sizes = write_publish_db(DB_PATH, menus, timer=timer, rowids=rowids)
+
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        view_rows = conn.execute(
+            f'SELECT {", ".join(MENU_COLUMNS)} FROM menus ORDER BY id'
+        ).fetchall()
+    finally:
+        conn.close()
+    if view_rows != sorted(menu_rows, key=lambda row: row[0]):
+        raise RuntimeError('Publish DB: menus view does not match menu sources')
+    return page_size, sizes
+
+
+def generate_db(incremental=False, combos=False, cache_brackets=0,
+                cache_top_k=DEFAULT_CACHE_TOP_K, search_index=False,
+                price_history=False, regions=False, menu_board=False,
+                affordability=False, item_keys=False, publish=False,
+                stable_ids=True, report_path=REPORT_PATH, columns_path=COLUMNS_PATH):
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    timer = PhaseTimer()
+    options = {
+        'incremental': incremental, 'combos': combos,
+        'cacheBrackets': cache_brackets, 'cacheTopK': cache_top_k,
+        'searchIndex': search_index, 'priceHistory': price_history,
+        'regions': regions, 'menuBoard': menu_board,
+        'affordability': affordability, 'itemKeys': item_keys,
+        'publish': publish,
+        'stableIds': stable_ids,
+    }
+
+    # 전체 목록이 필요한 경우(증분 비교, 파생 테이블, 배포본)만 메모리에 올리고
+    # 기본 전체 재생성은 소스 파일을 스트리밍으로 insert 합니다.
+    streaming = not (incremental or publish or combos or cache_brackets
+                     or search_index or price_history or regions or menu_board
+                     or affordability or item_keys)
+    with timer.phase('load'):
+        menu_rows = None if streaming else load_menus()
+
+    # 기존 DB를 건드리기 전에 행끼리의 규칙부터 확인
+    with timer.phase('check'):
+        catalog_report = check_catalog(
+            iter_menu_rows() if menu_rows is None else menu_rows,
+        )
+    if catalog_report['violations']:
+        raise RuntimeError(
+            f'Catalog check failed:\n{format_violations(catalog_report)}'
+        )
+
+    # id는 번들 DB(없으면 마지막 배포 DB)와 짝지어 물려받음 (소스 위치가 바뀌어도 id 유지)
+    with timer.phase('stable_ids'):
+        stable = StableIds.from_published() if stable_ids else None
+        if stable is not None and stable.baseline is None:
+            stable = None
+        if stable is not None and menu_rows is not None:
+            menu_rows = list(stable.assign(menu_rows))
+
+    with timer.phase('derive'):
+        derived = [] if streaming else _derived_tables(
+            menu_rows,
+            combos=combos,
+            cache_brackets=cache_brackets,
+            cache_top_k=cache_top_k,
+            search_index=search_index,
+            price_history=price_history,
+            regions=regions,
+            menu_board=menu_board,
+            affordability=affordability,
+            item_keys=item_keys,
+            id_mapping=stable.mapping if stable is not None else None,
+        )
+    schema = SCHEMA + [stmt for d in derived for stmt in d[0]]
+
+    if publish and (incremental or derived):
+        raise ValueError('--publish cannot be combined with other options')
+
+    conn = None
+    publish_report = None
+    if publish:
+        publish_report = _publish_db(menu_rows, timer)
+        conn = sqlite3.connect(DB_PATH)
+    elif incremental and os.path.exists(DB_PATH):
+        conn = sqlite3.connect(DB_PATH)
+        if _schema_matches(conn.cursor(), schema):
+            inserted, updated, deleted, replaced = _sync_db(
+                conn, derived, menu_rows, timer,
+            )
+            if inserted or updated or deleted or replaced:
+                print(
+                    f'Incremental update: +{inserted} inserted, '
+                    f'~{updated} updated, -{deleted} deleted'
+                )
+                for table in replaced:
+                    print(f'  rebuilt: {table}')
+            else:
+                print('No changes: DB file left untouched')
+        else:
+            print('Schema changed: falling back to full rebuild')
+            conn.close()
+            conn = None
+
+    if conn is None:
+        if menu_rows is None:
+            stream = iter_menu_rows()
+            conn = _create_db(
+                derived, stream if stable is None else stable.assign(stream), timer,
+            )
+        else:
+            conn = _create_db(derived, menu_rows, timer)
+
+    with timer.phase('query_plans'):
+        # 475행에서는 드러나지 않는 계획 변화를 합성 카탈로그로도 확인
+        failures = check_query_plans(conn) + check_synthetic_plans()
+    if failures:
+        conn.close()
+        raise RuntimeError(f'Query plan check failed:\n{format_failures(failures)}')
+
+    cursor = conn.cursor()
+
+    history_report = None
+    if price_history:
+        cursor.execute('SELECT COUNT(*), COUNT(DISTINCT menu_id) FROM price_history')
+        history_report = cursor.fetchone()
+
+    override_report = None
+    if regions:
+        cursor.execute('SELECT menu_id, region FROM price_overrides')
+        override_report = region_counts(cursor.fetchall())
 
     conn.close()
 
+    with timer.phase('columns'):
+        columns_bytes = write_columns(
+            columns_path, read_db_rows(DB_PATH) if menu_rows is None else menu_rows,
+        )
+
+    # ── Summary ── (행 수·크기·가격 분포는 빌드 리포트 하나로)
+    report = collect_report(DB_PATH, timer.rounded(), options)
+    write_report(report, report_path)
+    menu_counts = report['counts']['menus']
+    by_franchise, by_type = Counter(), Counter()
+    for key, count in menu_counts.items():
+        franchise, menu_type = key.split('/')
+        by_franchise[franchise] += count
+        by_type[menu_type] += count
+    with_delivery = sum(
+        prices['price_delivery']['count']
+        for prices in report['prices'].values() if prices['price_delivery']
+    )
+    free_pages = report['file']['freePages']
+    db_bytes = report['file']['pageSize'] * report['file']['pages']
+
     print(f'Seed DB generated: {DB_PATH}')
-    print(f'Total items: {total}')
+    print(f'Total items: {sum(menu_counts.values())}')
     print(f'With delivery price: {with_delivery}')
+    print(
+        f'Catalog check: {len(catalog_report["counts"])} rules, '
+        f'0 violations ({catalog_report["seconds"]:.3f}s)'
+    )
+    if stable is not None:
+        print(format_stable_report(stable.report(), limit=10))
+    if publish_report is not None:
+        page_size, sizes = publish_report
+        tried = ', '.join(f'{size}: {nbytes:,}' for size, nbytes in sizes.items())
+        print(
+            f'Publish: page size {page_size}, {sizes[page_size]:,} bytes, '
+            f'{free_pages} free pages (tried {tried})'
+        )
+    if combos:
+        print(f'Combos (non-dominated): {report["counts"]["rows"]["combos"]}')
+    if cache_brackets:
+        cache_rows = report['counts']['rows']['recommendation_cache']
+        cache_bytes = None
+        if report['objects'] is not None:
+            cache_bytes = report['objects']['recommendation_cache']['bytes']
+        budgets = cache_budgets(cache_brackets)
+        print(
+            f'Recommendation cache: {cache_brackets} brackets '
+            f'({budgets[0]:,}~{budgets[-1]:,}원), top {cache_top_k}, '
+            f'{cache_rows} rows'
+        )
+        if cache_bytes is not None:
+            print(
+                f'  size: {cache_bytes:,} bytes '
+                f'({cache_bytes / db_bytes:.0%} of {db_bytes:,} byte DB)'
+            )
+    if history_report is not None:
+        history_rows, history_items = history_report
+        print(f'Price history: {history_items} items with changes, {history_rows} rows')
+    if override_report is not None:
+        print(
+            f'Price overrides: {len(override_report)} regions, '
+            f'{sum(override_report.values())} rows'
+        )
+        for region, count in override_report.items():
+            print(f'  {region}: {count}')
+    if menu_board:
+        board_line = f'Menu board: {report["counts"]["rows"]["menu_board"]} rows'
+        if report['objects'] is not None:
+            board_bytes = sum(
+                obj['bytes'] for obj in report['objects'].values()
+                if obj['table'] == 'menu_board'
+            )
+            board_line += f', {board_bytes:,} bytes with indexes'
+        print(board_line)
+    if affordability:
+        print(
+            f'Affordability curves: '
+            f'{report["counts"]["rows"]["affordability"]} breakpoints'
+        )
+    if item_keys:
+        print(
+            f'Item keys: {report["counts"]["rows"]["item_keys"]} keys, '
+            f'{report["counts"]["rows"]["item_franchises"]} franchises'
+        )
     print()
     print('By franchise:')
-    for franchise, count in by_franchise:
+    for franchise, count in sorted(by_franchise.items()):
         print(f'  {franchise}: {count}')
     print()
     print('By type:')
-    for menu_type, count in by_type:
+    for menu_type, count in sorted(by_type.items()):
         print(f'  {menu_type}: {count}')
+    print()
+    print(
+        'Phases: ' + ', '.join(
+            f'{name} {seconds:.3f}s' for name, seconds in report['phases'].items()
+        )
+    )
+    print(f'Report: {report_path}')
+    print(f'Columnar snapshot: {columns_path} ({columns_bytes:,} bytes)')
+    version, baseline = published_baseline()
+    if baseline is not None:
+        print(format_diff(diff_reports(baseline, report), f'published v{version}'))
 
 
 if __name__ == '__main__':
-    generate_db()
+    parser = argparse.ArgumentParser(description='Burger Budget seed DB generator')
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='기존 DB와 비교해 변경된 행만 반영 (변경 없으면 파일 유지)',
+    )
+    parser.add_argument(
+        '--combos',
+        action='store_true',
+        help='비지배 메인+사이드+음료(+디저트) 조합을 combos 테이블로 사전 계산',
+    )
+    parser.add_argument(
+        '--cache-brackets',
+        type=int,
+        default=0,
+        metavar='N',
+        help='recommendation_cache 에 미리 계산할 예산 구간 수 '
+             '(3,000원부터 500원 단위, 0이면 생성 안 함)',
+    )
+    parser.add_argument(
+        '--cache-top-k',
+        type=int,
+        default=DEFAULT_CACHE_TOP_K,
+        metavar='K',
+        help=f'구간·프랜차이즈별 저장할 상위 조합 수 (기본 {DEFAULT_CACHE_TOP_K})',
+    )
+    parser.add_argument(
+        '--search-index',
+        action='store_true',
+        help='메뉴명 검색용 FTS5 trigram + 초성/자모 인덱스 생성',
+    )
+    parser.add_argument(
+        '--price-history',
+        action='store_true',
+        help='배포된 모든 버전에서 가격이 바뀐 메뉴의 이력을 price_history 테이블로 생성',
+    )
+    parser.add_argument(
+        '--regions',
+        action='store_true',
+        help='scripts/menu_data/regions/*.csv 의 지역·매장별 가격을 '
+             'price_overrides 테이블로 생성',
+    )
+    parser.add_argument(
+        '--menu-board',
+        action='store_true',
+        help='메뉴판 정렬 모드별 순위(인기·가격·이름·배달가·가성비)를 '
+             'menu_board 테이블로 생성',
+    )
+    parser.add_argument(
+        '--affordability',
+        action='store_true',
+        help='프랜차이즈 × 매장/배달 × (버거 / 세트 / 버거+사이드+음료)별 '
+             '예산 이하 경우의 수 곡선을 affordability 테이블로 생성',
+    )
+    parser.add_argument(
+        '--item-keys',
+        action='store_true',
+        help='메뉴 id 에서 계산한 정수 키 매핑(item_keys, item_franchises, '
+             'menus_keyed VIEW) 생성',
+    )
+    parser.add_argument(
+        '--publish',
+        action='store_true',
+        help='배포용 DB: 반복 TEXT를 lookup 테이블로 분리, menus는 VIEW, '
+             'page size 선택 후 VACUUM',
+    )
+    parser.add_argument(
+        '--no-stable-ids',
+        action='store_true',
+        help='마지막 배포 DB와 짝짓지 않고 소스 파일의 id를 그대로 사용',
+    )
+    parser.add_argument(
+        '--columns',
+        default=COLUMNS_PATH,
+        metavar='PATH',
+        help='열 기반 스냅샷(menu_columns.py 형식) 경로 (기본 build/menu_columns.bin)',
+    )
+    parser.add_argument(
+        '--report',
+        default=REPORT_PATH,
+        metavar='PATH',
+        help='빌드 리포트(단계별 시간, 테이블·인덱스 크기, 가격 분포) 경로 '
+             '(기본 build/seed_report.json)',
+    )
+    args = parser.parse_args()
+    if args.publish and (args.incremental or args.combos
+                         or args.cache_brackets or args.search_index
+                         or args.price_history or args.regions
+                         or args.menu_board or args.affordability
+                         or args.item_keys):
+        parser.error('--publish cannot be combined with other options')
+    generate_db(
+        incremental=args.incremental,
+        combos=args.combos,
+        cache_brackets=args.cache_brackets,
+        cache_top_k=args.cache_top_k,
+        search_index=args.search_index,
+        price_history=args.price_history,
+        regions=args.regions,
+        menu_board=args.menu_board,
+        affordability=args.affordability,
+        item_keys=args.item_keys,
+        publish=args.publish,
+        stable_ids=not args.no_stable_ids,
+        report_path=args.report,
+        columns_path=args.columns,
+    )
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 여러 명 주문(group order) 정확 탐색
+
+getRecommendations 는 personCount 가 2 이상이면 예산을 똑같이 나눠
+(budget ~/ personCount) 1인 조합을 찾습니다. 그러면 "한 명은 세트, 한 명은
+싼 버거"처럼 예산을 나눠 쓰는 주문을 놓칩니다. 여기서는 N명이 예산 하나를
+같이 쓰는 주문(1인 조합 N개의 중복 허용 묶음) 중 점수 상위 K개를 정확히
+찾습니다. 한 주문은 한 프랜차이즈 안에서만 고릅니다.
+
+점수는 recommendation_engine.score_matrix 의 feature를 그대로 씁니다.
+
+    1인 점수  base = meal×0.25 + set×0.10 + sig×0.10 + pref×0.25
+    주문 점수 = 평균 base + util×0.20
+                util 은 주문 합계 / 예산 에 1인 예산(budget ~/ N)의 목표 사용률
+
+N = 1 이면 디저트를 붙이지 않은 1인 추천 점수와 같습니다.
+
+탐색 (프랜차이즈마다):
+  1. 예산 안의 1인 조합을 가격 단위(가격들의 최대공약수)로 바꾸고, 같은
+     가격에서 base 상위 K개만 남김 — 더 나은 같은 가격 조합이 K개 있으면
+     그 조합을 쓰는 주문마다 더 나은 주문이 K개 있음
+  2. DP: V[l][r][t] = 가격 l 이하 조합 r개로 합계 정확히 t를 만들 때 base 합의
+     최댓값. 점수는 (base 합, 합계)로만 정해지므로 합계 t의 최고 점수
+     V[마지막][N][t]/N + util(t) 가 정확히 나옴
+  3. 최고 점수가 높은 합계부터, 합계를 t로 고정하고 가격 오름차순 배열에서
+     인덱스가 늘지 않는 순서로 고르는 branch-and-bound — 남은 예산은 bisect 로
+     자르고, 자식 j의 상한은 V[j의 가격 수준][남은 인원][t - 쓴 금액] 로 정확히
+     구해 상위 K번째 점수 이하면 버림. 합계의 최고 점수가 K번째 점수 이하가
+     되면 끝
+
+check 는 작은 무작위 조합 집합에서 모든 묶음을 훑는 전수 탐색과 상위 K개
+점수를 비교합니다.
+
+Requires: numpy
+
+Usage:
+    python3 scripts/group_orders.py solve 30000 3 mcd bk
+    python3 scripts/group_orders.py check
+    python3 scripts/group_orders.py bench --per-person 9000 --max-persons 10
+"""
+
+import argparse
+import bisect
+import functools
+import heapq
+import itertools
+import math
+import random
+import sys
+import time
+
+import numpy as np
+
+from recommendation_engine import (
+    DB_PATH,
+    FRANCHISES,
+    build_catalog,
+    candidate_order,
+    enumerate_combos,
+    load_menu_items,
+    load_signature_menus,
+    score_matrix,
+    target_utilization,
+    _NONE,
+)
+
+DEFAULT_TOP_K = 10
+UTIL_WEIGHT = 0.20
+# DP 표(가격 수준 × (N+1) × (예산/unit) float64) 상한 — 가격 하나가 100원
+# 격자에서 벗어나면 unit 이 작아져 표가 몇 배로 커지므로 할당 전에 막음
+MAX_TABLE_BYTES = 128 * 1024 * 1024
+
+_EPS = 1e-12
+
+
+def combo_base_scores(catalog, combos, budget, pref=None):
+    """조합별 예산과 무관한 점수 (meal/set/sig/pref)"""
+    scores = score_matrix(catalog, combos, [budget], pref)
+    return (scores['meal'] * 0.25 + scores['set'] * 0.10
+            + scores['sig'] * 0.10 + scores['pref'] * 0.25)
+
+
+def util_curve(budget, persons, unit, cap):
+    """합계 x×unit (x = 0..cap) 의 util"""
+    target = target_utilization(budget // persons)
+    pct = np.minimum(np.arange(cap + 1) * unit / budget, 1.0)
+    return np.power(np.maximum(0.0, 1.0 - np.abs(pct - target) / 0.20), 0.7)
+
+
+def group_score(bases, total, budget, persons):
+    """주문 점수 (전수 탐색·비교용 스칼라 버전)"""
+    target = target_utilization(budget // persons)
+    pct = min(total / budget, 1.0)
+    util = max(0.0, 1.0 - abs(pct - target) / 0.20) ** 0.7
+    return sum(bases) / persons + util * UTIL_WEIGHT
+
+
+def prune_by_price(prices, bases, top_k):
+    """같은 가격에서 base 상위 top_k 개만 (원래 인덱스 배열, 가격 오름차순·base 내림차순)"""
+    order = np.lexsort((-bases, prices))
+    keep = []
+    run_price, run = None, 0
+    for index in order:
+        if prices[index] != run_price:
+            run_price, run = prices[index], 0
+        if run < top_k:
+            keep.append(index)
+            run += 1
+    return np.array(keep, dtype=np.int64)
+
+
+def _level_tables(prices, bases, persons, cap):
+    """V[l][r][t] = 가격이 l번째 가격 이하인 조합 r개(중복 허용)로 합계 정확히 t를
+    만들 때 base 합의 최댓값 (r = 0..persons, 만들 수 없으면 -inf)
+
+    Returns: (조합별 가격 수준, V)
+    """
+    levels = np.unique(prices)
+    value = np.full((persons + 1, cap + 1), -np.inf)
+    value[0, 0] = 0.0
+    tables = np.empty((levels.size, persons + 1, cap + 1))
+    for level, price in enumerate(levels):
+        base = bases[prices == price].max()
+        # r 오름차순이라 같은 가격을 여러 번 고르는 경우도 포함
+        for r in range(1, persons + 1):
+            np.maximum(
+                value[r, price:], value[r - 1, :cap + 1 - price] + base,
+                out=value[r, price:],
+            )
+        tables[level] = value
+    return np.searchsorted(levels, prices), tables
+
+
+def table_bytes(levels, persons, cap):
+    """_level_tables 가 잡는 메모리 (바이트)"""
+    return levels * (persons + 1) * (cap + 1) * 8
+
+
+def solve(prices, bases, budget, persons, unit, top_k=DEFAULT_TOP_K):
+    """상위 top_k 주문 [(점수, 합계 단위, 조합 인덱스 튜플)] — 점수 내림차순
+
+    prices: 조합 가격 (unit 의 배수), bases: combo_base_scores
+    Returns: (주문 목록, 탐색 노드 수)
+    Raises: DP 표가 MAX_TABLE_BYTES 를 넘으면 ValueError (unit 이 너무 작음)
+    """
+    cap = budget // unit
+    if persons < 1 or prices.size == 0:
+        return [], 0
+    units = prices // unit
+    fits = np.flatnonzero(units <= cap - (persons - 1) * units.min())
+    if fits.size == 0:
+        return [], 0
+    kept = fits[prune_by_price(units[fits], bases[fits], top_k)]
+    p = units[kept]
+    b = bases[kept]
+    needed = table_bytes(np.unique(p).size, persons, cap)
+    if needed > MAX_TABLE_BYTES:
+        raise ValueError(
+            f'DP table would need {needed / 2**20:,.0f} MiB '
+            f'(> {MAX_TABLE_BYTES / 2**20:,.0f} MiB): price unit {unit}원 '
+            f'is too fine for a {budget:,}원 budget and {persons} persons — '
+            'is a price off the 100원 grid?'
+        )
+    p_list = p.tolist()
+    min_price = p_list[0]
+    util = util_curve(budget, persons, unit, cap) * UTIL_WEIGHT
+    level, tables = _level_tables(p, b, persons, cap)
+
+    # 합계 t 마다 가능한 최고 점수 — 높은 합계부터 풀고, 그 점수가 상위
+    # K번째 점수 이하가 되면 더 볼 필요가 없음
+    best_by_total = tables[-1, persons] / persons + util
+
+    heap = []  # (점수, -순번, 합계, 선택) — 최소 힙
+    counter = itertools.count()
+    nodes = 0
+
+    def threshold():
+        return heap[0][0] if len(heap) >= top_k else -np.inf
+
+    def visit(total, last, spent, base_sum, chosen):
+        """합계가 정확히 total 인 주문을 인덱스가 늘지 않는 순서로 탐색"""
+        nonlocal nodes
+        nodes += 1
+        remaining = persons - len(chosen)
+        limit = total - spent - (remaining - 1) * min_price
+        hi = min(last, bisect.bisect_right(p_list, limit) - 1)
+        if hi < 0:
+            return
+        rest = total - spent - p[:hi + 1]
+        upper = (base_sum + b[:hi + 1]
+                 + tables[level[:hi + 1], remaining - 1, rest]) / persons + util[total]
+        alive = np.flatnonzero(upper > threshold() + _EPS)
+        for j in alive[np.argsort(-upper[alive], kind='stable')]:
+            if upper[j] <= threshold() + _EPS:
+                break
+            pick = chosen + (int(j),)
+            if remaining == 1:
+                entry = (float(upper[j]), -next(counter), total, pick)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+            else:
+                visit(total, int(j), spent + p_list[j], base_sum + b[j], pick)
+
+    for total in np.argsort(-best_by_total, kind='stable'):
+        if not best_by_total[total] > threshold() + _EPS:
+            break
+        visit(int(total), len(p_list) - 1, 0, 0.0, ())
+
+    results = sorted(heap, key=lambda e: (-e[0], -e[1]))
+    return [
+        (score, total, tuple(int(kept[j]) for j in pick))
+        for score, _, total, pick in results
+    ], nodes
+
+
+def exhaustive(prices, bases, budget, persons, top_k=DEFAULT_TOP_K):
+    """전수 탐색 상위 top_k 점수 (검증용, 작은 입력만)"""
+    scores = []
+    for pick in itertools.combinations_with_replacement(range(prices.size), persons):
+        total = int(prices[list(pick)].sum())
+        if total <= budget:
+            scores.append(group_score(bases[list(pick)], total, budget, persons))
+    return sorted(scores, reverse=True)[:top_k]
+
+
+def _franchise_inputs(items, franchise, budget, persons, delivery, pref,
+                      signature_menus):
+    candidates = [
+        i for i in candidate_order(items, delivery) if i['franchise'] == franchise
+    ]
+    catalog = build_catalog(candidates, delivery, signature_menus)
+    combos = enumerate_combos(catalog, budget)
+    bases = combo_base_scores(catalog, combos, max(budget // persons, 1), pref)
+    return catalog, combos, bases
+
+
+def _describe(catalog, combos, index):
+    ids = catalog['id']
+    parts = [int(combos[key][index]) for key in ('main', 'side', 'drink')]
+    return {
+        'main': ids[parts[0]],
+        'side': ids[parts[1]] if parts[1] != _NONE else None,
+        'drink': ids[parts[2]] if parts[2] != _NONE else None,
+        'price': int(combos['price'][index]),
+    }
+
+
+def group_orders(items, budget, persons, franchises, delivery=False,
+                 top_k=DEFAULT_TOP_K, pref=None, signature_menus=None):
+    """프랜차이즈별로 풀어 합친 상위 top_k 주문
+
+    Returns: ([{franchise, score, total_price, orders: [조합 dict]}], 탐색 노드 수)
+    """
+    if signature_menus is None:
+        signature_menus = load_signature_menus()
+    results = []
+    nodes = 0
+    for franchise in franchises:
+        catalog, combos, bases = _franchise_inputs(
+            items, franchise, budget, persons, delivery, pref, signature_menus,
+        )
+        prices = combos['price']
+        if prices.size == 0:
+            continue
+        unit = functools.reduce(math.gcd, np.unique(prices).tolist())
+        found, searched = solve(prices, bases, budget, persons, unit, top_k)
+        nodes += searched
+        for score, total, pick in found:
+            results.append({
+                'franchise': franchise,
+                'score': score,
+                'total_price': total * unit,
+                'orders': [_describe(catalog, combos, i) for i in pick],
+            })
+    results.sort(key=lambda r: (-r['score'], r['total_price']))
+    return results[:top_k], nodes
+
+
+def even_split_score(items, budget, persons, franchises, delivery=False,
+                     pref=None, signature_menus=None):
+    """지금 앱 방식: 1인 예산(budget ~/ N)의 최고 조합을 N명이 똑같이 주문했을 때 점수"""
+    if signature_menus is None:
+        signature_menus = load_signature_menus()
+    per_person = budget // persons
+    best = None
+    for franchise in franchises:
+        catalog, combos, bases = _franchise_inputs(
+            items, franchise, per_person, 1, delivery, pref, signature_menus,
+        )
+        if combos['price'].size == 0:
+            continue
+        single = bases + UTIL_WEIGHT * util_curve(
+            per_person, 1, 1, per_person,
+        )[combos['price']]
+        i = int(np.argmax(single))
+        score = group_score(
+            [bases[i]] * persons, int(combos['price'][i]) * persons, budget, persons,
+        )
+        best = score if best is None else max(best, score)
+    return best
+
+
+def check(items, cases=40, seed=0, top_k=DEFAULT_TOP_K):
+    """무작위 작은 조합 집합에서 전수 탐색과 상위 점수 비교 → 실패 수"""
+    rng = random.Random(seed)
+    signature_menus = load_signature_menus()
+    failures = 0
+    for case in range(cases):
+        franchise = rng.choice(FRANCHISES)
+        persons = rng.randint(1, 4)
+        budget = rng.randrange(5000, 12001, 500) * persons
+        delivery = rng.random() < 0.3
+        catalog, combos, bases = _franchise_inputs(
+            items, franchise, budget, persons, delivery, None, signature_menus,
+        )
+        size = {1: 400, 2: 60, 3: 25, 4: 14}[persons]
+        sample = np.array(sorted(rng.sample(
+            range(combos['price'].size), min(size, combos['price'].size),
+        )), dtype=np.int64)
+        prices, sample_bases = combos['price'][sample], bases[sample]
+        unit = functools.reduce(math.gcd, np.unique(prices).tolist())
+
+        found, _ = solve(prices, sample_bases, budget, persons, unit, top_k)
+        got = [score for score, _, _ in found]
+        expected = exhaustive(prices, sample_bases, budget, persons, top_k)
+        # 반환한 주문도 실제로 예산 안이고 점수가 맞아야 함
+        recomputed = [
+            group_score(sample_bases[list(pick)], int(prices[list(pick)].sum()),
+                        budget, persons)
+            for _, _, pick in found
+            if int(prices[list(pick)].sum()) <= budget
+        ]
+        ok = len(got) == len(expected) == len(recomputed) and all(
+            abs(a - b) < 1e-9 and abs(a - c) < 1e-9
+            for a, b, c in zip(got, expected, recomputed)
+        )
+        failures += not ok
+        if not ok:
+            print(
+                f'  [FAIL] case {case}: {franchise} {persons}p {budget:,}원 '
+                f'{"delivery" if delivery else "store"} ({sample.size} combos)'
+            )
+            print(f'         solver     {[round(s, 6) for s in got]}')
+            print(f'         exhaustive {[round(s, 6) for s in expected]}')
+    print(f'{cases - failures}/{cases} cases match exhaustive search')
+    return failures
+
+
+def bench(items, per_person, max_persons, top_k, franchises, delivery=False):
+    signature_menus = load_signature_menus()
+    print(
+        f'{"persons":>7}{"budget":>10}{"ms":>9}{"nodes":>9}'
+        f'{"best":>9}{"even split":>12}'
+    )
+    rows = []
+    for persons in range(1, max_persons + 1):
+        budget = per_person * persons
+        started = time.perf_counter()
+        results, nodes = group_orders(
+            items, budget, persons, franchises, delivery, top_k,
+            signature_menus=signature_menus,
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+        even = even_split_score(
+            items, budget, persons, franchises, delivery,
+            signature_menus=signature_menus,
+        )
+        best = results[0]['score'] if results else None
+        rows.append((persons, budget, elapsed, nodes, best, even))
+        print(
+            f'{persons:>7}{budget:>10,}{elapsed:>9.1f}{nodes:>9,}'
+            f'{best if best is not None else float("nan"):>9.4f}'
+            f'{even if even is not None else float("nan"):>12.4f}'
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Group order solver')
+    parser.add_argument('--db', default=DB_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    solve_parser = sub.add_parser('solve', help='상위 주문 찾기')
+    solve_parser.add_argument('budget', type=int)
+    solve_parser.add_argument('persons', type=int)
+    solve_parser.add_argument('franchises', nargs='+', choices=FRANCHISES)
+    solve_parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K)
+    solve_parser.add_argument('--delivery', action='store_true')
+
+    check_parser = sub.add_parser('check', help='전수 탐색과 비교')
+    check_parser.add_argument('--cases', type=int, default=40)
+    check_parser.add_argument('--seed', type=int, default=0)
+
+    bench_parser = sub.add_parser('bench', help='인원 1..N 탐색 시간')
+    bench_parser.add_argument('--per-person', type=int, default=9000)
+    bench_parser.add_argument('--max-persons', type=int, default=10)
+    bench_parser.add_argument('--top-k', type=int, default=DEFAULT_TOP_K)
+    bench_parser.add_argument('--delivery', action='store_true')
+    args = parser.parse_args()
+
+    items = load_menu_items(args.db)
+    try:
+        _run(args, items)
+    except ValueError as e:
+        raise SystemExit(f'group_orders: {e}')
+
+
+def _run(args, items):
+    if args.command == 'check':
+        sys.exit(1 if check(items, args.cases, args.seed) else 0)
+    if args.command == 'bench':
+        bench(items, args.per_person, args.max_persons, args.top_k,
+              FRANCHISES, args.delivery)
+        return
+
+    started = time.perf_counter()
+    results, nodes = group_orders(
+        items, args.budget, args.persons, args.franchises,
+        args.delivery, args.top_k,
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    even = even_split_score(
+        items, args.budget, args.persons, args.franchises, args.delivery,
+    )
+    print(
+        f'{len(results)} group orders in {elapsed:.1f}ms ({nodes:,} nodes); '
+        f'even split best {even:.4f}' if even is not None else
+        f'{len(results)} group orders in {elapsed:.1f}ms ({nodes:,} nodes)'
+    )
+    for r in results:
+        print(f'  {r["score"]:.4f}  {r["total_price"]:>7,}  {r["franchise"]}')
+        for order in r['orders']:
+            parts = ' + '.join(
+                part for part in (order['main'], order['side'], order['drink']) if part
+            )
+            print(f'      {order["price"]:>7,}  {parts}')
+
+
+if __name__ == '__main__':
+    main()
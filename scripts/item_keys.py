@@ -0,0 +1,539 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 메뉴 정수 키(item key)
+
+menus.id 는 'mcd_set_14' 같은 TEXT PRIMARY KEY 라 rowid B-tree 옆에 TEXT
+인덱스(sqlite_autoindex_menus_1)가 따로 붙고, id 를 참조하는 파생 테이블과
+사용자 DB(favorites / order_history 의 *_item_id 세 컬럼)도 문자열을 그대로
+저장합니다. 프랜차이즈는 _extractFranchise 가 id 를 잘라 다시 구합니다.
+
+id 는 stable_ids.py 덕분에 한 번 쓰이면 다른 메뉴에 다시 쓰이지 않고 항상
+{franchise}_{type}_{번호} 형식이므로, 정수 키를 id 에서 바로 계산해 비트를
+나눠 담습니다(packed key).
+
+    key = ((franchise_id << TYPE_BITS) | type_id) << SERIAL_BITS | 번호
+
+    franchise_id  item_franchises 의 id — menu_source.FRANCHISES 순서로 1부터
+                  (새 프랜차이즈는 FRANCHISES 끝에 붙이므로 기존 id 가 바뀌지
+                  않음, FRANCHISES 밖의 코드는 그 뒤에 코드 순)
+    type_id       menu_source.MENU_TYPES 순서로 1부터
+    번호          id 의 마지막 숫자 (SERIAL_BITS 안에 들어가야 함)
+
+그래서 같은 id 는 어느 버전에서나 같은 키이고(배포 DB 의 매핑을 읽지 않아도
+됨), 프랜차이즈·타입은 `key >> SERIAL_BITS >> TYPE_BITS`,
+`(key >> SERIAL_BITS) & 7` 로 바로 나옵니다.
+
+처음 목표는 1, 2, 3, … 으로 이어지는 조밀한 키였지만 packed 키로 바꿨습니다.
+조밀한 키는 버전마다 같은 키를 주려면 이전 배포의 매핑 표를 읽어 이어 붙여야
+하고, 프랜차이즈·타입도 lookup 없이는 알 수 없습니다. 대신 키 사이에 빈
+번호가 많습니다. 실제 5개 프랜차이즈 475개 메뉴의 키가 2^18 미만까지 퍼져
+SQLite 레코드에서 3바이트를 쓰는데, 조밀한 키(475 이하)라면 2바이트입니다.
+
+--item-keys 로 만든 시드 DB 에는 다음이 들어갑니다.
+
+  item_franchises  (id, code)             프랜차이즈 lookup (5행)
+  item_keys        (key, menu_id)         정수 → TEXT 매핑 (key 가 rowid)
+  menus_keyed      VIEW: item_key + menus 의 모든 컬럼
+
+TEXT → 정수는 id 에서 계산하므로 menu_id 에는 인덱스를 두지 않습니다.
+사용자 DB 는 KEYED_USER_SCHEMA(*_key INTEGER 세 컬럼)로 옮기는 안을 두고
+migrate_user_db 로 기존 DB 를 변환합니다. 기본 시드 DB 의 menus 스키마는
+그대로입니다 (배포본·delta 의 정규 재구성과 앱 쿼리가 TEXT id 기준).
+
+Usage:
+    python3 scripts/item_keys.py check
+    python3 scripts/item_keys.py bench --rows 10000 100000 --orders 200000
+"""
+
+import argparse
+import os
+import random
+import re
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from generate_delta import DATA_DIR, published_versions
+from menu_source import FRANCHISES, MENU_COLUMNS, MENU_TYPES, load_menus
+from stable_ids import SEED_DB_PATH
+
+TYPE_BITS = 3
+SERIAL_BITS = 12
+
+_MENU_ID = re.compile(
+    rf'^([a-z0-9]+)_({"|".join(MENU_TYPES)})_(\d+)$'
+)
+
+ITEM_FRANCHISE_COLUMNS = ('id', 'code')
+ITEM_KEY_COLUMNS = ('key', 'menu_id')
+
+ITEM_FRANCHISE_SCHEMA = [
+    '''
+        CREATE TABLE item_franchises (
+            id   INTEGER PRIMARY KEY,
+            code TEXT NOT NULL UNIQUE
+        )
+    ''',
+]
+
+ITEM_KEY_SCHEMA = [
+    '''
+        CREATE TABLE item_keys (
+            key     INTEGER PRIMARY KEY,
+            menu_id TEXT NOT NULL REFERENCES menus(id)
+        )
+    ''',
+    '''
+        CREATE VIEW menus_keyed AS
+        SELECT k.key AS item_key, m.*
+        FROM item_keys k JOIN menus m ON m.id = k.menu_id
+    ''',
+]
+
+# 사용자 DB 제안 (user_database_helper.dart v3 의 *_item_id TEXT → *_key INTEGER)
+KEYED_USER_SCHEMA = [
+    '''
+        CREATE TABLE favorites (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            main_key INTEGER NOT NULL,
+            side_key INTEGER,
+            drink_key INTEGER,
+            created_at TEXT NOT NULL,
+            UNIQUE(main_key, side_key, drink_key)
+        )
+    ''',
+    '''
+        CREATE TABLE order_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            main_key INTEGER NOT NULL,
+            side_key INTEGER,
+            drink_key INTEGER,
+            total_price INTEGER NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_favorites_main ON favorites(main_key)',
+    'CREATE INDEX IF NOT EXISTS idx_history_created ON order_history(created_at DESC)',
+]
+
+# 프랜차이즈별 주문 수 (UserPreference.franchiseCounts) — 문자열을 자르지 않음
+KEYED_FRANCHISE_COUNTS_SQL = (
+    f'SELECT main_key >> {SERIAL_BITS + TYPE_BITS}, COUNT(*) '
+    'FROM order_history GROUP BY 1'
+)
+
+
+def parse_menu_id(menu_id):
+    """'mcd_set_14' → ('mcd', 'set', 14)"""
+    match = _MENU_ID.match(menu_id)
+    if match is None:
+        raise ValueError(f'menu id not in {{franchise}}_{{type}}_{{n}} form: {menu_id!r}')
+    return match.group(1), match.group(2), int(match.group(3))
+
+
+def franchise_ids(codes=()):
+    """{코드: id} — FRANCHISES 순서로 1부터, 나머지는 그 뒤에 코드 순"""
+    order = list(FRANCHISES) + sorted(set(codes) - set(FRANCHISES))
+    return {code: i + 1 for i, code in enumerate(order)}
+
+
+def item_key(franchise_id, type_id, serial):
+    if not 0 <= serial < 1 << SERIAL_BITS:
+        raise ValueError(f'serial {serial} does not fit in {SERIAL_BITS} bits')
+    if not 0 < type_id < 1 << TYPE_BITS:
+        raise ValueError(f'type id {type_id} does not fit in {TYPE_BITS} bits')
+    return ((franchise_id << TYPE_BITS) | type_id) << SERIAL_BITS | serial
+
+
+def split_item_key(key):
+    """key → (franchise_id, type_id, serial)"""
+    return (
+        key >> (SERIAL_BITS + TYPE_BITS),
+        (key >> SERIAL_BITS) & ((1 << TYPE_BITS) - 1),
+        key & ((1 << SERIAL_BITS) - 1),
+    )
+
+
+class ItemKeys:
+    """TEXT id ↔ 정수 키 (프랜차이즈 id 는 생성할 때 정해 둠)"""
+
+    def __init__(self, codes=()):
+        self.franchises = franchise_ids(codes)
+        self.codes = {i: code for code, i in self.franchises.items()}
+
+    @classmethod
+    def for_ids(cls, menu_ids):
+        return cls(parse_menu_id(menu_id)[0] for menu_id in menu_ids)
+
+    def key(self, menu_id):
+        franchise, menu_type, serial = parse_menu_id(menu_id)
+        return item_key(
+            self.franchises[franchise], MENU_TYPES.index(menu_type) + 1, serial,
+        )
+
+    def menu_id(self, key, width=2):
+        """키 → id (번호 자릿수는 id 마다 다르므로 매핑 테이블이 정답)"""
+        franchise_id, type_id, serial = split_item_key(key)
+        return f'{self.codes[franchise_id]}_{MENU_TYPES[type_id - 1]}_{serial:0{width}d}'
+
+    def franchise(self, key):
+        return self.codes[split_item_key(key)[0]]
+
+
+def build_item_keys(menus):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록 → (item_franchises 행, item_keys 행)
+
+    서로 다른 id 가 같은 키가 되면 ('x_set_1' / 'x_set_01') ValueError.
+    """
+    menus = list(menus)
+    keys = ItemKeys.for_ids(m['id'] for m in menus)
+    rows = {}
+    for menu in menus:
+        key = keys.key(menu['id'])
+        if key in rows and rows[key] != menu['id']:
+            raise ValueError(f'item key {key} collides: {rows[key]!r}, {menu["id"]!r}')
+        rows[key] = menu['id']
+    used = {parse_menu_id(m['id'])[0] for m in menus}
+    franchise_rows = [
+        (i, code) for code, i in keys.franchises.items() if code in used
+    ]
+    return franchise_rows, sorted(rows.items())
+
+
+def migrate_user_db(src, dst, keys=None):
+    """v3 사용자 DB(src, TEXT id) → KEYED_USER_SCHEMA DB(dst)
+
+    키는 id 에서 계산하므로 이미 내려간(retired) 메뉴의 주문도 그대로 옮겨집니다.
+    Returns: ItemKeys
+    """
+    conn = sqlite3.connect(f'file:{src}?mode=ro', uri=True)
+    try:
+        favorites = conn.execute(
+            'SELECT id, main_item_id, side_item_id, drink_item_id, created_at '
+            'FROM favorites ORDER BY id'
+        ).fetchall()
+        history = conn.execute(
+            'SELECT id, main_item_id, side_item_id, drink_item_id, total_price, '
+            'created_at FROM order_history ORDER BY id'
+        ).fetchall()
+    finally:
+        conn.close()
+    if keys is None:
+        keys = ItemKeys.for_ids(
+            item for row in favorites + history for item in row[1:4] if item
+        )
+
+    def key(menu_id):
+        return None if menu_id is None else keys.key(menu_id)
+
+    if os.path.exists(dst):
+        os.remove(dst)
+    out = sqlite3.connect(dst)
+    try:
+        with out:
+            for stmt in KEYED_USER_SCHEMA:
+                out.execute(stmt)
+            out.executemany(
+                'INSERT INTO favorites (id, main_key, side_key, drink_key, created_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(r[0], key(r[1]), key(r[2]), key(r[3]), r[4]) for r in favorites],
+            )
+            out.executemany(
+                'INSERT INTO order_history '
+                '(id, main_key, side_key, drink_key, total_price, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [(r[0], key(r[1]), key(r[2]), key(r[3]), r[4], r[5]) for r in history],
+            )
+        out.execute('VACUUM')
+    finally:
+        out.close()
+    return keys
+
+
+# ══════════════════════════════════════════════
+# check / bench
+# ══════════════════════════════════════════════
+
+def check():
+    """모든 배포 버전 + 번들 DB + 메뉴 소스 + 합성 카탈로그의 id 가 충돌 없이 왕복하는지,
+    변환한 사용자 DB 의 프랜차이즈 횟수가 id 로 센 것과 같은지"""
+    from synth_catalog import generate_catalog
+    from user_stats import generate_user_db
+
+    failures = 0
+    id_sets = [
+        (f'v{version}', _published_ids(path))
+        for version, path in published_versions(DATA_DIR)
+    ]
+    if os.path.exists(SEED_DB_PATH):
+        id_sets.append(('seed asset', _published_ids(SEED_DB_PATH)))
+    id_sets.append(('sources', [row[0] for row in load_menus()]))
+    id_sets.append(('synthetic 20k', [row[0] for row in generate_catalog(20000)]))
+
+    everything = {}
+    for label, ids in id_sets:
+        menus = [{'id': menu_id} for menu_id in ids]
+        try:
+            _, rows = build_item_keys(menus)
+        except ValueError as e:
+            print(f'  [FAIL] {label}: {e}')
+            failures += 1
+            continue
+        keys = ItemKeys.for_ids(ids)
+        bad = [
+            menu_id for key, menu_id in rows
+            if parse_menu_id(keys.menu_id(key, len(menu_id.rsplit('_', 1)[1])))
+            != parse_menu_id(menu_id)
+            or keys.franchise(key) != parse_menu_id(menu_id)[0]
+        ]
+        # 같은 id 는 어느 버전에서나 같은 키
+        drift = [
+            menu_id for key, menu_id in rows
+            if everything.setdefault(menu_id, key) != key
+        ]
+        failures += bool(bad) + bool(drift)
+        status = 'ok' if not (bad or drift) else f'{len(bad)} bad, {len(drift)} drifted'
+        print(
+            f'  {label:<14}{len(rows):>7,} ids, max key {rows[-1][0]:>12,} '
+            f'({max(k for k, _ in rows).bit_length()} bits)  {status}'
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'user_v3.db')
+        dst = os.path.join(tmp, 'user_keyed.db')
+        generate_user_db(src, 2000, stats=False)
+        keys = migrate_user_db(src, dst)
+        conn = sqlite3.connect(src)
+        try:
+            expected = {}
+            for (main,) in conn.execute('SELECT main_item_id FROM order_history'):
+                franchise = parse_menu_id(main)[0]
+                expected[franchise] = expected.get(franchise, 0) + 1
+        finally:
+            conn.close()
+        conn = sqlite3.connect(dst)
+        try:
+            got = {
+                keys.codes[franchise_id]: count
+                for franchise_id, count in conn.execute(KEYED_FRANCHISE_COUNTS_SQL)
+            }
+        finally:
+            conn.close()
+        ok = got == expected
+        failures += not ok
+        print(
+            f'  user DB       franchise counts by key '
+            f'{"match" if ok else "DIFFER"}: {dict(sorted(got.items()))}'
+        )
+    print(f'item key check: {failures} failures')
+    return failures == 0
+
+
+def _published_ids(path):
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        return [row[0] for row in conn.execute('SELECT id FROM menus')]
+    finally:
+        conn.close()
+
+
+def _median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def write_keyed_catalog(path, catalog):
+    """카탈로그를 정수 키가 rowid 인 menu_items 로 저장 (TEXT id 인덱스 없음)"""
+    from generate_seed_db import SCHEMA
+
+    keys = ItemKeys.for_ids(row[0] for row in catalog)
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    try:
+        # menus 컬럼 정의 그대로, id 만 인덱스 없는 TEXT 로
+        # (id → 키는 계산, 키 → id 는 rowid 로 찾은 행의 id)
+        body = SCHEMA[0][SCHEMA[0].index('(') + 1:SCHEMA[0].rindex(')')]
+        columns = ', '.join(
+            line.strip().rstrip(',') for line in body.splitlines()
+            if line.strip()
+        ).replace('TEXT PRIMARY KEY', 'TEXT NOT NULL')
+        conn.execute(f'CREATE TABLE menu_items (key INTEGER PRIMARY KEY, {columns})')
+        for stmt in SCHEMA[1:]:
+            conn.execute(
+                stmt.replace('idx_menus_', 'idx_menu_items_').replace(
+                    'ON menus(', 'ON menu_items(',
+                )
+            )
+        conn.executemany(
+            f'INSERT INTO menu_items (key, {", ".join(MENU_COLUMNS)}) '
+            f'VALUES ({", ".join("?" * (len(MENU_COLUMNS) + 1))})',
+            [(keys.key(row[0]), *row) for row in catalog],
+        )
+        conn.execute('ANALYZE')
+        conn.commit()
+    finally:
+        conn.close()
+    return keys
+
+
+def _object_bytes(path):
+    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+    try:
+        return dict(conn.execute(
+            'SELECT name, SUM(pgsize) FROM dbstat GROUP BY name'
+        ))
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        conn.close()
+
+
+def bench_catalog(rows, lookups=5000, repeat=5, seed=0):
+    """TEXT id 로 찾기 vs 정수 키로 찾기 (같은 합성 카탈로그)"""
+    from synth_catalog import generate_catalog, write_catalog_db
+
+    catalog = generate_catalog(rows, seed=seed)
+    rng = random.Random(seed)
+    probes = [row[0] for row in rng.choices(catalog, k=lookups)]
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, 'text.db')
+        key_path = os.path.join(tmp, 'keyed.db')
+        write_catalog_db(text_path, catalog)
+        keys = write_keyed_catalog(key_path, catalog)
+        probe_keys = [keys.key(menu_id) for menu_id in probes]
+
+        text = sqlite3.connect(text_path)
+        keyed = sqlite3.connect(key_path)
+        try:
+            text_us = _median_us(lambda: [
+                text.execute('SELECT * FROM menus WHERE id = ?', (p,)).fetchone()
+                for p in probes
+            ], repeat) / lookups
+            key_us = _median_us(lambda: [
+                keyed.execute('SELECT * FROM menu_items WHERE key = ?', (k,)).fetchone()
+                for k in probe_keys
+            ], repeat) / lookups
+        finally:
+            text.close()
+            keyed.close()
+        text_objects = _object_bytes(text_path)
+        return {
+            'rows': len(catalog),
+            'textLookupUs': round(text_us, 2),
+            'keyLookupUs': round(key_us, 2),
+            'textBytes': os.path.getsize(text_path),
+            'keyedBytes': os.path.getsize(key_path),
+            'textIdIndexBytes': text_objects.get('sqlite_autoindex_menus_1'),
+        }
+
+
+def bench_user(orders, repeat=5, seed=0):
+    """사용자 DB(TEXT id vs 정수 키): 크기, 메뉴 조인, 프랜차이즈 횟수"""
+    from menu_columns import read_db_rows
+    from recommendation_engine import DB_PATH
+    from user_stats import extract_franchise, generate_user_db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'user_v3.db')
+        dst = os.path.join(tmp, 'user_keyed.db')
+        catalog = os.path.join(tmp, 'keyed_catalog.db')
+        generate_user_db(src, orders, seed=seed, stats=False)
+        conn = sqlite3.connect(src)
+        conn.execute('VACUUM')
+        conn.close()
+        write_keyed_catalog(catalog, read_db_rows(DB_PATH))
+        migrate_user_db(src, dst)
+
+        text = sqlite3.connect(src)
+        keyed = sqlite3.connect(dst)
+        try:
+            text.execute('ATTACH DATABASE ? AS seed', (f'file:{DB_PATH}?mode=ro',))
+            keyed.execute('ATTACH DATABASE ? AS seed', (catalog,))
+            join_sql = (
+                'SELECT SUM(m.calories), COUNT(*) FROM order_history o '
+                'JOIN seed.{table} m ON m.{key} = o.{column}'
+            )
+            text_join = join_sql.format(table='menus', key='id', column='main_item_id')
+            key_join = join_sql.format(table='menu_items', key='key', column='main_key')
+            if text.execute(text_join).fetchone() != keyed.execute(key_join).fetchone():
+                raise RuntimeError('join results differ between TEXT and keyed DB')
+            text_join_us = _median_us(lambda: text.execute(text_join).fetchone(), repeat)
+            key_join_us = _median_us(lambda: keyed.execute(key_join).fetchone(), repeat)
+
+            def scan_counts():
+                # 지금 방식: main_item_id 를 전부 읽어 _extractFranchise
+                counts = {}
+                for (main,) in text.execute('SELECT main_item_id FROM order_history'):
+                    franchise = extract_franchise(main)
+                    counts[franchise] = counts.get(franchise, 0) + 1
+                return counts
+
+            scan_us = _median_us(scan_counts, repeat)
+            key_counts_us = _median_us(
+                lambda: keyed.execute(KEYED_FRANCHISE_COUNTS_SQL).fetchall(), repeat,
+            )
+        finally:
+            text.close()
+            keyed.close()
+        return {
+            'orders': orders,
+            'textBytes': os.path.getsize(src),
+            'keyedBytes': os.path.getsize(dst),
+            'textJoinMs': round(text_join_us / 1000, 2),
+            'keyJoinMs': round(key_join_us / 1000, 2),
+            'franchiseScanMs': round(scan_us / 1000, 2),
+            'franchiseKeyMs': round(key_counts_us / 1000, 2),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Packed integer item keys')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('check', help='id ↔ 키 왕복, 버전 간 안정성, 사용자 DB 변환')
+    bench_parser = sub.add_parser('bench', help='TEXT id vs 정수 키')
+    bench_parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000])
+    bench_parser.add_argument(
+        '--orders', type=int, nargs='+', default=[10000, 200000],
+    )
+    bench_parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        raise SystemExit(0 if check() else 1)
+
+    print('Catalog (synthetic): point lookup by id')
+    print(
+        f'  {"rows":>9}{"TEXT µs":>9}{"key µs":>8}{"TEXT DB B":>14}{"keyed DB B":>14}'
+        f'{"id index B":>13}'
+    )
+    for rows in args.rows:
+        r = bench_catalog(rows, repeat=args.repeat)
+        print(
+            f'  {r["rows"]:>9,}{r["textLookupUs"]:>9.2f}{r["keyLookupUs"]:>8.2f}'
+            f'{r["textBytes"]:>14,}{r["keyedBytes"]:>14,}'
+            f'{r["textIdIndexBytes"] or 0:>13,}'
+        )
+    print('\nUser DB: size, order ⋈ menus join, franchise counts')
+    print(
+        f'  {"orders":>9}{"TEXT B":>13}{"keyed B":>13}{"join ms":>16}'
+        f'{"franchise ms":>20}'
+    )
+    for orders in args.orders:
+        r = bench_user(orders, repeat=args.repeat)
+        join = f'{r["textJoinMs"]:.1f} / {r["keyJoinMs"]:.1f}'
+        franchise = f'{r["franchiseScanMs"]:.1f} / {r["franchiseKeyMs"]:.1f}'
+        print(
+            f'  {r["orders"]:>9,}{r["textBytes"]:>13,}{r["keyedBytes"]:>13,}'
+            f'{join:>16}{franchise:>20}'
+        )
+    print('  (join, franchise: TEXT / keyed)')
+
+
+if __name__ == '__main__':
+    main()
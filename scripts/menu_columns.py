@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 메뉴 카탈로그 열 기반(columnar) 스냅샷
+
+generate_seed_db.py 가 DB 와 함께 build/menu_columns.bin 을 씁니다. 분석이나
+오프라인 추천 실행이 sqlite3 행 튜플(셀마다 Python 객체) 대신 파일을 mmap 해
+열을 바로 씁니다. 합성 카탈로그(synth_catalog.py, 수백만 행)도 같은 형식입니다.
+
+파일 형식 (little-endian):
+    header   '<4sIII'  magic, format, 행 수 N, meta 길이
+    meta     JSON — 열마다 kind 와 버퍼 목록 {이름: [offset, dtype, 개수]}.
+             뒤를 공백으로 채워 64바이트 경계에서 끝남
+    buffers  offset 은 meta 끝부터 센 값, 각 버퍼는 64바이트 정렬 (Arrow 와 같은 정렬)
+
+    kind        열                           버퍼
+    string      id, name, imageUrl           offsets int32[N + 1], data uint8,
+                                             (NULL 이 있으면) valid uint8[N]
+    dictionary  franchise, type              codes uint8/16/32 — 사전 순번
+                                             + 사전 dict_offsets int32, dict_data uint8
+    int         price, price_delivery,       values int32, NULL 은 -1
+                calories, price_updated_at   (날짜는 1970-01-01 기준 일수)
+    list        tags                         offsets int32[N + 1], codes — 쉼표로
+                                             나눈 태그의 사전 순번, 원래 순서 + 사전
+    flags       includes_side (bit 0),       values uint8
+                includes_drink (bit 1)
+
+string / list 는 Arrow 의 utf8 / list<dictionary> 와 같은 offsets + 값 배치라
+numpy 로 그대로 읽힙니다. 사전도 버퍼라서 meta 크기는 행 수·프랜차이즈 수와
+상관없습니다. MenuColumns 는 파일을 mmap 하고 buffer() 로 numpy 배열(없으면
+memoryview)을 복사 없이 돌려주므로, 여는 데는 header 와 meta 만 읽고 메모리는
+실제로 건드린 페이지만 (여러 프로세스가 공유하는 페이지 캐시로) 씁니다.
+
+Usage:
+    python3 scripts/menu_columns.py build [--db assets/menu_seed.db] [--out PATH]
+    python3 scripts/menu_columns.py build --rows 1000000 --out /tmp/menu_1m.bin
+    python3 scripts/menu_columns.py check          # DB → 스냅샷 → 행 비교
+    python3 scripts/menu_columns.py bench --rows 10000 100000 1000000 --workers 8
+"""
+
+import argparse
+import array
+import datetime
+import json
+import mmap
+import multiprocessing
+import os
+import sqlite3
+import statistics
+import struct
+import sys
+import tempfile
+import time
+
+from generate_delta import PROJECT_DIR
+from menu_source import MENU_COLUMNS
+
+try:
+    import numpy as np
+except ImportError:  # numpy 가 없으면 buffer() 는 memoryview
+    np = None
+
+COLUMNS_PATH = os.path.join(PROJECT_DIR, 'build', 'menu_columns.bin')
+DB_PATH = os.path.join(PROJECT_DIR, 'assets', 'menu_seed.db')
+
+MAGIC = b'BBMC'
+FORMAT = 1
+_HEADER = struct.Struct('<4sIII')
+ALIGNMENT = 64
+_EPOCH = datetime.date(1970, 1, 1)
+
+STRING_COLUMNS = ('id', 'name', 'imageUrl')
+DICTIONARY_COLUMNS = ('franchise', 'type')
+INT_COLUMNS = ('price', 'price_delivery', 'calories', 'price_updated_at')
+FLAG_BITS = ('includes_side', 'includes_drink')
+TAG_SEPARATOR = ','
+
+# array typecode ↔ numpy dtype (little-endian)
+_TYPECODES = {'B': '<u1', 'H': '<u2', 'I': '<u4', 'i': '<i4'}
+
+_COL = {name: i for i, name in enumerate(MENU_COLUMNS)}
+
+
+def _to_day(date):
+    if date is None:
+        return -1
+    return (datetime.date.fromisoformat(date) - _EPOCH).days
+
+
+def _from_day(day):
+    return None if day < 0 else (_EPOCH + datetime.timedelta(days=day)).isoformat()
+
+
+def _code_typecode(size):
+    if size <= 1 << 8:
+        return 'B'
+    return 'H' if size <= 1 << 16 else 'I'
+
+
+def _encode_strings(values):
+    """(offsets, data, valid 또는 None)"""
+    offsets = array.array('i', [0])
+    data = bytearray()
+    valid = array.array('B')
+    for value in values:
+        if value is not None:
+            data += value.encode('utf-8')
+        valid.append(value is not None)
+        offsets.append(len(data))
+    if len(data) >= 1 << 31:
+        raise ValueError('string column over 2 GiB')
+    return offsets, array.array('B', data), valid if 0 in valid else None
+
+
+def _dictionary_buffers(name, dictionary):
+    offsets, data, _ = _encode_strings(dictionary)
+    return [(name, 'dict_offsets', offsets), (name, 'dict_data', data)]
+
+
+def encode_columns(rows):
+    """MENU_COLUMNS 튜플 → ({열: meta}, [(열, 버퍼 이름, array)])"""
+    columns = {}
+    buffers = []
+
+    for name in STRING_COLUMNS:
+        offsets, data, valid = _encode_strings(row[_COL[name]] for row in rows)
+        columns[name] = {'kind': 'string'}
+        buffers += [(name, 'offsets', offsets), (name, 'data', data)]
+        if valid is not None:
+            buffers.append((name, 'valid', valid))
+
+    for name in DICTIONARY_COLUMNS:
+        values = [row[_COL[name]] for row in rows]
+        dictionary = list(dict.fromkeys(values))
+        lookup = {value: i for i, value in enumerate(dictionary)}
+        codes = array.array(
+            _code_typecode(len(dictionary)), (lookup[value] for value in values),
+        )
+        columns[name] = {'kind': 'dictionary'}
+        buffers.append((name, 'codes', codes))
+        buffers += _dictionary_buffers(name, dictionary)
+
+    for name in INT_COLUMNS:
+        convert = _to_day if name == 'price_updated_at' else (lambda v: v)
+        values = array.array('i', (
+            -1 if row[_COL[name]] is None else convert(row[_COL[name]]) for row in rows
+        ))
+        columns[name] = {'kind': 'int', 'null': -1}
+        buffers.append((name, 'values', values))
+
+    tag_lists = []
+    for row in rows:
+        tags = row[_COL['tags']]
+        if tags is None:
+            raise ValueError(f'{row[_COL["id"]]}: tags is NULL (expected a string)')
+        tag_lists.append(tags.split(TAG_SEPARATOR) if tags else [])
+    dictionary = list(dict.fromkeys(tag for tags in tag_lists for tag in tags))
+    lookup = {tag: i for i, tag in enumerate(dictionary)}
+    offsets = array.array('i', [0])
+    codes = array.array(_code_typecode(len(dictionary)))
+    for tags in tag_lists:
+        codes.extend(lookup[tag] for tag in tags)
+        offsets.append(len(codes))
+    columns['tags'] = {'kind': 'list'}
+    buffers += [('tags', 'offsets', offsets), ('tags', 'codes', codes)]
+    buffers += _dictionary_buffers('tags', dictionary)
+
+    flags = array.array('B', (
+        sum(1 << bit for bit, name in enumerate(FLAG_BITS) if row[_COL[name]])
+        for row in rows
+    ))
+    columns['flags'] = {'kind': 'flags', 'bits': list(FLAG_BITS)}
+    buffers.append(('flags', 'values', flags))
+    return columns, buffers
+
+
+def write_columns(path, rows):
+    """열 기반 스냅샷 저장 → 파일 크기
+
+    rows: MENU_COLUMNS 순서 튜플 (generate_seed_db 의 menu_rows, DB 행, 합성 카탈로그)
+    """
+    rows = rows if isinstance(rows, list) else list(rows)
+    columns, buffers = encode_columns(rows)
+
+    placed = []
+    position = 0
+    for name, part, values in buffers:
+        position += -position % ALIGNMENT
+        columns[name].setdefault('buffers', {})[part] = [
+            position, _TYPECODES[values.typecode], len(values),
+        ]
+        placed.append((values, position))
+        position += len(values) * values.itemsize
+
+    meta = json.dumps(
+        {'columns': columns},
+        ensure_ascii=False, separators=(',', ':'),
+    ).encode('utf-8')
+    meta += b' ' * (-(_HEADER.size + len(meta)) % ALIGNMENT)
+    data_start = _HEADER.size + len(meta)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT, len(rows), len(meta)))
+        f.write(meta)
+        for values, offset in placed:
+            f.write(b'\0' * (data_start + offset - f.tell()))
+            if sys.byteorder != 'little' and values.itemsize > 1:
+                values = array.array(values.typecode, values)
+                values.byteswap()
+            values.tofile(f)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def _release(buffers):
+    for view in buffers.values():
+        if isinstance(view, memoryview):
+            view.release()
+
+
+class MenuColumns:
+    """mmap 으로 연 열 기반 스냅샷 (with 문으로 사용)
+
+    buffer(열, 버퍼) 는 numpy 배열 (numpy 가 없으면 memoryview) — 복사 없음.
+    """
+
+    def __init__(self, path=COLUMNS_PATH):
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, self.rows, meta_len = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or fmt != FORMAT:
+            raise ValueError(f'{path}: not a menu column snapshot (format {FORMAT})')
+        meta = json.loads(self._mmap[_HEADER.size:_HEADER.size + meta_len])
+        self.columns = meta['columns']
+        self._data_start = _HEADER.size + meta_len
+        self._buffers = {}
+        self._dictionaries = {}
+
+    def close(self):
+        """buffer() 로 받은 배열을 들고 있으면 mmap 을 닫을 수 없음 (BufferError)"""
+        _release(self._buffers)
+        self._buffers = {}
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.rows
+
+    def buffer(self, column, part='values'):
+        key = (column, part)
+        if key not in self._buffers:
+            self._buffers[key] = self._map_buffer(*self.columns[column]['buffers'][part])
+        return self._buffers[key]
+
+    def _map_buffer(self, offset, dtype, count):
+        offset += self._data_start
+        if np is not None:
+            return np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+        typecode = next(code for code, name in _TYPECODES.items() if name == dtype)
+        view = memoryview(self._mmap)[offset:offset + count * struct.calcsize(typecode)]
+        if sys.byteorder == 'little':
+            return view.cast(typecode)
+        values = array.array(typecode, view)
+        view.release()
+        values.byteswap()
+        return values
+
+    def _string_at(self, column, i, offsets_part, data_part):
+        offsets = self.buffer(column, offsets_part)
+        start = self._data_start + self.columns[column]['buffers'][data_part][0]
+        return self._mmap[start + offsets[i]:start + offsets[i + 1]].decode('utf-8')
+
+    def dictionary(self, column):
+        """사전 값 목록 (처음 부를 때 한 번 디코딩)"""
+        if column not in self._dictionaries:
+            _, _, count = self.columns[column]['buffers']['dict_offsets']
+            self._dictionaries[column] = [
+                self._string_at(column, i, 'dict_offsets', 'dict_data')
+                for i in range(count - 1)
+            ]
+        return self._dictionaries[column]
+
+    def string(self, column, i):
+        buffers = self.columns[column]['buffers']
+        if 'valid' in buffers and not self.buffer(column, 'valid')[i]:
+            return None
+        return self._string_at(column, i, 'offsets', 'data')
+
+    def strings(self, column):
+        return [self.string(column, i) for i in range(self.rows)]
+
+    def row(self, i):
+        """MENU_COLUMNS 순서 튜플 — DB 의 menus 행과 같은 값"""
+        values = {name: self.string(name, i) for name in STRING_COLUMNS}
+        for name in DICTIONARY_COLUMNS:
+            values[name] = self.dictionary(name)[self.buffer(name, 'codes')[i]]
+        for name in INT_COLUMNS:
+            value = int(self.buffer(name)[i])
+            if value < 0:
+                value = None
+            elif name == 'price_updated_at':
+                value = _from_day(value)
+            values[name] = value
+        tag_offsets = self.buffer('tags', 'offsets')
+        codes = self.buffer('tags', 'codes')[tag_offsets[i]:tag_offsets[i + 1]]
+        tags = self.dictionary('tags')
+        values['tags'] = TAG_SEPARATOR.join(tags[code] for code in codes)
+        flags = int(self.buffer('flags')[i])
+        for bit, name in enumerate(FLAG_BITS):
+            values[name] = (flags >> bit) & 1
+        return tuple(values[name] for name in MENU_COLUMNS)
+
+
+def read_db_rows(db_path=DB_PATH):
+    """menus 행 (MENU_COLUMNS 순서, rowid 순)"""
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        return conn.execute(
+            f'SELECT {", ".join(MENU_COLUMNS)} FROM menus ORDER BY rowid'
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+# ══════════════════════════════════════════════
+# check / bench
+# ══════════════════════════════════════════════
+
+def check(db_path=DB_PATH):
+    rows = read_db_rows(db_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menu_columns.bin')
+        size = write_columns(path, rows)
+        with MenuColumns(path) as columns:
+            decoded = [columns.row(i) for i in range(len(columns))]
+            aligned = all(
+                offset % ALIGNMENT == 0
+                for column in columns.columns.values()
+                for offset, _, _ in column['buffers'].values()
+            )
+    mismatches = sum(a != b for a, b in zip(rows, decoded)) + abs(len(rows) - len(decoded))
+    print(
+        f'{len(rows)} rows → {size:,} bytes (DB {os.path.getsize(db_path):,}); '
+        f'{mismatches} mismatched rows, buffers aligned: {aligned}'
+    )
+    return mismatches == 0 and aligned
+
+
+def _private_bytes():
+    """이 프로세스의 private(공유되지 않는) 메모리 — Linux 전용, 없으면 None"""
+    try:
+        with open('/proc/self/smaps_rollup', encoding='ascii') as f:
+            fields = dict(line.split(':', 1) for line in f if ':' in line)
+    except OSError:
+        return None
+    return sum(
+        int(fields[name].split()[0]) * 1024
+        for name in ('Private_Clean', 'Private_Dirty') if name in fields
+    )
+
+
+def _median_us(fn, repeat=50):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def _mean_price_by_type(columns):
+    prices = columns.buffer('price')
+    codes = columns.buffer('type', 'codes')
+    sums = np.bincount(codes, weights=prices)
+    counts = np.bincount(codes)
+    return {
+        name: sums[i] / counts[i]
+        for i, name in enumerate(columns.dictionary('type')) if counts[i]
+    }
+
+
+def _worker(path, queue):
+    before = _private_bytes()
+    with MenuColumns(path) as columns:
+        opened = _private_bytes()
+        _mean_price_by_type(columns)
+        queried = _private_bytes()
+    if before is None:
+        queue.put((None, None))
+    else:
+        queue.put((opened - before, queried - before))
+
+
+def bench(row_counts, workers, seed=0):
+    import tracemalloc
+
+    from synth_catalog import generate_catalog, write_catalog_db
+
+    print(
+        f'  {"rows":>10}{"file B":>13}{"DB B":>13}{"open µs":>9}{"scan ms":>9}'
+        f'{"sqlite ms":>11}{"sqlite MiB":>12}{"worker open/scan KiB":>22}'
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in row_counts:
+            catalog = generate_catalog(rows, seed=seed)
+            path = os.path.join(tmp, f'menu_{rows}.bin')
+            db_path = os.path.join(tmp, f'menu_{rows}.db')
+            size = write_columns(path, catalog)
+            write_catalog_db(db_path, catalog)
+            del catalog
+
+            open_us = _median_us(lambda: MenuColumns(path).close())
+            with MenuColumns(path) as columns:
+                scan_ms = _median_us(lambda: _mean_price_by_type(columns), 5) / 1000
+
+            # 지금 방식: sqlite3 행 튜플로 전부 읽기 (시간, 그다음 메모리)
+            started = time.perf_counter()
+            read_db_rows(db_path)
+            load_ms = (time.perf_counter() - started) * 1000
+            tracemalloc.start()
+            read_db_rows(db_path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            context = multiprocessing.get_context('spawn')
+            queue = context.Queue()
+            processes = [
+                context.Process(target=_worker, args=(path, queue))
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            results = [queue.get() for _ in processes]
+            for process in processes:
+                process.join()
+            if results[0][0] is None:
+                private_text = '-'
+            else:
+                private_text = (
+                    f'{max(r[0] for r in results) / 1024:,.0f} / '
+                    f'{max(r[1] for r in results) / 1024:,.0f}'
+                )
+            print(
+                f'  {rows:>10,}{size:>13,}{os.path.getsize(db_path):>13,}'
+                f'{open_us:>9.1f}{scan_ms:>9.2f}{load_ms:>11,.0f}'
+                f'{peak / 2**20:>12,.1f}{private_text:>22}'
+            )
+    print(
+        f'  scan = mean price by type over the mapped columns; worker = max private '
+        f'(unshared) memory of {workers} spawned workers after opening / after the scan'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar menu snapshot')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='스냅샷 생성')
+    build.add_argument('--db', default=DB_PATH)
+    build.add_argument('--rows', type=int, help='DB 대신 synth_catalog 로 rows 행 생성')
+    build.add_argument('--seed', type=int, default=0)
+    build.add_argument('--out', default=COLUMNS_PATH)
+
+    check_parser = sub.add_parser('check', help='DB 행과 스냅샷 행 비교')
+    check_parser.add_argument('--db', default=DB_PATH)
+
+    bench_parser = sub.add_parser('bench', help='열기 / 로드 / 메모리 비교')
+    bench_parser.add_argument(
+        '--rows', type=int, nargs='+', default=[10000, 100000, 1000000],
+    )
+    bench_parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        raise SystemExit(0 if check(args.db) else 1)
+    if args.command == 'bench':
+        if np is None:
+            raise SystemExit('bench requires numpy')
+        bench(args.rows, args.workers)
+        return
+
+    if args.rows:
+        from synth_catalog import generate_catalog
+        rows = generate_catalog(args.rows, seed=args.seed)
+    else:
+        rows = read_db_rows(args.db)
+    size = write_columns(args.out, rows)
+    print(f'Wrote: {args.out} ({len(rows):,} rows, {size:,} bytes)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+"""
+Burger Budget - 메뉴 소스 파일 로더
+
+메뉴 데이터는 scripts/menu_data/{franchise}.csv 에 프랜차이즈별로 있습니다.
+로더는 파일을 한 줄씩 읽으며 검증하고, MENU_COLUMNS 순서의 튜플을
+하나씩 내보냅니다. insert_menus()는 이 스트림을 BATCH_SIZE 단위 트랜잭션으로
+넣으므로 메모리는 카탈로그 크기와 상관없이 배치 하나 분량입니다.
+
+파일 형식:
+  - `#` 로 시작하는 줄과 빈 줄은 주석 (섹션 제목, 제외 메뉴 메모 등)
+  - 첫 번째 주석이 아닌 줄은 헤더: FILE_COLUMNS
+  - franchise 는 파일 이름에서 가져옵니다
+  - 빈 칸은 NULL (tags만 빈 문자열), note 는 DB에 넣지 않는 메모
+
+지역·매장별 가격은 scripts/menu_data/regions/{region}.csv 에 기본가와 다른
+메뉴만 적습니다 (헤더: REGION_FILE_COLUMNS, 빈 칸은 기본가 그대로).
+region 은 파일 이름이고 소문자·숫자·`_`·`-` 만 씁니다 (예: seoul, store-1234).
+
+Data source: .claude/price-collection/price-summary.md
+price = 매장가격 (공식앱 매장주문 기준)
+price_delivery = 배달가격 (비어 있으면 배달 정보 없음)
+  맥도날드/버거킹/KFC/롯데리아 → 공식앱 배달주문
+  맘스터치 → 배달의민족(배민) (공식앱은 매장=배달 동일가)
+"""
+
+import csv
+import os
+import re
+import sqlite3
+from collections import Counter
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MENU_DATA_DIR = os.path.join(SCRIPT_DIR, 'menu_data')
+
+# DB에 들어가는 순서 (rowid 순서이자 동점 정렬 기준)
+FRANCHISES = ('mcd', 'bk', 'kfc', 'mom', 'lot')
+
+MENU_COLUMNS = (
+    'id', 'franchise', 'name', 'type', 'price', 'price_delivery',
+    'price_updated_at', 'calories', 'imageUrl', 'tags', 'includes_side',
+    'includes_drink',
+)
+
+FILE_COLUMNS = (
+    'id', 'name', 'type', 'price', 'price_delivery', 'price_updated_at',
+    'calories', 'imageUrl', 'tags', 'includes_side', 'includes_drink', 'note',
+)
+
+MENU_TYPES = ('burger', 'side', 'drink', 'set', 'dessert')
+
+# 지역·매장별 가격: regions/{region}.csv 에 기본가와 다른 메뉴만
+REGION_DATA_DIR = os.path.join(MENU_DATA_DIR, 'regions')
+REGION_FILE_COLUMNS = ('id', 'price', 'price_delivery', 'note')
+
+BATCH_SIZE = 5000
+
+_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_REGION = re.compile(r'^[a-z0-9][a-z0-9_-]*$')
+
+
+def _int(value, column, required=False, minimum=None):
+    if value == '':
+        if required:
+            raise ValueError(f'{column} is required')
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f'{column} must be an integer, got {value!r}') from None
+    if minimum is not None and number < minimum:
+        raise ValueError(f'{column} must be >= {minimum}, got {number}')
+    return number
+
+
+def _flag(value, column):
+    if value not in ('0', '1'):
+        raise ValueError(f'{column} must be 0 or 1, got {value!r}')
+    return int(value)
+
+
+def parse_row(franchise, record):
+    """CSV 레코드(dict) → MENU_COLUMNS 튜플 (잘못된 값이면 ValueError)"""
+    menu_id = record['id']
+    if not menu_id.startswith(f'{franchise}_'):
+        raise ValueError(f'id {menu_id!r} must start with {franchise}_')
+    if not record['name'].strip():
+        raise ValueError('name is required')
+    if record['type'] not in MENU_TYPES:
+        raise ValueError(f'type must be one of {", ".join(MENU_TYPES)}')
+    updated_at = record['price_updated_at'] or None
+    if updated_at is not None and not _DATE.match(updated_at):
+        raise ValueError(f'price_updated_at must be YYYY-MM-DD, got {updated_at!r}')
+
+    return (
+        menu_id,
+        franchise,
+        record['name'],
+        record['type'],
+        _int(record['price'], 'price', required=True, minimum=1),
+        _int(record['price_delivery'], 'price_delivery', minimum=1),
+        updated_at,
+        _int(record['calories'], 'calories', minimum=0),
+        record['imageUrl'] or None,
+        record['tags'],
+        _flag(record['includes_side'], 'includes_side'),
+        _flag(record['includes_drink'], 'includes_drink'),
+    )
+
+
+def _data_lines(f):
+    """(줄 번호, 줄) — 주석과 빈 줄 제외"""
+    for number, line in enumerate(f, start=1):
+        stripped = line.strip()
+        if stripped and not stripped.startswith('#'):
+            yield number, line
+
+
+def _iter_records(path, columns, parse):
+    """CSV 파일 하나를 스트리밍으로 읽어 parse(record dict) 결과를 내보냄
+
+    잘못된 행은 파일:줄 번호를 붙인 ValueError.
+    """
+    with open(path, encoding='utf-8', newline='') as f:
+        lines = _data_lines(f)
+        numbers = []
+
+        def tracked():
+            for number, line in lines:
+                numbers.append(number)
+                yield line
+
+        reader = csv.reader(tracked())
+        header = next(reader, None)
+        if tuple(header or ()) != columns:
+            raise ValueError(
+                f'{path}: header must be {",".join(columns)}'
+            )
+        for values in reader:
+            line = numbers[-1]
+            del numbers[:]
+            if len(values) != len(columns):
+                raise ValueError(
+                    f'{path}:{line}: expected {len(columns)} columns, '
+                    f'got {len(values)}'
+                )
+            try:
+                yield parse(dict(zip(columns, values)))
+            except ValueError as e:
+                raise ValueError(f'{path}:{line}: {e}') from None
+
+
+def iter_franchise_rows(path, franchise):
+    """소스 파일 하나를 스트리밍으로 읽어 검증된 튜플을 내보냄"""
+    return _iter_records(
+        path, FILE_COLUMNS, lambda record: parse_row(franchise, record),
+    )
+
+
+def iter_menu_rows(data_dir=MENU_DATA_DIR, franchises=FRANCHISES):
+    """모든 프랜차이즈 소스 파일을 FRANCHISES 순서로 스트리밍"""
+    known = {f'{franchise}.csv' for franchise in franchises}
+    unknown = sorted(
+        name for name in os.listdir(data_dir)
+        if name.endswith('.csv') and name not in known
+    )
+    if unknown:
+        raise ValueError(
+            f'{data_dir}: {", ".join(unknown)} not listed in FRANCHISES'
+        )
+    for franchise in franchises:
+        yield from iter_franchise_rows(
+            os.path.join(data_dir, f'{franchise}.csv'), franchise,
+        )
+
+
+def parse_override(region, record):
+    """지역 가격 CSV 레코드 → (menu_id, region, price, price_delivery)"""
+    if not record['id']:
+        raise ValueError('id is required')
+    price = _int(record['price'], 'price', minimum=1)
+    delivery = _int(record['price_delivery'], 'price_delivery', minimum=1)
+    if price is None and delivery is None:
+        raise ValueError('price or price_delivery is required')
+    return record['id'], region, price, delivery
+
+
+def iter_region_overrides(data_dir=REGION_DATA_DIR):
+    """지역별 가격 파일(regions/{region}.csv)을 지역 이름 순으로 스트리밍
+
+    디렉터리가 없으면 아무것도 내보내지 않습니다.
+    """
+    if not os.path.isdir(data_dir):
+        return
+    for name in sorted(os.listdir(data_dir)):
+        if not name.endswith('.csv'):
+            continue
+        region = name[:-len('.csv')]
+        path = os.path.join(data_dir, name)
+        if not _REGION.match(region):
+            raise ValueError(f'{path}: region must match {_REGION.pattern}')
+        yield from _iter_records(
+            path, REGION_FILE_COLUMNS,
+            lambda record: parse_override(region, record),
+        )
+
+
+def load_menus(data_dir=MENU_DATA_DIR):
+    """전체 메뉴를 리스트로 (조합·캐시처럼 전체가 필요한 계산용)
+
+    중복 id가 있으면 ValueError.
+    """
+    menus = list(iter_menu_rows(data_dir))
+    counts = Counter(row[0] for row in menus)
+    dupes = sorted(key for key, count in counts.items() if count > 1)
+    if dupes:
+        raise ValueError(f'Duplicate menu ids: {", ".join(dupes)}')
+    return menus
+
+
+def insert_menus(conn, rows, columns=MENU_COLUMNS, batch_size=BATCH_SIZE):
+    """rows 스트림을 batch_size 행씩 별도 트랜잭션으로 insert
+
+    중복 id는 PRIMARY KEY 제약으로 잡아 ValueError로 바꿉니다.
+    Returns: insert 한 행 수
+    """
+    placeholders = ', '.join('?' * len(columns))
+    sql = f'INSERT INTO menus ({", ".join(columns)}) VALUES ({placeholders})'
+    id_index = columns.index('id')
+    total = 0
+    batch = []
+
+    def flush():
+        try:
+            with conn:
+                conn.executemany(sql, batch)
+        except sqlite3.IntegrityError:
+            ids = [row[id_index] for row in batch]
+            dupes = {key for key, count in Counter(ids).items() if count > 1}
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                dupes.update(row[0] for row in conn.execute(
+                    f'SELECT id FROM menus WHERE id IN ({", ".join("?" * len(chunk))})',
+                    chunk,
+                ))
+            raise ValueError(
+                f'Duplicate menu ids: {", ".join(sorted(dupes))}'
+            ) from None
+
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush()
+            total += len(batch)
+            batch = []
+    if batch:
+        flush()
+        total += len(batch)
+    return total
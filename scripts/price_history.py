@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 가격 이력 저장소
+
+gh-pages/data/menu_v*.db 의 모든 배포 버전을 읽어 메뉴별 가격 변화를 하나의
+열 기반(columnar) 파일로 모읍니다. 값이 바뀐 시점만 점(point)으로 남깁니다.
+
+파일 형식 (little-endian):
+    header   '<4sIIII'  magic, format, 메뉴 수 N, 점 수 P, meta 길이
+    meta     JSON — versions [[version, date]], items [[id, franchise, type,
+             name, 마지막으로 보인 version]] (id 순, 4바이트 정렬)
+    int32[N + 1]  offsets   메뉴 i의 점은 [offsets[i], offsets[i + 1])
+    int32[P]      version
+    int32[P]      day       1970-01-01 기준 일수, 날짜 없으면 -1
+    int32[P]      price
+    int32[P]      delivery  배달가 없으면 -1
+
+PriceHistory 는 파일을 mmap 한 뒤 열마다 memoryview 로 바로 읽으므로
+메뉴 이력 조회는 offsets 두 칸 + 해당 구간만 봅니다.
+
+버전마다 id가 밀렸을 수 있어서(위치 기반 id 시절), 현재 메뉴 소스의 id를
+기준으로 최신 배포 버전부터 한 버전씩 거슬러 올라가며 stable_ids.match_bucket
+으로 같은 메뉴를 잇습니다. 현재 id는 번들 DB 기준이라 최신 배포본(v5)의 id와
+다른 메뉴를 가리키므로, 배포본의 id를 그대로 키로 쓰면 다른 메뉴의 이력이
+붙습니다. 이어 붙인 메뉴의 마지막 이력 이름은 현재 이름과 같아야 하고,
+다르면 match_bucket 이 받아들인 이름 변경(Dice ≥ MATCH_THRESHOLD)이어야
+합니다 (check_names).
+
+Usage:
+    python3 scripts/price_history.py build               # build/price_history.bin
+    python3 scripts/price_history.py check               # 이력 이름 ↔ 현재 이름
+    python3 scripts/price_history.py item mcd_set_01
+    python3 scripts/price_history.py franchises
+    python3 scripts/price_history.py movers --limit 10 [--delivery]
+"""
+
+import argparse
+import array
+import datetime
+import json
+import mmap
+import os
+import struct
+import sys
+
+from generate_delta import DATA_DIR, PROJECT_DIR, published_versions, read_snapshot
+from menu_source import MENU_COLUMNS, load_menus
+from stable_ids import MATCH_THRESHOLD, dice, match_bucket, name_grams, normalize
+
+STORE_PATH = os.path.join(PROJECT_DIR, 'build', 'price_history.bin')
+
+MAGIC = b'BBPH'
+FORMAT = 1
+_HEADER = struct.Struct('<4sIIII')
+_EPOCH = datetime.date(1970, 1, 1)
+
+PRICE_HISTORY_COLUMNS = ('menu_id', 'seq', 'date', 'price', 'price_delivery')
+
+PRICE_HISTORY_SCHEMA = [
+    '''
+        CREATE TABLE price_history (
+            menu_id        TEXT NOT NULL REFERENCES menus(id),
+            seq            INTEGER NOT NULL,
+            date           TEXT,
+            price          INTEGER NOT NULL,
+            price_delivery INTEGER,
+            PRIMARY KEY (menu_id, seq)
+        ) WITHOUT ROWID
+    ''',
+]
+
+
+def _to_day(date):
+    if date is None:
+        return -1
+    return (datetime.date.fromisoformat(date) - _EPOCH).days
+
+
+def _from_day(day):
+    return None if day < 0 else (_EPOCH + datetime.timedelta(days=day)).isoformat()
+
+
+def read_versions(data_dir=DATA_DIR):
+    """[(version, 날짜, [메뉴 dict])] — 버전 오름차순
+
+    날짜는 그 버전의 가장 늦은 price_updated_at (컬럼이 없던 버전은 None)
+    """
+    snapshots = []
+    for version, path in published_versions(data_dir):
+        snapshot = read_snapshot(path)
+        columns = snapshot['columns']
+        menus = [
+            dict(zip(columns, row[1:]))
+            for row in sorted(snapshot['rows'].values())
+        ]
+        dates = [m['price_updated_at'] for m in menus if m.get('price_updated_at')]
+        snapshots.append((version, max(dates, default=None), menus))
+    return snapshots
+
+
+def _buckets(menus):
+    buckets = {}
+    for menu in menus:
+        buckets.setdefault((menu['franchise'], menu['type']), []).append(menu)
+    return buckets
+
+
+def link_versions(snapshots, current=None):
+    """버전별 {원래 id: 기준 id}
+
+    current(현재 메뉴 dict 목록)가 있으면 그 id가 기준이고, 최신 배포 버전도
+    현재 메뉴와 짝지은 id를 물려받습니다. 없으면 최신 버전이 자기 id 그대로입니다.
+    그 앞 버전은 바로 다음 버전과 짝지은 id를 물려받습니다. 짝이 없는(그 뒤로
+    사라진) 메뉴는 id가 겹치지 않으면 그대로, 겹치면 `id@v{version}` 입니다.
+    """
+    links = {}
+    taken = set()
+    newer = newer_links = None
+    if current is not None:
+        newer = current
+        newer_links = {menu['id']: menu['id'] for menu in current}
+        taken.update(newer_links)
+    for version, _, menus in reversed(snapshots):
+        link = {}
+        if newer is not None:
+            newer_buckets = _buckets(newer)
+            for key, bucket in _buckets(menus).items():
+                previous = newer_buckets.get(key, [])
+                matches = match_bucket(
+                    [(m['id'], m['name'], m['price']) for m in bucket],
+                    [(m['id'], m['name'], m['price']) for m in previous],
+                )
+                for i, (j, _) in matches.items():
+                    link[bucket[i]['id']] = newer_links[previous[j]['id']]
+        for menu in menus:
+            if menu['id'] not in link:
+                canonical = menu['id']
+                if canonical in taken:
+                    canonical = f'{canonical}@v{version}'
+                link[menu['id']] = canonical
+        taken.update(link.values())
+        links[version] = link
+        newer, newer_links = menus, link
+    return links
+
+
+def collect_history(snapshots, current=None):
+    """Returns: {id: {franchise, type, name, lastVersion, points}}
+
+    id 는 current 가 있으면 현재 메뉴 id (link_versions 참고).
+    name 은 그 메뉴가 마지막으로 배포된 버전의 이름입니다.
+    points: [(version, date, price, price_delivery)] — 값이 바뀐 버전만
+    """
+    links = link_versions(snapshots, current)
+    items = {}
+    for version, _, menus in snapshots:
+        for menu in menus:
+            item = items.setdefault(links[version][menu['id']], {'points': []})
+            # 이름·분류는 가장 최근 버전 기준
+            item.update(
+                franchise=menu['franchise'], type=menu['type'],
+                name=menu['name'], lastVersion=version,
+            )
+            point = (
+                version, menu.get('price_updated_at'),
+                menu['price'], menu.get('price_delivery'),
+            )
+            points = item['points']
+            if not points or points[-1][2:] != point[2:]:
+                points.append(point)
+    return items
+
+
+def check_names(items, menus):
+    """현재 메뉴마다 마지막 이력 이름과 현재 이름 비교
+
+    Returns: (renamed, mismatched) — [(id, 이력 이름, 현재 이름)]
+             renamed 는 match_bucket 기준을 넘는 이름 변경, mismatched 는 다른 메뉴
+    """
+    renamed = []
+    mismatched = []
+    for menu in menus:
+        item = items.get(menu['id'])
+        if item is None or normalize(item['name']) == normalize(menu['name']):
+            continue
+        entry = (menu['id'], item['name'], menu['name'])
+        if dice(name_grams(item['name']), name_grams(menu['name'])) >= MATCH_THRESHOLD:
+            renamed.append(entry)
+        else:
+            mismatched.append(entry)
+    return renamed, mismatched
+
+
+def current_menus():
+    """메뉴 소스 → 메뉴 dict 목록 (id 는 번들 DB 기준의 현재 id)"""
+    return [dict(zip(MENU_COLUMNS, row)) for row in load_menus()]
+
+
+def write_store(path, snapshots, items):
+    """열 기반 파일로 저장 → 파일 크기"""
+    ids = sorted(items)
+    offsets = array.array('i', [0])
+    columns = [array.array('i') for _ in range(4)]
+    for menu_id in ids:
+        for version, date, price, delivery in items[menu_id]['points']:
+            columns[0].append(version)
+            columns[1].append(_to_day(date))
+            columns[2].append(price)
+            columns[3].append(-1 if delivery is None else delivery)
+        offsets.append(len(columns[0]))
+
+    meta = json.dumps({
+        'versions': [[version, date] for version, date, _ in snapshots],
+        'items': [
+            [i, items[i]['franchise'], items[i]['type'], items[i]['name'],
+             items[i]['lastVersion']]
+            for i in ids
+        ],
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    meta += b' ' * (-len(meta) % 4)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT, len(ids), len(columns[0]), len(meta)))
+        f.write(meta)
+        for column in (offsets, *columns):
+            if sys.byteorder != 'little':
+                column.byteswap()
+            column.tofile(f)
+    return os.path.getsize(path)
+
+
+class PriceHistory:
+    """mmap 으로 연 가격 이력 저장소 (with 문으로 사용)"""
+
+    def __init__(self, path=STORE_PATH):
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, fmt, n_items, n_points, meta_len = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or fmt != FORMAT:
+            raise ValueError(f'{path}: not a price history store (format {FORMAT})')
+        start = _HEADER.size
+        meta = json.loads(self._mmap[start:start + meta_len])
+        start += meta_len
+
+        def column(count):
+            nonlocal start
+            view = memoryview(self._mmap)[start:start + count * 4]
+            start += count * 4
+            if sys.byteorder == 'little':
+                return view.cast('i')
+            values = array.array('i', view)
+            values.byteswap()
+            return values
+
+        self._offsets = column(n_items + 1)
+        self._version, self._day, self._price, self._delivery = (
+            column(n_points) for _ in range(4)
+        )
+        self.versions = [tuple(v) for v in meta['versions']]
+        self.items = [tuple(item) for item in meta['items']]
+        self._index = {item[0]: i for i, item in enumerate(self.items)}
+
+    def close(self):
+        for view in (self._offsets, self._version, self._day,
+                     self._price, self._delivery):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _points(self, i):
+        return range(self._offsets[i], self._offsets[i + 1])
+
+    def history(self, menu_id):
+        """[(version, date, price, price_delivery)] — 없는 id면 KeyError"""
+        return [
+            (
+                self._version[p], _from_day(self._day[p]), self._price[p],
+                None if self._delivery[p] < 0 else self._delivery[p],
+            )
+            for p in self._points(self._index[menu_id])
+        ]
+
+    def _span(self, i, delivery=False):
+        """비교할 첫 점·마지막 점 위치 (배달가는 값이 있는 첫 점부터)"""
+        first, last = self._offsets[i], self._offsets[i + 1] - 1
+        if delivery:
+            while first < last and self._delivery[first] < 0:
+                first += 1
+        return first, last
+
+    def _change(self, i, delivery=False):
+        """첫 점 → 마지막 점 변화율 (비교할 수 없으면 None)"""
+        first, last = self._span(i, delivery)
+        column = self._delivery if delivery else self._price
+        if column[first] <= 0 or column[last] < 0:
+            return None
+        return column[last] / column[first] - 1
+
+    def franchise_changes(self, delivery=False):
+        """{franchise: (메뉴 수, 평균 변화율)}
+
+        두 버전 이상 배포된 메뉴만 셉니다 (값이 그대로면 0%).
+        """
+        totals = {}
+        for i, (_, franchise, _, _, last_version) in enumerate(self.items):
+            if self._version[self._offsets[i]] >= last_version:
+                continue
+            change = self._change(i, delivery)
+            if change is None:
+                continue
+            count, total = totals.get(franchise, (0, 0.0))
+            totals[franchise] = (count + 1, total + change)
+        return {
+            franchise: (count, total / count)
+            for franchise, (count, total) in sorted(totals.items())
+        }
+
+    def movers(self, limit=10, delivery=False):
+        """변화율 절댓값이 큰 순 [(id, name, 처음 가격, 마지막 가격, 변화율)]"""
+        column = self._delivery if delivery else self._price
+        moved = []
+        for i, item in enumerate(self.items):
+            change = self._change(i, delivery)
+            if change:
+                first, last = self._span(i, delivery)
+                moved.append((item[0], item[3], column[first], column[last], change))
+        moved.sort(key=lambda m: (-abs(m[4]), m[0]))
+        return moved[:limit]
+
+
+def build_price_history_rows(snapshots, menus):
+    """시드 DB price_history 행: 현재 메뉴 중 가격이 한 번이라도 바뀐 것만
+
+    menus: 현재 메뉴 dict 목록 — 마지막 배포본과 다르면 현재 값이 마지막 점
+    이력이 다른 메뉴에 붙으면(check_names 의 mismatched) ValueError
+    """
+    items = collect_history(snapshots, menus) if snapshots else {}
+    _, mismatched = check_names(items, menus)
+    if mismatched:
+        raise ValueError(
+            'Price history linked to a different menu: '
+            + ', '.join(f'{i} ({old} ≠ {new})' for i, old, new in mismatched[:5])
+        )
+    rows = []
+    for menu in menus:
+        points = [p[1:] for p in items.get(menu['id'], {}).get('points', [])]
+        current = (menu['price_updated_at'], menu['price'], menu['price_delivery'])
+        if not points or points[-1][1:] != current[1:]:
+            points.append(current)
+        if len(points) < 2:
+            continue
+        rows.extend(
+            (menu['id'], seq, date, price, delivery)
+            for seq, (date, price, delivery) in enumerate(points)
+        )
+    return sorted(rows)
+
+
+def _pct(change):
+    return f'{change:+.1%}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Menu price history store')
+    parser.add_argument('--store', default=STORE_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('build', help='배포된 모든 버전으로 저장소 생성')
+    sub.add_parser('check', help='마지막 이력 이름이 현재 이름과 같은지 확인')
+    item = sub.add_parser('item', help='메뉴 하나의 가격 이력')
+    item.add_argument('menu_id')
+    franchises = sub.add_parser('franchises', help='프랜차이즈별 평균 변화율')
+    franchises.add_argument('--delivery', action='store_true')
+    movers = sub.add_parser('movers', help='변화율이 큰 메뉴')
+    movers.add_argument('--limit', type=int, default=10)
+    movers.add_argument('--delivery', action='store_true')
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        menus = current_menus()
+        renamed, mismatched = check_names(
+            collect_history(read_versions(), menus), menus,
+        )
+        for menu_id, old, new in renamed:
+            print(f'  renamed   {menu_id}: {old} → {new}')
+        for menu_id, old, new in mismatched:
+            print(f'  MISMATCH  {menu_id}: {old} ≠ {new}')
+        if mismatched:
+            raise SystemExit(f'price history check failed: {len(mismatched)} mismatches')
+        print(
+            f'price history check passed: {len(menus)} menus '
+            f'({len(renamed)} renamed)'
+        )
+        return
+
+    if args.command == 'build':
+        snapshots = read_versions()
+        items = collect_history(snapshots, current_menus())
+        size = write_store(args.store, snapshots, items)
+        points = sum(len(item['points']) for item in items.values())
+        print(
+            f'Price history: {len(snapshots)} versions, {len(items):,} items, '
+            f'{points:,} points → {args.store} ({size:,} bytes)'
+        )
+        return
+
+    with PriceHistory(args.store) as store:
+        if args.command == 'item':
+            try:
+                history = store.history(args.menu_id)
+            except KeyError:
+                raise SystemExit(f'Unknown menu id: {args.menu_id}')
+            for version, date, price, delivery in history:
+                delivery = '-' if delivery is None else f'{delivery:,}'
+                print(f'  v{version:<4}{date or "?":<12}{price:>8,}{delivery:>8}')
+        elif args.command == 'franchises':
+            for franchise, (count, change) in store.franchise_changes(
+                    args.delivery).items():
+                print(f'  {franchise:<8}{count:>6} items {_pct(change):>8}')
+        else:
+            for menu_id, name, first, last, change in store.movers(
+                    args.limit, args.delivery):
+                print(f'  {menu_id:<20}{first:>8,} → {last:>8,} {_pct(change):>8}  {name}')
+
+
+if __name__ == '__main__':
+    main()
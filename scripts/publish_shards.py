@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 프랜차이즈별 DB 샤드 배포
+
+generate_manifest.dart가 올린 최신 menu_v{N}.db를 프랜차이즈별로 나눠
+gh-pages/data/menu_{franchise}_v{K}.db 로 두고 manifest.json 에 등록합니다.
+
+    "shards": {
+      "mcd": {"version", "dbUrl", "sha256", "sizeBytes", "items"},
+      ...
+    }
+
+샤드 버전 K 는 프랜차이즈마다 따로 셉니다. 이전 버전과 해시는 배포된
+manifest.json(DEPLOYED_MANIFEST_URL, 또는 gh-pages 브랜치 checkout 의 파일)의
+shards 항목에서 읽습니다. gh-pages/data 에는 샤드 파일이 커밋되어 있지 않고
+배포 job은 새 checkout에서 keep_files: false 로 올리기 때문입니다.
+샤드는 매번 다시 만들어 올리되, sha256 이 배포된 샤드와 같으면 버전과 파일
+이름을 그대로 두고 다를 때만 K + 1 로 올립니다. 그래서 KFC 가격만 바뀐
+배포에서는 KFC 샤드만 새 버전이 되고, 맥도날드만 쓰는 클라이언트의 캐시는
+그대로 유효합니다.
+
+샤드는 전체 DB와 같은 배포용 스키마(seed_publish.py)이고 행 순서도 전체
+DB의 rowid 순서를 따릅니다. 생성할 때 모든 샤드의 행을 합친 결과가 전체
+DB와 같은지 확인합니다.
+
+Usage:
+    python3 scripts/publish_shards.py              # 샤드 생성 + manifest 갱신
+    python3 scripts/publish_shards.py --previous path/to/gh-pages/manifest.json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import urllib.error
+import urllib.request
+
+from generate_delta import (
+    BASE_URL,
+    DATA_DIR,
+    MANIFEST_PATH,
+    published_versions,
+    read_snapshot,
+    sha256_file,
+)
+from menu_source import FRANCHISES
+from seed_publish import write_publish_db
+
+_SHARD_NAME = 'menu_{franchise}_v{version}.db'
+
+
+DEPLOYED_MANIFEST_URL = f'{BASE_URL}/manifest.json'
+
+
+def deployed_shards(source=DEPLOYED_MANIFEST_URL):
+    """배포된 manifest.json 의 shards 항목 — {franchise: {version, sha256, ...}}
+
+    source: URL 또는 파일 경로. 아직 배포된 적이 없으면(404, 파일 없음) 빈 dict.
+    """
+    try:
+        if '://' in source:
+            with urllib.request.urlopen(source) as response:
+                manifest = json.load(response)
+        else:
+            with open(source, encoding='utf-8') as f:
+                manifest = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return {}
+        raise
+    return manifest.get('shards', {})
+
+
+def _menu_rows(snapshot):
+    """rowid 순 메뉴 값 튜플 (rowid 제외)"""
+    return [row[1:] for row in sorted(snapshot['rows'].values())]
+
+
+def split_snapshot(snapshot):
+    """{franchise: rowid 순 메뉴 값 튜플 목록} — FRANCHISES 순서"""
+    franchise = snapshot['columns'].index('franchise')
+    shards = {}
+    for row in _menu_rows(snapshot):
+        shards.setdefault(row[franchise], []).append(row)
+    unknown = sorted(set(shards) - set(FRANCHISES))
+    if unknown:
+        raise ValueError(f'Unknown franchises in published DB: {", ".join(unknown)}')
+    return {code: shards[code] for code in FRANCHISES if code in shards}
+
+
+def publish_shards(data_dir=DATA_DIR, manifest_path=MANIFEST_PATH, previous=None):
+    """최신 버전 DB를 샤드로 나누고 manifest.json 에 기록
+
+    previous: 배포된 shards 항목 (deployed_shards) — 없으면 모든 샤드가 v1
+    Returns: {franchise: manifest 항목}
+    """
+    versions = published_versions(data_dir)
+    if not versions:
+        print('Nothing to do: no published DB')
+        return {}
+    previous = previous or {}
+    version, db_path = versions[-1]
+    snapshot = read_snapshot(db_path)
+    columns = snapshot['columns']
+    shards = split_snapshot(snapshot)
+
+    entries = {}
+    merged = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for franchise, rows in shards.items():
+            built = os.path.join(tmp, f'{franchise}.db')
+            write_publish_db(built, [dict(zip(columns, row)) for row in rows])
+            digest = sha256_file(built)
+
+            deployed = previous.get(franchise)
+            unchanged = deployed is not None and deployed['sha256'] == digest
+            if unchanged:
+                shard_version = deployed['version']
+            else:
+                shard_version = deployed['version'] + 1 if deployed else 1
+            path = os.path.join(
+                data_dir,
+                _SHARD_NAME.format(franchise=franchise, version=shard_version),
+            )
+            os.replace(built, path)
+
+            # 검증: 샤드 파일을 다시 읽어 행이 같은지
+            if _menu_rows(read_snapshot(path)) != rows:
+                raise RuntimeError(f'{os.path.basename(path)} does not match v{version}')
+            merged.extend(rows)
+
+            size = os.path.getsize(path)
+            print(
+                f'  {franchise}: v{shard_version}, {len(rows)} items, {size:,} bytes'
+                f'{" (unchanged)" if unchanged else ""}'
+            )
+            entries[franchise] = {
+                'version': shard_version,
+                'dbUrl': f'{BASE_URL}/data/{os.path.basename(path)}',
+                'sha256': digest,
+                'sizeBytes': size,
+                'items': len(rows),
+            }
+
+    if sorted(merged) != sorted(_menu_rows(snapshot)):
+        raise RuntimeError(f'Shards do not add up to menu_v{version}.db')
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != version:
+            raise RuntimeError(
+                f'manifest.json is at v{manifest.get("version")}, '
+                f'expected v{version}'
+            )
+        manifest['shards'] = entries
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(manifest, indent=2, ensure_ascii=False) + '\n')
+        print(f'Updated: {manifest_path}')
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-franchise shard publisher')
+    parser.add_argument(
+        '--previous', default=DEPLOYED_MANIFEST_URL,
+        help='배포된 manifest.json (URL 또는 파일 경로) — 샤드 버전·해시 기준',
+    )
+    args = parser.parse_args()
+
+    previous = deployed_shards(args.previous)
+    print(f'Publishing per-franchise shards in {DATA_DIR}')
+    print(
+        f'  previous shards: {len(previous)} from {args.previous}'
+        if previous else f'  no previous shards at {args.previous}: starting at v1'
+    )
+    publish_shards(previous=previous)
+
+
+if __name__ == '__main__':
+    main()
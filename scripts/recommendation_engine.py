@@ -0,0 +1,672 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 추천 엔진 Python 참조 구현
+
+RecommendationRepositoryImpl(Dart)의 조합 생성 · 스코어링 · 다양성 선택을
+그대로 옮긴 오프라인 평가용 구현입니다. 스코어는 (조합 × 예산) 행렬로
+NumPy에서 한 번에 계산하므로 3,000~30,000원 전 구간을 한 번에 훑을 수 있습니다.
+
+Dart와 다른 점:
+  - Dart List.sort 는 안정 정렬이 아니므로 동점 조합의 순서는 다를 수 있습니다.
+    여기서는 생성 순서(후보 순서)로 동점을 정렬합니다.
+
+Requires: numpy
+
+Usage:
+    python3 scripts/recommendation_engine.py recommend 10000 mcd bk
+    python3 scripts/recommendation_engine.py sweep --out sweep.jsonl
+    python3 scripts/recommendation_engine.py check   # Dart 테스트 픽스처와 비교
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+DB_PATH = os.path.join(PROJECT_DIR, 'assets', 'menu_seed.db')
+APP_CONSTANTS_PATH = os.path.join(
+    PROJECT_DIR, 'lib', 'core', 'constants', 'app_constants.dart',
+)
+FIXTURES_PATH = os.path.join(SCRIPT_DIR, 'fixtures', 'recommendation_parity.json')
+
+FRANCHISES = ('mcd', 'bk', 'kfc', 'mom', 'lot')
+
+# RecommendationRepositoryImpl 상수
+MAX_PER_MAIN = 2
+MAX_RESULTS = 150
+DESSERT_THRESHOLD = 0.05
+
+SWEEP_BUDGETS = range(3000, 30001, 500)
+
+_NONE = -1
+
+
+def load_signature_menus(path=APP_CONSTANTS_PATH):
+    """AppConstants.signatureMenus 를 Dart 소스에서 읽어옴 (상수 중복 방지)"""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    block = re.search(r'signatureMenus\s*=\s*\{(.*?)\n  \};', source, re.S).group(1)
+    return {
+        franchise: re.findall(r"'([^']*)'", keywords)
+        for franchise, keywords in re.findall(r"'(\w+)':\s*\[(.*?)\]", block, re.S)
+    }
+
+
+def is_signature_menu(signature_menus, franchise, name):
+    return any(k in name for k in signature_menus.get(franchise, []))
+
+
+def target_utilization(budget_per_person):
+    if budget_per_person < 8000:
+        return 0.75
+    if budget_per_person < 13000:
+        return 0.82
+    return 0.87
+
+
+def _target_utilization_array(budgets):
+    return np.where(budgets < 8000, 0.75, np.where(budgets < 13000, 0.82, 0.87))
+
+
+# ══════════════════════════════════════════════
+# 카탈로그
+# ══════════════════════════════════════════════
+
+def load_menu_items(db_path=DB_PATH):
+    """menus 테이블 → dict 목록 (rowid 순)"""
+    import sqlite3
+
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute('SELECT * FROM menus ORDER BY rowid').fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+def candidate_order(items, delivery=False):
+    """RecommendationDatasource.getCandidates 의 후보 순서 (가격 내림차순)
+
+    배달 모드는 배달가 없는 아이템을 제외합니다. 같은 가격은 프랜차이즈
+    (ORDER BY 의 두 번째 키), 같은 프랜차이즈 안에서는 rowid 순
+    (idx_menus_franchise_price / idx_menus_franchise_price_delivery 의 순서).
+    """
+    if delivery:
+        items = [i for i in items if i.get('price_delivery') is not None]
+        key = 'price_delivery'
+    else:
+        key = 'price'
+    return sorted(items, key=lambda i: (-i[key], i['franchise']))
+
+
+def build_catalog(items, delivery=False, signature_menus=None):
+    """후보 목록(주어진 순서 그대로)을 NumPy 배열로 변환"""
+    if signature_menus is None:
+        signature_menus = load_signature_menus()
+    if delivery:
+        items = [i for i in items if i.get('price_delivery') is not None]
+
+    def price_of(item):
+        if delivery and item.get('price_delivery') is not None:
+            return item['price_delivery']
+        return item['price']
+
+    return {
+        'items': items,
+        'delivery': delivery,
+        'id': [i['id'] for i in items],
+        'franchise': np.array([i['franchise'] for i in items], dtype=object),
+        'type': np.array([i['type'] for i in items], dtype=object),
+        'price': np.array([price_of(i) for i in items], dtype=np.int64),
+        'store_price': np.array([i['price'] for i in items], dtype=np.int64),
+        'includes_side': np.array(
+            [bool(i.get('includes_side')) for i in items], dtype=bool),
+        'includes_drink': np.array(
+            [bool(i.get('includes_drink')) for i in items], dtype=bool),
+        'sig': np.array(
+            [is_signature_menu(signature_menus, i['franchise'], i['name'])
+             for i in items], dtype=bool),
+    }
+
+
+# ══════════════════════════════════════════════
+# 1단계: 조합 생성 (_buildAllCombos / _generateCombos)
+# ══════════════════════════════════════════════
+
+def enumerate_combos(catalog, max_budget):
+    """max_budget 이하인 모든 메인(+사이드)(+음료) 기본 조합
+
+    생성 순서는 Dart와 같습니다: 프랜차이즈(후보 등장 순) → 세트 → 버거,
+    메인마다 [없음, 사이드...] × [없음, 음료...].
+    예산 B에서 Dart가 만드는 조합은 정확히 price <= B 인 조합입니다.
+    """
+    price = catalog['price']
+    types = catalog['type']
+    franchises = catalog['franchise']
+
+    mains, sides, drinks = [], [], []
+    for franchise in dict.fromkeys(franchises):
+        in_franchise = franchises == franchise
+        idx = {
+            t: np.flatnonzero(in_franchise & (types == t))
+            for t in ('set', 'burger', 'side', 'drink')
+        }
+        for main in itertools.chain(idx['set'], idx['burger']):
+            if price[main] > max_budget:
+                continue
+            side_opts = np.array([_NONE]) if catalog['includes_side'][main] \
+                else np.concatenate(([_NONE], idx['side']))
+            drink_opts = np.array([_NONE]) if catalog['includes_drink'][main] \
+                else np.concatenate(([_NONE], idx['drink']))
+            s, d = np.meshgrid(side_opts, drink_opts, indexing='ij')
+            mains.append(np.full(s.size, main))
+            sides.append(s.ravel())
+            drinks.append(d.ravel())
+
+    if not mains:
+        empty = np.array([], dtype=np.int64)
+        return {'main': empty, 'side': empty, 'drink': empty, 'price': empty}
+
+    main = np.concatenate(mains)
+    side = np.concatenate(sides)
+    drink = np.concatenate(drinks)
+    padded = np.append(price, 0)  # _NONE(-1) → 0원
+    total = price[main] + padded[side] + padded[drink]
+    keep = total <= max_budget
+    return {
+        'main': main[keep],
+        'side': side[keep],
+        'drink': drink[keep],
+        'price': total[keep],
+    }
+
+
+def _dessert_lookup(catalog, combos):
+    """조합별 디저트 후보 (프랜차이즈별 가격 오름차순 배열)
+
+    Dart는 후보 순서(가격 내림차순)로 디저트를 훑으며 남은 예산 안의 첫
+    디저트를 붙이므로, 결과는 '남은 예산 이하 중 가장 비싼 디저트'입니다.
+    """
+    lookup = {}
+    for franchise in dict.fromkeys(catalog['franchise']):
+        idx = np.flatnonzero(
+            (catalog['franchise'] == franchise) & (catalog['type'] == 'dessert'))
+        # 가격 오름차순, 같은 가격이면 후보 순서상 앞선 것이 마지막에 오도록
+        order = sorted(idx, key=lambda i: (catalog['price'][i], -i))
+        lookup[franchise] = np.array(order, dtype=np.int64)
+    return lookup
+
+
+def preference_fit(catalog, combos, pref):
+    """_calcPreferenceFit 벡터화 버전"""
+    n = combos['main'].size
+    if not pref or not (pref.get('favorites') or pref.get('recent30')
+                        or pref.get('recent90')):
+        return np.zeros(n)
+
+    ids = np.array(catalog['id'] + [None], dtype=object)
+    favorites = set(pref.get('favorites', ()))
+    recent30 = set(pref.get('recent30', ()))
+    recent90 = set(pref.get('recent90', ()))
+
+    def member(indices, ids_set):
+        return np.array([i in ids_set for i in ids[indices]], dtype=bool)
+
+    raw = np.zeros(n)
+    raw += np.where(member(combos['main'], favorites), 0.35, 0.0)
+    in30 = member(combos['main'], recent30)
+    raw += np.where(in30, 0.25,
+                    np.where(member(combos['main'], recent90), 0.10, 0.0))
+    raw += np.where(member(combos['side'], favorites), 0.075, 0.0)
+    raw += np.where(member(combos['drink'], favorites), 0.075, 0.0)
+
+    counts = pref.get('franchise_counts') or {}
+    if counts:
+        # UserPreference.topFranchise: reduce(a.value >= b.value ? a : b)
+        top = None
+        for franchise, count in counts.items():
+            if top is None or count > counts[top]:
+                top = franchise
+        raw += np.where(catalog['franchise'][combos['main']] == top, 0.15, 0.0)
+    return np.clip(raw, 0.0, 1.0)
+
+
+# ══════════════════════════════════════════════
+# 2단계: 통합 스코어링 (조합 × 예산 행렬)
+# ══════════════════════════════════════════════
+
+def score_matrix(catalog, combos, budgets, pref=None):
+    """모든 조합 × 모든 예산 스코어를 한 번에 계산
+
+    Returns: dict — score / utilPct / util / dessert (N×M), feasible (N×M bool),
+             dessert_item (N×M, 없으면 -1), 그 외 조합별 상수 feature (N)
+    """
+    budgets = np.asarray(budgets, dtype=np.int64)
+    main = combos['main']
+    price = combos['price'].astype(np.float64)
+
+    util_pct = np.clip(price[:, None] / budgets[None, :], 0.0, 1.0)
+    target = _target_utilization_array(budgets)[None, :]
+    raw_util = np.maximum(0.0, 1.0 - np.abs(util_pct - target) / 0.20)
+    util = np.power(raw_util, 0.7)
+
+    has_side = (combos['side'] != _NONE) | catalog['includes_side'][main]
+    has_drink = (combos['drink'] != _NONE) | catalog['includes_drink'][main]
+    meal = 0.55 + has_side * 0.25 + has_drink * 0.20
+
+    is_set = catalog['type'][main] == 'set'
+    inc_side = catalog['includes_side'][main]
+    inc_drink = catalog['includes_drink'][main]
+    set_bonus = np.where(
+        is_set & inc_side & inc_drink, 1.0,
+        np.where(is_set & (inc_side | inc_drink), 0.5, 0.0))
+    sig = catalog['sig'][main].astype(np.float64)
+    pref_fit = preference_fit(catalog, combos, pref)
+
+    # 디저트: 남은 예산 이하 중 가장 비싼 디저트 (있으면 dessert=1.0)
+    leftover = budgets[None, :] - combos['price'][:, None]
+    dessert_item = np.full(leftover.shape, _NONE, dtype=np.int64)
+    lookup = _dessert_lookup(catalog, combos)
+    main_franchise = catalog['franchise'][main]
+    for franchise, desserts in lookup.items():
+        if desserts.size == 0:
+            continue
+        rows = np.flatnonzero(main_franchise == franchise)
+        prices = catalog['price'][desserts]
+        pos = np.searchsorted(prices, leftover[rows], side='right') - 1
+        dessert_item[rows] = np.where(pos >= 0, desserts[np.maximum(pos, 0)], _NONE)
+
+    base = (meal[:, None] * 0.25 + util * 0.20 + set_bonus[:, None] * 0.10
+            + sig[:, None] * 0.10 + pref_fit[:, None] * 0.25)
+    score_base = base + 0.0 * 0.10
+    with_dessert = base + 1.0 * 0.10
+    attach = (dessert_item != _NONE) & (with_dessert - score_base > DESSERT_THRESHOLD)
+    dessert_item = np.where(attach, dessert_item, _NONE)
+
+    return {
+        'budgets': budgets,
+        'feasible': combos['price'][:, None] <= budgets[None, :],
+        'score': np.where(attach, with_dessert, score_base),
+        'utilPct': util_pct,
+        'util': util,
+        'dessert': attach.astype(np.float64),
+        'dessert_item': dessert_item,
+        'meal': meal,
+        'set': set_bonus,
+        'sig': sig,
+        'pref': pref_fit,
+    }
+
+
+# ══════════════════════════════════════════════
+# 3단계: 다양성 보장 (_selectDiverse)
+# ══════════════════════════════════════════════
+
+def franchise_queues(catalog, combos, scores, column):
+    """예산 column 에서 프랜차이즈별 큐 (스코어순, 메인당 최대 2개, 최대 150개)
+
+    메인 ID는 프랜차이즈에 속하므로 메인당 상한은 프랜차이즈 큐 안에서
+    미리 적용해도 라운드로빈 결과가 같습니다.
+    """
+    feasible = np.flatnonzero(scores['feasible'][:, column])
+    score = scores['score'][feasible, column]
+    order = feasible[np.argsort(-score, kind='stable')]
+
+    # 메인별 등장 순번 (0, 1, 2...) 계산 후 MAX_PER_MAIN 미만만 유지
+    mains = combos['main'][order]
+    by_main = np.argsort(mains, kind='stable')
+    sorted_mains = mains[by_main]
+    starts = np.flatnonzero(np.r_[True, sorted_mains[1:] != sorted_mains[:-1]])
+    group_start = np.repeat(starts, np.diff(np.r_[starts, sorted_mains.size]))
+    occurrence = np.empty_like(by_main)
+    occurrence[by_main] = np.arange(sorted_mains.size) - group_start
+    order = order[occurrence < MAX_PER_MAIN]
+
+    queues = {}
+    franchise_of = catalog['franchise'][combos['main'][order]]
+    for franchise in dict.fromkeys(catalog['franchise']):
+        queue = order[franchise_of == franchise][:MAX_RESULTS]
+        if queue.size:
+            queues[franchise] = queue
+    return queues
+
+
+def round_robin(queues, scores, column):
+    """프랜차이즈 큐를 번갈아 하나씩 꺼내 최대 MAX_RESULTS 개
+
+    Dart는 전역 스코어순으로 처음 등장한 프랜차이즈부터 돕니다.
+    """
+    ordered = sorted(
+        queues.items(),
+        key=lambda kv: -scores['score'][kv[1][0], column],
+    )
+    result = []
+    for rank in range(MAX_RESULTS):
+        added = False
+        for _, queue in ordered:
+            if len(result) >= MAX_RESULTS:
+                break
+            if rank < queue.size:
+                result.append(int(queue[rank]))
+                added = True
+        if not added or len(result) >= MAX_RESULTS:
+            break
+    return result
+
+
+# ══════════════════════════════════════════════
+# 4단계: 정렬 모드 (_applySortMode)
+# ══════════════════════════════════════════════
+
+def _to_record(catalog, combos, scores, index, column):
+    ids = catalog['id']
+    items = catalog['items']
+    main = int(combos['main'][index])
+    side = int(combos['side'][index])
+    drink = int(combos['drink'][index])
+    dessert = int(scores['dessert_item'][index, column])
+    parts = [p for p in (main, side, drink, dessert) if p != _NONE]
+
+    main_item = items[main]
+    if main_item.get('calories') is None:
+        calories = None
+    else:
+        calories = sum(items[p].get('calories') or 0 for p in parts)
+    if main_item.get('price_delivery') is None:
+        delivery_price = None
+    else:
+        delivery_price = sum(
+            items[p]['price_delivery'] if items[p].get('price_delivery') is not None
+            else items[p]['price'] for p in parts)
+
+    return {
+        'main': ids[main],
+        'side': ids[side] if side != _NONE else None,
+        'drink': ids[drink] if drink != _NONE else None,
+        'dessert': ids[dessert] if dessert != _NONE else None,
+        'franchise': main_item['franchise'],
+        'main_type': main_item['type'],
+        'total_price': sum(items[p]['price'] for p in parts),
+        'total_delivery_price': delivery_price,
+        'total_calories': calories,
+        'score': float(scores['score'][index, column]),
+        'features': {
+            'util': float(scores['util'][index, column]),
+            'utilPct': float(scores['utilPct'][index, column]),
+            'meal': float(scores['meal'][index]),
+            'set': float(scores['set'][index]),
+            'sig': float(scores['sig'][index]),
+            'pref': float(scores['pref'][index]),
+            'dessert': float(scores['dessert'][index, column]),
+        },
+    }
+
+
+def _apply_exploration(records):
+    candidates = [
+        r for r in records[2:]
+        if r['features']['pref'] < 0.15 and r['features']['meal'] >= 0.55
+    ]
+    inserted = 0
+    for pos in (2, 5):
+        if inserted >= len(candidates):
+            break
+        candidate = candidates[inserted]
+        current = records.index(candidate)
+        if current <= pos:
+            continue
+        records.pop(current)
+        records.insert(pos, candidate)
+        inserted += 1
+
+
+def apply_sort_mode(records, sort, budget, delivery, pref=None):
+    def combo_price(r):
+        if delivery and r['total_delivery_price'] is not None:
+            return r['total_delivery_price']
+        return r['total_price']
+
+    records = list(records)
+    if sort == 'recommended':
+        target = target_utilization(budget)
+        records.sort(key=lambda r: (
+            -r['score'], abs(r['features']['utilPct'] - target)))
+        pref_empty = not pref or not (pref.get('favorites') or pref.get('recent30')
+                                      or pref.get('recent90'))
+        if not pref_empty and len(records) >= 6:
+            _apply_exploration(records)
+    elif sort == 'saving':
+        records.sort(key=combo_price)
+    elif sort == 'lowestCalories':
+        records.sort(key=lambda r: (
+            r['total_calories'] is None,
+            r['total_calories'] or 0,
+            combo_price(r),
+        ))
+    else:
+        raise ValueError(f'Unknown sort mode: {sort}')
+    return records
+
+
+def recommend(items, budget, franchises, sort='recommended', person_count=1,
+              delivery=False, pref=None, signature_menus=None, ordered=False):
+    """getRecommendations 한 번과 같은 결과
+
+    items: 메뉴 dict 목록. ordered=True 면 이미 후보 순서라고 보고 그대로 사용
+    (Dart 테스트처럼 datasource 결과를 직접 주는 경우).
+    """
+    per_person = budget // person_count if person_count > 1 else budget
+    if ordered:
+        candidates = [i for i in items if i['franchise'] in franchises]
+    else:
+        candidates = [
+            i for i in candidate_order(items, delivery)
+            if i['franchise'] in franchises
+        ]
+    catalog = build_catalog(candidates, delivery, signature_menus)
+    combos = enumerate_combos(catalog, per_person)
+    scores = score_matrix(catalog, combos, [per_person], pref)
+    queues = franchise_queues(catalog, combos, scores, 0)
+    selected = round_robin(queues, scores, 0)
+    records = [_to_record(catalog, combos, scores, i, 0) for i in selected]
+    return apply_sort_mode(records, sort, per_person, delivery, pref)
+
+
+# ══════════════════════════════════════════════
+# 예산 일괄 평가
+# ══════════════════════════════════════════════
+
+def sweep(items, budgets=SWEEP_BUDGETS, pref=None, top_k=5, signature_menus=None):
+    """모든 예산 × 프랜차이즈 조합(31가지) × 매장/배달 설정을 평가
+
+    스코어 행렬은 모드별로 한 번만 계산하고, 프랜차이즈 부분집합은
+    프랜차이즈별 큐를 라운드로빈으로 합치기만 합니다.
+    Returns: 설정별 지표 dict 목록
+    """
+    if signature_menus is None:
+        signature_menus = load_signature_menus()
+    budgets = list(budgets)
+    subsets = [
+        combo for size in range(1, len(FRANCHISES) + 1)
+        for combo in itertools.combinations(FRANCHISES, size)
+    ]
+
+    results = []
+    for delivery in (False, True):
+        catalog = build_catalog(candidate_order(items, delivery), delivery, signature_menus)
+        combos = enumerate_combos(catalog, max(budgets))
+        scores = score_matrix(catalog, combos, budgets, pref)
+        for column, budget in enumerate(budgets):
+            queues = franchise_queues(catalog, combos, scores, column)
+            for subset in subsets:
+                picked = round_robin(
+                    {f: q for f, q in queues.items() if f in subset}, scores, column)
+                top = sorted(picked, key=lambda i: -scores['score'][i, column])[:top_k]
+                results.append({
+                    'budget': budget,
+                    'franchises': list(subset),
+                    'delivery': delivery,
+                    'results': len(picked),
+                    'topScore': float(scores['score'][top[0], column]) if top else None,
+                    'meanTopScore': float(np.mean(scores['score'][top, column]))
+                    if top else None,
+                    'meanTopUtilPct': float(np.mean(scores['utilPct'][top, column]))
+                    if top else None,
+                    'topSetShare': float(np.mean(
+                        catalog['type'][combos['main'][top]] == 'set')) if top else None,
+                    'topFranchises': len(set(catalog['franchise'][combos['main'][top]]))
+                    if top else 0,
+                })
+    return results
+
+
+# ══════════════════════════════════════════════
+# Dart 테스트 픽스처 비교
+# ══════════════════════════════════════════════
+
+def _check_expectations(case, records):
+    """픽스처의 expect 항목을 검사하고 실패 메시지 목록을 반환"""
+    expect = case['expect']
+    failures = []
+
+    def fail(message):
+        failures.append(message)
+
+    if 'count' in expect and len(records) != expect['count']:
+        fail(f'count {len(records)} != {expect["count"]}')
+    if 'minCount' in expect and len(records) < expect['minCount']:
+        fail(f'count {len(records)} < {expect["minCount"]}')
+    if 'first' in expect:
+        for key, value in expect['first'].items():
+            if not records or records[0].get(key) != value:
+                got = records[0].get(key) if records else None
+                fail(f'first.{key} {got!r} != {value!r}')
+    if 'firstScore' in expect:
+        if not records or abs(records[0]['score'] - expect['firstScore']) > 1e-9:
+            fail(f'first score {records[0]["score"] if records else None} '
+                 f'!= {expect["firstScore"]}')
+    if expect.get('includesSetMain') and \
+            not any(r['main_type'] == 'set' for r in records):
+        fail('no set main in results')
+    if 'maxPerMain' in expect:
+        counts = {}
+        for r in records:
+            counts[r['main']] = counts.get(r['main'], 0) + 1
+        if counts and max(counts.values()) > expect['maxPerMain']:
+            fail(f'main repeated {max(counts.values())} times')
+    if expect.get('sameFranchise'):
+        items = {i['id']: i for i in case['candidates']}
+        for r in records:
+            for part in ('side', 'drink', 'dessert'):
+                if r[part] and items[r[part]]['franchise'] != r['franchise']:
+                    fail(f'{r[part]} mixed into {r["main"]}')
+    if 'maxTotalPrice' in expect and \
+            any(r['total_price'] > expect['maxTotalPrice'] for r in records):
+        fail(f'total price above {expect["maxTotalPrice"]}')
+    if 'ascending' in expect:
+        key = expect['ascending']
+        values = [r[key] for r in records if r[key] is not None]
+        if values != sorted(values):
+            fail(f'{key} not ascending')
+    for main, fields in expect.get('nullFor', {}).items():
+        matching = [r for r in records if r['main'] == main]
+        if not matching:
+            fail(f'{main} missing')
+        for r in matching:
+            for field in fields:
+                if r[field] is not None:
+                    fail(f'{main}.{field} should be null')
+    for main in expect.get('variedFor', []):
+        variants = {(r['side'], r['drink']) for r in records if r['main'] == main}
+        if len(variants) < 2:
+            fail(f'{main} has no side/drink variety')
+    return failures
+
+
+def check(fixtures_path=FIXTURES_PATH):
+    with open(fixtures_path, encoding='utf-8') as f:
+        cases = json.load(f)
+    signature_menus = load_signature_menus()
+    failed = 0
+    for case in cases:
+        records = recommend(
+            case['candidates'],
+            case['budget'],
+            case['franchises'],
+            sort=case.get('sort', 'recommended'),
+            person_count=case.get('personCount', 1),
+            signature_menus=signature_menus,
+            ordered=True,
+        )
+        failures = _check_expectations(case, records)
+        status = 'FAIL' if failures else 'ok'
+        print(f'  [{status}] {case["name"]}')
+        for message in failures:
+            print(f'         {message}')
+        failed += bool(failures)
+    print(f'{len(cases) - failed}/{len(cases)} parity cases passed')
+    return failed == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Burger Budget recommendation engine')
+    parser.add_argument('--db', default=DB_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('recommend', help='추천 한 번 실행')
+    rec.add_argument('budget', type=int)
+    rec.add_argument('franchises', nargs='+', choices=FRANCHISES)
+    rec.add_argument('--sort', default='recommended',
+                     choices=('recommended', 'saving', 'lowestCalories'))
+    rec.add_argument('--persons', type=int, default=1)
+    rec.add_argument('--delivery', action='store_true')
+    rec.add_argument('--limit', type=int, default=10)
+
+    sw = sub.add_parser('sweep', help='전 예산 × 프랜차이즈 × 매장/배달 일괄 평가')
+    sw.add_argument('--step', type=int, default=500)
+    sw.add_argument('--out', help='설정별 지표를 JSON Lines로 저장')
+
+    sub.add_parser('check', help='Dart 테스트 픽스처와 결과 비교')
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        sys.exit(0 if check() else 1)
+
+    items = load_menu_items(args.db)
+    if args.command == 'recommend':
+        records = recommend(
+            items, args.budget, args.franchises, sort=args.sort,
+            person_count=args.persons, delivery=args.delivery,
+        )
+        print(f'{len(records)} recommendations')
+        for r in records[:args.limit]:
+            parts = ' + '.join(p for p in (r['main'], r['side'], r['drink'], r['dessert']) if p)
+            print(f'  {r["score"]:.4f}  {r["total_price"]:>6}  {parts}')
+        return
+
+    started = time.perf_counter()
+    results = sweep(items, budgets=range(3000, 30001, args.step))
+    elapsed = time.perf_counter() - started
+    empty = sum(1 for r in results if r['results'] == 0)
+    print(f'Evaluated {len(results)} configurations in {elapsed:.2f}s')
+    print(f'  empty results: {empty}')
+    scored = [r['meanTopScore'] for r in results if r['meanTopScore'] is not None]
+    if scored:
+        print(f'  mean top-5 score: {np.mean(scored):.4f}')
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            for r in results:
+                f.write(json.dumps(r, ensure_ascii=False) + '\n')
+        print(f'Wrote: {args.out}')
+
+
+if __name__ == '__main__':
+    main()
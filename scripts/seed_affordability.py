@@ -0,0 +1,221 @@
+"""
+Burger Budget - 예산별 선택지 수 곡선(affordability) 사전 계산
+
+예산 입력(budget_input.dart)은 getRecommendations 를 끝까지 돌린 뒤에야
+결과를 보여 주므로, 입력하는 동안에는 "6,000원으로 맥도날드에서 뭘 먹을 수
+있나"를 알 수 없습니다. 여기서는 프랜차이즈 × 매장/배달 × 식사 구성마다
+"예산 B 이하로 고를 수 있는 경우의 수"를 예산 단계(BUDGET_STEP)별 누적
+곡선으로 미리 계산합니다.
+
+  burger  버거 하나
+  set     세트 하나
+  meal    버거 + 사이드 + 음료 (각각 하나씩, 모든 조합)
+
+곡선은 값이 바뀌는 지점만 (price, options) 행으로 저장합니다. price 는
+합계를 BUDGET_STEP 단위로 올림한 값이라 예산이 단계의 배수면 정확하고
+(메뉴 가격은 모두 100원 단위), 예산 B 의 답은 price <= B 인 마지막 행입니다.
+
+    SELECT options FROM affordability
+    WHERE franchise = ? AND delivery = ? AND kind = ? AND price <= ?
+    ORDER BY price DESC LIMIT 1          -- PK 한 번 탐색 (O(log n)), 없으면 0
+
+배달 곡선은 배달가가 있는 메뉴만으로 만들고, AppConstants.maxBudget 을
+넘는 합계는 저장하지 않습니다.
+
+Usage:
+    python3 scripts/seed_affordability.py check   # 메뉴 소스 전수 열거와 비교
+"""
+
+import argparse
+import bisect
+import os
+import sqlite3
+from collections import Counter
+from itertools import product
+
+BUDGET_STEP = 100
+MAX_BUDGET = 100000   # AppConstants.maxBudget
+
+# kind → 구성 타입 (순서대로 하나씩)
+MEAL_KINDS = {
+    'burger': ('burger',),
+    'set': ('set',),
+    'meal': ('burger', 'side', 'drink'),
+}
+
+AFFORDABILITY_COLUMNS = ('franchise', 'delivery', 'kind', 'price', 'options')
+
+AFFORDABILITY_SCHEMA = [
+    '''
+        CREATE TABLE affordability (
+            franchise TEXT NOT NULL,
+            delivery  INTEGER NOT NULL,
+            kind      TEXT NOT NULL CHECK(kind IN ('burger','set','meal')),
+            price     INTEGER NOT NULL,
+            options   INTEGER NOT NULL,
+            PRIMARY KEY (franchise, delivery, kind, price)
+        ) WITHOUT ROWID
+    ''',
+]
+
+
+def _step_up(price):
+    return -(-price // BUDGET_STEP) * BUDGET_STEP
+
+
+def _prices(menus, franchise, menu_type, delivery):
+    key = 'price_delivery' if delivery else 'price'
+    return Counter(
+        m[key] for m in menus
+        if m['franchise'] == franchise and m['type'] == menu_type
+        and m[key] is not None
+    )
+
+
+def _convolve(totals, prices):
+    """{합계: 경우의 수} × {가격: 메뉴 수} → MAX_BUDGET 이하 합계만"""
+    combined = Counter()
+    for total, ways in totals.items():
+        for price, count in prices.items():
+            if total + price <= MAX_BUDGET:
+                combined[total + price] += ways * count
+    return combined
+
+
+def affordability_curve(menus, franchise, kind, delivery):
+    """[(price, options)] — price 오름차순, options 는 price 이하 누적 경우의 수"""
+    totals = Counter({0: 1})
+    for menu_type in MEAL_KINDS[kind]:
+        totals = _convolve(totals, _prices(menus, franchise, menu_type, delivery))
+    stepped = Counter()
+    for total, ways in totals.items():
+        stepped[_step_up(total)] += ways
+    curve = []
+    options = 0
+    for price in sorted(stepped):
+        options += stepped[price]
+        curve.append((price, options))
+    return curve
+
+
+def build_affordability(menus):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록 → affordability 행 목록"""
+    menus = list(menus)
+    rows = []
+    for franchise in sorted({m['franchise'] for m in menus}):
+        for delivery in (0, 1):
+            for kind in MEAL_KINDS:
+                rows.extend(
+                    (franchise, delivery, kind, price, options)
+                    for price, options in affordability_curve(
+                        menus, franchise, kind, delivery,
+                    )
+                )
+    return rows
+
+
+def options_within(curve, budget):
+    """곡선에서 예산 이하 경우의 수 (이분 탐색)"""
+    index = bisect.bisect_right(curve, (budget, float('inf')))
+    return curve[index - 1][1] if index else 0
+
+
+def lookup(conn, franchise, delivery, kind, budget):
+    """DB 의 affordability 에서 예산 이하 경우의 수"""
+    row = conn.execute(
+        'SELECT options FROM affordability '
+        'WHERE franchise = ? AND delivery = ? AND kind = ? AND price <= ? '
+        'ORDER BY price DESC LIMIT 1',
+        (franchise, int(delivery), kind, budget),
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def brute_force_totals(menus, franchise, kind, delivery):
+    """모든 조합을 하나씩 열거한 합계 목록 (정렬됨)"""
+    key = 'price_delivery' if delivery else 'price'
+    slots = [
+        [
+            m[key] for m in menus
+            if m['franchise'] == franchise and m['type'] == menu_type
+            and m[key] is not None
+        ]
+        for menu_type in MEAL_KINDS[kind]
+    ]
+    return sorted(sum(combo) for combo in product(*slots))
+
+
+def check(db_path=None):
+    """메뉴 소스 전수 열거와 곡선(메모리·DB)을 예산 단계마다 비교
+
+    Returns: (비교한 (곡선, 예산) 수, 불일치 목록)
+    """
+    from menu_source import MENU_COLUMNS, load_menus
+
+    menus = [dict(zip(MENU_COLUMNS, row)) for row in load_menus()]
+    conn = None
+    if db_path is not None:
+        conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    budgets = range(0, MAX_BUDGET + 1, BUDGET_STEP)
+    checked = 0
+    mismatches = []
+    try:
+        for franchise in sorted({m['franchise'] for m in menus}):
+            for delivery in (0, 1):
+                for kind in MEAL_KINDS:
+                    totals = brute_force_totals(menus, franchise, kind, delivery)
+                    curve = affordability_curve(menus, franchise, kind, delivery)
+                    for budget in budgets:
+                        expected = bisect.bisect_right(totals, budget)
+                        got = options_within(curve, budget)
+                        if conn is not None:
+                            stored = lookup(conn, franchise, delivery, kind, budget)
+                            if stored != expected:
+                                mismatches.append(
+                                    (franchise, delivery, kind, budget, expected, stored),
+                                )
+                        if got != expected:
+                            mismatches.append(
+                                (franchise, delivery, kind, budget, expected, got),
+                            )
+                        checked += 1
+    finally:
+        if conn is not None:
+            conn.close()
+    return checked, mismatches
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Affordability curve')
+    sub = parser.add_subparsers(dest='command', required=True)
+    check_parser = sub.add_parser('check', help='메뉴 소스 전수 열거와 비교')
+    check_parser.add_argument(
+        'db', nargs='?',
+        default=os.path.join(script_dir, '..', 'assets', 'menu_seed.db'),
+        help='affordability 테이블이 있으면 DB 조회 결과도 비교',
+    )
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+    try:
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'affordability'"
+        ).fetchone() is not None
+    finally:
+        conn.close()
+
+    checked, mismatches = check(args.db if has_table else None)
+    for franchise, delivery, kind, budget, expected, got in mismatches[:20]:
+        print(
+            f'  mismatch: {franchise} delivery={delivery} {kind} '
+            f'{budget:,}원: expected {expected}, got {got}'
+        )
+    if mismatches:
+        raise SystemExit(f'affordability check failed: {len(mismatches)} mismatches')
+    source = 'curve + DB table' if has_table else 'curve (no table in DB)'
+    print(f'affordability check passed: {checked:,} budgets ({source})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""
+Burger Budget - 메뉴판 정렬 테이블(menu_board) 사전 계산
+
+메뉴판(franchise_menu_view.dart, category_compare_view.dart)은 프랜차이즈나
+카테고리의 메뉴를 통째로 읽은 뒤, 다시 그릴 때마다 `name.contains(query)` 로
+거르고 MenuBoardSortMode 별로 메모리에서 다시 정렬합니다. 여기서는 정렬 키를
+미리 계산해 둡니다.
+
+  popular_rank   시그니처(AppConstants.signatureMenus) 먼저, 그다음 이름순
+  price_rank     매장가 오름차순 (priceDesc 는 같은 인덱스를 거꾸로)
+  name_rank      이름순
+  delivery_rank  배달가 오름차순 (배달가 없으면 NULL)
+  value_rank     1,000원당 칼로리 내림차순 (칼로리 없으면 맨 뒤)
+  delivery_markup  배달가 - 매장가 (원, 배달가 없으면 NULL)
+
+순위는 모두 타입 안에서 1부터 빈틈없이 매기고, 동점은 이름 → id 순으로
+끊습니다. 두 화면 모두 타입 하나를 보므로 (type, rank) / (franchise, type,
+rank) 인덱스를 정렬 순서대로 훑고 LIMIT/OFFSET 으로 페이지를 자르면 됩니다.
+검색어는 `instr(name, ?) > 0` (Dart contains 와 같이 대소문자 구분)으로
+훑는 도중에 거릅니다.
+
+Usage:
+    python3 scripts/seed_board.py check   # DB 의 menu_board 를 Dart 정렬과 비교
+"""
+
+import argparse
+import os
+import sqlite3
+
+BOARD_COLUMNS = (
+    'menu_id', 'franchise', 'type', 'name', 'is_signature', 'popular_rank',
+    'price_rank', 'name_rank', 'delivery_rank', 'value_rank', 'delivery_markup',
+)
+
+BOARD_SCHEMA = [
+    '''
+        CREATE TABLE menu_board (
+            menu_id         TEXT PRIMARY KEY REFERENCES menus(id),
+            franchise       TEXT NOT NULL,
+            type            TEXT NOT NULL,
+            name            TEXT NOT NULL,
+            is_signature    INTEGER NOT NULL,
+            popular_rank    INTEGER NOT NULL,
+            price_rank      INTEGER NOT NULL,
+            name_rank       INTEGER NOT NULL,
+            delivery_rank   INTEGER,
+            value_rank      INTEGER NOT NULL,
+            delivery_markup INTEGER
+        ) WITHOUT ROWID
+    ''',
+    # 카테고리 비교: WHERE type = ? [AND franchise IN (...)] ORDER BY <rank>
+    '''
+        CREATE INDEX idx_menu_board_type_popular ON menu_board(type, popular_rank)
+    ''',
+    '''
+        CREATE INDEX idx_menu_board_type_price ON menu_board(type, price_rank)
+    ''',
+    '''
+        CREATE INDEX idx_menu_board_type_name ON menu_board(type, name_rank)
+    ''',
+    '''
+        CREATE INDEX idx_menu_board_type_delivery ON menu_board(type, delivery_rank)
+        WHERE delivery_rank IS NOT NULL
+    ''',
+    '''
+        CREATE INDEX idx_menu_board_type_value ON menu_board(type, value_rank)
+    ''',
+    # 프랜차이즈 메뉴판: WHERE franchise = ? AND type = ? ORDER BY <rank>
+    '''
+        CREATE INDEX idx_menu_board_franchise_popular
+        ON menu_board(franchise, type, popular_rank)
+    ''',
+    '''
+        CREATE INDEX idx_menu_board_franchise_price
+        ON menu_board(franchise, type, price_rank)
+    ''',
+    '''
+        CREATE INDEX idx_menu_board_franchise_name
+        ON menu_board(franchise, type, name_rank)
+    ''',
+]
+
+# MenuBoardSortMode → (순위 컬럼, 방향)
+SORT_MODES = {
+    'popular': ('popular_rank', 'ASC'),
+    'priceAsc': ('price_rank', 'ASC'),
+    'priceDesc': ('price_rank', 'DESC'),
+    'nameAsc': ('name_rank', 'ASC'),
+    'deliveryAsc': ('delivery_rank', 'ASC'),
+    'value': ('value_rank', 'ASC'),
+}
+
+
+def _ranks(menus, key):
+    """{id: 타입 안 순위(1부터)} — key 가 None 인 메뉴는 순위 없음"""
+    ranks = {}
+    by_type = {}
+    for menu in menus:
+        sort_key = key(menu)
+        if sort_key is not None:
+            by_type.setdefault(menu['type'], []).append(
+                (sort_key, menu['name'], menu['id']),
+            )
+    for entries in by_type.values():
+        entries.sort()
+        for rank, (_, _, menu_id) in enumerate(entries, 1):
+            ranks[menu_id] = rank
+    return ranks
+
+
+def _value_key(menu):
+    # 1,000원당 칼로리가 높을수록 앞 — 칼로리가 없으면 뒤로 (정수 비교로 고정)
+    if menu['calories'] is None or menu['price'] <= 0:
+        return (1, 0)
+    return (0, -(menu['calories'] * 1000 // menu['price']))
+
+
+def build_menu_board(menus, signature_menus=None):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록 → menu_board 행 목록 (id 순)"""
+    if signature_menus is None:
+        from recommendation_engine import load_signature_menus
+
+        signature_menus = load_signature_menus()
+    menus = list(menus)
+    signature = {
+        menu['id']: int(any(
+            k in menu['name'] for k in signature_menus.get(menu['franchise'], [])
+        ))
+        for menu in menus
+    }
+    popular = _ranks(menus, lambda m: 1 - signature[m['id']])
+    price = _ranks(menus, lambda m: m['price'])
+    name = _ranks(menus, lambda m: 0)
+    delivery = _ranks(menus, lambda m: m['price_delivery'])
+    value = _ranks(menus, _value_key)
+
+    rows = []
+    for menu in sorted(menus, key=lambda m: m['id']):
+        menu_id = menu['id']
+        price_delivery = menu['price_delivery']
+        rows.append((
+            menu_id,
+            menu['franchise'],
+            menu['type'],
+            menu['name'],
+            signature[menu_id],
+            popular[menu_id],
+            price[menu_id],
+            name[menu_id],
+            delivery.get(menu_id),
+            value[menu_id],
+            None if price_delivery is None else price_delivery - menu['price'],
+        ))
+    return rows
+
+
+def board_query(mode, franchises=None, search=False):
+    """메뉴판 한 페이지 SQL — 인자: type, [franchise...], [검색어], limit, offset
+
+    franchises 가 하나면 프랜차이즈 메뉴판, 여럿이면 카테고리 비교
+    (IN 목록), None 이면 모든 프랜차이즈입니다.
+    """
+    column, direction = SORT_MODES[mode]
+    where = ['b.type = ?']
+    if franchises is not None and len(franchises) == 1:
+        where.insert(0, 'b.franchise = ?')
+    elif franchises is not None:
+        # IN 목록이 (franchise, type, rank) 인덱스를 고르면 다시 정렬하게 되므로
+        # 단항 + 로 (type, rank) 인덱스를 쓰게 함
+        where.append(f'+b.franchise IN ({", ".join("?" * len(franchises))})')
+    if column == 'delivery_rank':
+        where.append('b.delivery_rank IS NOT NULL')
+    if search:
+        where.append('instr(b.name, ?) > 0')
+    return (
+        'SELECT m.* FROM menu_board b JOIN menus m ON m.id = b.menu_id '
+        f'WHERE {" AND ".join(where)} '
+        f'ORDER BY b.{column} {direction} LIMIT ? OFFSET ?'
+    )
+
+
+def board_page(conn, mode, menu_type, franchises=None, query='', limit=50,
+               offset=0):
+    """메뉴판 한 페이지의 menus 행 목록"""
+    params = [menu_type]
+    if franchises is not None and len(franchises) == 1:
+        params.insert(0, franchises[0])
+    elif franchises is not None:
+        params.extend(franchises)
+    if query:
+        params.append(query)
+    params.extend((limit, offset))
+    return conn.execute(
+        board_query(mode, franchises, search=bool(query)), params,
+    ).fetchall()
+
+
+def sort_items(menus, mode, signature_menus):
+    """franchise_menu_view.dart 의 _sortItems 를 그대로 옮긴 메모리 정렬
+
+    Dart 의 List.sort 는 안정 정렬이 아니므로 동점은 이름 → id 로 끊어 비교합니다
+    (priceDesc 는 인덱스를 거꾸로 읽으므로 동점도 거꾸로).
+    """
+    def signature_first(m):
+        is_sig = any(k in m['name'] for k in signature_menus.get(m['franchise'], []))
+        return (0 if is_sig else 1, m['name'], m['id'])
+
+    if mode == 'priceDesc':
+        return sorted(menus, key=lambda m: (m['price'], m['name'], m['id']),
+                      reverse=True)
+    keys = {
+        'popular': signature_first,
+        'priceAsc': lambda m: (m['price'], m['name'], m['id']),
+        'nameAsc': lambda m: (m['name'], m['id']),
+    }
+    return sorted(menus, key=keys[mode])
+
+
+def _computed_board(menus, signature_menus):
+    """menu_board 가 없는 DB 용: menus + 계산한 menu_board 를 담은 메모리 DB"""
+    from generate_seed_db import SCHEMA
+    from menu_source import MENU_COLUMNS
+
+    conn = sqlite3.connect(':memory:')
+    for stmt in SCHEMA + BOARD_SCHEMA:
+        conn.execute(stmt)
+    for table, columns, rows in (
+        ('menus', MENU_COLUMNS, [tuple(m[c] for c in MENU_COLUMNS) for m in menus]),
+        ('menu_board', BOARD_COLUMNS, build_menu_board(menus, signature_menus)),
+    ):
+        conn.executemany(
+            f'INSERT INTO {table} ({", ".join(columns)}) '
+            f'VALUES ({", ".join("?" * len(columns))})',
+            rows,
+        )
+    return conn
+
+
+def check(db_path):
+    """DB 의 menu_board 페이지를 메모리 정렬과 비교
+
+    DB 에 menu_board 가 없으면(--menu-board 없이 만든 기본 DB) 그 DB 의 menus 로
+    순위를 계산해 같은 비교를 합니다.
+    Returns: (비교한 페이지 수, 불일치 목록, DB 에 테이블이 있었는지)
+    """
+    from menu_source import MENU_COLUMNS
+    from recommendation_engine import load_signature_menus
+
+    signature_menus = load_signature_menus()
+    conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+    try:
+        menus = [
+            dict(zip(MENU_COLUMNS, row)) for row in conn.execute(
+                f'SELECT {", ".join(MENU_COLUMNS)} FROM menus'
+            )
+        ]
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'menu_board'"
+        ).fetchone() is not None
+        if not has_table:
+            conn.close()
+            conn = _computed_board(menus, signature_menus)
+        franchises = sorted({m['franchise'] for m in menus})
+        types = sorted({m['type'] for m in menus})
+        mismatches = []
+        checked = 0
+        for menu_type in types:
+            scopes = [[f] for f in franchises] + [franchises, None]
+            for scope in scopes:
+                for mode in ('popular', 'priceAsc', 'priceDesc', 'nameAsc'):
+                    expected = [
+                        m['id'] for m in sort_items(
+                            (m for m in menus if m['type'] == menu_type
+                             and (scope is None or m['franchise'] in scope)),
+                            mode, signature_menus,
+                        )
+                    ]
+                    got = [
+                        row[0] for row in board_page(
+                            conn, mode, menu_type, scope, limit=-1,
+                        )
+                    ]
+                    checked += 1
+                    if got != expected:
+                        mismatches.append((menu_type, scope, mode))
+    finally:
+        conn.close()
+    return checked, mismatches, has_table
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Menu board rank table')
+    sub = parser.add_subparsers(dest='command', required=True)
+    check_parser = sub.add_parser('check', help='menu_board 순위를 메모리 정렬과 비교')
+    check_parser.add_argument(
+        'db', nargs='?',
+        default=os.path.join(script_dir, '..', 'assets', 'menu_seed.db'),
+    )
+    args = parser.parse_args()
+
+    checked, mismatches, has_table = check(args.db)
+    if not has_table:
+        print(f'No menu_board table in {args.db}: checking computed ranks instead')
+    for menu_type, scope, mode in mismatches:
+        print(f'  mismatch: type={menu_type} franchises={scope} mode={mode}')
+    if mismatches:
+        raise SystemExit(f'menu_board check failed: {len(mismatches)}/{checked}')
+    source = 'DB table' if has_table else 'computed ranks'
+    print(f'menu_board check passed: {checked} pages ({source})')
+
+
+if __name__ == '__main__':
+    main()
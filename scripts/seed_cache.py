@@ -0,0 +1,97 @@
+"""
+Burger Budget - 예산 구간별 추천 캐시(recommendation_cache) 사전 계산
+
+getRecommendations 는 같은 (예산, 프랜차이즈, 배달 여부)에 대해 매번 같은
+결과를 다시 계산합니다. 선호 데이터가 없는 경우의 결과는 프랜차이즈별
+큐(스코어순, 메인당 최대 2개)를 라운드로빈으로 합친 것이므로, 예산 구간마다
+프랜차이즈별 상위 K개만 저장해 두면 클라이언트는 조합 생성 없이 병합만 하면 됩니다.
+
+  - 예산이 구간 값과 같으면 결과가 정확히 일치합니다 (K가 충분할 때).
+  - 구간 사이 예산은 아래 구간 결과를 쓰면 항상 예산 안이지만 최적은 아닐 수 있습니다.
+  - 선호 데이터(preferenceFit)가 있는 사용자는 캐시를 쓰지 않고 직접 계산해야 합니다.
+
+Requires: numpy (recommendation_engine.py)
+"""
+
+CACHE_MIN_BUDGET = 3000
+CACHE_BUDGET_STEP = 500
+DEFAULT_CACHE_BRACKETS = 55   # 3,000 ~ 30,000원
+DEFAULT_CACHE_TOP_K = 30
+
+CACHE_COLUMNS = (
+    'franchise', 'delivery', 'budget', 'rank', 'main_item_id',
+    'side_item_id', 'drink_item_id', 'dessert_item_id', 'score',
+)
+
+CACHE_SCHEMA = [
+    '''
+        CREATE TABLE recommendation_cache (
+            franchise       TEXT NOT NULL,
+            delivery        INTEGER NOT NULL,
+            budget          INTEGER NOT NULL,
+            rank            INTEGER NOT NULL,
+            main_item_id    TEXT NOT NULL,
+            side_item_id    TEXT,
+            drink_item_id   TEXT,
+            dessert_item_id TEXT,
+            score           REAL NOT NULL,
+            PRIMARY KEY (franchise, delivery, budget, rank)
+        ) WITHOUT ROWID
+    ''',
+]
+
+
+def cache_budgets(brackets):
+    return [CACHE_MIN_BUDGET + i * CACHE_BUDGET_STEP for i in range(brackets)]
+
+
+def build_recommendation_cache(menus, brackets=DEFAULT_CACHE_BRACKETS,
+                               top_k=DEFAULT_CACHE_TOP_K):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록 (rowid 순) → 캐시 행 목록"""
+    import recommendation_engine as engine
+
+    budgets = cache_budgets(brackets)
+    if not budgets:
+        return []
+
+    signature_menus = engine.load_signature_menus()
+    rows = []
+    for delivery in (False, True):
+        catalog = engine.build_catalog(
+            engine.candidate_order(menus, delivery), delivery, signature_menus,
+        )
+        combos = engine.enumerate_combos(catalog, max(budgets))
+        scores = engine.score_matrix(catalog, combos, budgets)
+        ids = catalog['id'] + [None]  # _NONE(-1) → None
+        for column, budget in enumerate(budgets):
+            queues = engine.franchise_queues(catalog, combos, scores, column)
+            for franchise in sorted(queues):
+                for rank, index in enumerate(queues[franchise][:top_k]):
+                    rows.append((
+                        franchise,
+                        int(delivery),
+                        budget,
+                        rank,
+                        ids[combos['main'][index]],
+                        ids[combos['side'][index]],
+                        ids[combos['drink'][index]],
+                        ids[scores['dessert_item'][index, column]],
+                        float(scores['score'][index, column]),
+                    ))
+    rows.sort(key=lambda row: row[:4])
+    return rows
+
+
+def table_size_bytes(cursor, names):
+    """dbstat 으로 테이블/인덱스가 차지하는 바이트 (dbstat 없으면 None)"""
+    import sqlite3
+
+    placeholders = ', '.join('?' * len(names))
+    try:
+        cursor.execute(
+            f'SELECT SUM(pgsize) FROM dbstat WHERE name IN ({placeholders})',
+            names,
+        )
+    except sqlite3.OperationalError:
+        return None
+    return cursor.fetchone()[0] or 0
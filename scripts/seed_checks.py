@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 메뉴 카탈로그 일관성 검사
+
+menu_source.py 의 행 단위 검증(타입·숫자·날짜 형식)으로는 못 잡는, 행끼리의
+규칙을 확인합니다. 프랜차이즈마다 id 해시 인덱스와 버거 이름 인덱스를 한 번
+만든 뒤 모든 행을 한 번씩만 훑으므로 카탈로그 크기에 선형입니다.
+
+  id_format           id 는 {franchise}_{type}_{번호}
+  delivery_price      price_delivery 는 NULL 이거나 price 이상
+  unknown_tag         tags 는 KNOWN_TAGS 중에서만 (콤마 구분, 중복 없이)
+  includes_flags      세트는 사이드나 음료를 포함, 세트가 아니면 둘 다 0
+  set_without_burger  세트마다 짝이 되는 버거가 있어야 함 (UNPAIRED_SETS 제외)
+  set_price           세트는 짝 버거보다 비쌈 (매장가, 둘 다 있으면 배달가도)
+
+세트의 짝 버거는 먼저 같은 번호의 `*_burger_NN` 을 보고, 그 버거 이름이 세트
+이름의 앞부분이 아니면 이름이 세트 이름의 가장 긴 앞부분과 같은 버거를
+찾습니다 (공백 무시). KFC 박스·켄치밥 세트처럼 번호가 버거와 어긋난 세트가
+이 경우입니다.
+
+프랜차이즈는 서로 독립이라 PARALLEL_MIN_ROWS 행 이상이면 프로세스 풀에서
+나눠 검사합니다. 입력이 스트림이어도 in-flight 배치 수만큼만 메모리에 둡니다.
+
+Usage:
+    python3 scripts/seed_checks.py                     # 메뉴 소스 검사
+    python3 scripts/seed_checks.py --json report.json
+    python3 scripts/seed_checks.py --rows 100000       # 합성 카탈로그로 속도 확인
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from menu_source import MENU_COLUMNS, iter_menu_rows
+
+KNOWN_TAGS = ('인기', '프리미엄', '매운', '가성비', '시그니처')
+
+# 짝 버거가 없는 단독 세트 (팩·박스 구성, 사이드 단품 세트)
+UNPAIRED_SETS = frozenset({
+    'kfc_set_17',  # 최현석 CHEFS PACK
+    'kfc_set_18',  # 최현석 CHEFS BOX
+    'kfc_set_24',  # 해쉬통다리세트
+})
+
+RULES = (
+    'id_format', 'delivery_price', 'unknown_tag', 'includes_flags',
+    'set_without_burger', 'set_price',
+)
+
+PARALLEL_MIN_ROWS = 20000
+BATCH_ROWS = 5000
+
+_ID = MENU_COLUMNS.index('id')
+_FRANCHISE = MENU_COLUMNS.index('franchise')
+_NAME = MENU_COLUMNS.index('name')
+_TYPE = MENU_COLUMNS.index('type')
+_PRICE = MENU_COLUMNS.index('price')
+_DELIVERY = MENU_COLUMNS.index('price_delivery')
+_TAGS = MENU_COLUMNS.index('tags')
+_SIDE = MENU_COLUMNS.index('includes_side')
+_DRINK = MENU_COLUMNS.index('includes_drink')
+
+_KNOWN_TAGS = frozenset(KNOWN_TAGS)
+_ID_SUFFIX = re.compile(r'^_(\d+)$')
+
+
+def _normalize(name):
+    return name.replace(' ', '')
+
+
+def _paired_burger(franchise, row, by_id, burger_names, longest):
+    """세트 행의 짝 버거 행 (없으면 None)"""
+    name = _normalize(row[_NAME])
+    numbered = by_id.get(f'{franchise}_burger_{row[_ID].rsplit("_", 1)[-1]}')
+    if numbered is not None and numbered[_TYPE] == 'burger' and \
+            name.startswith(_normalize(numbered[_NAME])):
+        return numbered
+    for length in range(min(len(name), longest), 0, -1):
+        burger = burger_names.get(name[:length])
+        if burger is not None:
+            return burger
+    return None
+
+
+def check_franchise(franchise, rows):
+    """프랜차이즈 하나의 행 목록 검사
+
+    Returns: [(rule, id, message)]
+    """
+    by_id = {}
+    burger_names = {}
+    for row in rows:
+        by_id[row[_ID]] = row
+        if row[_TYPE] == 'burger':
+            burger_names.setdefault(_normalize(row[_NAME]), row)
+    longest = max(map(len, burger_names), default=0)
+
+    violations = []
+    for row in rows:
+        menu_id, menu_type = row[_ID], row[_TYPE]
+        price, delivery = row[_PRICE], row[_DELIVERY]
+
+        prefix = f'{franchise}_{menu_type}'
+        if not (menu_id.startswith(prefix) and
+                _ID_SUFFIX.match(menu_id[len(prefix):])):
+            violations.append((
+                'id_format', menu_id, f'expected {prefix}_<number>',
+            ))
+
+        if delivery is not None and delivery < price:
+            violations.append((
+                'delivery_price', menu_id,
+                f'price_delivery {delivery} < price {price}',
+            ))
+
+        tags = row[_TAGS].split(',') if row[_TAGS] else []
+        unknown = [tag for tag in tags if tag not in _KNOWN_TAGS]
+        if unknown or len(set(tags)) != len(tags):
+            violations.append((
+                'unknown_tag', menu_id,
+                f'tags {row[_TAGS]!r} (known: {",".join(KNOWN_TAGS)})',
+            ))
+
+        side, drink = row[_SIDE], row[_DRINK]
+        if (menu_type == 'set') != bool(side or drink):
+            violations.append((
+                'includes_flags', menu_id,
+                f'{menu_type} with includes_side={side}, includes_drink={drink}',
+            ))
+
+        if menu_type != 'set':
+            continue
+        burger = _paired_burger(franchise, row, by_id, burger_names, longest)
+        if burger is None:
+            if menu_id not in UNPAIRED_SETS:
+                violations.append((
+                    'set_without_burger', menu_id,
+                    f'no burger matches {row[_NAME]!r}',
+                ))
+            continue
+        if price <= burger[_PRICE]:
+            violations.append((
+                'set_price', menu_id,
+                f'price {price} <= {burger[_ID]} price {burger[_PRICE]}',
+            ))
+        burger_delivery = burger[_DELIVERY]
+        if delivery is not None and burger_delivery is not None and \
+                delivery <= burger_delivery:
+            violations.append((
+                'set_price', menu_id,
+                f'price_delivery {delivery} <= {burger[_ID]} '
+                f'price_delivery {burger_delivery}',
+            ))
+    return violations
+
+
+def _check_batch(groups):
+    return [
+        (rule, franchise, menu_id, message)
+        for franchise, rows in groups
+        for rule, menu_id, message in check_franchise(franchise, rows)
+    ]
+
+
+def _franchise_groups(rows, stats):
+    """연속된 같은 프랜차이즈 행을 (franchise, rows) 로 묶음"""
+    seen = set()
+    for franchise, group in itertools.groupby(rows, key=lambda row: row[_FRANCHISE]):
+        if franchise in seen:
+            raise ValueError(f'Rows for {franchise} are not contiguous')
+        seen.add(franchise)
+        group = list(group)
+        stats['rows'] += len(group)
+        stats['franchises'] += 1
+        yield franchise, group
+
+
+def _batches(groups, batch_rows=BATCH_ROWS):
+    """프랜차이즈 묶음을 batch_rows 행 안팎의 배치로 (작업 하나당 IPC 한 번)"""
+    batch, size = [], 0
+    for group in groups:
+        batch.append(group)
+        size += len(group[1])
+        if size >= batch_rows:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def _pool_map(batches, workers):
+    """순서를 유지하면서 in-flight 배치 수를 workers * 2 로 제한"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = collections.deque()
+        for batch in batches:
+            window.append(pool.submit(_check_batch, batch))
+            if len(window) >= workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+
+def check_catalog(rows, workers=None):
+    """카탈로그 전체 검사 (rows: MENU_COLUMNS 튜플 리스트 또는 스트림)
+
+    Returns: {rows, franchises, workers, seconds, counts, violations}
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    stats = {'rows': 0, 'franchises': 0}
+    batches = _batches(_franchise_groups(rows, stats))
+
+    # 작은 카탈로그는 프로세스를 띄우는 비용이 검사보다 큼
+    head = []
+    for batch in batches:
+        head.append(batch)
+        if stats['rows'] >= PARALLEL_MIN_ROWS:
+            break
+    if workers > 1 and stats['rows'] >= PARALLEL_MIN_ROWS:
+        results = _pool_map(itertools.chain(head, batches), workers)
+    else:
+        workers = 1
+        results = map(_check_batch, itertools.chain(head, batches))
+
+    violations = sorted(itertools.chain.from_iterable(results),
+                        key=lambda v: (v[1], v[2], v[0]))
+    counts = collections.Counter(v[0] for v in violations)
+    return {
+        'rows': stats['rows'],
+        'franchises': stats['franchises'],
+        'workers': workers,
+        'seconds': round(time.perf_counter() - started, 3),
+        'counts': {rule: counts[rule] for rule in RULES},
+        'violations': [
+            {'rule': rule, 'franchise': franchise, 'id': menu_id, 'message': message}
+            for rule, franchise, menu_id, message in violations
+        ],
+    }
+
+
+def format_violations(report, limit=50):
+    lines = [
+        f'{v["id"]}: [{v["rule"]}] {v["message"]}'
+        for v in report['violations'][:limit]
+    ]
+    hidden = len(report['violations']) - limit
+    if hidden > 0:
+        lines.append(f'... and {hidden} more')
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Menu catalog consistency check')
+    parser.add_argument('--rows', type=int, help='합성 카탈로그 행 수 (속도 확인용)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, help='프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--json', help='보고서를 JSON으로 저장')
+    args = parser.parse_args()
+
+    if args.rows:
+        from synth_catalog import generate_catalog
+        source = f'synthetic catalog ({args.rows:,} rows, seed {args.seed})'
+        rows = generate_catalog(args.rows, seed=args.seed)
+    else:
+        source = 'menu sources'
+        rows = iter_menu_rows()
+
+    report = check_catalog(rows, workers=args.workers)
+    print(
+        f'Checked {source}: {report["rows"]:,} rows, '
+        f'{report["franchises"]:,} franchises in {report["seconds"]:.3f}s '
+        f'({report["workers"]} worker{"s" if report["workers"] > 1 else ""})'
+    )
+    for rule, count in report['counts'].items():
+        print(f'  {rule:<20}{count:>8,}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'Wrote: {args.json}')
+
+    if report['violations']:
+        print(format_violations(report))
+        # 합성 카탈로그는 이름·가격을 흔들어 만들므로 위반이 나오는 게 정상
+        if not args.rows:
+            sys.exit(1)
+    else:
+        print('Catalog check passed')
+
+
+if __name__ == '__main__':
+    main()
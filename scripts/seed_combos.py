@@ -0,0 +1,164 @@
+"""
+Burger Budget - 조합(combos) 테이블 사전 계산
+
+RecommendationRepositoryImpl._buildAllCombos 가 기기에서 매번 수행하던
+메인 × 사이드 × 음료 (× 디저트) 열거를 빌드 시점에 한 번만 수행합니다.
+
+지배(dominated) 조합은 저장하지 않습니다. 같은 메인에 대해 조합 A가
+조합 B의 구성 슬롯(사이드/음료/디저트)을 모두 갖추고 매장가·배달가가
+모두 B 이하라면 B는 제거됩니다. 가격과 슬롯이 완전히 같은 조합끼리는
+메뉴 소스 순서상 먼저 나온 것 하나만 남깁니다.
+
+클라이언트 쿼리:
+    SELECT * FROM combos
+    WHERE franchise IN (...) AND total_price <= ?
+    ORDER BY total_price DESC
+"""
+
+from itertools import combinations, product
+
+SLOTS = ('side', 'drink', 'dessert')
+
+COMBO_COLUMNS = (
+    'id', 'franchise', 'main_item_id', 'side_item_id', 'drink_item_id',
+    'dessert_item_id', 'total_price', 'total_price_delivery',
+)
+
+COMBO_SCHEMA = [
+    '''
+        CREATE TABLE combos (
+            id              INTEGER PRIMARY KEY,
+            franchise       TEXT NOT NULL,
+            main_item_id    TEXT NOT NULL REFERENCES menus(id),
+            side_item_id    TEXT REFERENCES menus(id),
+            drink_item_id   TEXT REFERENCES menus(id),
+            dessert_item_id TEXT REFERENCES menus(id),
+            total_price     INTEGER NOT NULL,
+            total_price_delivery INTEGER
+        )
+    ''',
+    '''
+        CREATE INDEX idx_combos_price ON combos(total_price DESC, franchise)
+    ''',
+    '''
+        CREATE INDEX idx_combos_delivery ON combos(total_price_delivery DESC, franchise)
+        WHERE total_price_delivery IS NOT NULL
+    ''',
+]
+
+_INF = float('inf')
+
+
+def _delivery_key(value):
+    """배달가 없음(None)은 배달 모드에서 고를 수 없으므로 무한대로 취급"""
+    return _INF if value is None else value
+
+
+def _pareto(entries):
+    """(price, delivery, order, payload) 중 2차원 파레토 최적만 반환
+
+    가격이 같으면 order가 앞선 것 하나만 남습니다.
+    """
+    frontier = []
+    best_delivery = None
+    for entry in sorted(entries, key=lambda e: (e[0], _delivery_key(e[1]), e[2])):
+        delivery = _delivery_key(entry[1])
+        if best_delivery is None or delivery < best_delivery:
+            frontier.append(entry)
+            best_delivery = delivery
+    return frontier
+
+
+def _slot_frontier(items):
+    """슬롯 내에서 다른 아이템보다 비싸기만 한 아이템은 어떤 조합에서도 지배됨"""
+    return [
+        entry[3] for entry in _pareto(
+            (item['price'], item['price_delivery'], item['order'], item)
+            for item in items
+        )
+    ]
+
+
+def _dominates(a, b):
+    """a가 b를 지배하는지 (같은 메인 전제)"""
+    if not a['slots'] >= b['slots']:
+        return False
+    if a['price'] > b['price']:
+        return False
+    if _delivery_key(a['delivery']) > _delivery_key(b['delivery']):
+        return False
+    if a['slots'] > b['slots']:
+        return True
+    if a['price'] < b['price'] or \
+            _delivery_key(a['delivery']) < _delivery_key(b['delivery']):
+        return True
+    return a['order'] < b['order']
+
+
+def _main_bundles(main, slot_items):
+    """메인 하나에 대한 비지배 조합 목록"""
+    free_slots = [
+        slot for slot in SLOTS
+        if slot_items[slot]
+        and not (slot == 'side' and main['includes_side'])
+        and not (slot == 'drink' and main['includes_drink'])
+    ]
+
+    candidates = []
+    for size in range(len(free_slots) + 1):
+        for profile in combinations(free_slots, size):
+            entries = []
+            for picks in product(*(slot_items[slot] for slot in profile)):
+                items = [main, *picks]
+                price = sum(item['price'] for item in items)
+                # 배달 모드는 배달가 있는 아이템만 후보로 쓰므로 하나라도 없으면 NULL
+                if any(item['price_delivery'] is None for item in items):
+                    delivery = None
+                else:
+                    delivery = sum(item['price_delivery'] for item in items)
+                order = tuple(item['order'] for item in picks)
+                entries.append((price, delivery, order, dict(zip(profile, picks))))
+            for price, delivery, order, picks in _pareto(entries):
+                candidates.append({
+                    'slots': frozenset(profile),
+                    'price': price,
+                    'delivery': delivery,
+                    'order': (len(profile), order),
+                    'picks': picks,
+                })
+
+    return [
+        b for b in candidates
+        if not any(a is not b and _dominates(a, b) for a in candidates)
+    ]
+
+
+def build_combos(menus):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록 → combos 행 목록"""
+    by_franchise = {}
+    for order, item in enumerate(menus):
+        by_franchise.setdefault(item['franchise'], []).append({**item, 'order': order})
+
+    rows = []
+    for franchise in sorted(by_franchise):
+        items = by_franchise[franchise]
+        slot_items = {
+            slot: _slot_frontier(i for i in items if i['type'] == slot)
+            for slot in SLOTS
+        }
+        mains = [i for i in items if i['type'] in ('set', 'burger')]
+        for main in mains:
+            bundles = _main_bundles(main, slot_items)
+            for bundle in sorted(bundles, key=lambda b: (b['price'], b['order'])):
+                picks = bundle['picks']
+                rows.append((
+                    len(rows) + 1,
+                    franchise,
+                    main['id'],
+                    picks['side']['id'] if 'side' in picks else None,
+                    picks['drink']['id'] if 'drink' in picks else None,
+                    picks['dessert']['id'] if 'dessert' in picks else None,
+                    bundle['price'],
+                    bundle['delivery'],
+                ))
+    return rows
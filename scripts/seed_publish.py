@@ -0,0 +1,250 @@
+"""
+Burger Budget - 배포용(publish) 압축 DB
+
+기본 시드 DB는 franchise / type / tags / price_updated_at 을 행마다 TEXT로
+반복 저장합니다. 배포본은 이 값들을 작은 사전(lookup) 테이블로 빼고
+menu_items 에는 INTEGER id만 둡니다. 앱 쿼리는 그대로 동작하도록
+`menus` 는 기존과 같은 컬럼 구성의 VIEW 로 제공합니다.
+
+  franchises   (id, code)   — code 순으로 id 부여, code 는 UNIQUE
+  menu_types   (id, name)   — CHECK 제약과 같은 순서
+  price_dates  (id, date)
+  tag_sets     (id, tags)   — 콤마로 이은 태그 문자열 전체를 하나의 값으로
+
+franchise id를 code 순으로 주기 때문에 여러 프랜차이즈 IN + ORDER BY price
+결과의 동점 순서도 기본 DB(price DESC, franchise)와 같습니다.
+
+menu_items 의 rowid 는 직전 배포본에서 물려받습니다(assign_rowids). 남은 메뉴는
+같은 rowid, 새 메뉴는 이전 최대 rowid 뒤에 붙고, 지운 메뉴 자리는 비워 둡니다.
+그래서 메뉴 하나를 더하거나 빼도 delta(generate_delta.py)는 그 행만 담습니다.
+
+마지막으로 PUBLISH_PAGE_SIZES 중 파일이 가장 작은 page size로 VACUUM 하므로
+free page가 남지 않습니다.
+"""
+
+import contextlib
+import os
+import shutil
+import sqlite3
+import tempfile
+
+from menu_source import MENU_TYPES
+
+PUBLISH_PAGE_SIZES = (1024, 2048, 4096, 8192)
+
+PUBLISH_SCHEMA = [
+    '''
+        CREATE TABLE franchises (
+            id   INTEGER PRIMARY KEY,
+            code TEXT NOT NULL UNIQUE
+        )
+    ''',
+    '''
+        CREATE TABLE menu_types (
+            id   INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        )
+    ''',
+    '''
+        CREATE TABLE price_dates (
+            id   INTEGER PRIMARY KEY,
+            date TEXT NOT NULL
+        )
+    ''',
+    '''
+        CREATE TABLE tag_sets (
+            id   INTEGER PRIMARY KEY,
+            tags TEXT NOT NULL
+        )
+    ''',
+    '''
+        CREATE TABLE menu_items (
+            id             TEXT PRIMARY KEY,
+            franchise_id   INTEGER NOT NULL REFERENCES franchises(id),
+            name           TEXT NOT NULL,
+            type_id        INTEGER NOT NULL REFERENCES menu_types(id),
+            price          INTEGER NOT NULL,
+            price_delivery INTEGER,
+            price_date_id  INTEGER REFERENCES price_dates(id),
+            calories       INTEGER,
+            imageUrl       TEXT,
+            tag_set_id     INTEGER NOT NULL REFERENCES tag_sets(id),
+            includes_side  INTEGER NOT NULL DEFAULT 0,
+            includes_drink INTEGER NOT NULL DEFAULT 0
+        )
+    ''',
+    '''
+        CREATE INDEX idx_menu_items_franchise_price
+        ON menu_items(franchise_id, price DESC)
+    ''',
+    '''
+        CREATE INDEX idx_menu_items_franchise_price_delivery
+        ON menu_items(franchise_id, price_delivery DESC)
+        WHERE price_delivery IS NOT NULL
+    ''',
+    '''
+        CREATE INDEX idx_menu_items_franchise_name ON menu_items(franchise_id, name)
+    ''',
+    '''
+        CREATE VIEW menus AS
+        SELECT
+            i.id,
+            f.code AS franchise,
+            i.name,
+            t.name AS type,
+            i.price,
+            i.price_delivery,
+            d.date AS price_updated_at,
+            i.calories,
+            i.imageUrl,
+            s.tags,
+            i.includes_side,
+            i.includes_drink
+        FROM menu_items i
+        JOIN franchises f ON f.id = i.franchise_id
+        JOIN menu_types t ON t.id = i.type_id
+        LEFT JOIN price_dates d ON d.id = i.price_date_id
+        JOIN tag_sets s ON s.id = i.tag_set_id
+    ''',
+]
+
+
+def is_publish_schema(schema):
+    # 'CREATE VIEW menus_keyed' (item_keys.py) 같은 다른 VIEW 는 제외
+    return any(stmt.split()[:3] == ['CREATE', 'VIEW', 'menus'] for stmt in schema)
+
+
+def _dictionary(values, order=None):
+    """값 → 1부터 시작하는 id (order가 없으면 정렬 순)"""
+    return {value: i + 1 for i, value in enumerate(order or sorted(values))}
+
+
+def assign_rowids(ids, previous=None):
+    """ids(카탈로그 순) → rowid 목록
+
+    previous: 직전 배포본의 {id: rowid}. 거기 있던 id는 같은 rowid를 쓰고,
+    새 id는 이전 최대 rowid 다음부터 카탈로그 순으로 받습니다.
+    """
+    previous = previous or {}
+    next_rowid = max(previous.values(), default=0) + 1
+    rowids = []
+    for key in ids:
+        if key in previous:
+            rowids.append(previous[key])
+        else:
+            rowids.append(next_rowid)
+            next_rowid += 1
+    return rowids
+
+
+def build_publish_tables(menus, rowids=None):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록
+
+    rowids: menus 와 같은 순서의 menu_items rowid (없으면 1부터 차례로)
+    Returns: [(table, columns, rows)] — insert 순서 (menu_items 는 rowid 순)
+    """
+    if rowids is None:
+        rowids = range(1, len(menus) + 1)
+    franchises = _dictionary({m['franchise'] for m in menus})
+    types = _dictionary(MENU_TYPES, order=MENU_TYPES)
+    dates = _dictionary({
+        m['price_updated_at'] for m in menus if m['price_updated_at'] is not None
+    })
+    tag_sets = _dictionary({m['tags'] or '' for m in menus})
+
+    items = sorted(
+        (
+            rowid,
+            m['id'],
+            franchises[m['franchise']],
+            m['name'],
+            types[m['type']],
+            m['price'],
+            m['price_delivery'],
+            dates.get(m['price_updated_at']),
+            m['calories'],
+            m['imageUrl'],
+            tag_sets[m['tags'] or ''],
+            m['includes_side'],
+            m['includes_drink'],
+        )
+        for m, rowid in zip(menus, rowids)
+    )
+
+    def lookup(mapping):
+        return sorted((i, value) for value, i in mapping.items())
+
+    return [
+        ('franchises', ('id', 'code'), lookup(franchises)),
+        ('menu_types', ('id', 'name'), lookup(types)),
+        ('price_dates', ('id', 'date'), lookup(dates)),
+        ('tag_sets', ('id', 'tags'), lookup(tag_sets)),
+        ('menu_items', (
+            'rowid', 'id', 'franchise_id', 'name', 'type_id', 'price',
+            'price_delivery', 'price_date_id', 'calories', 'imageUrl', 'tag_set_id',
+            'includes_side', 'includes_drink',
+        ), items),
+    ]
+
+
+def _no_phase(name):
+    return contextlib.nullcontext()
+
+
+def _vacuum_copy(source, dest, page_size):
+    shutil.copyfile(source, dest)
+    conn = sqlite3.connect(dest)
+    try:
+        conn.execute(f'PRAGMA page_size = {page_size}')
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+    return os.path.getsize(dest)
+
+
+def write_publish_db(path, menus, page_size=None, schema=PUBLISH_SCHEMA,
+                     timer=None, rowids=None):
+    """배포용 DB 생성 → VACUUM
+
+    page_size가 없으면 PUBLISH_PAGE_SIZES 를 모두 시도해 가장 작은 파일을
+    고릅니다 (같으면 큰 page size).
+    timer: build_report.PhaseTimer — 주면 schema / insert / analyze / vacuum 시간 기록
+    rowids: menus 와 같은 순서의 menu_items rowid (assign_rowids)
+    Returns: (선택한 page size, {page size: 파일 크기})
+    """
+    phase = timer.phase if timer is not None else _no_phase
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = os.path.join(tmp, 'staging.db')
+        conn = sqlite3.connect(staging)
+        try:
+            with phase('schema'):
+                for stmt in schema:
+                    conn.execute(stmt)
+            with phase('insert'):
+                for table, columns, rows in build_publish_tables(menus, rowids):
+                    placeholders = ', '.join('?' * len(columns))
+                    conn.executemany(
+                        f'INSERT INTO {table} ({", ".join(columns)}) '
+                        f'VALUES ({placeholders})',
+                        rows,
+                    )
+                conn.commit()
+            with phase('analyze'):
+                conn.execute('ANALYZE')
+                conn.commit()
+        finally:
+            conn.close()
+
+        candidates = (page_size,) if page_size else PUBLISH_PAGE_SIZES
+        sizes = {}
+        with phase('vacuum'):
+            for candidate in candidates:
+                sizes[candidate] = _vacuum_copy(
+                    staging, os.path.join(tmp, f'{candidate}.db'), candidate,
+                )
+        chosen = min(candidates, key=lambda size: (sizes[size], -size))
+
+        if os.path.exists(path):
+            os.remove(path)
+        shutil.move(os.path.join(tmp, f'{chosen}.db'), path)
+    return chosen, sizes
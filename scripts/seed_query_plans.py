@@ -0,0 +1,376 @@
+"""
+Burger Budget - 앱 쿼리 형태별 실행 계획(EXPLAIN QUERY PLAN) 검사
+
+앱이 시드 DB에 보내는 쿼리를 그대로 옮겨 두고, 빌드한 DB에서 각 쿼리의
+실행 계획을 확인합니다. 다음 중 하나라도 나오면 위반입니다.
+
+  - SCAN <table>            인덱스 없이 테이블 전체를 읽음
+  - USE TEMP B-TREE         ORDER BY 를 인덱스로 처리하지 못하고 따로 정렬
+
+정렬을 인덱스로 할 수 없는 쿼리는 PLAN_ALLOWANCES 에 이유와 함께 둡니다.
+`SCAN <table> USING INDEX` (정렬 순서대로 인덱스를 훑으며 인덱스 안의
+컬럼으로 걸러 냄)는 결과 자체가 테이블 대부분인 쿼리에만 허용합니다.
+IN 목록은 프랜차이즈 1개 / 2개 / 전체일 때 계획이 달라지므로 모두 확인합니다.
+
+`franchise IN (...) ORDER BY price` 는 프랜차이즈가 둘 이상이면 인덱스 순서로
+읽을 수 없습니다. 시드 DB(475행)에서는 가격 인덱스를 통째로 훑는 편이 싸서
+드러나지 않지만, 합성 1만 행 카탈로그에서는 franchise 인덱스로 찾은 뒤
+임시 B-tree 로 정렬했습니다. 그래서 메뉴 목록 쿼리는 프랜차이즈마다
+`franchise = ?` 가지를 UNION ALL 로 잇고({each}), SQLite 가 (franchise, 가격)
+인덱스 순서의 가지들을 정렬 없이 MERGE 로 합칩니다. 규모에 따라 계획이
+바뀌므로 synth_catalog.py 카탈로그(--rows)에서도 검사합니다.
+
+Usage:
+    python3 scripts/seed_query_plans.py            # assets/menu_seed.db 검사
+    python3 scripts/seed_query_plans.py path/to.db
+    python3 scripts/seed_query_plans.py --rows 10000 100000   # 합성 카탈로그
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import tempfile
+
+from seed_regions import REGION_LIST_SQL, REGION_LOOKUP_SQL
+
+FRANCHISE_SAMPLES = (
+    ('mcd',),
+    ('mcd', 'bk'),
+    ('mcd', 'bk', 'kfc', 'mom', 'lot'),
+)
+
+# 빌드할 때마다 검사하는 합성 카탈로그 크기 (generate_seed_db.py)
+SYNTH_CHECK_ROWS = 10000
+
+# (이름, 필요한 테이블, SQL 템플릿, IN 목록 외 인자 수, 인덱스 스캔 허용)
+# {in} 은 프랜차이즈 IN 목록 placeholder 로 바뀝니다.
+# {each} 는 프랜차이즈 하나의 placeholder 로, ORDER BY 앞까지를 프랜차이즈마다
+# 복제해 UNION ALL 로 잇습니다 (bind_franchises). 인자는 가지마다
+# (프랜차이즈, IN 목록 외 인자...) 순서입니다.
+QUERY_SHAPES = [
+    (
+        'MenuLocalDatasource.getMenusByFranchise',
+        'menus',
+        'SELECT * FROM menus WHERE franchise = {each} '
+        'ORDER BY price DESC, franchise',
+        0,
+        False,
+    ),
+    (
+        'MenuLocalDatasource.getMenusWithinBudget',
+        'menus',
+        'SELECT * FROM menus WHERE franchise = {each} AND price <= ? '
+        'ORDER BY price DESC, franchise',
+        1,
+        False,
+    ),
+    (
+        'MenuLocalDatasource.getMenuById',
+        'menus',
+        'SELECT * FROM menus WHERE id = ?',
+        1,
+        False,
+    ),
+    (
+        'MenuLocalDatasource.searchMenus',
+        'menus',
+        'SELECT * FROM menus WHERE name LIKE ? ORDER BY franchise, name',
+        1,
+        True,
+    ),
+    (
+        'RecommendationDatasource.getCandidates',
+        'menus',
+        'SELECT * FROM menus WHERE franchise = {each} AND price <= ? '
+        'ORDER BY price DESC, franchise',
+        1,
+        False,
+    ),
+    (
+        'RecommendationDatasource.getCandidates (delivery)',
+        'menus',
+        'SELECT * FROM menus WHERE franchise = {each} '
+        'AND price_delivery IS NOT NULL AND price_delivery <= ? '
+        'ORDER BY price_delivery DESC, franchise',
+        1,
+        False,
+    ),
+    (
+        'combos',
+        'combos',
+        'SELECT * FROM combos WHERE franchise IN ({in}) AND total_price <= ? '
+        'ORDER BY total_price DESC',
+        1,
+        False,
+    ),
+    (
+        'combos (delivery)',
+        'combos',
+        'SELECT * FROM combos WHERE franchise IN ({in}) '
+        'AND total_price_delivery IS NOT NULL AND total_price_delivery <= ? '
+        'ORDER BY total_price_delivery DESC',
+        1,
+        False,
+    ),
+    (
+        'recommendation_cache',
+        'recommendation_cache',
+        'SELECT * FROM recommendation_cache '
+        'WHERE franchise = ? AND delivery = ? AND budget = ? ORDER BY rank',
+        3,
+        False,
+    ),
+    (
+        'price_overrides (lookup)',
+        'price_overrides',
+        REGION_LOOKUP_SQL,
+        2,
+        False,
+    ),
+    (
+        'price_overrides (franchise list)',
+        'price_overrides',
+        REGION_LIST_SQL,
+        1,
+        True,
+    ),
+    (
+        'menu_board (franchise)',
+        'menu_board',
+        'SELECT m.* FROM menu_board b JOIN menus m ON m.id = b.menu_id '
+        'WHERE b.franchise = ? AND b.type = ? ORDER BY b.price_rank DESC '
+        'LIMIT ? OFFSET ?',
+        4,
+        False,
+    ),
+    (
+        'menu_board (franchise, search)',
+        'menu_board',
+        'SELECT m.* FROM menu_board b JOIN menus m ON m.id = b.menu_id '
+        'WHERE b.franchise = ? AND b.type = ? AND instr(b.name, ?) > 0 '
+        'ORDER BY b.popular_rank ASC LIMIT ? OFFSET ?',
+        5,
+        False,
+    ),
+    (
+        'menu_board (category)',
+        'menu_board',
+        'SELECT m.* FROM menu_board b JOIN menus m ON m.id = b.menu_id '
+        'WHERE b.type = ? AND +b.franchise IN ({in}) '
+        'ORDER BY b.name_rank ASC LIMIT ? OFFSET ?',
+        3,
+        False,
+    ),
+    (
+        'menu_board (category, delivery)',
+        'menu_board',
+        'SELECT m.* FROM menu_board b JOIN menus m ON m.id = b.menu_id '
+        'WHERE b.type = ? AND b.delivery_rank IS NOT NULL '
+        'ORDER BY b.delivery_rank ASC LIMIT ? OFFSET ?',
+        3,
+        False,
+    ),
+    (
+        'affordability',
+        'affordability',
+        'SELECT options FROM affordability '
+        'WHERE franchise = ? AND delivery = ? AND kind = ? AND price <= ? '
+        'ORDER BY price DESC LIMIT 1',
+        4,
+        False,
+    ),
+    (
+        'item_keys (key → id)',
+        'item_keys',
+        'SELECT * FROM menus_keyed WHERE item_key = ?',
+        1,
+        False,
+    ),
+    (
+        'price_history',
+        'price_history',
+        'SELECT * FROM price_history WHERE menu_id = ? ORDER BY seq',
+        1,
+        False,
+    ),
+]
+
+# 위반으로 보지 않는 계획 항목: 이름 → (detail 접두어, 이유)
+PLAN_ALLOWANCES = {
+    'price_overrides (franchise list)': (
+        ('USE TEMP B-TREE FOR ORDER BY', 'SCAN m'),
+        '실제 가격(COALESCE)은 조인 결과라 어떤 인덱스 순서로도 정렬되지 않음. '
+        '프랜차이즈 1~2개는 franchise 인덱스로 찾고, 전체면 통째로 읽는 편이 '
+        '싸서 SCAN — seed_regions.py',
+    ),
+}
+
+_FULL_SCAN = re.compile(r'^SCAN \w+( AS \w+)?$')
+
+
+def explain(conn, sql, params):
+    """EXPLAIN QUERY PLAN 의 detail 목록"""
+    return [
+        row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+    ]
+
+
+def _allowed(name):
+    return PLAN_ALLOWANCES[name][0] if name in PLAN_ALLOWANCES else ()
+
+
+def plan_violations(plan, allow_index_scan, allowed=()):
+    """계획에서 위반 사유 목록 (allowed 접두어로 시작하는 항목은 제외)"""
+    problems = []
+    for detail in plan:
+        if detail.startswith(tuple(allowed)):
+            continue
+        if detail.startswith('USE TEMP B-TREE'):
+            problems.append(detail)
+        elif _FULL_SCAN.match(detail):
+            problems.append(detail)
+        elif detail.startswith('SCAN ') and 'USING' in detail \
+                and not allow_index_scan:
+            problems.append(detail)
+    return problems
+
+
+def per_franchise(template):
+    """프랜차이즈 목록을 받는 템플릿인지 ({in} 또는 {each})"""
+    return '{in}' in template or '{each}' in template
+
+
+def bind_franchises(template, franchises, args):
+    """템플릿 + 프랜차이즈 목록 + IN 목록 외 인자 → (sql, params)
+
+    {each} 템플릿은 ORDER BY 앞까지를 프랜차이즈마다 한 가지로 복제해
+    UNION ALL 로 잇습니다 (앱 datasource 의 franchiseMergeQuery 와 같은 SQL).
+    """
+    if '{each}' in template:
+        select, order = template.rsplit(' ORDER BY ', 1)
+        branch = select.replace('{each}', '?')
+        sql = ' UNION ALL '.join([branch] * len(franchises)) + f' ORDER BY {order}'
+        params = tuple(
+            value for franchise in franchises for value in (franchise, *args)
+        )
+        return sql, params
+    sql = template.replace('{in}', ','.join('?' * len(franchises)))
+    return sql, (*franchises, *args)
+
+
+def _expand(template, extra_params):
+    """프랜차이즈 목록을 받으면 FRANCHISE_SAMPLES 별로 (sql, params) 생성"""
+    if not per_franchise(template):
+        yield template, (0,) * extra_params
+        return
+    for franchises in FRANCHISE_SAMPLES:
+        yield bind_franchises(template, franchises, (0,) * extra_params)
+
+
+def shape_plans(conn):
+    """DB에 있는 테이블에 해당하는 쿼리 형태별 (이름, sql, 계획, 인덱스 스캔 허용)"""
+    tables = {
+        row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'view')"
+        )
+    }
+    for name, table, template, extra_params, allow_index_scan in QUERY_SHAPES:
+        if table not in tables:
+            continue
+        for sql, params in _expand(template, extra_params):
+            yield name, sql, explain(conn, sql, params), allow_index_scan
+
+
+def check_query_plans(conn):
+    """Returns: [(이름, sql, 계획, 위반 사유)] — 비어 있으면 통과"""
+    failures = []
+    for name, sql, plan, allow_index_scan in shape_plans(conn):
+        problems = plan_violations(
+            plan, allow_index_scan, _allowed(name),
+        )
+        if problems:
+            failures.append((name, sql, plan, problems))
+    return failures
+
+
+def check_synthetic_plans(rows=SYNTH_CHECK_ROWS, seed=0):
+    """synth_catalog.py 카탈로그(rows 행)에서 check_query_plans
+
+    menus 쿼리만 해당합니다. 합성 카탈로그에는 파생 테이블이 없습니다.
+    """
+    # synth_catalog 는 generate_seed_db 의 SCHEMA 를 쓰고, generate_seed_db 는
+    # 이 모듈을 import 하므로 여기서 가져옵니다.
+    from synth_catalog import generate_catalog, write_catalog_db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f'synth_{rows}.db')
+        write_catalog_db(path, generate_catalog(rows, seed))
+        conn = sqlite3.connect(path)
+        try:
+            return check_query_plans(conn)
+        finally:
+            conn.close()
+
+
+def format_failures(failures):
+    lines = []
+    for name, sql, plan, problems in failures:
+        lines.append(f'{name}: {", ".join(problems)}')
+        lines.append(f'    {sql}')
+        lines.extend(f'    | {detail}' for detail in plan)
+    return '\n'.join(lines)
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description='Seed DB query plan check')
+    parser.add_argument(
+        'db',
+        nargs='?',
+        default=os.path.join(script_dir, '..', 'assets', 'menu_seed.db'),
+    )
+    parser.add_argument(
+        '--rows', type=int, nargs='+',
+        help='DB 대신 이 크기의 합성 카탈로그들을 검사',
+    )
+    args = parser.parse_args()
+
+    if args.rows:
+        failed = 0
+        for rows in args.rows:
+            failures = check_synthetic_plans(rows)
+            failed += bool(failures)
+            print(f'synthetic {rows:,} rows: '
+                  f'{"FAIL" if failures else "ok"}')
+            if failures:
+                print(format_failures(failures))
+        if failed:
+            raise SystemExit('\nQuery plan check failed')
+        print('\nQuery plan check passed')
+        return
+
+    conn = sqlite3.connect(f'file:{args.db}?mode=ro', uri=True)
+    try:
+        plans = list(shape_plans(conn))
+    finally:
+        conn.close()
+
+    failures = []
+    for name, sql, plan, allow_index_scan in plans:
+        print(f'{name}\n    {sql}')
+        for detail in plan:
+            print(f'    | {detail}')
+        problems = plan_violations(
+            plan, allow_index_scan, _allowed(name),
+        )
+        if problems:
+            failures.append((name, sql, plan, problems))
+
+    if failures:
+        raise SystemExit(f'\nQuery plan check failed:\n{format_failures(failures)}')
+    print(f'\nQuery plan check passed ({len(plans)} queries)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Burger Budget - 지역·매장별 가격 (sparse override)
+
+menus 의 price / price_delivery 는 기본가입니다. 지역(또는 매장)마다 다른
+가격은 기본가와 다른 메뉴만 price_overrides 에 (menu_id, region) 키로
+저장합니다. 지역이 늘어도 menus 는 그대로이고, 늘어나는 것은 실제로 값이
+다른 행뿐입니다.
+
+  price_overrides (menu_id, region, price, price_delivery)
+      — 컬럼이 NULL 이면 그 가격은 기본가 그대로
+      — PRIMARY KEY (menu_id, region), WITHOUT ROWID: 메뉴 하나의 지역가는
+        기본 키 한 번 탐색. region 보조 인덱스는 두지 않습니다 — 있으면
+        플래너가 그쪽을 고르고 기본 키를 한 번 더 찾습니다.
+
+지역 R의 실제 가격 조회 (REGION_LOOKUP_SQL):
+    SELECT m.*, COALESCE(o.price, m.price) AS effective_price,
+           COALESCE(o.price_delivery, m.price_delivery) AS effective_price_delivery
+    FROM menus m
+    LEFT JOIN price_overrides o ON o.menu_id = m.id AND o.region = ?
+    WHERE m.id = ?
+
+지역 R의 프랜차이즈 메뉴 목록(REGION_LIST_SQL)은 실제 가격 순이어야 하므로
+`ORDER BY effective_price DESC` 입니다. 실제 가격은 조인 결과라 인덱스로
+정렬할 수 없어 USE TEMP B-TREE 로 따로 정렬합니다. 정렬 대상은 고른
+프랜차이즈의 행뿐이고, 비용은 bench_regions.py 의 sort µs 로 잽니다.
+seed_query_plans.py 는 이 쿼리에만 정렬을 허용합니다.
+"""
+
+import collections
+
+PRICE_OVERRIDE_COLUMNS = ('menu_id', 'region', 'price', 'price_delivery')
+
+PRICE_OVERRIDE_SCHEMA = [
+    '''
+        CREATE TABLE price_overrides (
+            menu_id        TEXT NOT NULL REFERENCES menus(id),
+            region         TEXT NOT NULL,
+            price          INTEGER,
+            price_delivery INTEGER,
+            PRIMARY KEY (menu_id, region)
+        ) WITHOUT ROWID
+    ''',
+]
+
+EFFECTIVE_COLUMNS = (
+    'm.*, COALESCE(o.price, m.price) AS effective_price, '
+    'COALESCE(o.price_delivery, m.price_delivery) AS effective_price_delivery'
+)
+REGION_JOIN = (
+    'FROM menus m '
+    'LEFT JOIN price_overrides o ON o.menu_id = m.id AND o.region = ?'
+)
+REGION_LOOKUP_SQL = f'SELECT {EFFECTIVE_COLUMNS} {REGION_JOIN} WHERE m.id = ?'
+# {in} 은 프랜차이즈 IN 목록 placeholder (seed_query_plans.QUERY_SHAPES 와 같음)
+REGION_LIST_SQL = (
+    f'SELECT {EFFECTIVE_COLUMNS} {REGION_JOIN} '
+    'WHERE m.franchise IN ({in}) ORDER BY effective_price DESC'
+)
+
+
+def build_price_overrides(menus, overrides, id_mapping=None):
+    """price_overrides 행 목록
+
+    menus: 현재 메뉴 dict 목록
+    overrides: (menu_id, region, price, price_delivery) — menu_source.iter_region_overrides
+    id_mapping: 소스 id → DB id (stable_ids 로 바뀐 id)
+
+    기본가와 같은 값은 NULL 로 바꾸고, 둘 다 NULL 이 되면 행을 버립니다.
+    없는 메뉴, 같은 (메뉴, 지역) 중복, 배달가가 매장가보다 싼 경우는 ValueError.
+    """
+    by_id = {menu['id']: menu for menu in menus}
+    id_mapping = id_mapping or {}
+    rows = {}
+    errors = []
+    for menu_id, region, price, delivery in overrides:
+        menu_id = id_mapping.get(menu_id, menu_id)
+        menu = by_id.get(menu_id)
+        if menu is None:
+            errors.append(f'{region}/{menu_id}: unknown menu id')
+            continue
+        if (menu_id, region) in rows:
+            errors.append(f'{region}/{menu_id}: listed twice')
+            continue
+        if price == menu['price']:
+            price = None
+        if delivery == menu['price_delivery']:
+            delivery = None
+        effective = price or menu['price']
+        effective_delivery = delivery or menu['price_delivery']
+        if effective_delivery is not None and effective_delivery < effective:
+            errors.append(
+                f'{region}/{menu_id}: price_delivery {effective_delivery} '
+                f'< price {effective}'
+            )
+            continue
+        rows[(menu_id, region)] = (price, delivery)
+    if errors:
+        raise ValueError('Invalid price overrides:\n' + '\n'.join(errors))
+    return [
+        (menu_id, region, price, delivery)
+        for (menu_id, region), (price, delivery) in sorted(rows.items())
+        if price is not None or delivery is not None
+    ]
+
+
+def region_counts(rows):
+    """{region: override 행 수}"""
+    return dict(sorted(collections.Counter(row[1] for row in rows).items()))
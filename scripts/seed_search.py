@@ -0,0 +1,220 @@
+"""
+Burger Budget - 메뉴명 검색 인덱스
+
+MenuLocalDatasource.searchMenus 의 `name LIKE '%q%'` 는 인덱스를 쓰지 못하고
+항상 전체 테이블을 훑습니다. 여기서는 검색용 파생 테이블을 만듭니다.
+
+  menu_search_forms  메뉴별 정규화 이름 / 초성 / 자모 분해형
+  menus_fts          초성/자모형 FTS5 trigram 인덱스 (3글자 이상, 외부 content)
+  menu_search_grams  1~2글자 질의용 unigram/bigram 인덱스
+
+질의는 먼저 정규화(소문자, 공백·기호 제거)한 뒤
+  - 초성만 있으면("ㅂㄱ") 초성형에서 찾고,
+  - 그 밖에는 자모 분해형 인덱스로 후보를 고른 다음 정규화 이름에서 확인합니다.
+    완성 음절은 그대로 비교하고, 끝에 남은 자음 하나만 그 초성으로 시작하는
+    음절로 풀어 봅니다(입력 중인 "빅ㅁ" → "빅맥"). 자모형만 보면 음절 경계를
+    넘어 "드립"이 "에드워드 리"에 걸리기 때문입니다.
+  - 숫자·영문 한 글자는 인덱스가 없어 searchMenus 와 같은 LIKE 로 찾습니다.
+
+인덱스를 쓴다고 늘 빠르지는 않습니다. 흔한 초성 bigram("ㅂㄱ")은 posting 이
+길어 100× 규모(47,500개)에서 LIKE 전체 스캔보다 몇 배 느렸습니다
+(64 ms vs 9 ms, bench_search.py). 선택적인 질의("빅맥")에서만 이득이 큽니다.
+"""
+
+import unicodedata
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+# 호환용 자모 (U+3131~) — 키보드로 입력되는 형태
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ('', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ',
+             'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ',
+             'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ')
+
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+FORM_COLUMNS = ('id', 'menu_id', 'name', 'normalized', 'choseong', 'jamo')
+GRAM_COLUMNS = ('form', 'gram', 'form_id')
+
+SEARCH_SCHEMA = [
+    '''
+        CREATE TABLE menu_search_forms (
+            id         INTEGER PRIMARY KEY,
+            menu_id    TEXT NOT NULL UNIQUE REFERENCES menus(id),
+            name       TEXT NOT NULL,
+            normalized TEXT NOT NULL,
+            choseong   TEXT NOT NULL,
+            jamo       TEXT NOT NULL
+        )
+    ''',
+    '''
+        CREATE VIRTUAL TABLE menus_fts USING fts5(
+            choseong, jamo,
+            content='menu_search_forms', content_rowid='id',
+            tokenize='trigram'
+        )
+    ''',
+    '''
+        CREATE TRIGGER menu_search_forms_ai AFTER INSERT ON menu_search_forms BEGIN
+            INSERT INTO menus_fts(rowid, choseong, jamo)
+            VALUES (new.id, new.choseong, new.jamo);
+        END
+    ''',
+    '''
+        CREATE TRIGGER menu_search_forms_ad AFTER DELETE ON menu_search_forms BEGIN
+            INSERT INTO menus_fts(menus_fts, rowid, choseong, jamo)
+            VALUES ('delete', old.id, old.choseong, old.jamo);
+        END
+    ''',
+]
+
+GRAM_SCHEMA = [
+    '''
+        CREATE TABLE menu_search_grams (
+            form    TEXT NOT NULL CHECK(form IN ('c','j')),
+            gram    TEXT NOT NULL,
+            form_id INTEGER NOT NULL REFERENCES menu_search_forms(id),
+            PRIMARY KEY (form, gram, form_id)
+        ) WITHOUT ROWID
+    ''',
+]
+
+
+def normalize(text):
+    """NFC + 소문자 + 글자/숫자만 남김 ('불고기 버거' == '불고기버거')"""
+    text = unicodedata.normalize('NFC', text).lower()
+    return ''.join(ch for ch in text if ch.isalnum())
+
+
+def _split_syllable(ch):
+    code = ord(ch) - _HANGUL_BASE
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def _is_syllable(ch):
+    return _HANGUL_BASE <= ord(ch) <= _HANGUL_LAST
+
+
+def to_choseong(text):
+    """'빅맥' → 'ㅂㅁ' (한글 외 문자는 그대로)"""
+    return ''.join(
+        CHOSEONG[_split_syllable(ch)[0]] if _is_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def to_jamo(text):
+    """'빅맥' → 'ㅂㅣㄱㅁㅐㄱ' (한글 외 문자는 그대로)"""
+    out = []
+    for ch in text:
+        if _is_syllable(ch):
+            lead, vowel, tail = _split_syllable(ch)
+            out.append(CHOSEONG[lead] + JUNGSEONG[vowel] + JONGSEONG[tail])
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def classify_query(query):
+    """질의 → (form, term). form: 'c'(초성) | 'j'(자모)"""
+    normalized = normalize(query)
+    if normalized and all(ch in _CHOSEONG_SET for ch in normalized):
+        return 'c', normalized
+    return 'j', to_jamo(normalized)
+
+
+def _syllable_range(consonant):
+    first = _HANGUL_BASE + CHOSEONG.index(consonant) * 588
+    return f'[{chr(first)}-{chr(first + 587)}]'
+
+
+def name_pattern(query):
+    """질의 → 정규화 이름에 맞춰 볼 GLOB 패턴
+
+    완성 음절은 그대로 두고, 끝의 자음 하나만 그 초성으로 시작하는 음절
+    범위로 바꿉니다 ('빅ㅁ' → '*빅[마-밓]*'). 정규화 결과는 글자/숫자뿐이라
+    GLOB 특수문자가 섞이지 않습니다.
+    """
+    normalized = normalize(query)
+    if normalized[-1:] in _CHOSEONG_SET:
+        return f'*{normalized[:-1]}{_syllable_range(normalized[-1])}*'
+    return f'*{normalized}*'
+
+
+def _grams(text, sizes=(1, 2)):
+    return {
+        text[i:i + n]
+        for n in sizes
+        for i in range(len(text) - n + 1)
+    }
+
+
+def build_search_forms(menus):
+    """menus: MENU_COLUMNS 키를 가진 dict 목록 → menu_search_forms 행"""
+    rows = []
+    for item in menus:
+        normalized = normalize(item['name'])
+        rows.append((
+            len(rows) + 1,
+            item['id'],
+            item['name'],
+            normalized,
+            to_choseong(normalized),
+            to_jamo(normalized),
+        ))
+    return rows
+
+
+def build_search_grams(forms):
+    """trigram이 처리하지 못하는 1~2글자 질의용 gram 행
+
+    초성은 1·2글자, 자모는 2글자만 저장합니다. 자모 1글자 질의는 자음이면
+    초성 질의로 분류되고, 그 밖(숫자·영문 한 글자)은 search() 가 LIKE 로 찾습니다.
+    """
+    rows = set()
+    for form_id, _, _, _, choseong, jamo in forms:
+        rows.update(('c', gram, form_id) for gram in _grams(choseong))
+        rows.update(('j', gram, form_id) for gram in _grams(jamo, sizes=(2,)))
+    return sorted(rows)
+
+
+def search(conn, query):
+    """검색 인덱스를 이용한 참조 질의 — searchMenus 와 같은 정렬 (franchise, name)"""
+    form, term = classify_query(query)
+    if not term:
+        return []
+
+    select = (
+        'SELECT m.* FROM menus m '
+        'JOIN menu_search_forms f ON f.menu_id = m.id '
+    )
+    order = ' ORDER BY m.franchise, m.name'
+    if form == 'j' and len(term) == 1:
+        # 숫자·영문 한 글자: gram 인덱스가 없으므로 searchMenus 와 같은 LIKE
+        return conn.execute(
+            'SELECT * FROM menus WHERE name LIKE ? ORDER BY franchise, name',
+            (f'%{term}%',),
+        ).fetchall()
+
+    column = 'choseong' if form == 'c' else 'jamo'
+    if len(term) >= 3:
+        phrase = '"' + term.replace('"', '""') + '"'
+        sql = select + (
+            'WHERE f.id IN ('
+            '  SELECT rowid FROM menus_fts WHERE menus_fts MATCH ?'
+            ')'
+        )
+        params = [f'{column} : {phrase}']
+    else:
+        sql = select + (
+            'JOIN menu_search_grams g ON g.form_id = f.id '
+            'WHERE g.form = ? AND g.gram = ?'
+        )
+        params = [form, term]
+    if form == 'j':
+        # 자모형 일치는 음절 경계를 넘을 수 있으므로 정규화 이름으로 거름
+        sql += ' AND f.normalized GLOB ?'
+        params.append(name_pattern(query))
+    return conn.execute(sql + order, params).fetchall()
@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 로컬 manifest / 데이터 서버 (CDN 대역)
+
+gh-pages/ 트리를 GitHub Pages(CDN)처럼 서빙하는 asyncio HTTP/1.1 서버입니다.
+테스트에서 실제 배포 URL 대신 쓰거나, bench_data_server.py 로 업데이트 확인
+비용을 잴 때 씁니다.
+
+  ETag            파일 내용(표현)마다 강한 ETag — SHA-256 앞 32자리
+  If-None-Match   일치하면 304 (약한 비교, `*` 포함). 없을 때만 If-Modified-Since
+  Range           `bytes=a-b` / `a-` / `-n` 하나만 206, 범위 밖이면 416,
+                  여러 범위는 무시하고 200 전체. If-Range 가 현재 ETag 와
+                  다르면(파일이 바뀌었으면) 범위를 무시하고 200 전체
+  압축본          Accept-Encoding 이 허용하면 미리 만든 압축본을
+                  Content-Encoding 으로 보냄 — 같은 폴더의 X.gz / X.zst
+                  (compress_db.py 가 만드는 menu_vN.db.gz 등), .json 은 처음
+                  요청될 때 메모리에 gzip. 표현마다 ETag 가 다르고 Range 는
+                  고른 표현의 바이트 기준
+  Cache-Control   이름에 _v{N} 이 있는 파일은 내용이 바뀌지 않으므로
+                  `public, max-age=31536000, immutable`, 나머지(manifest.json)는
+                  `no-cache` (매번 재검증)
+
+파일은 요청마다 stat 해서 (mtime, 크기)가 바뀌었을 때만 다시 해시하므로,
+서버를 띄운 채로 manifest.json 을 바꾸면 다음 요청부터 새 ETag 가 나갑니다.
+
+Usage:
+    python3 scripts/serve_data.py                      # gh-pages/ 를 :8000 에서 서빙
+    python3 scripts/serve_data.py --root DIR --port 0 --log
+    python3 scripts/serve_data.py selftest             # ETag / 304 / Range / 압축본 검증
+"""
+
+import argparse
+import asyncio
+import contextlib
+import email.utils
+import gzip
+import hashlib
+import http.client
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import tempfile
+import threading
+import urllib.parse
+from collections import Counter
+
+from generate_delta import PAGES_DIR
+
+CHUNK_SIZE = 64 * 1024
+# 이보다 작은 파일은 메모리에 올려 두고 바로 보냄
+MEMORY_LIMIT = 4 * 1024 * 1024
+IDLE_TIMEOUT = 15.0
+MAX_HEADER_BYTES = 16 * 1024
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+# 압축본 우선순위 (같은 크기면 앞쪽)
+ENCODINGS = ('zstd', 'gzip')
+ENCODING_SUFFIX = {'gzip': '.gz', 'zstd': '.zst'}
+# 압축본 파일이 없어도 메모리에 gzip 으로 만들어 두는 확장자
+GZIP_IN_MEMORY = ('.json',)
+GZIP_LEVEL = 9
+
+CONTENT_TYPES = {
+    '.db': 'application/vnd.sqlite3',
+    '.json': 'application/json',
+    '.gz': 'application/gzip',
+    '.zst': 'application/zstd',
+}
+
+_VERSIONED = re.compile(r'_v\d+[._]')
+_RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+REASONS = {
+    200: 'OK', 206: 'Partial Content', 304: 'Not Modified',
+    400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    416: 'Range Not Satisfiable', 431: 'Request Header Fields Too Large',
+}
+
+
+def content_type(path):
+    ext = os.path.splitext(path)[1]
+    if ext in CONTENT_TYPES:
+        return CONTENT_TYPES[ext]
+    return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def cache_control(path):
+    return IMMUTABLE if _VERSIONED.search(os.path.basename(path)) else REVALIDATE
+
+
+class Representation:
+    """파일 하나의 표현 (원본 또는 압축본): 바이트 출처, 크기, ETag"""
+
+    def __init__(self, size, etag, path=None, data=None):
+        self.size = size
+        self.etag = etag
+        self.path = path
+        self.data = data
+
+
+def _etag(data_or_path):
+    digest = hashlib.sha256()
+    if isinstance(data_or_path, bytes):
+        digest.update(data_or_path)
+    else:
+        with open(data_or_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                digest.update(chunk)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def _load(path, size):
+    if size <= MEMORY_LIMIT:
+        with open(path, 'rb') as f:
+            data = f.read()
+        return Representation(len(data), _etag(data), data=data)
+    return Representation(size, _etag(path), path=path)
+
+
+def _stamp(path):
+    """(mtime_ns, 크기) — 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def file_stamps(path):
+    """원본과 압축본 파일들의 stamp — 하나라도 바뀌면 Resource 를 다시 만듦"""
+    return (_stamp(path),) + tuple(
+        _stamp(path + ENCODING_SUFFIX[encoding]) for encoding in ENCODINGS
+    )
+
+
+class Resource:
+    """URL 하나: 원본 표현 + {encoding: 압축 표현}"""
+
+    def __init__(self, path, stamps):
+        self.path = path
+        self.stamps = stamps
+        self.mtime = stamps[0][0] / 1e9
+        self.content_type = content_type(path)
+        self.cache_control = cache_control(path)
+        self.identity = _load(path, stamps[0][1])
+        self.encoded = {}
+        for encoding, stamp in zip(ENCODINGS, stamps[1:]):
+            if stamp is not None:
+                self.encoded[encoding] = _load(
+                    path + ENCODING_SUFFIX[encoding], stamp[1],
+                )
+        if 'gzip' not in self.encoded and path.endswith(GZIP_IN_MEMORY) and \
+                self.identity.data is not None:
+            data = gzip.compress(self.identity.data, GZIP_LEVEL, mtime=0)
+            if len(data) < self.identity.size:
+                self.encoded['gzip'] = Representation(len(data), _etag(data), data=data)
+
+    def negotiate(self, accept_encoding):
+        """Accept-Encoding 으로 고른 (encoding, 표현) — 원본이면 encoding None"""
+        accepted = _accepted_encodings(accept_encoding)
+        best = (None, self.identity)
+        for encoding in ENCODINGS:
+            rep = self.encoded.get(encoding)
+            if encoding in accepted and rep is not None and rep.size < best[1].size:
+                best = (encoding, rep)
+        return best
+
+
+def _accepted_encodings(header):
+    accepted = set()
+    for item in (header or '').split(','):
+        token, _, params = item.strip().partition(';')
+        token = token.strip().lower()
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if token and q > 0:
+            accepted.add(token)
+    if '*' in accepted:
+        accepted.update(ENCODINGS)
+    return accepted
+
+
+def _etag_matches(header, etag):
+    """If-None-Match 약한 비교"""
+    if header.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def parse_range(header, size):
+    """Range 헤더 → (start, end) 포함 범위, 'unsatisfiable', 또는 None(무시)"""
+    match = _RANGE.match(header.strip().replace(' ', ''))
+    if match is None:
+        return None  # 형식 오류나 여러 범위 → 전체
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        length = int(last)
+        if length == 0:
+            return 'unsatisfiable'
+        return max(0, size - length), size - 1
+    start = int(first)
+    if start >= size:
+        return 'unsatisfiable'
+    end = int(last) if last else size - 1
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+class DataServer:
+    """gh-pages 트리를 서빙하는 asyncio 서버
+
+    stats: 상태 코드별 응답 수와 보낸 바이트 (헤더 포함)
+    """
+
+    def __init__(self, root=PAGES_DIR, log=False):
+        self.root = os.path.abspath(root)
+        self.log = log
+        self.stats = Counter()
+        self._resources = {}
+        self._server = None
+        self._writers = set()
+
+    async def start(self, host='127.0.0.1', port=8000):
+        self._server = await asyncio.start_server(
+            self._handle, host, port, limit=MAX_HEADER_BYTES,
+        )
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """리스닝 소켓과 열린 keep-alive 연결을 모두 닫음"""
+        self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+
+    def resource(self, url_path):
+        """URL 경로 → Resource (없으면 None). 바뀐 파일만 다시 읽음"""
+        parts = [
+            part for part in posixpath.normpath(url_path).split('/')
+            if part not in ('', '.')
+        ]
+        if '..' in parts:
+            return None
+        path = os.path.join(self.root, *parts)
+        if not os.path.isfile(path):
+            self._resources.pop(path, None)
+            return None
+        stamps = file_stamps(path)
+        cached = self._resources.get(path)
+        if cached is None or cached.stamps != stamps:
+            cached = Resource(path, stamps)
+            self._resources[path] = cached
+        return cached
+
+    async def _handle(self, reader, writer):
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b'\r\n\r\n'), IDLE_TIMEOUT,
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                        ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send(writer, 431, {}, close=True)
+                    break
+                keep_alive = await self._respond(writer, head)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, writer, head):
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, target, version = lines[0].split(' ')
+            headers = {}
+            for line in lines[1:]:
+                if line:
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+        except ValueError:
+            await self._send(writer, 400, {}, close=True)
+            return False
+
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' \
+            else connection == 'keep-alive'
+
+        if method not in ('GET', 'HEAD'):
+            await self._send(writer, 405, {'Allow': 'GET, HEAD'}, close=not keep_alive)
+            return keep_alive
+
+        url_path = urllib.parse.unquote(urllib.parse.urlsplit(target).path)
+        resource = self.resource(url_path)
+        if resource is None:
+            await self._send(writer, 404, {}, close=not keep_alive)
+            self._log(method, target, 404, 0)
+            return keep_alive
+
+        encoding, rep = resource.negotiate(headers.get('accept-encoding'))
+        response = {
+            'ETag': rep.etag,
+            'Last-Modified': email.utils.formatdate(resource.mtime, usegmt=True),
+            'Cache-Control': resource.cache_control,
+            'Accept-Ranges': 'bytes',
+        }
+        if resource.encoded:
+            response['Vary'] = 'Accept-Encoding'
+
+        if self._not_modified(headers, rep.etag, resource.mtime):
+            await self._send(writer, 304, response, close=not keep_alive)
+            self._log(method, target, 304, 0)
+            return keep_alive
+
+        response['Content-Type'] = resource.content_type
+        if encoding is not None:
+            response['Content-Encoding'] = encoding
+
+        status, start, end = 200, 0, rep.size - 1
+        requested = headers.get('range')
+        if requested and method == 'GET' and \
+                headers.get('if-range', rep.etag) == rep.etag:
+            parsed = parse_range(requested, rep.size)
+            if parsed == 'unsatisfiable':
+                response['Content-Range'] = f'bytes */{rep.size}'
+                await self._send(writer, 416, response, close=not keep_alive)
+                self._log(method, target, 416, 0)
+                return keep_alive
+            if parsed is not None:
+                status, (start, end) = 206, parsed
+                response['Content-Range'] = f'bytes {start}-{end}/{rep.size}'
+
+        length = end - start + 1
+        await self._send(
+            writer, status, response, close=not keep_alive, length=length,
+            body=(rep, start, length) if method == 'GET' else None,
+        )
+        self._log(method, target, status, length if method == 'GET' else 0)
+        return keep_alive
+
+    @staticmethod
+    def _not_modified(headers, etag, mtime):
+        if 'if-none-match' in headers:
+            return _etag_matches(headers['if-none-match'], etag)
+        since = headers.get('if-modified-since')
+        if since:
+            try:
+                parsed = email.utils.parsedate_to_datetime(since)
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= parsed.timestamp()
+        return False
+
+    async def _send(self, writer, status, headers, close, length=0, body=None):
+        lines = [f'HTTP/1.1 {status} {REASONS[status]}']
+        headers = {
+            'Date': email.utils.formatdate(usegmt=True),
+            **headers,
+        }
+        if status != 304:
+            headers['Content-Length'] = str(length)
+        if close:
+            headers['Connection'] = 'close'
+        lines.extend(f'{name}: {value}' for name, value in headers.items())
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        writer.write(head)
+        sent = len(head)
+        if body is not None:
+            rep, start, length = body
+            if rep.data is not None:
+                writer.write(rep.data[start:start + length])
+            else:
+                with open(rep.path, 'rb') as f:
+                    f.seek(start)
+                    remaining = length
+                    while remaining:
+                        chunk = f.read(min(CHUNK_SIZE, remaining))
+                        writer.write(chunk)
+                        remaining -= len(chunk)
+                        await writer.drain()
+            sent += length
+        await writer.drain()
+        self.stats[status] += 1
+        self.stats['bytes'] += sent
+
+    def _log(self, method, target, status, length):
+        if self.log:
+            print(f'{method} {target} {status} {length}', flush=True)
+
+
+@contextlib.contextmanager
+def running_server(root=PAGES_DIR):
+    """테스트용: 별도 스레드에서 서버를 띄우고 (base URL, DataServer) 를 돌려줌"""
+    server = DataServer(root)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+    port = []
+
+    async def main():
+        port.append(await server.start(port=0))
+        ready.set()
+        with contextlib.suppress(asyncio.CancelledError):
+            await server.serve_forever()
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(main(),), daemon=True)
+    thread.start()
+    ready.wait()
+    try:
+        yield f'http://127.0.0.1:{port[0]}', server
+    finally:
+        loop.call_soon_threadsafe(lambda: loop.create_task(server.close()))
+        thread.join(timeout=5)
+
+
+def _request(base, path, method='GET', **headers):
+    """(status, {헤더 소문자: 값}, body) — http.client 는 압축을 풀지 않음"""
+    parsed = urllib.parse.urlsplit(base)
+    conn = http.client.HTTPConnection(parsed.hostname, parsed.port)
+    try:
+        conn.request(method, path, headers={
+            name.replace('_', '-'): value for name, value in headers.items()
+        })
+        response = conn.getresponse()
+        body = response.read()
+        return response.status, {k.lower(): v for k, v in response.getheaders()}, body
+    finally:
+        conn.close()
+
+
+def selftest():
+    """임시 트리(manifest.json, menu_v1.db, menu_v1.db.gz)로 프로토콜 검증"""
+    failures = 0
+
+    def check(ok, label):
+        nonlocal failures
+        failures += not ok
+        print(f'  [{"ok" if ok else "FAIL"}] {label}')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, 'data')
+        os.makedirs(data_dir)
+        db = os.urandom(1024) * 200  # 200 KiB, 잘 압축됨
+        with open(os.path.join(data_dir, 'menu_v1.db'), 'wb') as f:
+            f.write(db)
+        db_gz = gzip.compress(db, 9, mtime=0)
+        with open(os.path.join(data_dir, 'menu_v1.db.gz'), 'wb') as f:
+            f.write(db_gz)
+        manifest = {'version': 1, 'dbUrl': '/data/menu_v1.db', 'padding': 'x' * 500}
+        manifest_path = os.path.join(tmp, 'manifest.json')
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+
+        with running_server(tmp) as (base, server):
+            status, headers, body = _request(base, '/manifest.json')
+            etag = headers.get('etag', '')
+            check(
+                status == 200 and etag.startswith('"') and json.loads(body) == manifest
+                and headers.get('cache-control') == REVALIDATE,
+                f'manifest 200, ETag {etag}, Cache-Control no-cache',
+            )
+            status, headers, body = _request(
+                base, '/manifest.json', If_None_Match=etag,
+            )
+            check(status == 304 and body == b'' and headers.get('etag') == etag,
+                  'If-None-Match → 304, empty body')
+            status, _, _ = _request(base, '/manifest.json', If_None_Match=f'W/{etag}')
+            check(status == 304, 'weak If-None-Match → 304')
+            status, _, _ = _request(base, '/manifest.json', If_None_Match='"stale"')
+            check(status == 200, 'stale If-None-Match → 200')
+            status, _, _ = _request(
+                base, '/manifest.json', If_Modified_Since=headers['last-modified'],
+            )
+            check(status == 304, 'If-Modified-Since → 304')
+
+            status, headers, body = _request(
+                base, '/manifest.json', Accept_Encoding='gzip, deflate',
+            )
+            check(
+                status == 200 and headers.get('content-encoding') == 'gzip'
+                and headers.get('vary') == 'Accept-Encoding'
+                and headers.get('etag') != etag
+                and json.loads(gzip.decompress(body)) == manifest,
+                f'manifest gzip: {len(body)} bytes, own ETag',
+            )
+            status, headers, _ = _request(
+                base, '/manifest.json', Accept_Encoding='gzip;q=0',
+            )
+            check('content-encoding' not in headers, 'gzip;q=0 → identity')
+
+            status, headers, body = _request(base, '/data/menu_v1.db', 'HEAD')
+            db_etag = headers.get('etag')
+            check(
+                status == 200 and body == b'' and
+                headers.get('content-length') == str(len(db)) and
+                headers.get('cache-control') == IMMUTABLE,
+                'HEAD menu_v1.db: Content-Length, immutable',
+            )
+            status, headers, body = _request(
+                base, '/data/menu_v1.db', Accept_Encoding='gzip',
+            )
+            check(
+                headers.get('content-encoding') == 'gzip' and body == db_gz,
+                f'precomputed menu_v1.db.gz: {len(body):,} of {len(db):,} bytes',
+            )
+
+            status, headers, part1 = _request(base, '/data/menu_v1.db', Range='bytes=0-99')
+            check(
+                status == 206 and part1 == db[:100] and
+                headers.get('content-range') == f'bytes 0-99/{len(db)}',
+                'Range bytes=0-99 → 206',
+            )
+            status, _, part2 = _request(
+                base, '/data/menu_v1.db', Range='bytes=100-', If_Range=db_etag,
+            )
+            check(status == 206 and part1 + part2 == db, 'resume bytes=100- with If-Range')
+            status, _, body = _request(base, '/data/menu_v1.db', Range='bytes=-10')
+            check(status == 206 and body == db[-10:], 'suffix Range bytes=-10')
+            status, headers, _ = _request(
+                base, '/data/menu_v1.db', Range=f'bytes={len(db)}-',
+            )
+            check(
+                status == 416 and headers.get('content-range') == f'bytes */{len(db)}',
+                'Range past end → 416',
+            )
+            status, _, body = _request(base, '/data/menu_v1.db', Range='bytes=0-1,5-6')
+            check(status == 200 and body == db, 'multiple ranges → 200 full')
+            status, _, body = _request(
+                base, '/data/menu_v1.db', Range='bytes=100-', If_Range='"old"',
+            )
+            check(status == 200 and body == db, 'If-Range mismatch → 200 full')
+
+            status, _, _ = _request(base, '/../requests.jsonl')
+            check(status == 404, 'path outside root → 404')
+            status, _, _ = _request(base, '/manifest.json', 'POST')
+            check(status == 405, 'POST → 405')
+
+            # 서버를 띄운 채로 manifest 교체 → 새 ETag, 이전 ETag 는 200
+            manifest['version'] = 2
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.utime(manifest_path, ns=(0, os.stat(manifest_path).st_mtime_ns + 10**9))
+            status, headers, body = _request(base, '/manifest.json', If_None_Match=etag)
+            check(
+                status == 200 and headers.get('etag') != etag and
+                json.loads(body)['version'] == 2,
+                'changed manifest → 200 with new ETag',
+            )
+            print(f'  server stats: {dict(server.stats)}')
+    return failures
+
+
+async def _serve(root, host, port, log):
+    server = DataServer(root, log=log)
+    port = await server.start(host, port)
+    print(f'Serving {server.root} on http://{host}:{port}', flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        print(f'Stats: {dict(server.stats)}', flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local manifest/data server')
+    parser.add_argument('command', nargs='?', choices=['serve', 'selftest'], default='serve')
+    parser.add_argument('--root', default=PAGES_DIR)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000, help='0 이면 빈 포트')
+    parser.add_argument('--log', action='store_true', help='요청마다 한 줄 출력')
+    args = parser.parse_args()
+
+    if args.command == 'selftest':
+        print('Self-test')
+        failures = selftest()
+        if failures:
+            raise SystemExit(f'{failures} check(s) failed')
+        print('All checks passed')
+        return
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args.root, args.host, args.port, args.log))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 버전 간 안정적인 메뉴 id
+
+소스 파일의 id는 위치 기반(mcd_burger_01, ...)이라 메뉴 하나를 끼워 넣으면
+뒤 번호가 밀립니다. 그러면 사용자 DB(favorites / order_history)에 저장된
+*_item_id 가 다른 메뉴를 가리키게 되고 버전 간 delta도 커집니다.
+
+여기서는 소스 행을 가장 최근 이전 버전의 행과 짝지어 이전 id를 그대로
+물려줍니다. 가장 최근 이전 버전은 앱에 번들된 assets/menu_seed.db 이고,
+없으면 마지막으로 배포한 DB(gh-pages/data/menu_v*.db 최신)입니다. 번들 DB는
+배포본보다 새롭고 행도 많아서(사용자 DB의 id 대부분이 여기서 옴) 배포본만
+보면 번들 id 대부분이 다른 메뉴로 바뀝니다. 같은 (franchise, type) 안에서만
+비교합니다.
+
+  1. 정규화한 이름이 같으면 그대로 짝 (해시)
+  2. 남은 행은 이름 글자 bigram 역색인으로 후보를 모은 뒤 Dice 계수가
+     MATCH_THRESHOLD 이상이고 가격 차이가 MAX_PRICE_RATIO 배 이내인 쌍을
+     점수 높은 순(동점이면 가격 차이 작은 순)으로 1:1 배정 → renamed
+  3. 짝이 없는 소스 행은 new — 소스 id가 배포된 적 없는 id면 그대로 쓰고,
+     아니면 그 (franchise, type)에서 쓰인 적 있는(그대로 쓰는 new id 포함)
+     가장 큰 번호 + 1
+  4. 짝이 없는 이전 행은 retired (그 id는 다시 쓰지 않음)
+
+모든 배포 버전과 번들 DB에 한 번이라도 나온 id를 "쓰인 적 있는 id"로 봅니다.
+번들 DB가 기준이면 최신 배포본의 id 중 이번 빌드에서 다른 이름의 메뉴를
+가리키거나 사라지는 것을 reassigned 로 보고합니다.
+다음 --publish 가 그 id들을 다른 메뉴로 내보내므로 배포본 id를 키로 쓰는
+코드(price_history.py 등)는 현재 메뉴 기준으로 다시 이어야 합니다.
+역색인은 버킷마다 한 번만 만들고, MAX_POSTING 보다 흔한 bigram("버거" 등)은
+후보 수집에서 빼므로 행 수에 거의 선형입니다.
+
+Usage:
+    python3 scripts/stable_ids.py                  # 번들/최신 배포 DB 기준 보고서
+    python3 scripts/stable_ids.py --write-sources  # 배정한 id를 소스 파일에 반영
+"""
+
+import argparse
+import collections
+import itertools
+import os
+import re
+
+from generate_delta import DATA_DIR, PROJECT_DIR, published_versions, read_snapshot
+from menu_source import FRANCHISES, MENU_COLUMNS, MENU_DATA_DIR, load_menus
+from seed_search import normalize
+
+SEED_DB_PATH = os.path.join(PROJECT_DIR, 'assets', 'menu_seed.db')
+
+MATCH_THRESHOLD = 0.5
+MAX_POSTING = 64
+# 이름이 비슷해도 가격이 이만큼 넘게 벌어지면 다른 메뉴로 봄 ('치즈버거' ≠ '트리플 치즈 버거')
+MAX_PRICE_RATIO = 1.5
+
+_ID = MENU_COLUMNS.index('id')
+_FRANCHISE = MENU_COLUMNS.index('franchise')
+_NAME = MENU_COLUMNS.index('name')
+_TYPE = MENU_COLUMNS.index('type')
+_PRICE = MENU_COLUMNS.index('price')
+
+_ID_NUMBER = re.compile(r'^(.*)_(\d+)$')
+
+
+def name_grams(name):
+    """경계 표시를 붙인 글자 bigram 집합 ('빅맥' → ^빅, 빅맥, 맥$)"""
+    text = f'^{normalize(name)}$'
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 1.0
+
+
+def _buckets(snapshot):
+    """{(franchise, type): [(id, name, price)]} — rowid 순"""
+    index = {c: i + 1 for i, c in enumerate(snapshot['columns'])}
+    buckets = {}
+    for row in sorted(snapshot['rows'].values()):
+        buckets.setdefault(
+            (row[index['franchise']], row[index['type']]), [],
+        ).append((row[index['id']], row[index['name']], row[index['price']]))
+    return buckets
+
+
+def load_previous(data_dir=DATA_DIR, seed_path=SEED_DB_PATH):
+    """가장 최근 이전 버전의 메뉴와 모든 버전에서 쓰인 id
+
+    번들 DB(seed_path)가 있으면 그것이, 없으면 최신 배포 DB가 기준입니다.
+    Returns: (기준 이름, {(franchise, type): [(id, name, price)]}, used ids,
+              기준이 번들 DB면 (최신 배포 이름, {id: name}) 아니면 None)
+             — 둘 다 없으면 (None, {}, set(), None)
+    """
+    sources = [(f'v{version}', path) for version, path in published_versions(data_dir)]
+    if seed_path is not None and os.path.exists(seed_path):
+        sources.append((os.path.basename(seed_path), seed_path))
+    if not sources:
+        return None, {}, set(), None
+
+    used = set()
+    published = None
+    for label, path in sources:
+        snapshot = read_snapshot(path)
+        used.update(snapshot['rows'])
+        if path != seed_path:
+            published = (label, {
+                menu_id: name
+                for bucket in _buckets(snapshot).values()
+                for menu_id, name, _ in bucket
+            })
+    if sources[-1][1] != seed_path:
+        published = None
+    # 루프가 끝나면 snapshot 은 가장 최근 이전 버전
+    return sources[-1][0], _buckets(snapshot), used, published
+
+
+def match_bucket(current, previous):
+    """한 (franchise, type) 안에서 소스 행 ↔ 이전 행 짝짓기
+
+    current: [(id, name, price)] — 소스 순서
+    previous: [(id, name, price)]
+    Returns: {current 위치: (previous 위치, score)}
+    """
+    matches = {}
+    taken = set()
+
+    # 1. 정규화 이름이 같은 것
+    by_name = collections.defaultdict(collections.deque)
+    for j, (_, name, _) in enumerate(previous):
+        by_name[normalize(name)].append(j)
+    for i, (_, name, _) in enumerate(current):
+        queue = by_name.get(normalize(name))
+        if queue:
+            j = queue.popleft()
+            matches[i] = (j, 1.0)
+            taken.add(j)
+
+    # 2. bigram 역색인으로 후보를 모아 Dice 점수 순으로 배정
+    rest = [j for j in range(len(previous)) if j not in taken]
+    if not rest or len(matches) == len(current):
+        return matches
+    grams = {j: name_grams(previous[j][1]) for j in rest}
+    postings = collections.defaultdict(list)
+    for j in rest:
+        for gram in grams[j]:
+            postings[gram].append(j)
+
+    pairs = []
+    for i, (_, name, price) in enumerate(current):
+        if i in matches:
+            continue
+        mine = name_grams(name)
+        candidates = set()
+        for gram in mine:
+            posting = postings.get(gram)
+            if posting and len(posting) <= MAX_POSTING:
+                candidates.update(posting)
+        for j in candidates:
+            low, high = sorted((price, previous[j][2]))
+            if high > low * MAX_PRICE_RATIO:
+                continue
+            score = dice(mine, grams[j])
+            if score >= MATCH_THRESHOLD:
+                pairs.append((-score, abs(price - previous[j][2]), i, j))
+
+    for neg_score, _, i, j in sorted(pairs):
+        if i not in matches and j not in taken:
+            matches[i] = (j, -neg_score)
+            taken.add(j)
+    return matches
+
+
+class StableIds:
+    """소스 행 스트림의 id를 이전 배포 DB 기준으로 바꿔 주는 변환기
+
+    assign() 은 프랜차이즈 단위로 처리하므로 스트림에도 쓸 수 있고,
+    스트림을 다 읽은 뒤 report() 로 new / renamed / retired 를 봅니다.
+    """
+
+    def __init__(self, baseline, previous, used, published=None):
+        self.baseline = baseline
+        self._previous = previous
+        self._published = published
+        self._names = {}
+        self._used = set(used)
+        self._matched = set()
+        self._next = {}
+        self.kept = 0
+        self.renamed = []
+        self.new = []
+        self.mapping = {}
+
+    @classmethod
+    def from_published(cls, data_dir=DATA_DIR, seed_path=SEED_DB_PATH):
+        return cls(*load_previous(data_dir, seed_path))
+
+    def _allocate(self, franchise, menu_type):
+        prefix = f'{franchise}_{menu_type}'
+        if prefix not in self._next:
+            numbers = [
+                int(match.group(2)) for match in map(_ID_NUMBER.match, self._used)
+                if match and match.group(1) == prefix
+            ]
+            self._next[prefix] = max(numbers, default=0) + 1
+        while True:
+            menu_id = f'{prefix}_{self._next[prefix]:02d}'
+            self._next[prefix] += 1
+            if menu_id not in self._used:
+                self._used.add(menu_id)
+                return menu_id
+
+    def _assign_franchise(self, franchise, rows):
+        buckets = collections.defaultdict(list)
+        for position, row in enumerate(rows):
+            buckets[row[_TYPE]].append(position)
+
+        assigned = [None] * len(rows)
+        for menu_type, positions in buckets.items():
+            previous = self._previous.get((franchise, menu_type), [])
+            current = [(rows[p][_ID], rows[p][_NAME], rows[p][_PRICE]) for p in positions]
+            matches = match_bucket(current, previous)
+            for i, position in enumerate(positions):
+                if i not in matches:
+                    continue
+                j, score = matches[i]
+                old_id, old_name, _ = previous[j]
+                assigned[position] = old_id
+                self._matched.add(old_id)
+                if normalize(old_name) == normalize(rows[position][_NAME]):
+                    self.kept += 1
+                else:
+                    self.renamed.append(
+                        (old_id, old_name, rows[position][_NAME], round(score, 3)),
+                    )
+
+        # new: 배포된 적 없는 소스 id를 먼저 확정해야, 새 번호를 받는 행이
+        # 다른 new 행의 id를 빼앗아 줄줄이 밀리지 않음
+        fresh = set()
+        for position, row in enumerate(rows):
+            if assigned[position] is None and row[_ID] not in self._used:
+                assigned[position] = row[_ID]
+                self._used.add(row[_ID])
+                fresh.add(position)
+        for position, row in enumerate(rows):
+            if assigned[position] is None:
+                assigned[position] = self._allocate(franchise, row[_TYPE])
+                fresh.add(position)
+            if position in fresh:
+                self.new.append((assigned[position], row[_NAME]))
+            if assigned[position] != row[_ID]:
+                self.mapping[row[_ID]] = assigned[position]
+            self._names[assigned[position]] = row[_NAME]
+            yield (assigned[position], *row[1:])
+
+    def assign(self, rows):
+        """rows(MENU_COLUMNS 튜플, 프랜차이즈별로 연속) → id를 바꾼 튜플"""
+        for franchise, group in itertools.groupby(rows, key=lambda r: r[_FRANCHISE]):
+            yield from self._assign_franchise(franchise, list(group))
+
+    def retired(self):
+        return sorted(
+            (menu_id, name)
+            for bucket in self._previous.values()
+            for menu_id, name, _ in bucket
+            if menu_id not in self._matched
+        )
+
+    def reassigned(self):
+        """최신 배포본 id 중 이번 빌드에서 다른 메뉴를 가리키거나 사라지는 것
+
+        Returns: [(id, 배포본 이름, 이번 이름 또는 None)] — 기준이 배포본이면 []
+        """
+        if self._published is None:
+            return []
+        _, names = self._published
+        moved = []
+        for menu_id, name in sorted(names.items()):
+            current = self._names.get(menu_id)
+            if current is None or normalize(current) != normalize(name):
+                moved.append((menu_id, name, current))
+        return moved
+
+    def report(self):
+        published, names = self._published or (None, {})
+        return {
+            'baseline': self.baseline,
+            'published': published,
+            'publishedIds': len(names),
+            'reassigned': self.reassigned(),
+            'kept': self.kept,
+            'renamed': self.renamed,
+            'new': self.new,
+            'retired': self.retired(),
+            'remapped': len(self.mapping),
+        }
+
+
+def format_report(report, limit=20):
+    lines = [
+        f'Stable IDs vs {report["baseline"]}: {report["kept"]} kept, '
+        f'{len(report["renamed"])} renamed, {len(report["new"])} new, '
+        f'{len(report["retired"])} retired '
+        f'({report["remapped"]} source ids remapped)'
+    ]
+    if report['reassigned']:
+        lines.append(
+            f'  WARNING: the next --publish reassigns {len(report["reassigned"])} '
+            f'of {report["publishedIds"]} {report["published"]} ids '
+            f'(they name a different menu, or none, in this build)'
+        )
+    sections = (
+        ('renamed', lambda r: f'{r[0]}: {r[1]} → {r[2]} ({r[3]:.2f})'),
+        ('new', lambda r: f'{r[0]}: {r[1]}'),
+        ('retired', lambda r: f'{r[0]}: {r[1]}'),
+        ('reassigned', lambda r: f'{r[0]}: {r[1]} → {r[2] or "-"}'),
+    )
+    for key, fmt in sections:
+        entries = report[key]
+        for entry in entries[:limit]:
+            lines.append(f'  {key:<10} {fmt(entry)}')
+        if len(entries) > limit:
+            lines.append(f'  {key:<10} ... and {len(entries) - limit} more')
+    return '\n'.join(lines)
+
+
+def write_source_ids(mapping, data_dir=MENU_DATA_DIR):
+    """소스 파일의 id 칸만 mapping 대로 바꿈 (주석·순서는 그대로)
+
+    Returns: 바꾼 행 수
+    """
+    changed = 0
+    for franchise in FRANCHISES:
+        path = os.path.join(data_dir, f'{franchise}.csv')
+        with open(path, encoding='utf-8', newline='') as f:
+            lines = f.readlines()
+        seen_header = False
+        for number, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if not seen_header:
+                seen_header = True
+                continue
+            menu_id, sep, rest = line.partition(',')
+            if menu_id in mapping:
+                lines[number] = f'{mapping[menu_id]}{sep}{rest}'
+                changed += 1
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(lines)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stable menu ids across versions')
+    parser.add_argument(
+        '--write-sources', action='store_true',
+        help='배정한 id를 scripts/menu_data/*.csv 에 반영',
+    )
+    args = parser.parse_args()
+
+    stable = StableIds.from_published()
+    if stable.baseline is None:
+        print(f'No seed DB or published DB in {DATA_DIR}: ids left as is')
+        return
+    for _ in stable.assign(load_menus()):
+        pass
+    print(format_report(stable.report()))
+
+    if args.write_sources and stable.mapping:
+        changed = write_source_ids(stable.mapping)
+        print(f'Rewrote {changed} ids in {MENU_DATA_DIR}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 합성 대형 카탈로그 생성기
+
+메뉴 소스(약 500행)의 분포를 그대로 따라 1만~100만 행 규모의 가짜 카탈로그를
+만듭니다. 프랜차이즈 추가 / 지역가 / 매장별 메뉴가 들어왔을 때 스키마와
+쿼리가 어떻게 버티는지 보기 위한 용도입니다.
+
+  - 원래 5개 프랜차이즈는 그대로 두고, 부족한 행은 합성 프랜차이즈
+    (syn0001, syn0002, ...)로 채웁니다. 합성 프랜차이즈는 실제 프랜차이즈
+    하나를 템플릿으로 삼아 타입 구성(버거/세트/사이드...)을 따릅니다.
+  - 아이템마다 템플릿 프랜차이즈·타입의 실제 메뉴 하나를 골라 가격은
+    ±15% 흔들어 100원 단위로 반올림하고, 배달가는 원래 배달 할증 비율을
+    유지합니다 (배달가 없음도 그대로). 태그·세트 구성 여부도 따라갑니다.
+  - 같은 seed면 항상 같은 카탈로그가 나옵니다.
+
+Usage:
+    python3 scripts/synth_catalog.py --rows 100000 --out /tmp/menu_100k.db
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import time
+
+from generate_seed_db import SCHEMA
+from menu_source import MENU_COLUMNS, insert_menus, load_menus
+
+NAME_VARIANTS = (
+    '', '', '', '더블', '스파이시', '치즈', '베이컨', '트러플', '갈릭', '콰트로',
+    '라이트', '오리지널', '시즌', '리미티드', '서울', '부산', '제주', '대구',
+)
+
+_COL = {name: i for i, name in enumerate(MENU_COLUMNS)}
+
+
+def franchise_profiles(menus):
+    """프랜차이즈 → 타입 → 실제 메뉴 행 목록 (소스 순서 유지)"""
+    profiles = {}
+    for row in menus:
+        profiles.setdefault(row[_COL['franchise']], {}) \
+            .setdefault(row[_COL['type']], []).append(row)
+    return profiles
+
+
+def _jitter_price(rng, price, spread=0.15):
+    return max(100, int(round(price * rng.uniform(1 - spread, 1 + spread), -2)))
+
+
+def synth_item(rng, template, franchise, item_id):
+    """실제 메뉴 한 행(template)을 흔들어 만든 합성 행"""
+    price = _jitter_price(rng, template[_COL['price']])
+    delivery = template[_COL['price_delivery']]
+    if delivery is not None:
+        markup = delivery / template[_COL['price']]
+        delivery = int(round(price * markup, -2))
+    variant = rng.choice(NAME_VARIANTS)
+    name = template[_COL['name']]
+    return (
+        item_id,
+        franchise,
+        f'{variant} {name}' if variant else name,
+        template[_COL['type']],
+        price,
+        delivery,
+        template[_COL['price_updated_at']],
+        template[_COL['calories']],
+        None,
+        template[_COL['tags']],
+        template[_COL['includes_side']],
+        template[_COL['includes_drink']],
+    )
+
+
+def generate_catalog(rows, seed=0, menus=None):
+    """실제 메뉴를 포함해 총 rows 행의 카탈로그 (MENU_COLUMNS 튜플 목록)"""
+    if menus is None:
+        menus = load_menus()
+    catalog = list(menus)[:rows]
+    profiles = franchise_profiles(menus)
+    templates = sorted(profiles)
+    rng = random.Random(seed)
+
+    number = 0
+    while len(catalog) < rows:
+        number += 1
+        franchise = f'syn{number:04d}'
+        profile = profiles[templates[(number - 1) % len(templates)]]
+        for menu_type in sorted(profile):
+            source = profile[menu_type]
+            for index in range(len(source)):
+                if len(catalog) >= rows:
+                    break
+                catalog.append(synth_item(
+                    rng,
+                    rng.choice(source),
+                    franchise,
+                    f'{franchise}_{menu_type}_{index + 1:03d}',
+                ))
+    return catalog
+
+
+def write_catalog_db(path, catalog):
+    """generate_seed_db.py와 같은 스키마로 DB 생성 + ANALYZE
+
+    Returns: 생성에 걸린 초
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    started = time.perf_counter()
+    conn = sqlite3.connect(path)
+    try:
+        for stmt in SCHEMA:
+            conn.execute(stmt)
+        insert_menus(conn, catalog)
+        conn.execute('ANALYZE')
+        conn.commit()
+    finally:
+        conn.close()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic menu catalog generator')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', required=True, help='생성할 DB 경로')
+    args = parser.parse_args()
+
+    catalog = generate_catalog(args.rows, seed=args.seed)
+    elapsed = write_catalog_db(args.out, catalog)
+    franchises = len({row[_COL['franchise']] for row in catalog})
+    print(f'Synthetic DB generated: {args.out}')
+    print(f'Rows: {len(catalog):,} ({franchises} franchises)')
+    print(f'Build: {elapsed:.2f}s, {os.path.getsize(args.out):,} bytes')
+
+
+if __name__ == '__main__':
+    main()
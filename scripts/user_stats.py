@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+Burger Budget - 사용자 DB 규모 생성기 + user_item_stats 집계 제안
+
+UserPreferenceRepositoryImpl.getUserPreference 는 추천할 때마다 favorites 와
+order_history 를 전부 읽어 Dart 에서 30일/90일 창과 프랜차이즈 횟수로 나눕니다.
+앱을 오래 쓸수록 느려집니다. 여기서는
+
+  - user_database_helper.dart(v3) 스키마 그대로 주문 1천~20만 건의 사용자 DB 생성
+  - 지금 방식(scan)을 그대로 옮긴 preference_scan
+  - 트리거로 유지되는 집계 테이블 user_item_stats 와, 그 테이블 한 번 읽기로
+    같은 UserPreference 를 만드는 preference_stats
+
+를 두고 둘을 비교합니다.
+
+    user_item_stats (item_id, order_count, main_count, favorite_count, last_ordered_at)
+      order_count     주문에 들어간 횟수 (main/side/drink 슬롯마다 1)
+      main_count      main 으로 들어간 횟수 — 프랜차이즈 횟수의 재료
+      favorite_count  즐겨찾기 조합에 들어간 횟수
+      last_ordered_at 마지막 주문 시각 (주문이 없으면 NULL)
+
+    order_history / favorites 의 INSERT·DELETE 트리거가 행을 고칩니다 (앱은 두
+    테이블을 UPDATE 하지 않음). 주문을 지울 때 그 주문이 아이템의 마지막 주문이면
+    idx_history_created 를 최신부터 훑어 다음 주문 시각을 찾습니다. 세 카운트가
+    모두 0이 되면 행을 지웁니다. 기존 사용자는 install_item_stats 의 backfill
+    한 번으로 채웁니다.
+
+    읽기는 `SELECT ... FROM user_item_stats` 한 번이고 행 수는 주문해 본 메뉴
+    수(카탈로그 크기 이하)라 주문 이력 길이와 상관없습니다. 30일/90일 창은
+    last_ordered_at 비교, 프랜차이즈 횟수는 main_count 합입니다.
+
+프랜차이즈 코드는 _extractFranchise 를 그대로 따릅니다 (id 의 마지막 '_' 앞까지
+— 지금 id 형식 mcd_burger_01 에서는 'mcd_burger').
+
+check 는 무작위 주문·즐겨찾기 추가/삭제, 전체 삭제를 섞어 가며 두 방식의
+결과와 backfill 결과가 같은지 봅니다. bench 는 주문 수별 두 방식의 읽기
+지연과 트리거가 붙은 insert / delete 비용을 잽니다.
+
+Usage:
+    python3 scripts/user_stats.py generate 10000 /tmp/user_data.db [--no-stats]
+    python3 scripts/user_stats.py check
+    python3 scripts/user_stats.py bench --orders 1000 10000 50000 100000 200000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from recommendation_engine import DB_PATH
+
+# 생성 DB 의 "지금" (같은 seed면 같은 DB)
+REFERENCE_NOW = datetime.datetime(2026, 3, 1, 12, 0)
+
+# user_database_helper.dart _onCreate (version 3)
+USER_SCHEMA = [
+    '''
+        CREATE TABLE favorites (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            main_item_id TEXT NOT NULL,
+            side_item_id TEXT,
+            drink_item_id TEXT,
+            created_at TEXT NOT NULL,
+            UNIQUE(main_item_id, side_item_id, drink_item_id)
+        )
+    ''',
+    '''
+        CREATE TABLE order_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            main_item_id TEXT NOT NULL,
+            side_item_id TEXT,
+            drink_item_id TEXT,
+            total_price INTEGER NOT NULL,
+            created_at TEXT NOT NULL
+        )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_favorites_main ON favorites(main_item_id)',
+    'CREATE INDEX IF NOT EXISTS idx_history_created ON order_history(created_at DESC)',
+]
+
+_SLOTS = (('main_item_id', 1), ('side_item_id', 0), ('drink_item_id', 0))
+
+
+def _order_insert(column, is_main):
+    return f'''
+        INSERT INTO user_item_stats (item_id, order_count, main_count, last_ordered_at)
+        SELECT NEW.{column}, 1, {is_main}, NEW.created_at
+        WHERE NEW.{column} IS NOT NULL
+        ON CONFLICT(item_id) DO UPDATE SET
+            order_count = order_count + 1,
+            main_count = main_count + excluded.main_count,
+            last_ordered_at = MAX(COALESCE(last_ordered_at, ''), excluded.last_ordered_at);
+    '''
+
+
+def _order_delete(column, is_main):
+    return f'''
+        UPDATE user_item_stats SET
+            order_count = order_count - 1,
+            main_count = main_count - {is_main},
+            last_ordered_at = CASE
+                WHEN order_count = 1 THEN NULL
+                WHEN OLD.created_at < last_ordered_at THEN last_ordered_at
+                ELSE (
+                    SELECT created_at FROM order_history
+                    WHERE OLD.{column} IN (main_item_id, side_item_id, drink_item_id)
+                    ORDER BY created_at DESC LIMIT 1
+                )
+            END
+        WHERE item_id = OLD.{column};
+        DELETE FROM user_item_stats
+        WHERE item_id = OLD.{column}
+          AND order_count = 0 AND favorite_count = 0;
+    '''
+
+
+def _favorite_insert(column):
+    return f'''
+        INSERT INTO user_item_stats (item_id, favorite_count)
+        SELECT NEW.{column}, 1 WHERE NEW.{column} IS NOT NULL
+        ON CONFLICT(item_id) DO UPDATE SET favorite_count = favorite_count + 1;
+    '''
+
+
+def _favorite_delete(column):
+    return f'''
+        UPDATE user_item_stats SET favorite_count = favorite_count - 1
+        WHERE item_id = OLD.{column};
+        DELETE FROM user_item_stats
+        WHERE item_id = OLD.{column}
+          AND order_count = 0 AND favorite_count = 0;
+    '''
+
+
+def _trigger(name, event, table, body):
+    return f'CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN {body} END'
+
+
+ITEM_STATS_SCHEMA = [
+    '''
+        CREATE TABLE user_item_stats (
+            item_id         TEXT PRIMARY KEY,
+            order_count     INTEGER NOT NULL DEFAULT 0,
+            main_count      INTEGER NOT NULL DEFAULT 0,
+            favorite_count  INTEGER NOT NULL DEFAULT 0,
+            last_ordered_at TEXT
+        ) WITHOUT ROWID
+    ''',
+    _trigger(
+        'trg_history_stats_insert', 'INSERT', 'order_history',
+        ''.join(_order_insert(column, is_main) for column, is_main in _SLOTS),
+    ),
+    _trigger(
+        'trg_history_stats_delete', 'DELETE', 'order_history',
+        ''.join(_order_delete(column, is_main) for column, is_main in _SLOTS),
+    ),
+    _trigger(
+        'trg_favorites_stats_insert', 'INSERT', 'favorites',
+        ''.join(_favorite_insert(column) for column, _ in _SLOTS),
+    ),
+    _trigger(
+        'trg_favorites_stats_delete', 'DELETE', 'favorites',
+        ''.join(_favorite_delete(column) for column, _ in _SLOTS),
+    ),
+]
+
+# 기존 사용자 DB 에 테이블을 붙일 때 한 번
+ITEM_STATS_BACKFILL = '''
+    INSERT INTO user_item_stats
+        (item_id, order_count, main_count, favorite_count, last_ordered_at)
+    SELECT item_id, SUM(is_order), SUM(is_main), SUM(is_favorite), MAX(ordered_at)
+    FROM (
+        SELECT main_item_id AS item_id, 1 AS is_order, 1 AS is_main,
+               0 AS is_favorite, created_at AS ordered_at FROM order_history
+        UNION ALL
+        SELECT side_item_id, 1, 0, 0, created_at FROM order_history
+        WHERE side_item_id IS NOT NULL
+        UNION ALL
+        SELECT drink_item_id, 1, 0, 0, created_at FROM order_history
+        WHERE drink_item_id IS NOT NULL
+        UNION ALL
+        SELECT main_item_id, 0, 0, 1, NULL FROM favorites
+        UNION ALL
+        SELECT side_item_id, 0, 0, 1, NULL FROM favorites WHERE side_item_id IS NOT NULL
+        UNION ALL
+        SELECT drink_item_id, 0, 0, 1, NULL FROM favorites WHERE drink_item_id IS NOT NULL
+    )
+    GROUP BY item_id
+'''
+
+STATS_READ_SQL = (
+    'SELECT item_id, main_count, favorite_count, last_ordered_at FROM user_item_stats'
+)
+
+HISTORY_INSERT_SQL = (
+    'INSERT INTO order_history '
+    '(main_item_id, side_item_id, drink_item_id, total_price, created_at) '
+    'VALUES (?, ?, ?, ?, ?)'
+)
+FAVORITE_INSERT_SQL = (
+    'INSERT INTO favorites (main_item_id, side_item_id, drink_item_id, created_at) '
+    'VALUES (?, ?, ?, ?)'
+)
+
+
+def install_item_stats(conn):
+    """user_item_stats 테이블·트리거 생성 + 기존 행 backfill (트랜잭션 하나)"""
+    with conn:
+        for stmt in ITEM_STATS_SCHEMA:
+            conn.execute(stmt)
+        conn.execute(ITEM_STATS_BACKFILL)
+
+
+def iso(moment):
+    """Dart DateTime.toIso8601String (로컬 시각, 마이크로초까지)"""
+    return moment.strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+def extract_franchise(item_id):
+    """UserPreferenceRepositoryImpl._extractFranchise"""
+    idx = item_id.rfind('_')
+    return item_id[:idx] if idx > 0 else None
+
+
+def _windows(now):
+    return (
+        iso(now - datetime.timedelta(days=30)),
+        iso(now - datetime.timedelta(days=90)),
+    )
+
+
+def preference_scan(conn, now):
+    """지금 방식: favorites / order_history 전체를 읽어 집계
+
+    Returns: recommendation_engine 의 pref dict
+        {favorites, recent30, recent90, franchise_counts}
+    """
+    favorites = set()
+    for row in conn.execute(
+        'SELECT main_item_id, side_item_id, drink_item_id FROM favorites'
+    ):
+        favorites.update(item for item in row if item is not None)
+
+    d30, d90 = _windows(now)
+    recent30, recent90 = set(), set()
+    counts = {}
+    for main, side, drink, created_at in conn.execute(
+        'SELECT main_item_id, side_item_id, drink_item_id, created_at '
+        'FROM order_history'
+    ):
+        franchise = extract_franchise(main)
+        if franchise is not None:
+            counts[franchise] = counts.get(franchise, 0) + 1
+        if created_at >= d90:
+            ids = [item for item in (main, side, drink) if item is not None]
+            recent90.update(ids)
+            if created_at >= d30:
+                recent30.update(ids)
+    return {
+        'favorites': favorites,
+        'recent30': recent30,
+        'recent90': recent90,
+        'franchise_counts': counts,
+    }
+
+
+def preference_stats(conn, now):
+    """user_item_stats 한 번 읽기로 같은 pref dict"""
+    d30, d90 = _windows(now)
+    favorites, recent30, recent90 = set(), set(), set()
+    counts = {}
+    for item_id, main_count, favorite_count, last_ordered_at in \
+            conn.execute(STATS_READ_SQL):
+        if favorite_count:
+            favorites.add(item_id)
+        if last_ordered_at is not None and last_ordered_at >= d90:
+            recent90.add(item_id)
+            if last_ordered_at >= d30:
+                recent30.add(item_id)
+        if main_count:
+            franchise = extract_franchise(item_id)
+            if franchise is not None:
+                counts[franchise] = counts.get(franchise, 0) + main_count
+    return {
+        'favorites': favorites,
+        'recent30': recent30,
+        'recent90': recent90,
+        'franchise_counts': counts,
+    }
+
+
+# ══════════════════════════════════════════════
+# 사용자 DB 생성
+# ══════════════════════════════════════════════
+
+class OrderModel:
+    """한 사용자의 주문 습관: 자주 가는 프랜차이즈, 자주 먹는 메뉴, 주문 간격
+
+    프랜차이즈 가중치는 rng.random() ** 3 (한두 곳에 몰림), 프랜차이즈 안의
+    메뉴는 1 / (순위 + 1) 로 고릅니다. 버거만 시키면 사이드·음료를 붙일 수
+    있고, 세트는 main 하나입니다.
+    """
+
+    def __init__(self, rng, menu_db=DB_PATH):
+        self.rng = rng
+        conn = sqlite3.connect(f'file:{menu_db}?mode=ro', uri=True)
+        try:
+            rows = conn.execute(
+                'SELECT id, franchise, type, price FROM menus ORDER BY rowid'
+            ).fetchall()
+        finally:
+            conn.close()
+        by_franchise = {}
+        for item_id, franchise, menu_type, price in rows:
+            by_franchise.setdefault(franchise, {}) \
+                .setdefault(menu_type, []).append((item_id, price))
+        self.franchises = sorted(by_franchise)
+        self.franchise_weights = [rng.random() ** 3 + 0.01 for _ in self.franchises]
+        self.menus = {}
+        for franchise, types in by_franchise.items():
+            self.menus[franchise] = {}
+            for menu_type, items in types.items():
+                items = list(items)
+                rng.shuffle(items)
+                self.menus[franchise][menu_type] = (
+                    items, [1 / (rank + 1) for rank in range(len(items))],
+                )
+
+    def _pick(self, franchise, menu_type):
+        entry = self.menus[franchise].get(menu_type)
+        if not entry:
+            return None
+        items, weights = entry
+        return self.rng.choices(items, weights)[0]
+
+    def order(self):
+        """(main, side, drink, total_price)"""
+        rng = self.rng
+        franchise = rng.choices(self.franchises, self.franchise_weights)[0]
+        main_type = 'set' if 'set' in self.menus[franchise] and rng.random() < 0.4 \
+            else 'burger'
+        main = self._pick(franchise, main_type)
+        side = drink = None
+        if main_type == 'burger':
+            if rng.random() < 0.6:
+                side = self._pick(franchise, 'side')
+            if rng.random() < 0.7:
+                drink = self._pick(franchise, 'drink')
+        parts = [item for item in (main, side, drink) if item is not None]
+        return (
+            main[0],
+            side[0] if side else None,
+            drink[0] if drink else None,
+            sum(price for _, price in parts),
+        )
+
+
+def order_times(rng, count, now=REFERENCE_NOW, per_day=2.0):
+    """주문 시각 count개 (오래된 것부터) — 하루 평균 per_day 건"""
+    span = max(1.0, count / per_day) * 86400
+    offsets = sorted((rng.random() * span for _ in range(count)), reverse=True)
+    return [iso(now - datetime.timedelta(seconds=offset)) for offset in offsets]
+
+
+def generate_user_db(path, orders, favorites=20, seed=0, stats=True,
+                     now=REFERENCE_NOW, menu_db=DB_PATH):
+    """주문 orders 건, 즐겨찾기 최대 favorites 개의 사용자 DB
+
+    stats 이면 user_item_stats 를 먼저 만들어 트리거로 채웁니다.
+    Returns: 생성 초
+    """
+    rng = random.Random(seed)
+    model = OrderModel(rng, menu_db)
+    started = time.perf_counter()
+    if os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    try:
+        with conn:
+            for stmt in USER_SCHEMA + (ITEM_STATS_SCHEMA if stats else []):
+                conn.execute(stmt)
+            history = [model.order() for _ in range(orders)]
+            conn.executemany(HISTORY_INSERT_SQL, [
+                order + (created_at,)
+                for order, created_at in zip(history, order_times(rng, orders, now))
+            ])
+            # 즐겨찾기: 자주 시킨 조합 중에서
+            combos = list(dict.fromkeys(order[:3] for order in history))
+            favorite_times = order_times(rng, favorites, now)
+            conn.executemany(FAVORITE_INSERT_SQL, [
+                combo + (created_at,)
+                for combo, created_at in zip(combos[:favorites], favorite_times)
+            ])
+    finally:
+        conn.close()
+    return time.perf_counter() - started
+
+
+# ══════════════════════════════════════════════
+# check / bench
+# ══════════════════════════════════════════════
+
+def _stats_rows(conn):
+    return conn.execute(
+        'SELECT item_id, order_count, main_count, favorite_count, last_ordered_at '
+        'FROM user_item_stats ORDER BY item_id'
+    ).fetchall()
+
+
+def _backfill_rows(conn):
+    """같은 주문·즐겨찾기로 backfill 만 했을 때의 행"""
+    scratch = sqlite3.connect(':memory:')
+    try:
+        for stmt in USER_SCHEMA:
+            scratch.execute(stmt)
+        scratch.executemany(
+            'INSERT INTO order_history VALUES (?, ?, ?, ?, ?, ?)',
+            conn.execute('SELECT * FROM order_history'),
+        )
+        scratch.executemany(
+            'INSERT INTO favorites VALUES (?, ?, ?, ?, ?)',
+            conn.execute('SELECT * FROM favorites'),
+        )
+        install_item_stats(scratch)
+        return _stats_rows(scratch)
+    finally:
+        scratch.close()
+
+
+def check(rounds=30, orders=300, seed=0):
+    """무작위 변경 뒤마다 scan == stats == backfill"""
+    rng = random.Random(seed)
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'user_data.db')
+        generate_user_db(path, orders, favorites=15, seed=seed)
+        model = OrderModel(rng)
+        conn = sqlite3.connect(path)
+        try:
+            for round_no in range(rounds):
+                with conn:
+                    action = rng.choice(
+                        ['add', 'add', 'remove', 'remove_latest', 'favorite',
+                         'unfavorite', 'clear' if round_no % 10 == 9 else 'add'],
+                    )
+                    now = REFERENCE_NOW + datetime.timedelta(days=round_no)
+                    if action == 'add':
+                        for _ in range(rng.randint(1, 20)):
+                            stamp = now - datetime.timedelta(
+                                seconds=rng.random() * 120 * 86400,
+                            )
+                            conn.execute(
+                                HISTORY_INSERT_SQL, model.order() + (iso(stamp),),
+                            )
+                    elif action in ('remove', 'remove_latest'):
+                        order = 'created_at DESC' if action == 'remove_latest' \
+                            else 'RANDOM()'
+                        conn.execute(
+                            'DELETE FROM order_history WHERE id IN ('
+                            f'SELECT id FROM order_history ORDER BY {order} LIMIT ?)',
+                            (rng.randint(1, 10),),
+                        )
+                    elif action == 'favorite':
+                        conn.execute(
+                            FAVORITE_INSERT_SQL.replace('INSERT', 'INSERT OR IGNORE', 1),
+                            model.order()[:3] + (iso(now),),
+                        )
+                    elif action == 'unfavorite':
+                        conn.execute(
+                            'DELETE FROM favorites WHERE id IN '
+                            '(SELECT id FROM favorites ORDER BY RANDOM() LIMIT 2)'
+                        )
+                    else:
+                        conn.execute('DELETE FROM order_history')
+
+                for probe in (now, now - datetime.timedelta(days=45)):
+                    scan = preference_scan(conn, probe)
+                    stats = preference_stats(conn, probe)
+                    ok = scan == stats
+                    failures += not ok
+                    if not ok:
+                        print(f'  [FAIL] round {round_no} {action}: scan != stats')
+                backfill_ok = _stats_rows(conn) == _backfill_rows(conn)
+                failures += not backfill_ok
+                if not backfill_ok:
+                    print(f'  [FAIL] round {round_no} {action}: triggers != backfill')
+
+            history = conn.execute('SELECT COUNT(*) FROM order_history').fetchone()[0]
+            items = conn.execute('SELECT COUNT(*) FROM user_item_stats').fetchone()[0]
+        finally:
+            conn.close()
+    print(
+        f'{rounds} rounds: scan vs stats vs backfill, {failures} failures '
+        f'({history} orders, {items} stats rows at the end)'
+    )
+    return failures == 0
+
+
+def _median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(samples)
+
+
+def _write_cost_us(path, count, seed):
+    """주문 count건 insert 후 최신 주문부터 count건 delete — 건당 µs (insert, delete)"""
+    rng = random.Random(seed)
+    model = OrderModel(rng)
+    conn = sqlite3.connect(path)
+    try:
+        latest = conn.execute('SELECT MAX(created_at) FROM order_history').fetchone()[0]
+        base = datetime.datetime.fromisoformat(latest)
+        rows = [
+            model.order() + (iso(base + datetime.timedelta(minutes=i + 1)),)
+            for i in range(count)
+        ]
+        started = time.perf_counter()
+        with conn:
+            for row in rows:
+                conn.execute(HISTORY_INSERT_SQL, row)
+        insert_us = (time.perf_counter() - started) * 1e6 / count
+        ids = [row[0] for row in conn.execute(
+            'SELECT id FROM order_history ORDER BY created_at DESC LIMIT ?', (count,),
+        )]
+        started = time.perf_counter()
+        with conn:
+            for order_id in ids:
+                conn.execute('DELETE FROM order_history WHERE id = ?', (order_id,))
+        delete_us = (time.perf_counter() - started) * 1e6 / count
+    finally:
+        conn.close()
+    return insert_us, delete_us
+
+
+def bench(order_counts, repeat=20, writes=500, seed=0):
+    print(
+        f'  {"orders":>8}{"scan µs":>12}{"stats µs":>10}{"speedup":>9}'
+        f'{"stats rows":>12}{"insert µs (plain/trig)":>24}{"delete µs (plain/trig)":>24}'
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for orders in order_counts:
+            costs = {}
+            for stats in (False, True):
+                path = os.path.join(tmp, f'user_{orders}_{int(stats)}.db')
+                generate_user_db(path, orders, seed=seed, stats=stats)
+                costs[stats] = _write_cost_us(path, writes, seed)
+                if stats:
+                    conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+                    try:
+                        scan = preference_scan(conn, REFERENCE_NOW)
+                        if scan != preference_stats(conn, REFERENCE_NOW):
+                            raise RuntimeError(f'{orders} orders: scan != stats')
+                        scan_us = _median_us(
+                            lambda: preference_scan(conn, REFERENCE_NOW),
+                            max(3, repeat * 1000 // max(orders, 1000)),
+                        )
+                        stats_us = _median_us(
+                            lambda: preference_stats(conn, REFERENCE_NOW), repeat,
+                        )
+                        rows = conn.execute(
+                            'SELECT COUNT(*) FROM user_item_stats'
+                        ).fetchone()[0]
+                    finally:
+                        conn.close()
+            (plain_in, plain_del), (trig_in, trig_del) = costs[False], costs[True]
+            print(
+                f'  {orders:>8,}{scan_us:>12,.0f}{stats_us:>10,.0f}'
+                f'{scan_us / stats_us:>8.0f}x{rows:>12}'
+                f'{f"{plain_in:.1f} / {trig_in:.1f}":>24}'
+                f'{f"{plain_del:.1f} / {trig_del:.1f}":>24}'
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='User DB generator and preference stats')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    gen = sub.add_parser('generate', help='사용자 DB 생성')
+    gen.add_argument('orders', type=int)
+    gen.add_argument('out')
+    gen.add_argument('--favorites', type=int, default=20)
+    gen.add_argument('--seed', type=int, default=0)
+    gen.add_argument('--no-stats', action='store_true', help='user_item_stats 없이 (지금 스키마)')
+
+    check_parser = sub.add_parser('check', help='scan / stats / backfill 비교')
+    check_parser.add_argument('--rounds', type=int, default=30)
+    check_parser.add_argument('--seed', type=int, default=0)
+
+    bench_parser = sub.add_parser('bench', help='주문 수별 읽기·쓰기 비용')
+    bench_parser.add_argument(
+        '--orders', type=int, nargs='+', default=[1000, 10000, 50000, 100000, 200000],
+    )
+    bench_parser.add_argument('--repeat', type=int, default=20)
+    bench_parser.add_argument('--writes', type=int, default=500)
+    args = parser.parse_args()
+
+    if args.command == 'check':
+        raise SystemExit(0 if check(args.rounds, seed=args.seed) else 1)
+    if args.command == 'bench':
+        bench(args.orders, args.repeat, args.writes)
+        return
+
+    elapsed = generate_user_db(
+        args.out, args.orders, args.favorites, args.seed, stats=not args.no_stats,
+    )
+    print(
+        f'Generated: {args.out} ({args.orders:,} orders, '
+        f'{os.path.getsize(args.out):,} bytes, {elapsed:.2f}s)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import 'package:burger_budget/core/database/franchise_merge_query.dart';
+import 'package:flutter_test/flutter_test.dart';
+
+void main() {
+  group('franchiseMergeQuery', () {
+    test('프랜차이즈 하나는 UNION ALL 없이 한 가지만 만든다', () {
+      final query = franchiseMergeQuery(
+        franchises: ['mcd'],
+        orderBy: 'price DESC',
+      );
+
+      expect(
+        query.sql,
+        'SELECT * FROM menus WHERE franchise = ? '
+        'ORDER BY price DESC, franchise',
+      );
+      expect(query.args, ['mcd']);
+    });
+
+    test('프랜차이즈마다 가지를 잇고 인자를 가지 순서로 넘긴다', () {
+      final query = franchiseMergeQuery(
+        franchises: ['mcd', 'bk'],
+        where: 'price <= ?',
+        args: [10000],
+        orderBy: 'price DESC',
+      );
+
+      expect(
+        query.sql,
+        'SELECT * FROM menus WHERE franchise = ? AND price <= ? '
+        'UNION ALL '
+        'SELECT * FROM menus WHERE franchise = ? AND price <= ? '
+        'ORDER BY price DESC, franchise',
+      );
+      expect(query.args, ['mcd', 10000, 'bk', 10000]);
+    });
+
+    test('중복된 프랜차이즈는 한 번만 넣는다', () {
+      final query = franchiseMergeQuery(
+        franchises: ['mcd', 'mcd'],
+        orderBy: 'price DESC',
+      );
+
+      expect(query.sql, isNot(contains('UNION ALL')));
+      expect(query.args, ['mcd']);
+    });
+  });
+}